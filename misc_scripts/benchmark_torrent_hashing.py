@@ -0,0 +1,121 @@
+"""Compare NfoForge's torrent hashing with torf's own and with mkbrr.
+
+Hashes one synthetic file with each engine at the same piece exponent, prints
+the wall time and throughput of each, and checks they agree on the infohash.
+
+    python misc_scripts/benchmark_torrent_hashing.py --size-gib 4
+    python misc_scripts/benchmark_torrent_hashing.py --mkbrr /usr/local/bin/mkbrr
+
+Run from the repository root so `src` is importable.
+"""
+
+import argparse
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from torf import Torrent
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.backend.torrents.piece_size import piece_exponent
+from src.backend.torrents.torrent import (
+    INDEX_SIDECAR_GLOBS,
+    generate_torrent,
+    mkbrr_generate_torrent,
+)
+
+# repeated rather than fully random, which would make writing the file the
+# slowest part of the run
+_BLOCK = os.urandom(1 << 26)
+
+
+def write_synthetic(path: Path, size: int) -> None:
+    with open(path, "wb") as file:
+        remaining = size
+        while remaining:
+            block = _BLOCK[: min(remaining, len(_BLOCK))]
+            file.write(block)
+            remaining -= len(block)
+
+
+def bench_torf(path: Path, exponent: int) -> str:
+    # what generate_torrent did before it had its own hashing
+    torrent = Torrent(
+        path=path,
+        private=True,
+        piece_size=2**exponent,
+        exclude_globs=INDEX_SIDECAR_GLOBS,
+    )
+    torrent.generate(callback=lambda *_args: None, interval=0)
+    return torrent.infohash
+
+
+def bench_native(path: Path, exponent: int) -> str:
+    return generate_torrent(
+        path=path, piece_exponent=exponent, cb=lambda *_args: None
+    ).infohash
+
+
+def bench_mkbrr(mkbrr: Path, path: Path, exponent: int, output: Path) -> str:
+    mkbrr_generate_torrent(
+        mkbrr_path=mkbrr,
+        path=path,
+        output_path=output,
+        piece_exponent=exponent,
+        cb=lambda _progress: None,
+    )
+    return Torrent.read(output).infohash
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-gib", type=float, default=4.0)
+    parser.add_argument(
+        "--piece-exponent",
+        type=int,
+        default=None,
+        help="defaults to what NfoForge would pick for the file size",
+    )
+    parser.add_argument("--mkbrr", type=Path, default=None, help="mkbrr binary")
+    parser.add_argument(
+        "--dir", type=Path, default=None, help="where to write the synthetic file"
+    )
+    args = parser.parse_args()
+
+    size = int(args.size_gib * (1 << 30))
+    exponent = args.piece_exponent or piece_exponent(size)
+    with tempfile.TemporaryDirectory(dir=args.dir) as temp_dir:
+        media = Path(temp_dir) / "synthetic.mkv"
+        print(f"writing {size / (1 << 30):.2f} GiB to {media}")
+        write_synthetic(media, size)
+
+        engines = {
+            "torf": lambda: bench_torf(media, exponent),
+            "nfoforge": lambda: bench_native(media, exponent),
+        }
+        if args.mkbrr:
+            engines["mkbrr"] = lambda: bench_mkbrr(
+                args.mkbrr, media, exponent, Path(temp_dir) / "mkbrr.torrent"
+            )
+
+        print(f"piece size 2^{exponent} ({1 << exponent} bytes)")
+        infohashes = {}
+        for name, run in engines.items():
+            started = time.perf_counter()
+            infohashes[name] = run()
+            elapsed = time.perf_counter() - started
+            print(
+                f"{name:>9}: {elapsed:7.2f}s  {size / elapsed / (1 << 20):8.1f} MiB/s"
+                f"  {infohashes[name]}"
+            )
+
+    if len(set(infohashes.values())) != 1:
+        sys.exit("infohashes differ")
+    print("all infohashes match")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,16 @@
 import asyncio
-import base64
-from collections.abc import Awaitable, Callable, Sequence
-from os import PathLike
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Literal, cast
 
 import aiohttp
 
+from src.backend.image_host_uploading.host_limiter import (
+    RETRY_STATUSES,
+    AdaptiveHostLimiter,
+)
+from src.backend.image_host_uploading.session_registry import borrow_session
 from src.exceptions import ImageUploadError
 from src.logger.nfo_forge_logger import LOG
 from src.packages.custom_types import ImageUploadData
@@ -14,36 +18,79 @@ from src.packages.custom_types import ImageUploadData
 AuthMode = Literal["body", "header"]
 
 
+@asynccontextmanager
+async def image_form_data(
+    field_name: str, image: Path, fields: Mapping[str, str]
+) -> AsyncIterator[aiohttp.FormData]:
+    """
+    Build the multipart body for a single image upload.
+
+    The file is opened off the event loop and streamed by aiohttp in chunks. A
+    new body is needed for every attempt since a streamed file is consumed by
+    the request.
+    """
+    image_file = await asyncio.to_thread(open, image, "rb")
+    try:
+        form_data = aiohttp.FormData()
+        form_data.add_field(field_name, image_file, filename=image.name)
+        for name, value in fields.items():
+            form_data.add_field(name, value)
+        yield form_data
+    finally:
+        image_file.close()
+
+
 async def _post_image(
     url: str,
     api_key: str,
     auth_mode: AuthMode,
-    image_data: str,
+    image: Path,
     host_name: str,
     retries: int = 3,
+    session: aiohttp.ClientSession | None = None,
+    limiter: AdaptiveHostLimiter | None = None,
 ) -> dict[str, Any]:
-    """Uploads a base64-encoded image using aiohttp with retries and proper error handling."""
-    data: dict[str, str] = {"image": image_data}
+    """Uploads an image using aiohttp with retries and proper error handling.
+
+    `image` is streamed from disk as a multipart file. Each attempt holds a slot
+    of the host's `limiter`.
+    """
+    limiter = limiter or AdaptiveHostLimiter()
+    fields: dict[str, str] = {}
     headers: dict[str, str] | None = None
     if auth_mode == "body":
-        data["key"] = api_key
+        fields["key"] = api_key
     else:
         headers = {"X-API-Key": api_key}
 
-    async with aiohttp.ClientSession() as session:
+    async with borrow_session(session) as session:
         for attempt in range(retries):
+            retry_after = None
             try:
-                async with session.post(url, data=data, headers=headers) as response:
-                    if response.status == 200:
-                        return cast(dict[str, Any], await response.json())
-
-                    if response.status in {429, 500, 502, 503, 504}:
-                        await asyncio.sleep(2**attempt)
-                        continue
-                    else:
-                        return {"status": response.status, "reason": response.reason}
+                async with limiter.slot():
+                    async with image_form_data("image", image, fields) as data:
+                        async with session.post(
+                            url, data=data, headers=headers
+                        ) as response:
+                            if response.status == 200:
+                                limiter.success()
+                                return cast(dict[str, Any], await response.json())
+
+                            if response.status not in RETRY_STATUSES:
+                                return {
+                                    "status": response.status,
+                                    "reason": response.reason,
+                                }
+                            retry_after = limiter.throttled(
+                                response.headers.get("Retry-After")
+                            )
+                # a retryable status, the request body is rebuilt for the next attempt
+                # and the limiter already holds every upload back for a Retry-After
+                if not retry_after:
+                    await asyncio.sleep(2**attempt)
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                limiter.throttled()
                 if attempt < retries - 1:
                     await asyncio.sleep(2**attempt)
                 else:
@@ -55,40 +102,6 @@ async def _post_image(
     return {"status": "Failed", "reason": "Failure on retry"}
 
 
-async def _upload_batch(
-    url: str,
-    api_key: str,
-    auth_mode: AuthMode,
-    host_name: str,
-    filepaths: Sequence[Path],
-    start_index: int,
-    cb: Callable[[int], Awaitable[None]] | None = None,
-) -> dict[int, ImageUploadData]:
-    async def upload_single_image(
-        filepath: PathLike[str], index: int
-    ) -> tuple[int, ImageUploadData]:
-        with open(filepath, "rb") as image_file:
-            image_data = base64.b64encode(image_file.read()).decode("utf-8")
-            response = await _post_image(url, api_key, auth_mode, image_data, host_name)
-            data = response.get("data", {})
-            image_urls = data.get("image", {}) if isinstance(data, dict) else {}
-            medium_urls = data.get("medium", {}) if isinstance(data, dict) else {}
-            upload_data = ImageUploadData(
-                image_urls.get("url", "") if isinstance(image_urls, dict) else "",
-                medium_urls.get("url", "") if isinstance(medium_urls, dict) else "",
-            )
-            if cb:
-                await cb(index + 1)
-            return index, upload_data
-
-    tasks = [
-        asyncio.create_task(upload_single_image(filepath, start_index + i))
-        for i, filepath in enumerate(filepaths)
-    ]
-    batch_results = await asyncio.gather(*tasks)
-    return {index: result for index, result in batch_results}
-
-
 async def api_key_image_upload(
     url: str,
     api_key: str,
@@ -97,12 +110,18 @@ async def api_key_image_upload(
     filepaths: Sequence[Path],
     batch_size: int = 4,
     progress_callback: Callable[[int], Awaitable[None]] | None = None,
+    session: aiohttp.ClientSession | None = None,
+    limiter: AdaptiveHostLimiter | None = None,
 ) -> dict[int, ImageUploadData] | None:
-    """Shared upload flow for image hosts that accept a base64-encoded image
+    """Shared upload flow for image hosts that accept an ``image`` upload
     plus a static API key (either as a ``key`` form field or an
     ``X-API-Key`` header) and respond with
     ``{"data": {"image": {"url": ...}, "medium": {"url": ...}}}``.
 
+    Images are streamed from disk as multipart files. Every image is
+    uploaded concurrently, bounded by the host's ``limiter`` (one starting
+    at ``batch_size`` uploads at once when none is given).
+
     Used by ImgBB, OnlyImage, and Lensdump -- identical shape apart from
     where the API key goes.
     """
@@ -112,20 +131,32 @@ async def api_key_image_upload(
     if not filepaths:
         return {}
     filepaths = sorted(filepaths)
+    limiter = limiter or AdaptiveHostLimiter(initial=batch_size)
 
-    results: dict[int, ImageUploadData] = {}
-    tasks: list[asyncio.Task[dict[int, ImageUploadData]]] = []
-    for i in range(0, len(filepaths), batch_size):
-        batch = filepaths[i : i + batch_size]
-        task = asyncio.create_task(
-            _upload_batch(
-                url, api_key, auth_mode, host_name, batch, i, progress_callback
-            )
+    async def upload_single_image(
+        filepath: Path, index: int
+    ) -> tuple[int, ImageUploadData]:
+        response = await _post_image(
+            url,
+            api_key,
+            auth_mode,
+            filepath,
+            host_name,
+            session=session,
+            limiter=limiter,
         )
-        tasks.append(task)
-
-    batch_results_list = await asyncio.gather(*tasks)
-    for batch_results in batch_results_list:
-        results.update(batch_results)
-
-    return results
+        data = response.get("data", {})
+        image_urls = data.get("image", {}) if isinstance(data, dict) else {}
+        medium_urls = data.get("medium", {}) if isinstance(data, dict) else {}
+        upload_data = ImageUploadData(
+            image_urls.get("url", "") if isinstance(image_urls, dict) else "",
+            medium_urls.get("url", "") if isinstance(medium_urls, dict) else "",
+        )
+        if progress_callback:
+            await progress_callback(index + 1)
+        return index, upload_data
+
+    results = await asyncio.gather(
+        *(upload_single_image(filepath, i) for i, filepath in enumerate(filepaths))
+    )
+    return dict(results)
@@ -3,14 +3,31 @@ from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
+import aiohttp
+
+from src.backend.image_host_uploading.host_limiter import AdaptiveHostLimiter
+from src.enums.image_host import ImageHost
 from src.packages.custom_types import ImageUploadData
 
 ImageUploadProgressCallback = Callable[[int], Awaitable[None]]
 
+# published per image upload limits in bytes, hosts not listed are either
+# self hosted (Chevereto, plugins) or do not publish one
+IMAGE_HOST_SIZE_LIMITS: dict[ImageHost, int] = {
+    ImageHost.IMAGE_BOX: 10 * 1024 * 1024,
+    ImageHost.IMAGE_BB: 32 * 1024 * 1024,
+    ImageHost.PIXHOST: 10 * 1024 * 1024,
+}
+
 
 @dataclass(frozen=True, slots=True)
 class ImageUploadRequest:
-    """Provider-neutral image upload input."""
+    """Provider-neutral image upload input.
+
+    `session` is the host's shared keep-alive session and `limiter` the host's
+    shared concurrency limiter, both injected by `ImageUploader`. Uploaders
+    that are called directly open their own.
+    """
 
     filepaths: Sequence[Path]
     batch_size: int = 4
@@ -21,6 +38,8 @@ class ImageUploadRequest:
     square_thumbs: bool = False
     adult: bool = False
     comments_enabled: bool = False
+    session: aiohttp.ClientSession | None = None
+    limiter: AdaptiveHostLimiter | None = None
 
 
 class BaseImageHostUploader(ABC):
@@ -7,10 +7,16 @@ import re
 
 import aiohttp
 
+from src.backend.image_host_uploading.api_key_upload import image_form_data
 from src.backend.image_host_uploading.base_image_host import (
     BaseImageHostUploader,
     ImageUploadRequest,
 )
+from src.backend.image_host_uploading.host_limiter import (
+    RETRY_STATUSES,
+    AdaptiveHostLimiter,
+)
+from src.backend.image_host_uploading.session_registry import borrow_session
 from src.exceptions import ImageUploadError
 from src.logger.nfo_forge_logger import LOG
 from src.packages.custom_types import ImageUploadData
@@ -121,38 +127,54 @@ async def _upload_image(
     cb: Callable[[int], Awaitable[None]] | None,
     idx: int,
     retries: int = 3,
+    limiter: AdaptiveHostLimiter | None = None,
 ) -> ImageUploadData:
     """Uploads an image with retries and proper error handling."""
+    limiter = limiter or AdaptiveHostLimiter()
     for attempt in range(retries):
+        retry_after = None
+        response_data = None
         try:
-            form_data = aiohttp.FormData()
-            with open(img, "rb") as image_file:
-                form_data.add_field("source", image_file, filename=img.name)
-                form_data.add_field("type", "file")
-                form_data.add_field("action", "upload")
-                form_data.add_field("auth_token", auth_code)
-                form_data.add_field("album_id", album_id)
-                form_data.add_field("nsfw", "0")
-
-                async with session.post(
-                    f"{base_url}/json", data=form_data
-                ) as img_upload:
-                    if img_upload.status == 200:
-                        response_data = await img_upload.json()
-                    elif img_upload.status in {429, 500, 502, 503, 504}:
-                        await asyncio.sleep(2**attempt)
-                        continue
-                    else:
-                        return ImageUploadData(None, None)
-
-                    image_data = response_data.get("image", {})
-                    full_url = image_data.get("url", "")
-                    medium_url = image_data.get("medium", {}).get("url", "")
-                    if cb:
-                        await cb(idx)
-                    return ImageUploadData(full_url, medium_url)
+            async with limiter.slot():
+                async with image_form_data(
+                    "source",
+                    img,
+                    {
+                        "type": "file",
+                        "action": "upload",
+                        "auth_token": auth_code,
+                        "album_id": album_id,
+                        "nsfw": "0",
+                    },
+                ) as form_data:
+                    async with session.post(
+                        f"{base_url}/json", data=form_data
+                    ) as img_upload:
+                        if img_upload.status == 200:
+                            limiter.success()
+                            response_data = await img_upload.json()
+                        elif img_upload.status in RETRY_STATUSES:
+                            retry_after = limiter.throttled(
+                                img_upload.headers.get("Retry-After")
+                            )
+                        else:
+                            return ImageUploadData(None, None)
+
+            if response_data is None:
+                # the limiter already holds every upload back for a Retry-After
+                if not retry_after:
+                    await asyncio.sleep(2**attempt)
+                continue
+
+            image_data = response_data.get("image", {})
+            full_url = image_data.get("url", "")
+            medium_url = image_data.get("medium", {}).get("url", "")
+            if cb:
+                await cb(idx)
+            return ImageUploadData(full_url, medium_url)
 
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            limiter.throttled()
             if attempt < retries - 1:
                 await asyncio.sleep(2**attempt)
             else:
@@ -170,22 +192,25 @@ async def _upload_images(
     auth_code: str,
     album_id: str,
     filepaths: Sequence[PathLike[str] | Path | str],
-    batch_size: int,
+    limiter: AdaptiveHostLimiter,
     cb: Callable[[int], Awaitable[None]] | None,
 ) -> dict[int, ImageUploadData]:
-    tasks = [
-        asyncio.create_task(
+    results = await asyncio.gather(
+        *(
             _upload_image(
-                session, base_url, auth_code, album_id, Path(img), cb, idx + 1
+                session,
+                base_url,
+                auth_code,
+                album_id,
+                Path(img),
+                cb,
+                idx + 1,
+                limiter=limiter,
             )
+            for idx, img in enumerate(filepaths)
         )
-        for idx, img in enumerate(filepaths)
-    ]
-    results = {}
-    for i in range(0, len(tasks), batch_size):
-        batch_results = await asyncio.gather(*tasks[i : i + batch_size])
-        results.update({i + j: batch_results[j] for j in range(len(batch_results))})
-    return results
+    )
+    return dict(enumerate(results))
 
 
 async def chevereto_v3_upload(
@@ -196,11 +221,13 @@ async def chevereto_v3_upload(
     batch_size: int = 4,
     album_name: str | None = None,
     progress_callback: Callable[[int], Awaitable[None]] | None = None,
+    session: aiohttp.ClientSession | None = None,
+    limiter: AdaptiveHostLimiter | None = None,
 ) -> dict[int, ImageUploadData]:
     base_url = _clean_url(base_url)
     filepaths = sorted(filepaths)
 
-    async with aiohttp.ClientSession() as session:
+    async with borrow_session(session) as session:
         auth_code = await _login_to_chevereto_v3(session, base_url, user, password)
         if not auth_code:
             raise ImageUploadError("Failed to log in to Chevereto v3")
@@ -220,7 +247,7 @@ async def chevereto_v3_upload(
             auth_code,
             album_id,
             filepaths,
-            batch_size,
+            limiter or AdaptiveHostLimiter(initial=batch_size),
             progress_callback,
         )
         return uploaded_images
@@ -247,6 +274,8 @@ class CheveretoV3Uploader(BaseImageHostUploader):
                 batch_size=request.batch_size,
                 album_name=request.album_name,
                 progress_callback=request.progress_callback,
+                session=request.session,
+                limiter=request.limiter,
             )
             or {}
         )
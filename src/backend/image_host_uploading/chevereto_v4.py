@@ -1,15 +1,20 @@
 import asyncio
-import base64
 from collections.abc import Awaitable, Callable, Sequence
 from pathlib import Path
 from typing import Any, cast
 
 import aiohttp
 
+from src.backend.image_host_uploading.api_key_upload import image_form_data
 from src.backend.image_host_uploading.base_image_host import (
     BaseImageHostUploader,
     ImageUploadRequest,
 )
+from src.backend.image_host_uploading.host_limiter import (
+    RETRY_STATUSES,
+    AdaptiveHostLimiter,
+)
+from src.backend.image_host_uploading.session_registry import borrow_session
 from src.exceptions import ImageUploadError
 from src.logger.nfo_forge_logger import LOG
 from src.packages.custom_types import ImageUploadData
@@ -27,22 +32,43 @@ def _create_api_url(image_url: str) -> str:
 
 
 async def upload_image(
-    url: str, api_key: str, image_data: str, retries: int = 3
+    url: str,
+    api_key: str,
+    image: Path,
+    retries: int = 3,
+    session: aiohttp.ClientSession | None = None,
+    limiter: AdaptiveHostLimiter | None = None,
 ) -> dict[str, Any]:
-    """Upload a single image to the specified URL using the provided API key with retries."""
-    async with aiohttp.ClientSession() as session:
+    """
+    Upload a single image to the specified URL using the provided API key with retries.
+
+    `image` is streamed from disk as a multipart file. Each attempt holds a slot
+    of the host's `limiter`.
+    """
+    limiter = limiter or AdaptiveHostLimiter()
+    async with borrow_session(session) as session:
         for attempt in range(retries):
+            retry_after = None
             try:
-                async with session.post(
-                    url, data={"key": api_key, "image": image_data}
-                ) as response:
-                    if response.status == 200:
-                        return cast(dict[str, Any], await response.json())
-                    elif response.status in {429, 500, 502, 503, 504}:
-                        await asyncio.sleep(2**attempt)
-                    else:
-                        break
+                async with limiter.slot():
+                    async with image_form_data(
+                        "image", image, {"key": api_key}
+                    ) as data:
+                        async with session.post(url, data=data) as response:
+                            if response.status == 200:
+                                limiter.success()
+                                return cast(dict[str, Any], await response.json())
+                            elif response.status not in RETRY_STATUSES:
+                                break
+                            retry_after = limiter.throttled(
+                                response.headers.get("Retry-After")
+                            )
+                # a retryable status, the request body is rebuilt for the next attempt
+                # and the limiter already holds every upload back for a Retry-After
+                if not retry_after:
+                    await asyncio.sleep(2**attempt)
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                limiter.throttled()
                 if attempt < retries - 1:
                     await asyncio.sleep(2**attempt)
                 else:
@@ -54,38 +80,22 @@ async def upload_image(
     return {}
 
 
-async def _chevereto_V4_upload_batch(
-    api_key: str,
-    url: str,
-    batch: Sequence[Path],
-    start_index: int,
-    cb: Callable[[int], Awaitable[None]] | None = None,
-) -> dict[int, ImageUploadData]:
-    """Upload a batch of images to Chevereto V4."""
-    batch_results = {}
-
-    for i, filepath in enumerate(batch):
-        with open(filepath, "rb") as image_file:
-            image_data = base64.b64encode(image_file.read()).decode("utf-8")
-            response = await upload_image(url, api_key, image_data)
-            data = response.get("data", {})
-            batch_results[start_index + i] = ImageUploadData(
-                data.get("url", ""), data.get("medium", {}).get("url", "")
-            )
-            if cb:
-                await cb((start_index + i) + 1)
-
-    return batch_results
-
-
 async def chevereto_v4_upload(
     api_key: str,
     url: str,
     filepaths: Sequence[Path],
     batch_size: int = 4,
     progress_callback: Callable[[int], Awaitable[None]] | None = None,
+    session: aiohttp.ClientSession | None = None,
+    limiter: AdaptiveHostLimiter | None = None,
 ) -> dict[int, ImageUploadData] | None:
-    """Upload images to Chevereto V4 in batches."""
+    """
+    Upload images to Chevereto V4.
+
+    Images are streamed from disk as multipart files. Every image is uploaded
+    concurrently, bounded by the host's `limiter` (one starting at `batch_size`
+    uploads at once when none is given).
+    """
     if not api_key:
         raise ImageUploadError("You are required to have an API key")
 
@@ -94,21 +104,26 @@ async def chevereto_v4_upload(
     filepaths = sorted(filepaths)
 
     url = _create_api_url(url)
-    total_files = len(filepaths)
-    results = {}
-
-    tasks = []
-    for i in range(0, total_files, batch_size):
-        batch = filepaths[i : i + batch_size]
-        task = _chevereto_V4_upload_batch(api_key, url, batch, i, progress_callback)
-        tasks.append(task)
+    limiter = limiter or AdaptiveHostLimiter(initial=batch_size)
 
-    batch_results_list = await asyncio.gather(*tasks)
-
-    for batch_results in batch_results_list:
-        results.update(batch_results)
+    async def upload_single_image(
+        filepath: Path, index: int
+    ) -> tuple[int, ImageUploadData]:
+        response = await upload_image(
+            url, api_key, filepath, session=session, limiter=limiter
+        )
+        data = response.get("data", {})
+        upload_data = ImageUploadData(
+            data.get("url", ""), data.get("medium", {}).get("url", "")
+        )
+        if progress_callback:
+            await progress_callback(index + 1)
+        return index, upload_data
 
-    return results
+    results = await asyncio.gather(
+        *(upload_single_image(filepath, i) for i, filepath in enumerate(filepaths))
+    )
+    return dict(results)
 
 
 class CheveretoV4Uploader(BaseImageHostUploader):
@@ -129,6 +144,8 @@ class CheveretoV4Uploader(BaseImageHostUploader):
                 filepaths=request.filepaths,
                 batch_size=request.batch_size,
                 progress_callback=request.progress_callback,
+                session=request.session,
+                limiter=request.limiter,
             )
             or {}
         )
@@ -0,0 +1,115 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from src.backend.image_host_uploading.session_registry import (
+    DEFAULT_HOST_CONNECTION_LIMIT,
+)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_AFTER = 120.0
+
+
+class AdaptiveHostLimiter:
+    """Adaptive (AIMD) limit on concurrent uploads to a single image host.
+
+    Every upload for a host takes a slot from the same limiter. Each success
+    grows the limit by roughly one slot per window of uploads (additive
+    increase), each push back from the host halves it (multiplicative
+    decrease). A `Retry-After` sent with the push back pauses every upload to
+    the host until it has passed, rather than each task guessing its own
+    backoff.
+
+    The limit never grows past `maximum`, which should match the host
+    session's connection limit: an upload above it would only queue in the
+    connector while counting as in flight here.
+    """
+
+    __slots__ = ("minimum", "maximum", "_limit", "_in_flight", "_resume_at", "_cond")
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = DEFAULT_HOST_CONNECTION_LIMIT,
+    ) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self._limit = float(min(max(initial, self.minimum), self.maximum))
+        self._in_flight = 0
+        self._resume_at = 0.0
+        self._cond: asyncio.Condition | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current number of uploads allowed at once."""
+        return int(self._limit)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free slot (and for any Retry-After pause) and hold it."""
+        cond = self._condition()
+        loop = asyncio.get_running_loop()
+        async with cond:
+            while True:
+                pause = self._resume_at - loop.time()
+                if pause > 0:
+                    try:
+                        await asyncio.wait_for(cond.wait(), pause)
+                    except asyncio.TimeoutError:
+                        pass
+                elif self._in_flight < self.limit:
+                    break
+                else:
+                    await cond.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with cond:
+                self._in_flight -= 1
+                cond.notify_all()
+
+    def success(self) -> None:
+        """Record an accepted upload, growing the limit."""
+        self._limit = min(float(self.maximum), self._limit + 1 / self._limit)
+
+    def throttled(self, retry_after: str | None = None) -> float | None:
+        """
+        Record push back from the host, shrinking the limit.
+
+        Returns the parsed `Retry-After` delay in seconds, when one was sent, after
+        pausing every upload to the host for that long.
+        """
+        self._limit = max(float(self.minimum), self._limit / 2)
+        delay = parse_retry_after(retry_after)
+        if delay:
+            self._resume_at = max(
+                self._resume_at, asyncio.get_running_loop().time() + delay
+            )
+        return delay
+
+    def _condition(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
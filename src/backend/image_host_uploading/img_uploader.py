@@ -7,6 +7,10 @@ from src.backend.image_host_uploading.base_image_host import (
     BaseImageHostUploader,
     ImageUploadRequest,
 )
+from src.backend.image_host_uploading.host_limiter import AdaptiveHostLimiter
+from src.backend.image_host_uploading.session_registry import (
+    ImageHostSessionRegistry,
+)
 from src.exceptions import ImageUploadError
 from src.packages.custom_types import ImageUploadData
 
@@ -29,22 +33,31 @@ def assert_all_images_uploaded(
 
 
 class ImageUploader:
-    """Manages image uploads across multiple hosts with progress tracking."""
+    """Manages image uploads across multiple hosts with progress tracking.
+
+    Every job for a host is handed that host's shared session from an
+    `ImageHostSessionRegistry`, which is closed once `start_jobs` finishes,
+    and that host's `AdaptiveHostLimiter`, so all uploads to a host share one
+    adaptive concurrency limit and back off together.
+    """
 
     def __init__(
         self,
         progress_signal: Callable[[str, int, int], None] | None = None,
         delete_job_as_completed: bool = False,
+        sessions: ImageHostSessionRegistry | None = None,
     ) -> None:
         self.progress_signal = progress_signal
         self.delete_job_as_completed = delete_job_as_completed
+        self.sessions = sessions or ImageHostSessionRegistry()
         self._lock = asyncio.Lock()
         self._jobs: dict[
             str,
-            tuple[BaseImageHostUploader, ImageUploadRequest],
+            tuple[str, BaseImageHostUploader, ImageUploadRequest],
         ] = {}
         self._progress_trackers: dict[str, dict[str, int]] = {}
         self._uploaders: dict[str, BaseImageHostUploader] = {}
+        self._limiters: dict[str, AdaptiveHostLimiter] = {}
 
     def register_uploader(
         self, host_name: str, uploader: BaseImageHostUploader
@@ -69,7 +82,7 @@ class ImageUploader:
             "remaining": total_files,
         }
 
-        self._jobs[job_id] = (self._uploaders[host_name], request)
+        self._jobs[job_id] = (host_name, self._uploaders[host_name], request)
 
         return job_id
 
@@ -103,21 +116,36 @@ class ImageUploader:
             if self.delete_job_as_completed and remaining == 0:
                 del self._progress_trackers[job_id]
 
+    def limiter(self, host_name: str, initial: int = 4) -> AdaptiveHostLimiter:
+        """Return the limiter shared by every upload to `host_name`."""
+        limiter = self._limiters.get(host_name)
+        if limiter is None:
+            # grown past the session's connection limit, uploads would only
+            # queue for a connection
+            limiter = self._limiters[host_name] = AdaptiveHostLimiter(
+                initial=initial, maximum=self.sessions.connection_limit
+            )
+        return limiter
+
     async def start_jobs(self) -> dict[str, dict[int, ImageUploadData]]:
         """Starts all registered jobs and collects results."""
         results: dict[str, dict[int, ImageUploadData]] = {}
 
         tasks = [
-            self._run_job(job_id, uploader, request, results)
-            for job_id, (uploader, request) in self._jobs.items()
+            self._run_job(job_id, host_name, uploader, request, results)
+            for job_id, (host_name, uploader, request) in self._jobs.items()
         ]
 
-        await asyncio.gather(*tasks)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await self.sessions.close()
         return results
 
     async def _run_job(
         self,
         job_id: str,
+        host_name: str,
         uploader: BaseImageHostUploader,
         request: ImageUploadRequest,
         results: dict[str, dict[int, ImageUploadData]],
@@ -128,6 +156,11 @@ class ImageUploader:
             await self.upload_progress(job_id)
 
         upload_results = await uploader.upload(
-            replace(request, progress_callback=progress_callback)
+            replace(
+                request,
+                progress_callback=progress_callback,
+                session=request.session or self.sessions.get(host_name),
+                limiter=request.limiter or self.limiter(host_name, request.batch_size),
+            )
         )
         results[job_id] = upload_results
@@ -1,11 +1,14 @@
 from collections.abc import Awaitable, Callable, Sequence
 from pathlib import Path
 
+import aiohttp
+
 from src.backend.image_host_uploading.api_key_upload import api_key_image_upload
 from src.backend.image_host_uploading.base_image_host import (
     BaseImageHostUploader,
     ImageUploadRequest,
 )
+from src.backend.image_host_uploading.host_limiter import AdaptiveHostLimiter
 from src.packages.custom_types import ImageUploadData
 
 URL = "https://api.imgbb.com/1/upload"
@@ -16,6 +19,8 @@ async def imgbb_upload(
     filepaths: Sequence[Path],
     batch_size: int = 4,
     progress_callback: Callable[[int], Awaitable[None]] | None = None,
+    session: aiohttp.ClientSession | None = None,
+    limiter: AdaptiveHostLimiter | None = None,
 ) -> dict[int, ImageUploadData] | None:
     return await api_key_image_upload(
         url=URL,
@@ -25,6 +30,8 @@ async def imgbb_upload(
         filepaths=filepaths,
         batch_size=batch_size,
         progress_callback=progress_callback,
+        session=session,
+        limiter=limiter,
     )
 
 
@@ -44,6 +51,8 @@ class ImageBBUploader(BaseImageHostUploader):
                 filepaths=request.filepaths,
                 batch_size=request.batch_size,
                 progress_callback=request.progress_callback,
+                session=request.session,
+                limiter=request.limiter,
             )
             or {}
         )
@@ -5,10 +5,16 @@ from typing import Any, cast
 
 import aiohttp
 
+from src.backend.image_host_uploading.api_key_upload import image_form_data
 from src.backend.image_host_uploading.base_image_host import (
     BaseImageHostUploader,
     ImageUploadRequest,
 )
+from src.backend.image_host_uploading.host_limiter import (
+    RETRY_STATUSES,
+    AdaptiveHostLimiter,
+)
+from src.backend.image_host_uploading.session_registry import borrow_session
 from src.logger.nfo_forge_logger import LOG
 from src.packages.custom_types import ImageUploadData
 
@@ -27,80 +33,83 @@ async def _upload_image(
     cb: Callable[[int], Awaitable[None]] | None,
     idx: int,
     retries: int = 3,
+    session: aiohttp.ClientSession | None = None,
+    limiter: AdaptiveHostLimiter | None = None,
 ) -> ImageUploadData:
     """Uploads a single image with retries and proper error handling. Pixhost
     requires no authentication -- there is no API key to attach."""
-    for attempt in range(retries):
-        try:
-            async with aiohttp.ClientSession() as session:
-                with open(filepath, "rb") as image_file:
-                    form_data = aiohttp.FormData()
-                    form_data.add_field("img", image_file, filename=filepath.name)
-                    form_data.add_field("content_type", "0")
-                    form_data.add_field("max_th_size", "350")
-
-                    async with session.post(URL, data=form_data) as response:
-                        if response.status == 200:
-                            response_data = cast(dict[str, Any], await response.json())
-                        elif response.status in {429, 500, 502, 503, 504}:
-                            await asyncio.sleep(2**attempt)
-                            continue
-                        else:
-                            return ImageUploadData(None, None)
-
-                    thumbnail_url = response_data.get("th_url", "")
-                    if not thumbnail_url:
-                        return ImageUploadData(None, None)
-                    if cb:
-                        await cb(idx)
-                    return ImageUploadData(_full_size_url(thumbnail_url), thumbnail_url)
-
-        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            if attempt < retries - 1:
-                await asyncio.sleep(2**attempt)
-            else:
-                LOG.warning(
-                    LOG.LOG_SOURCE.BE,
-                    f"Pixhost: upload failed after {retries} attempts: {e}",
-                )
+    limiter = limiter or AdaptiveHostLimiter()
+    async with borrow_session(session) as upload_session:
+        for attempt in range(retries):
+            retry_after = None
+            response_data: dict[str, Any] | None = None
+            try:
+                async with limiter.slot():
+                    async with image_form_data(
+                        "img", filepath, {"content_type": "0", "max_th_size": "350"}
+                    ) as form_data:
+                        async with upload_session.post(URL, data=form_data) as response:
+                            if response.status == 200:
+                                limiter.success()
+                                response_data = cast(
+                                    dict[str, Any], await response.json()
+                                )
+                            elif response.status in RETRY_STATUSES:
+                                retry_after = limiter.throttled(
+                                    response.headers.get("Retry-After")
+                                )
+                            else:
+                                return ImageUploadData(None, None)
+
+                if response_data is None:
+                    # the limiter already holds every upload back for a Retry-After
+                    if not retry_after:
+                        await asyncio.sleep(2**attempt)
+                    continue
+
+                thumbnail_url = response_data.get("th_url", "")
+                if not thumbnail_url:
+                    return ImageUploadData(None, None)
+                if cb:
+                    await cb(idx)
+                return ImageUploadData(_full_size_url(thumbnail_url), thumbnail_url)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                limiter.throttled()
+                if attempt < retries - 1:
+                    await asyncio.sleep(2**attempt)
+                else:
+                    LOG.warning(
+                        LOG.LOG_SOURCE.BE,
+                        f"Pixhost: upload failed after {retries} attempts: {e}",
+                    )
 
     return ImageUploadData(None, None)
 
 
-async def _upload_batch(
-    filepaths: Sequence[Path],
-    start_index: int,
-    cb: Callable[[int], Awaitable[None]] | None,
-) -> dict[int, ImageUploadData]:
-    tasks = [
-        asyncio.create_task(_upload_image(filepath, cb, start_index + i + 1))
-        for i, filepath in enumerate(filepaths)
-    ]
-    results = await asyncio.gather(*tasks)
-    return {start_index + i: result for i, result in enumerate(results)}
-
-
 async def pixhost_upload(
     filepaths: Sequence[Path],
     batch_size: int = 4,
     progress_callback: Callable[[int], Awaitable[None]] | None = None,
+    session: aiohttp.ClientSession | None = None,
+    limiter: AdaptiveHostLimiter | None = None,
 ) -> dict[int, ImageUploadData] | None:
+    """Upload every image concurrently, bounded by the host's `limiter` (one
+    starting at `batch_size` uploads at once when none is given)."""
     if not filepaths:
         return {}
     filepaths = sorted(filepaths)
+    limiter = limiter or AdaptiveHostLimiter(initial=batch_size)
 
-    results: dict[int, ImageUploadData] = {}
-    tasks: list[asyncio.Task[dict[int, ImageUploadData]]] = []
-    for i in range(0, len(filepaths), batch_size):
-        batch = filepaths[i : i + batch_size]
-        task = asyncio.create_task(_upload_batch(batch, i, progress_callback))
-        tasks.append(task)
-
-    batch_results_list = await asyncio.gather(*tasks)
-    for batch_results in batch_results_list:
-        results.update(batch_results)
-
-    return results
+    results = await asyncio.gather(
+        *(
+            _upload_image(
+                filepath, progress_callback, i + 1, session=session, limiter=limiter
+            )
+            for i, filepath in enumerate(filepaths)
+        )
+    )
+    return dict(enumerate(results))
 
 
 class PixhostUploader(BaseImageHostUploader):
@@ -115,6 +124,8 @@ class PixhostUploader(BaseImageHostUploader):
                 filepaths=request.filepaths,
                 batch_size=request.batch_size,
                 progress_callback=request.progress_callback,
+                session=request.session,
+                limiter=request.limiter,
             )
             or {}
         )
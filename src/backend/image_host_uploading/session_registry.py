@@ -0,0 +1,63 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import aiohttp
+
+DEFAULT_HOST_CONNECTION_LIMIT = 8
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+
+
+class ImageHostSessionRegistry:
+    """Owns one keep-alive `aiohttp.ClientSession` per image host.
+
+    Uploads for the same host share a session, and with it a pool of open
+    connections, instead of paying a new TCP/TLS handshake for every image.
+    Each host gets its own connector so the connection limit applies per host.
+    Sessions are created lazily on first use (they must be created inside the
+    running event loop) and are all closed by `close`.
+    """
+
+    __slots__ = ("connection_limit", "keepalive_timeout", "_sessions")
+
+    def __init__(
+        self,
+        connection_limit: int = DEFAULT_HOST_CONNECTION_LIMIT,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ) -> None:
+        self.connection_limit = connection_limit
+        self.keepalive_timeout = keepalive_timeout
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+
+    def get(self, host_name: str) -> aiohttp.ClientSession:
+        """Return the shared session for `host_name`, creating it if needed."""
+        session = self._sessions.get(host_name)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.connection_limit,
+                    limit_per_host=self.connection_limit,
+                    keepalive_timeout=self.keepalive_timeout,
+                )
+            )
+            self._sessions[host_name] = session
+        return session
+
+    async def close(self) -> None:
+        """Close every session (and its open connections)."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+
+@asynccontextmanager
+async def borrow_session(
+    session: aiohttp.ClientSession | None,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield the injected shared session, or a private one closed on exit."""
+    if session is not None:
+        yield session
+        return
+    async with aiohttp.ClientSession() as own_session:
+        yield own_session
@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from os import cpu_count
 from pathlib import Path
 import random
 import re
 import subprocess
-from typing import Any
+from threading import Event, Lock
+from typing import Any, NamedTuple, Protocol
 
 from pymediainfo import MediaInfo
 from PySide6.QtCore import SignalInstance
 
+from src.backend.utils.crop_detect_cache import CropDetectCache
 from src.backend.utils.frameforge_index_cache import FrameForgeIndexCache
 from src.backend.utils.images import (
     compare_res,
@@ -27,6 +32,7 @@ from src.enums.cropping import Cropping
 from src.enums.image_plugin import ImagePlugin
 from src.enums.indexer import Indexer
 from src.enums.subtitles import SubtitleAlignment
+from src.exceptions import MediaFrameCountError
 from src.logger.nfo_forge_logger import LOG
 from src.packages.crop_detect import CropDetect
 from src.packages.custom_types import AdvancedResize, CropValues, SubNames
@@ -35,6 +41,37 @@ COMPARISON_FONT_PATH = (
     RUNTIME_DIR / "fonts" / "Montserrat" / "static" / "Montserrat-Medium.ttf"
 )
 
+# default share of CPU threads used for concurrent ffmpeg frame extraction
+DEFAULT_EXTRACTION_CPU_FRACTION = 0.25
+
+# per frame ffmpeg timeout in seconds
+FRAME_EXTRACTION_TIMEOUT = 30
+
+# inputs (each its own seek and decoder) opened by one single pass invocation
+SINGLE_PASS_MAX_INPUTS = 4
+
+# ceiling on one single pass invocation, so a hang costs little before the per
+# frame fallback takes over
+SINGLE_PASS_TIMEOUT = FRAME_EXTRACTION_TIMEOUT * 2
+
+# crop detection samples (segments * frames)
+CROP_DETECT_SEGMENTS = 15
+CROP_DETECT_FRAMES = 4
+
+
+def _format_ffmpeg_timestamp(seconds: float) -> str:
+    """Format seconds (clamped to zero) as an FFmpeg HH:MM:SS.mmm timestamp."""
+    seconds = max(0, seconds)
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds % 60:06.3f}"
+
+
+def get_extraction_workers(fraction: float = DEFAULT_EXTRACTION_CPU_FRACTION) -> int:
+    """Number of concurrent ffmpeg frame extractions for a share of CPU threads."""
+    total_cores = cpu_count() or 2
+    return max(1, int(total_cores * fraction))
+
 
 def _quote_ffmpeg_filter_value(value: str) -> str:
     """Quote a value for FFmpeg's filter parser, not a command shell."""
@@ -52,13 +89,19 @@ def _build_drawtext_filter(
     border_color: str,
     x: str,
     y: str,
+    expansion: bool = False,
 ) -> str:
-    """Escape drawtext filter for FFMPEG."""
+    """
+    Escape drawtext filter for FFMPEG.
+
+    Text expansion is disabled unless requested, it should only be enabled for text
+    built internally (e.g. a `%{eif:n+...}` frame counter), never for user input.
+    """
     return (
         f"drawtext=fontfile="
         f"{_quote_ffmpeg_filter_value(COMPARISON_FONT_PATH.as_posix())}:"
         f"text={_quote_ffmpeg_filter_value(text)}:"
-        "expansion=none:"
+        f"expansion={'normal' if expansion else 'none'}:"
         f"fontsize={font_size}:"
         f"fontcolor={_quote_ffmpeg_filter_value(font_color)}:"
         f"bordercolor={_quote_ffmpeg_filter_value(border_color)}:"
@@ -66,11 +109,178 @@ def _build_drawtext_filter(
     )
 
 
+class ProgressSignal(Protocol):
+    """Anything that accepts progress as `emit(message, progress)`."""
+
+    def emit(self, message: str, progress: float, /) -> None: ...
+
+
+class MergedProgressSignal:
+    """
+    Merge progress from pipelines running concurrently into one signal stream.
+
+    Each pipeline reports its own 0-100 progress through `pipeline(name)`, the wrapped
+    signal receives the pipeline's message (prefixed with its name) alongside the
+    average progress of every pipeline so the progress bar only ever moves forward.
+    """
+
+    def __init__(self, signal: ProgressSignal, names: Sequence[str]) -> None:
+        self._signal = signal
+        self._progress = dict.fromkeys(names, 0.0)
+        self._lock = Lock()
+
+    def pipeline(self, name: str) -> "_PipelineProgress":
+        if name not in self._progress:
+            raise KeyError(f"Unknown pipeline: {name}")
+        return _PipelineProgress(self, name)
+
+    def _emit(self, name: str, message: str, progress: float) -> None:
+        with self._lock:
+            self._progress[name] = max(self._progress[name], progress)
+            total = sum(self._progress.values()) / len(self._progress)
+            self._signal.emit(f"[{name}] {message.lstrip()}", total)
+
+
+class _PipelineProgress:
+    def __init__(self, merger: MergedProgressSignal, name: str) -> None:
+        self._merger = merger
+        self._name = name
+
+    def emit(self, message: str, progress: float) -> None:
+        self._merger._emit(self._name, message, progress)
+
+
+class FrameSegment(NamedTuple):
+    """A run of consecutive frames decoded after a single input seek."""
+
+    timestamp: str
+    vf_filter: str
+    output_files: tuple[str, ...]
+
+
 class ImageGeneration(ABC):
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        cpu_fraction: float = DEFAULT_EXTRACTION_CPU_FRACTION,
+    ) -> None:
+        """
+        Parameters:
+            max_workers (Optional[int]): Maximum concurrent ffmpeg frame extractions,
+                derived from `cpu_fraction` when not provided.
+            cpu_fraction (float): Share of CPU threads used for frame extraction.
+        """
+        self.max_workers = max_workers or get_extraction_workers(cpu_fraction)
+
     @abstractmethod
     def generate_images(self, **kwargs: Any) -> int:
         raise NotImplementedError()
 
+    def run_frame_commands(
+        self,
+        commands: Sequence[tuple[str, list[str]]],
+        total_images: int,
+        signal: ProgressSignal,
+        max_workers: int | None = None,
+    ) -> int:
+        """
+        Run independent single frame ffmpeg commands across a bounded worker pool.
+
+        Progress is emitted from the calling thread as each frame is extracted, so
+        the signal still reports a steadily increasing count regardless of which
+        frame finishes first. Failed frames are not counted, so progress only
+        reaches 100% when every frame was extracted.
+
+        Parameters:
+            commands (Sequence[tuple[str, list[str]]]): (timestamp, command) pairs.
+            total_images (int): Total images used to calculate progress.
+            signal (ProgressSignal): Progress signal.
+            max_workers (Optional[int]): Overrides the worker limit for this call.
+
+        Returns:
+            int: Number of frames extracted successfully.
+        """
+        if not commands:
+            return 0
+
+        success_count = 0
+        workers = max(1, min(max_workers or self.max_workers, len(commands)))
+        LOG.debug(
+            LOG.LOG_SOURCE.BE,
+            f"Extracting {len(commands)} frame(s) with {workers} worker(s)",
+        )
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ffmpeg-frame"
+        ) as executor:
+            futures = [
+                executor.submit(self._run_frame_command, command, timestamp)
+                for timestamp, command in commands
+            ]
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+                    progress = success_count / total_images * 100
+                    signal.emit(
+                        f"Extracted frame {success_count}/{total_images}", progress
+                    )
+
+        return success_count
+
+    def detect_crop(
+        self,
+        ffmpeg_path: Path,
+        source_input: Path,
+        source_mi_obj: MediaInfo,
+        cache_root: Path | None = None,
+    ) -> str | None:
+        """Detect the source crop, reusing the cached result of an unchanged source."""
+        try:
+            duration = get_total_frames(source_mi_obj) / get_frame_rate(source_mi_obj)
+        except (MediaFrameCountError, IndexError, ValueError, ZeroDivisionError):
+            # without a duration crop detection scans from the start of the file
+            duration = None
+
+        return CropDetectCache(cache_root).get_or_detect(
+            source_input,
+            CROP_DETECT_SEGMENTS,
+            CROP_DETECT_FRAMES,
+            lambda: CropDetect(
+                ffmpeg_path,
+                source_input,
+                CROP_DETECT_SEGMENTS,
+                CROP_DETECT_FRAMES,
+                duration=duration,
+                max_workers=self.max_workers,
+            ).get_result(),
+            method=CropDetect.method(duration),
+        )
+
+    @staticmethod
+    def _run_frame_command(command: list[str], timestamp: str) -> bool:
+        """Run one single frame ffmpeg command, logging any failure."""
+        try:
+            result = subprocess.run(  # noqa: S603 - list argv, no shell; ffmpeg path is the configured binary, return code checked
+                command,
+                capture_output=True,
+                text=True,
+                timeout=FRAME_EXTRACTION_TIMEOUT,
+                creationflags=get_subprocess_creation_flags(),
+            )
+        except subprocess.TimeoutExpired:
+            LOG.error(LOG.LOG_SOURCE.BE, f"Timeout extracting frame at {timestamp}")
+            return False
+        except Exception as e:
+            LOG.error(LOG.LOG_SOURCE.BE, f"Error extracting frame at {timestamp}: {e}")
+            return False
+
+        if result.returncode != 0:
+            LOG.error(
+                LOG.LOG_SOURCE.BE,
+                f"Failed to extract frame at {timestamp}: {result.stderr}",
+            )
+            return False
+        return True
+
     def run_ffmpeg_command(
         self, command: list[str], total_images: int, signal: "SignalInstance"
     ) -> int:
@@ -220,8 +430,8 @@ class BasicImageGeneration(ImageGeneration):
 
         vf_filter = ",".join(filters) if filters else "copy"
 
-        # extract each frame individually using seeks
-        success_count = 0
+        # build one seek command per frame, extracted concurrently
+        commands = []
         for i, timestamp in enumerate(timestamps):
             output_file = output_pattern.replace("%02d", f"{i + 1:02d}")
 
@@ -244,39 +454,29 @@ class BasicImageGeneration(ImageGeneration):
                 "error",
                 "-hide_banner",
             ]
+            commands.append((timestamp, command))
 
-            # run the command
-            try:
-                result = subprocess.run(  # noqa: S603 - list argv, no shell; ffmpeg path is the configured binary, return code checked
-                    command,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    creationflags=get_subprocess_creation_flags(),
-                )
-
-                if result.returncode == 0:
-                    success_count += 1
-                    # emit progress
-                    progress = (i + 1) / total_images * 100
-                    signal.emit(f"Extracted frame {i + 1}/{total_images}", progress)
-                else:
-                    LOG.error(
-                        LOG.LOG_SOURCE.BE,
-                        f"Failed to extract frame at {timestamp}: {result.stderr}",
-                    )
-
-            except subprocess.TimeoutExpired:
-                LOG.error(LOG.LOG_SOURCE.BE, f"Timeout extracting frame at {timestamp}")
-            except Exception as e:
-                LOG.error(
-                    LOG.LOG_SOURCE.BE, f"Error extracting frame at {timestamp}: {e}"
-                )
-
+        success_count = self.run_frame_commands(commands, total_images, signal)
         return 0 if success_count == total_images else 1
 
 
 class ComparisonImageGeneration(ImageGeneration):
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        cpu_fraction: float = DEFAULT_EXTRACTION_CPU_FRACTION,
+        single_pass: bool = True,
+    ) -> None:
+        """
+        Parameters:
+            max_workers (Optional[int]): Maximum concurrent ffmpeg frame extractions.
+            cpu_fraction (float): Share of CPU threads used for frame extraction.
+            single_pass (bool): Extract the frames of an input a few seeks per ffmpeg
+                invocation, falling back to one invocation per frame if rejected.
+        """
+        super().__init__(max_workers=max_workers, cpu_fraction=cpu_fraction)
+        self.single_pass = single_pass
+
     def generate_images(self, **kwargs: Any) -> int:
         return self.comparison_image_generation(**kwargs)
 
@@ -298,6 +498,7 @@ class ComparisonImageGeneration(ImageGeneration):
         ffmpeg_path: Path,
         signal: SignalInstance,
         re_sync: int = 0,
+        cache_root: Path | None = None,
     ) -> int:
         directories = create_directories(output_directory, sync_dir=True)
         img_comparison = directories[0]
@@ -336,7 +537,9 @@ class ComparisonImageGeneration(ImageGeneration):
                     auto_crop_detect_msg,
                     0,
                 )
-                detect_crop = CropDetect(ffmpeg_path, source_input, 15, 4).get_result()
+                detect_crop = self.detect_crop(
+                    ffmpeg_path, source_input, source_file_mi_obj, cache_root
+                )
                 crop_detection_complete_msg = (
                     f"Crop detection complete ({detect_crop})."
                 )
@@ -370,10 +573,6 @@ class ComparisonImageGeneration(ImageGeneration):
                     LOG.info(LOG.LOG_SOURCE.BE, detect_crop_msg)
                     signal.emit(detect_crop_msg, 0)
 
-        generate_enc_img_msg = "\nGenerating encode images."
-        LOG.info(LOG.LOG_SOURCE.BE, generate_enc_img_msg)
-        signal.emit(generate_enc_img_msg, 0)
-
         frame_rate = get_frame_rate(media_file_mi_obj)
         random_offset = random.randint(0, (int(frame_rate) * 10))  # noqa: S311 - jitters a comparison screenshot timestamp, not security sensitive
 
@@ -389,44 +588,58 @@ class ComparisonImageGeneration(ImageGeneration):
             LOG.info(LOG.LOG_SOURCE.BE, re_sync_msg)
             signal.emit(re_sync_msg, 0)
 
-        generate_encode_images = self.generate_comp_frames(
-            input_video=media_input,
-            output_pattern=enc_output,
-            text_overlay=sub_names.encode if sub_names else None,
-            sub_size=sub_size,
-            mi_object=media_file_mi_obj,
-            total_images=total_images,
-            trim=trim,
-            random_offset=random_offset,
-            frame_rate=frame_rate,
-            subtitle_color=subtitle_color,
-            subtitle_outline_color=subtitle_outline_color,
-            ffmpeg=ffmpeg_path,
-            signal=signal,
-        )
-
-        generate_src_img_msg = "\nGenerating source images."
-        LOG.info(LOG.LOG_SOURCE.BE, generate_src_img_msg)
-        signal.emit(generate_src_img_msg, 0)
-        generate_source_images = self.generate_comp_frames(
-            input_video=source_input,
-            output_pattern=src_output,
-            text_overlay=sub_names.source if sub_names else None,
-            sub_size=sub_size,
-            mi_object=source_file_mi_obj,
-            total_images=total_images,
-            trim=trim,
-            random_offset=random_offset,
-            frame_rate=frame_rate,
-            subtitle_color=subtitle_color,
-            subtitle_outline_color=subtitle_outline_color,
-            ffmpeg=ffmpeg_path,
-            signal=signal,
-            ffmpeg_crop=detect_crop,
-            width=media_width,
-            height=media_height,
-            re_sync_offset_seconds=source_re_sync_offset,
-        )
+        generate_img_msg = "\nGenerating encode and source images."
+        LOG.info(LOG.LOG_SOURCE.BE, generate_img_msg)
+        signal.emit(generate_img_msg, 0)
+
+        # the encode and source are read concurrently (they are usually on different
+        # disks), each limited to half of the extraction workers so both together
+        # stay within the configured budget
+        per_input_workers = max(1, self.max_workers // 2)
+        progress = MergedProgressSignal(signal, ("Encode", "Source"))
+        with ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="comparison-input"
+        ) as executor:
+            encode_future = executor.submit(
+                self.generate_comp_frames,
+                input_video=media_input,
+                output_pattern=enc_output,
+                text_overlay=sub_names.encode if sub_names else None,
+                sub_size=sub_size,
+                mi_object=media_file_mi_obj,
+                total_images=total_images,
+                trim=trim,
+                random_offset=random_offset,
+                frame_rate=frame_rate,
+                subtitle_color=subtitle_color,
+                subtitle_outline_color=subtitle_outline_color,
+                ffmpeg=ffmpeg_path,
+                signal=progress.pipeline("Encode"),
+                max_workers=per_input_workers,
+            )
+            source_future = executor.submit(
+                self.generate_comp_frames,
+                input_video=source_input,
+                output_pattern=src_output,
+                text_overlay=sub_names.source if sub_names else None,
+                sub_size=sub_size,
+                mi_object=source_file_mi_obj,
+                total_images=total_images,
+                trim=trim,
+                random_offset=random_offset,
+                frame_rate=frame_rate,
+                subtitle_color=subtitle_color,
+                subtitle_outline_color=subtitle_outline_color,
+                ffmpeg=ffmpeg_path,
+                signal=progress.pipeline("Source"),
+                ffmpeg_crop=detect_crop,
+                width=media_width,
+                height=media_height,
+                re_sync_offset_seconds=source_re_sync_offset,
+                max_workers=per_input_workers,
+            )
+            generate_encode_images = encode_future.result()
+            generate_source_images = source_future.result()
 
         if generate_encode_images != 0 or generate_source_images != 0:
             return 1
@@ -469,11 +682,12 @@ class ComparisonImageGeneration(ImageGeneration):
         subtitle_color: str,
         subtitle_outline_color: str,
         ffmpeg: Path,
-        signal: SignalInstance,
+        signal: ProgressSignal,
         ffmpeg_crop: str | None = None,
         width: int | None = None,
         height: int | None = None,
         re_sync_offset_seconds: float = 0.0,
+        max_workers: int | None = None,
     ) -> int:
         """Frame generation using direct seeks for optimal performance."""
 
@@ -557,8 +771,9 @@ class ComparisonImageGeneration(ImageGeneration):
                 f"Applying re-sync offset: {re_sync_offset_seconds:.3f} seconds",
             )
 
-        # extract each frame individually using seeks
-        success_count = 0
+        # build one seek command per frame, extracted concurrently
+        commands = []
+        segments = []
         for i, timestamp in enumerate(timestamps):
             # handle different output pattern formats
             if "%02d" in output_pattern:
@@ -591,36 +806,212 @@ class ComparisonImageGeneration(ImageGeneration):
                 "error",
                 "-hide_banner",
             ]
+            commands.append((timestamp, command))
+            segments.append(FrameSegment(timestamp, vf_filter, (output_file,)))
+
+        # decode several frames per ffmpeg invocation when possible
+        if self.single_pass and self._extract_single_pass(
+            ffmpeg, input_video, segments, max_workers=max_workers
+        ):
+            signal.emit(f"Extracted frame {total_images}/{total_images}", 100)
+            return 0
+
+        success_count = self.run_frame_commands(
+            commands, total_images, signal, max_workers=max_workers
+        )
 
-            # run the command
-            try:
-                result = subprocess.run(  # noqa: S603 - list argv, no shell; ffmpeg path is the configured binary, return code checked
-                    command,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    creationflags=get_subprocess_creation_flags(),
-                )
+        return 0 if success_count == total_images else 1
 
-                if result.returncode == 0:
-                    success_count += 1
-                    # emit progress
-                    progress = (i + 1) / total_images * 100
-                    signal.emit(f"Extracted frame {i + 1}/{total_images}", progress)
-                else:
-                    LOG.error(
-                        LOG.LOG_SOURCE.BE,
-                        f"Failed to extract frame at {timestamp}: {result.stderr}",
-                    )
+    @staticmethod
+    def _build_single_pass_command(
+        ffmpeg: Path,
+        input_video: Path,
+        segments: Sequence[FrameSegment],
+        first_index: int = 0,
+    ) -> tuple[list[str], list[str]]:
+        """
+        Build one ffmpeg command that seeks the input once per segment.
+
+        Every segment becomes its own input (so each `-ss` is a fast input seek rather
+        than a decode from the start of the file) feeding its own filter chain and
+        image output. Segments with more than one frame are written to a temporary
+        numbered pattern that is renamed once ffmpeg has finished; `first_index`
+        keeps those names unique across the invocations of one input.
+
+        Returns:
+            tuple[list[str], list[str]]: The command and each segment's output target.
+        """
+        command = [str(ffmpeg), "-v", "error", "-hide_banner", "-y"]
+        for segment in segments:
+            command.extend(["-ss", segment.timestamp, "-i", str(input_video)])
+
+        command.extend(
+            [
+                "-filter_complex",
+                ";".join(
+                    f"[{idx}:v]{segment.vf_filter}[v{idx}]"
+                    for idx, segment in enumerate(segments)
+                ),
+            ]
+        )
 
-            except subprocess.TimeoutExpired:
-                LOG.error(LOG.LOG_SOURCE.BE, f"Timeout extracting frame at {timestamp}")
-            except Exception as e:
-                LOG.error(
-                    LOG.LOG_SOURCE.BE, f"Error extracting frame at {timestamp}: {e}"
+        targets = []
+        for idx, segment in enumerate(segments):
+            if len(segment.output_files) == 1:
+                target = segment.output_files[0]
+            else:
+                target = str(
+                    Path(segment.output_files[0]).parent
+                    / f"_single_pass_{first_index + idx:02d}_%03d.png"
                 )
+            targets.append(target)
+            command.extend(
+                [
+                    "-map",
+                    f"[v{idx}]",
+                    "-frames:v",
+                    str(len(segment.output_files)),
+                    "-compression_level",
+                    "6",
+                    target,
+                ]
+            )
+        return command, targets
 
-        return 0 if success_count == total_images else 1
+    def _extract_single_pass(
+        self,
+        ffmpeg: Path,
+        input_video: Path,
+        segments: Sequence[FrameSegment],
+        max_workers: int | None = None,
+    ) -> bool:
+        """
+        Extract every segment of one input in as few ffmpeg decode passes as possible.
+
+        Each invocation opens at most `SINGLE_PASS_MAX_INPUTS` inputs, so a long
+        comparison set from a UHD source never has a decoder per frame open in one
+        process. Invocations run concurrently within the worker limit, leaving about
+        as many decoders open as per frame extraction would.
+
+        Returns False (after logging why) when ffmpeg rejects the filter graph or
+        does not produce every frame, so callers can fall back to per frame commands.
+        Invocations not yet started when one fails are skipped.
+        """
+        if not segments:
+            return True
+
+        passes = []
+        for start in range(0, len(segments), SINGLE_PASS_MAX_INPUTS):
+            chunk = segments[start : start + SINGLE_PASS_MAX_INPUTS]
+            command, targets = self._build_single_pass_command(
+                ffmpeg, input_video, chunk, first_index=start
+            )
+            passes.append((chunk, command, targets))
+
+        workers = max(
+            1,
+            min(
+                (max_workers or self.max_workers) // SINGLE_PASS_MAX_INPUTS,
+                len(passes),
+            ),
+        )
+        failed = Event()
+
+        def run_pass(
+            chunk: Sequence[FrameSegment], command: list[str], targets: Sequence[str]
+        ) -> bool:
+            # once one invocation fails every frame is re-extracted anyway
+            if failed.is_set():
+                return False
+            if not self._run_single_pass(chunk, command, targets):
+                failed.set()
+                return False
+            return True
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ffmpeg-pass"
+        ) as executor:
+            futures = [
+                executor.submit(run_pass, chunk, command, targets)
+                for chunk, command, targets in passes
+            ]
+            extracted = all([future.result() for future in futures])
+
+        if not extracted:
+            for chunk, _command, targets in passes:
+                self._remove_single_pass_files(chunk, targets)
+        return extracted
+
+    @staticmethod
+    def _run_single_pass(
+        segments: Sequence[FrameSegment], command: list[str], targets: Sequence[str]
+    ) -> bool:
+        """Run one single pass invocation and move its frames to their final names."""
+        total_frames = sum(len(segment.output_files) for segment in segments)
+        LOG.debug(LOG.LOG_SOURCE.BE, f"FFMPEG single pass command: {' '.join(command)}")
+        try:
+            result = subprocess.run(  # noqa: S603 - list argv, no shell; ffmpeg path is the configured binary, return code checked
+                command,
+                capture_output=True,
+                text=True,
+                timeout=min(
+                    FRAME_EXTRACTION_TIMEOUT * total_frames, SINGLE_PASS_TIMEOUT
+                ),
+                creationflags=get_subprocess_creation_flags(),
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            LOG.warning(
+                LOG.LOG_SOURCE.BE,
+                f"Single pass frame extraction failed, using per frame extraction ({e})",
+            )
+            return False
+
+        if result.returncode != 0:
+            LOG.warning(
+                LOG.LOG_SOURCE.BE,
+                "Single pass frame extraction was rejected, using per frame "
+                f"extraction ({result.stderr.strip()})",
+            )
+            return False
+
+        # move numbered segment frames to their final names
+        for segment, target in zip(segments, targets, strict=True):
+            if len(segment.output_files) == 1:
+                continue
+            for frame_idx, output_file in enumerate(segment.output_files, start=1):
+                frame = Path(target.replace("%03d", f"{frame_idx:03d}"))
+                if frame.is_file():
+                    frame.replace(output_file)
+
+        missing = [
+            output_file
+            for segment in segments
+            for output_file in segment.output_files
+            if not Path(output_file).is_file()
+        ]
+        if missing:
+            LOG.warning(
+                LOG.LOG_SOURCE.BE,
+                f"Single pass frame extraction missed {len(missing)} frame(s), "
+                "using per frame extraction",
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _remove_single_pass_files(
+        segments: Sequence[FrameSegment], targets: Sequence[str]
+    ) -> None:
+        """Remove partial output so a fallback never mixes frames from both paths."""
+        for segment, target in zip(segments, targets, strict=True):
+            if len(segment.output_files) > 1:
+                target_path = Path(target)
+                for frame in target_path.parent.glob(
+                    target_path.name.replace("%03d", "*")
+                ):
+                    frame.unlink(missing_ok=True)
+            for output_file in segment.output_files:
+                Path(output_file).unlink(missing_ok=True)
 
     @staticmethod
     def check_draw_text(ffmpeg_path: Path) -> bool:
@@ -706,53 +1097,44 @@ class ComparisonImageGeneration(ImageGeneration):
             else sync_frame_1 + int(frame_rate * 30)
         )
 
-        # generate reference frames (encode frames with frame number subtitle)
-        self._generate_reference_frames(
-            media_input=media_input,
-            sync_frames=[sync_frame_1, sync_frame_2],
-            img_sync=img_sync,
-            frame_rate=frame_rate,
-            subtitle_color=subtitle_color,
-            subtitle_outline_color=subtitle_outline_color,
-            sub_size=sub_size,
-            ffmpeg_path=ffmpeg_path,
-        )
-
         # generate sync ranges around each reference frame (±5 frames)
         sync_range_1 = [sync_frame_1 + i for i in range(-5, 6)]
         sync_range_2 = [sync_frame_2 + i for i in range(-5, 6)]
 
-        # generate sync frames for sync1 directory
-        self._generate_sync_range_frames(
-            source_input=source_input,
-            sync_frames=sync_range_1,
-            output_dir=sync1_dir,
-            frame_rate=frame_rate,
-            subtitle_color=subtitle_color,
-            subtitle_outline_color=subtitle_outline_color,
-            sub_size=sub_size,
-            ffmpeg_path=ffmpeg_path,
-            ffmpeg_crop=ffmpeg_crop,
-            width=width,
-            height=height,
-            source_re_sync_offset=source_re_sync_offset,
-        )
-
-        # generate sync frames for sync2 directory
-        self._generate_sync_range_frames(
-            source_input=source_input,
-            sync_frames=sync_range_2,
-            output_dir=sync2_dir,
-            frame_rate=frame_rate,
-            subtitle_color=subtitle_color,
-            subtitle_outline_color=subtitle_outline_color,
-            sub_size=sub_size,
-            ffmpeg_path=ffmpeg_path,
-            ffmpeg_crop=ffmpeg_crop,
-            width=width,
-            height=height,
-            source_re_sync_offset=source_re_sync_offset,
-        )
+        # reference frames (encode) and sync ranges (source) read different files,
+        # so both are generated concurrently
+        with ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="comparison-sync"
+        ) as executor:
+            # generate reference frames (encode frames with frame number subtitle)
+            reference_future = executor.submit(
+                self._generate_reference_frames,
+                media_input=media_input,
+                sync_frames=[sync_frame_1, sync_frame_2],
+                img_sync=img_sync,
+                frame_rate=frame_rate,
+                subtitle_color=subtitle_color,
+                subtitle_outline_color=subtitle_outline_color,
+                sub_size=sub_size,
+                ffmpeg_path=ffmpeg_path,
+            )
+            # generate sync frames for the sync1 and sync2 directories
+            sync_future = executor.submit(
+                self._generate_source_sync_ranges,
+                source_input=source_input,
+                sync_ranges=((sync_range_1, sync1_dir), (sync_range_2, sync2_dir)),
+                frame_rate=frame_rate,
+                subtitle_color=subtitle_color,
+                subtitle_outline_color=subtitle_outline_color,
+                sub_size=sub_size,
+                ffmpeg_path=ffmpeg_path,
+                ffmpeg_crop=ffmpeg_crop,
+                width=width,
+                height=height,
+                source_re_sync_offset=source_re_sync_offset,
+            )
+            reference_future.result()
+            sync_future.result()
 
         signal.emit("Sync frame generation completed", 100)
         LOG.info(LOG.LOG_SOURCE.BE, "Sync frame generation completed")
@@ -770,6 +1152,8 @@ class ComparisonImageGeneration(ImageGeneration):
     ) -> None:
         """Generate reference frames (encode frames with frame number subtitle)."""
 
+        commands = []
+        segments = []
         for i, frame_number in enumerate(sync_frames):
             # convert frame to timestamp
             timestamp_seconds = frame_number / frame_rate
@@ -817,10 +1201,79 @@ class ComparisonImageGeneration(ImageGeneration):
                 "-hide_banner",
             ]
 
+            commands.append((frame_number, command))
+            segments.append(FrameSegment(timestamp, vf_filter, (output_file,)))
+
+        if self.single_pass and self._extract_single_pass(
+            ffmpeg_path, media_input, segments
+        ):
+            return
+
+        for frame_number, command in commands:
             self._run_required_frame_command(
                 command, frame_kind="reference", frame_number=frame_number
             )
 
+    def _generate_source_sync_ranges(
+        self,
+        source_input: Path,
+        sync_ranges: Sequence[tuple[list[int], Path]],
+        frame_rate: float,
+        subtitle_color: str,
+        subtitle_outline_color: str,
+        sub_size: int,
+        ffmpeg_path: Path,
+        ffmpeg_crop: str | None = None,
+        width: int | None = None,
+        height: int | None = None,
+        source_re_sync_offset: float = 0.0,
+    ) -> None:
+        """Generate every sync range, decoded in single pass invocations when possible."""
+
+        if self.single_pass and self._extract_single_pass(
+            ffmpeg_path,
+            source_input,
+            [
+                FrameSegment(
+                    _format_ffmpeg_timestamp(
+                        sync_range[0] / frame_rate + source_re_sync_offset
+                    ),
+                    self._build_sync_filter(
+                        text=f"Sync Frame %{{eif:n+{sync_range[0]}:d}}",
+                        sub_size=sub_size,
+                        subtitle_color=subtitle_color,
+                        subtitle_outline_color=subtitle_outline_color,
+                        ffmpeg_crop=ffmpeg_crop,
+                        width=width,
+                        height=height,
+                        expansion=True,
+                    ),
+                    tuple(
+                        str(output_dir / f"{i + 1:02d}a_source__{frame_number}.png")
+                        for i, frame_number in enumerate(sync_range)
+                    ),
+                )
+                for sync_range, output_dir in sync_ranges
+            ],
+        ):
+            return
+
+        for sync_range, output_dir in sync_ranges:
+            self._generate_sync_range_frames(
+                source_input=source_input,
+                sync_frames=sync_range,
+                output_dir=output_dir,
+                frame_rate=frame_rate,
+                subtitle_color=subtitle_color,
+                subtitle_outline_color=subtitle_outline_color,
+                sub_size=sub_size,
+                ffmpeg_path=ffmpeg_path,
+                ffmpeg_crop=ffmpeg_crop,
+                width=width,
+                height=height,
+                source_re_sync_offset=source_re_sync_offset,
+            )
+
     def _generate_sync_range_frames(
         self,
         source_input: Path,
@@ -850,31 +1303,16 @@ class ComparisonImageGeneration(ImageGeneration):
 
             output_file = str(output_dir / f"{i + 1:02d}a_source__{frame_number}.png")
 
-            # build filter chain
-            filters = []
-
-            # crop and resize - crop first, then resize
-            if ffmpeg_crop:
-                crop_filter = ffmpeg_crop.lstrip(",")
-                filters.append(crop_filter)
-
-            if width and height:
-                filters.append(f"scale={width}:{height}")
-
-            # add subtitle with sync frame info
-            filters.append(
-                _build_drawtext_filter(
-                    text=f"Sync Frame {frame_number}",
-                    font_size=sub_size + 5,
-                    font_color=subtitle_color,
-                    border_color=subtitle_outline_color,
-                    x="(w-text_w)/2",
-                    y="10",
-                )
+            vf_filter = self._build_sync_filter(
+                text=f"Sync Frame {frame_number}",
+                sub_size=sub_size,
+                subtitle_color=subtitle_color,
+                subtitle_outline_color=subtitle_outline_color,
+                ffmpeg_crop=ffmpeg_crop,
+                width=width,
+                height=height,
             )
 
-            vf_filter = ",".join(filters) if filters else "copy"
-
             command = [
                 str(ffmpeg_path),
                 "-ss",
@@ -899,6 +1337,43 @@ class ComparisonImageGeneration(ImageGeneration):
                 command, frame_kind="sync", frame_number=frame_number
             )
 
+    @staticmethod
+    def _build_sync_filter(
+        text: str,
+        sub_size: int,
+        subtitle_color: str,
+        subtitle_outline_color: str,
+        ffmpeg_crop: str | None = None,
+        width: int | None = None,
+        height: int | None = None,
+        expansion: bool = False,
+    ) -> str:
+        """Build the filter chain for a source sync frame."""
+        filters = []
+
+        # crop and resize - crop first, then resize
+        if ffmpeg_crop:
+            crop_filter = ffmpeg_crop.lstrip(",")
+            filters.append(crop_filter)
+
+        if width and height:
+            filters.append(f"scale={width}:{height}")
+
+        # add subtitle with sync frame info
+        filters.append(
+            _build_drawtext_filter(
+                text=text,
+                font_size=sub_size + 5,
+                font_color=subtitle_color,
+                border_color=subtitle_outline_color,
+                x="(w-text_w)/2",
+                y="10",
+                expansion=expansion,
+            )
+        )
+
+        return ",".join(filters)
+
     @staticmethod
     def _run_required_frame_command(
         command: list[str],
@@ -1011,7 +1486,9 @@ class FrameForgeImageGeneration(ImageGeneration):
                     auto_crop_detect_msg,
                     0,
                 )
-                detect_crop = CropDetect(ffmpeg_path, source_input, 15, 4).get_result()
+                detect_crop = self.detect_crop(
+                    ffmpeg_path, source_input, source_file_mi_obj, index_cache_root
+                )
                 if detect_crop:
                     crop_detection_complete_msg = (
                         f"Crop detection complete ({detect_crop})."
@@ -1141,6 +1618,7 @@ class ImagesBackEnd:
         trim: tuple[int, int],
         ffmpeg_path: Path,
         signal: SignalInstance,
+        cpu_fraction: float = DEFAULT_EXTRACTION_CPU_FRACTION,
     ) -> int:
         """
         Generate images and emit progress signals.
@@ -1153,9 +1631,10 @@ class ImagesBackEnd:
             trim (tuple[int, int]): The percentage of the file to trim from start and end.
             ffmpeg_path (Path): Path to FFMPEG executable.
             signal (SignalInstance[str, float]): The signal used to emit progress updates on the frontend.
+            cpu_fraction (float): Share of CPU threads used for concurrent frame extraction.
 
         """
-        return BasicImageGeneration().generate_images(
+        return BasicImageGeneration(cpu_fraction=cpu_fraction).generate_images(
             media_input=media_input,
             output_directory=output_directory,
             mi_object=mi_object,
@@ -1183,6 +1662,8 @@ class ImagesBackEnd:
         ffmpeg_path: Path,
         signal: SignalInstance,
         re_sync: int = 0,
+        cpu_fraction: float = DEFAULT_EXTRACTION_CPU_FRACTION,
+        cache_root: Path | None = None,
     ) -> int:
         """
         Generate comparison images and emit progress signals.
@@ -1203,9 +1684,12 @@ class ImagesBackEnd:
             crop_values (Optional[CropValues]): Crop values.
             ffmpeg_path (Path): Path to FFMPEG executable.
             signal (SignalInstance[str, float]): The signal used to emit progress updates on the frontend.
+            re_sync (int): Re_sync value.
+            cpu_fraction (float): Share of CPU threads used for concurrent frame extraction.
+            cache_root (Optional[Path]): Base directory for the crop detection cache.
 
         """
-        return ComparisonImageGeneration().generate_images(
+        return ComparisonImageGeneration(cpu_fraction=cpu_fraction).generate_images(
             source_input=source_input,
             source_file_mi_obj=source_file_mi_obj,
             media_input=media_input,
@@ -1222,6 +1706,7 @@ class ImagesBackEnd:
             ffmpeg_path=ffmpeg_path,
             signal=signal,
             re_sync=re_sync,
+            cache_root=cache_root,
         )
 
     @staticmethod
@@ -1275,7 +1760,8 @@ class ImagesBackEnd:
             frame_forge_path (Path): Path to FrameForge executable.
             ffmpeg_path (Optional[Path]): Path to FFMPEG executable.
             signal (SignalInstance[str, float]): The signal used to emit progress updates on the frontend.
-            index_cache_root (Optional[Path]): Injectable base directory for FrameForge indexes.
+            index_cache_root (Optional[Path]): Injectable base directory for FrameForge
+                indexes and the crop detection cache.
             protected_media_root (Optional[Path]): Upload tree that the private
                 FrameForge encode index must remain outside.
 
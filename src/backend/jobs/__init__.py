@@ -20,7 +20,6 @@ from src.backend.jobs.assets import (
     capture_nfos,
     copy_base_torrent,
     copy_images,
-    fingerprint_files,
     fingerprints_match,
     read_job_asset,
     template_fingerprint,
@@ -77,7 +76,6 @@ __all__ = [
     "delete_job",
     "encode_value",
     "filter_context_document",
-    "fingerprint_files",
     "fingerprints_match",
     "job_dir",
     "jobs_dir",
@@ -24,10 +24,8 @@ Qt-free, so it stays unit testable.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
 from dataclasses import dataclass
 import hashlib
-import os
 from pathlib import Path
 import shutil
 from typing import Any
@@ -42,6 +40,7 @@ from src.backend.jobs.store import (
     JOB_MEDIAINFO_DIR_NAME,
     JOB_NFO_DIR_NAME,
 )
+from src.backend.torrents.manifest import scan_content
 from src.enums.tracker_selection import TrackerSelection
 from src.logger.nfo_forge_logger import LOG
 
@@ -334,45 +333,20 @@ def archived_base_is_valid(torrent_path: Path, snapshot: Any) -> bool:
 
 
 def torrent_content_files(input_path: Path) -> list[Path]:
-    """Every file the generated torrent covers, in a stable order.
+    """Every file the generated torrent covers, in torrent order.
 
     Walks the input rather than reading `MediaInputPayload.file_list`: the
     torrent is built from `input_path`, so for a pack it also covers subtitles
     and other extras that the media file list leaves out.
 
-    Uses `os.walk(followlinks=True)` rather than `Path.rglob`: torf itself
-    walks with `followlinks=True` (see `torf/_utils.py`), and `rglob`'s `**`
-    does not descend into a symlinked directory on this project's Python
-    floor. Missing a symlinked subtree here would mean a file the torrent
-    covers is never fingerprinted, so an edit inside it would go undetected --
-    the exact failure this function exists to close.
-
-    Index sidecars such as `.lwi`/`.ffindex` are deliberately included even
-    though torrent creation excludes them (see `INDEX_SIDECAR_GLOBS` in
-    `src/backend/torrents/torrent.py`): fingerprinting a file the torrent does
-    not actually contain only costs a spurious re-hash, never a stale clone,
-    and it is not worth coupling this package to that one over it.
+    Uses the same `scan_content` walk torrent creation does, so the set is
+    exactly what the torrent contains: symlinked directories are followed,
+    hidden files and index sidecars (`.lwi`/`.ffindex`) are left out. A file
+    fingerprinted here that the torrent does not contain would only cost a
+    spurious re-hash, but one the torrent contains and this missed would let an
+    edit to it go undetected.
     """
-    if input_path.is_dir():
-        found: list[Path] = []
-        for directory, _sub_dirs, file_names in os.walk(input_path, followlinks=True):
-            found.extend(Path(directory) / name for name in file_names)
-        # sorted with the same casefold key torf's list_files uses (see
-        # torf/_utils.py), so the order this reports matches the order torf
-        # itself assigns the pack's files
-        return sorted(found, key=lambda path: str(path).casefold())
-    return [input_path] if input_path.is_file() else []
-
-
-def fingerprint_files(paths: Iterable[Path]) -> dict[str, dict[str, int]]:
-    """Size and mtime for each path, keyed by its string form."""
-    captured: dict[str, dict[str, int]] = {}
-    for path in paths:
-        try:
-            captured[str(path)] = MediaFingerprint.of(path).to_dict()
-        except OSError as error:
-            raise JobAssetError(f"Could not fingerprint '{path}': {error}") from error
-    return captured
+    return scan_content(input_path).filepaths
 
 
 def fingerprints_match(stored: Any, input_path: Path) -> bool:
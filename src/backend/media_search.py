@@ -5,14 +5,14 @@ import re
 from typing import Any, cast
 import zlib
 
-from guessit import guessit
 import niquests
 from rapidfuzz import fuzz
 from unidecode import unidecode
 
-from src.backend.utils.guessit_helpers import get_guessit_title
+from src.backend.utils.guessit_helpers import get_guessit_title, parse_guessit
 from src.backend.utils.http_client import new_http_session
-from src.backend.utils.tvdb_client import AsyncTVDBClient, TVDBClient
+from src.backend.utils.response_cache import DAY, HOUR, ResponseCache, fetch_json
+from src.backend.utils.tvdb_client import AsyncTVDBClient
 from src.enums.media_search_mode import MediaSearchMode
 from src.enums.media_type import MediaType
 from src.enums.tmdb_genres import TMDBGenreIDsMovies, TMDBGenreIDsSeries
@@ -28,15 +28,23 @@ _ANILIST_SESSION = new_http_session()
 
 
 class MediaSearchBackEnd:
+    # how long a cached response is used without asking TMDB again; results
+    # for a search change as titles are added, a title's own record rarely does
+    SEARCH_CACHE_TTL = 6 * HOUR
+    DETAILS_CACHE_TTL = 3 * DAY
+
     def __init__(
         self,
         language: str = "en-US",
         use_base_language_for_images: bool = True,
         timeout: int = 60,
         api_key: str = "",
+        cache: ResponseCache | None = None,
     ) -> None:
         self.media_data: dict[str, dict[str, Any]] = {}
         self.session = new_http_session()
+        # shared with the TVDB and AniList lookups made from here
+        self.cache = cache
         self._tvdb_client: AsyncTVDBClient | None = None
         self.use_base_language_for_images = use_base_language_for_images
         self.timeout = max(1, timeout)
@@ -53,12 +61,16 @@ class MediaSearchBackEnd:
         """Swap the key when settings change, mirroring `update_language`."""
         self.params["api_key"] = api_key.strip() or self._get_tmdb_k()
 
+    def update_cache(self, cache: ResponseCache | None) -> None:
+        """Follow the working directory when settings move it."""
+        self.cache = cache
+        if self._tvdb_client is not None:
+            self._tvdb_client.cache = cache
+
     def close_session(self) -> None:
         """Properly close the session when done"""
         if hasattr(self, "session") and self.session:
             self.session.close()
-        if hasattr(self, "_tvdb_client") and self._tvdb_client:
-            self._tvdb_client.close()
 
     def __del__(self) -> None:
         """Cleanup when object is destroyed"""
@@ -189,22 +201,21 @@ class MediaSearchBackEnd:
         params: Mapping[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         try:
-            with self.session.get(
+            response_json = fetch_json(
+                self.session,
                 url,
                 params=params if params is not None else self.params,
                 timeout=self.timeout,
-            ) as response:
-                response.raise_for_status()
-                response_json = response.json()
-                if not isinstance(response_json, dict):
-                    raise MediaSearchError("TMDB returned an invalid search response.")
-                response_data = cast(dict[str, Any], response_json)
-                results = response_data.get("results", [])
-                return (
-                    cast(list[dict[str, Any]], results)
-                    if isinstance(results, list)
-                    else []
-                )
+                cache=self.cache,
+                ttl=self.SEARCH_CACHE_TTL,
+            )
+            if not isinstance(response_json, dict):
+                raise MediaSearchError("TMDB returned an invalid search response.")
+            response_data = cast(dict[str, Any], response_json)
+            results = response_data.get("results", [])
+            return (
+                cast(list[dict[str, Any]], results) if isinstance(results, list) else []
+            )
         except (
             niquests.exceptions.ConnectionError,
             niquests.exceptions.Timeout,
@@ -256,37 +267,36 @@ class MediaSearchBackEnd:
         image_params["append_to_response"] = "alternative_titles,images,external_ids"
 
         try:
-            with self.session.get(
-                url, params=image_params, timeout=self.timeout
-            ) as response:
-                response.raise_for_status()
-                response_json = response.json()
-                if not isinstance(response_json, dict):
-                    raise MediaSearchError(
-                        "TMDB returned an invalid metadata response."
-                    )
-                response_data = cast(dict[str, Any], response_json)
-                if not response_data:
-                    raise MediaSearchError(
-                        "TMDB returned no metadata for the selection."
-                    )
-                returned_id = response_data.get("id")
-                try:
-                    returned_numeric_id = (
-                        int(str(returned_id))
-                        if isinstance(returned_id, str | int)
-                        and not isinstance(returned_id, bool)
-                        else None
-                    )
-                except ValueError:
-                    returned_numeric_id = None
-                if returned_numeric_id is None or returned_numeric_id != int(
-                    validated_media_id
-                ):
-                    raise MediaSearchError(
-                        "TMDB returned metadata for a different ID than requested."
-                    )
-                return response_data
+            response_json = fetch_json(
+                self.session,
+                url,
+                params=image_params,
+                timeout=self.timeout,
+                cache=self.cache,
+                ttl=self.DETAILS_CACHE_TTL,
+            )
+            if not isinstance(response_json, dict):
+                raise MediaSearchError("TMDB returned an invalid metadata response.")
+            response_data = cast(dict[str, Any], response_json)
+            if not response_data:
+                raise MediaSearchError("TMDB returned no metadata for the selection.")
+            returned_id = response_data.get("id")
+            try:
+                returned_numeric_id = (
+                    int(str(returned_id))
+                    if isinstance(returned_id, str | int)
+                    and not isinstance(returned_id, bool)
+                    else None
+                )
+            except ValueError:
+                returned_numeric_id = None
+            if returned_numeric_id is None or returned_numeric_id != int(
+                validated_media_id
+            ):
+                raise MediaSearchError(
+                    "TMDB returned metadata for a different ID than requested."
+                )
+            return response_data
         except (
             niquests.exceptions.ConnectionError,
             niquests.exceptions.Timeout,
@@ -307,7 +317,7 @@ class MediaSearchBackEnd:
 
     @staticmethod
     def _guessit(input_string: str) -> tuple[str, str]:
-        get_info = guessit(input_string, {"excludes": ["language"]})
+        get_info = parse_guessit(input_string, {"excludes": ["language"]})
         title = get_guessit_title(get_info)
         year_value = get_info.get("year", "")
         year = str(year_value) if year_value else ""
@@ -418,8 +428,18 @@ class MediaSearchBackEnd:
     async def parse_tvdb_data(
         self, imdb_id: str | None, tvdb_id: int | None
     ) -> dict[str, Any] | None:
+        # one pool of connections for the whole lookup, so the orderings and
+        # their pages are fetched side by side
         tvdb_parse = self._get_tvdb_client()
+        async with tvdb_parse:
+            return await self._parse_tvdb_data(tvdb_parse, imdb_id, tvdb_id)
 
+    async def _parse_tvdb_data(
+        self,
+        tvdb_parse: AsyncTVDBClient,
+        imdb_id: str | None,
+        tvdb_id: int | None,
+    ) -> dict[str, Any] | None:
         # if we have imdb_id but failed to detect tvdb_id we'll use tvdb api to find the id
         if not tvdb_id and imdb_id:
             find_tvdb_id = await tvdb_parse.search_by_remote_id(imdb_id)
@@ -613,7 +633,7 @@ class MediaSearchBackEnd:
     def _get_tvdb_client(self) -> AsyncTVDBClient:
         if self._tvdb_client is None:
             self._tvdb_client = AsyncTVDBClient(
-                TVDBClient(self._get_tvdb_k(), self.timeout)
+                self._get_tvdb_k(), self.timeout, cache=self.cache
             )
         return self._tvdb_client
 
@@ -632,7 +652,9 @@ class MediaSearchBackEnd:
     async def parse_ani_list(
         self, tmdb_title: str, tmdb_year: int
     ) -> dict[str, Any] | None:
-        matcher = MatchAnilistTitle(tmdb_title, tmdb_year, self.timeout)
+        matcher = MatchAnilistTitle(
+            tmdb_title, tmdb_year, self.timeout, cache=self.cache
+        )
         best_match = await matcher.match()
         if best_match:
             # {'id': 21519, 'idMal': 32281, 'title': {'romaji': 'Kimi no Na wa.', 'english': 'Your Name.', 'native': '君の名は。'}, 'seasonYear': 2016, 'episodes': 1}
@@ -671,10 +693,19 @@ class MediaSearchBackEnd:
 
 
 class MatchAnilistTitle:
-    def __init__(self, title: str, year: int, timeout: int = 60) -> None:
+    CACHE_TTL = 7 * DAY
+
+    def __init__(
+        self,
+        title: str,
+        year: int,
+        timeout: int = 60,
+        cache: ResponseCache | None = None,
+    ) -> None:
         self.title = title
         self.year = year
         self.timeout = max(1, timeout)
+        self.cache = cache
         self.data: dict[str, Any] | None = None
 
     async def parse_ani_list(self, tmdb_title: str) -> dict[str, Any]:
@@ -699,14 +730,15 @@ class MatchAnilistTitle:
             }
         """
         variables = {"search": tmdb_title}
-        response = await asyncio.to_thread(
-            _ANILIST_SESSION.post,
+        response_json = await asyncio.to_thread(
+            fetch_json,
+            _ANILIST_SESSION,
             "https://graphql.anilist.co",
-            json={"query": query, "variables": variables},
+            json_body={"query": query, "variables": variables},
             timeout=self.timeout,
+            cache=self.cache,
+            ttl=self.CACHE_TTL,
         )
-        response.raise_for_status()
-        response_json = response.json()
         return cast(dict[str, Any], response_json)
 
     def normalize_text(self, text: str) -> str:
@@ -1,10 +1,17 @@
 import asyncio
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Coroutine, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import functools
 from html import escape
+import math
 from pathlib import Path
+import queue
 import shutil
+import threading
+import time
 import traceback
-from typing import Any
+from typing import Any, Concatenate, ParamSpec
 
 from PySide6.QtCore import SignalInstance
 from tenacity import Retrying, retry_if_exception, stop_after_attempt
@@ -12,6 +19,7 @@ from tenacity.wait import wait_exponential
 from torf import Torrent
 
 from src.backend.image_host_uploading.base_image_host import (
+    IMAGE_HOST_SIZE_LIMITS,
     BaseImageHostUploader,
     ImageUploadRequest,
 )
@@ -40,12 +48,15 @@ from src.backend.torrent_clients.rtorrent import RTorrentClient
 from src.backend.torrent_clients.transmission import TransmissionClient
 from src.backend.torrents import (
     BASE_TORRENT_SUFFIX,
-    clone_torrent,
-    content_size,
+    PIECE_CACHE_NAME,
+    BaseTorrentCloner,
+    ContentManifest,
+    PieceCache,
     generate_torrent,
     mkbrr_generate_torrent,
     neutralize_base,
     piece_exponent,
+    scan_content,
     write_torrent,
 )
 from src.backend.trackers import (
@@ -112,7 +123,9 @@ from src.backend.utils.images import (
     get_parity_images,
     get_parity_images_to_str,
 )
+from src.backend.utils.response_cache import RESPONSE_CACHE_NAME, ResponseCache
 from src.backend.utils.token_utils import get_prompt_tokens
+from src.backend.utils.working_dir import cache_dir
 from src.config.config import ConfigManager
 from src.config.tv_tokens import get_tvr_title_token
 from src.context.processing_context import ProcessingContext
@@ -152,6 +165,28 @@ from src.plugins.api import (
 )
 from src.utils.secret_redaction import scrub_secrets
 
+_P = ParamSpec("_P")
+
+# a search can take several requests (e.g. a login first), each bounded by the
+# general timeout
+DUPE_CHECK_TIMEOUT_MULTIPLIER = 3
+# tracker health probes are blocking too, every selected tracker is probed at once
+HEALTH_PREFETCH_MAX_WORKERS = 8
+
+DupeCheckResult = tuple[TrackerSelection, bool, list[TrackerSearchResult] | str]
+# a finished concurrent upload's position, or a retry prompt raised by its worker
+_UploadEvent = int | tuple[UploadFailure, Future[UploadRetryAction]]
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingTrackerUpload:
+    """A tracker upload running on the concurrent upload pool."""
+
+    tracker: TrackerSelection
+    tracker_name: str
+    torrent_path: Path
+    future: Future[tuple[Path | bool | str | None, bool]]
+
 
 def _media_source_available(media_input: Any) -> bool:
     """Report source availability while remaining compatible with test stubs."""
@@ -159,6 +194,21 @@ def _media_source_available(media_input: Any) -> bool:
     return bool(checker()) if callable(checker) else True
 
 
+def _discards_base_torrent_job(
+    method: Callable[Concatenate["ProcessBackEnd", _P], None],
+) -> Callable[Concatenate["ProcessBackEnd", _P], None]:
+    """Cancel a pipelined base torrent hash the run ended without joining."""
+
+    @functools.wraps(method)
+    def wrapper(self: "ProcessBackEnd", *args: _P.args, **kwargs: _P.kwargs) -> None:
+        try:
+            method(self, *args, **kwargs)
+        finally:
+            self._discard_base_torrent_job()
+
+    return wrapper
+
+
 class ProcessBackEnd:
     def __init__(self, config: ConfigManager) -> None:
         self.config = config
@@ -176,23 +226,46 @@ class ProcessBackEnd:
         self.watch_folder_counter = 0
         self.clients_can_logout = (self.qbit_client, self.deluge_client)
 
+        # seconds each tracker took in the last dupe check
+        self.dupe_check_timings: dict[TrackerSelection, float] = {}
+
+        # reachability and probe latency (seconds) from the last health prefetch
+        self.tracker_health: dict[TrackerSelection, bool] = {}
+        self.tracker_health_timings: dict[TrackerSelection, float] = {}
+
+        # base torrent hashed in the background by a pipelined run
+        self._base_torrent_job: tuple[Future[Path], threading.Event] | None = None
+        # the files the last hashed base covers, as they were when it was hashed
+        self.content_manifest: ContentManifest | None = None
+
     async def dupe_checks(
         self,
         processing_queue: list[TrackerSelection],
         media_input_payload: MediaInputPayload,
         media_search_payload: MediaSearchPayload,
-    ) -> dict[
-        TrackerSelection, tuple[TrackerSelection, bool, list[TrackerSearchResult] | str]
-    ]:
+    ) -> dict[TrackerSelection, DupeCheckResult]:
+        """
+        Check every tracker for duplicates concurrently.
+
+        Tracker searches are blocking, so each tracker's check runs on its own
+        worker thread with its own timeout, and the whole check costs roughly the
+        slowest tracker.
+        The time each tracker took is logged and kept in `dupe_check_timings`.
+        Every tracker's health is probed alongside the searches, see
+        `tracker_health`.
+        """
         # TODO: test this when we add disc & tv support, as this will likely require different
         # checks to accurately obtain dupes
-        tasks = []
+        tasks: list[tuple[TrackerSelection, Coroutine[Any, Any, DupeCheckResult]]] = []
         release_info = build_series_release_info(media_input_payload)
         for tracker_sel in processing_queue:
             if release_info.is_series and tracker_sel in UNSUPPORTED_SERIES_TRACKERS:
                 tasks.append(
-                    self._unsupported_series_tracker_dupe(
-                        tracker_sel=tracker_sel,
+                    (
+                        tracker_sel,
+                        self._unsupported_series_tracker_dupe(
+                            tracker_sel=tracker_sel,
+                        ),
                     )
                 )
                 continue
@@ -200,97 +273,211 @@ class ProcessBackEnd:
             search_input = release_info.search_path or file_input
             if tracker_sel is TrackerSelection.TORRENT_LEECH:
                 tasks.append(
-                    self._dupe_tl(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_tl(tracker_sel=tracker_sel, file_input=search_input),
+                    )
                 )
             elif tracker_sel is TrackerSelection.BEYOND_HD:
                 tasks.append(
-                    self._dupe_bhd(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_bhd(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
+                    )
                 )
             elif tracker_sel is TrackerSelection.PASS_THE_POPCORN:
                 tasks.append(
-                    self._dupe_ptp(
-                        tracker_sel=tracker_sel,
-                        # file_input prioritizes folder name > file since the api doesn't
-                        # support directly looking for files
-                        file_input=search_input,
-                        media_search_payload=media_search_payload,
+                    (
+                        tracker_sel,
+                        self._dupe_ptp(
+                            tracker_sel=tracker_sel,
+                            # file_input prioritizes folder name > file since the api doesn't
+                            # support directly looking for files
+                            file_input=search_input,
+                            media_search_payload=media_search_payload,
+                        ),
                     )
                 )
             elif tracker_sel is TrackerSelection.REELFLIX:
                 tasks.append(
-                    self._dupe_rf(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_rf(tracker_sel=tracker_sel, file_input=search_input),
+                    )
                 )
             elif tracker_sel is TrackerSelection.AITHER:
                 tasks.append(
-                    self._dupe_aither(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_aither(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
+                    )
                 )
             elif tracker_sel is TrackerSelection.HUNO:
                 tasks.append(
-                    self._dupe_huno(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_huno(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
+                    )
                 )
             elif tracker_sel is TrackerSelection.LST:
                 tasks.append(
-                    self._dupe_lst(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_lst(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
+                    )
                 )
             elif tracker_sel is TrackerSelection.DARK_PEERS:
                 tasks.append(
-                    self._dupe_dp(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_dp(tracker_sel=tracker_sel, file_input=search_input),
+                    )
                 )
             elif tracker_sel is TrackerSelection.SHARE_ISLAND:
                 tasks.append(
-                    self._dupe_shri(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_shri(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
+                    )
                 )
             elif tracker_sel is TrackerSelection.UPLOAD_CX:
                 tasks.append(
-                    self._dupe_ulcx(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_ulcx(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
+                    )
                 )
             elif tracker_sel is TrackerSelection.ONLY_ENCODES:
                 tasks.append(
-                    self._dupe_oe(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_oe(tracker_sel=tracker_sel, file_input=search_input),
+                    )
                 )
             elif tracker_sel is TrackerSelection.HDB:
                 tasks.append(
-                    self._dupe_hdb(
-                        tracker_sel=tracker_sel,
-                        file_input=search_input,
-                        media_input_payload=media_input_payload,
-                        media_search_payload=media_search_payload,
+                    (
+                        tracker_sel,
+                        self._dupe_hdb(
+                            tracker_sel=tracker_sel,
+                            file_input=search_input,
+                            media_input_payload=media_input_payload,
+                            media_search_payload=media_search_payload,
+                        ),
                     )
                 )
             elif tracker_sel is TrackerSelection.BLUTOPIA:
                 tasks.append(
-                    self._dupe_blutopia(
-                        tracker_sel=tracker_sel, file_input=search_input
+                    (
+                        tracker_sel,
+                        self._dupe_blutopia(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
                     )
                 )
             elif tracker_sel is TrackerSelection.SEEDPOOL:
                 tasks.append(
-                    self._dupe_seedpool(
-                        tracker_sel=tracker_sel, file_input=search_input
+                    (
+                        tracker_sel,
+                        self._dupe_seedpool(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
                     )
                 )
             elif tracker_sel is TrackerSelection.UTOPIA:
                 tasks.append(
-                    self._dupe_utp(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_utp(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
+                    )
                 )
             elif tracker_sel is TrackerSelection.YU_SCENE:
                 tasks.append(
-                    self._dupe_yuscene(tracker_sel=tracker_sel, file_input=search_input)
+                    (
+                        tracker_sel,
+                        self._dupe_yuscene(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
+                    )
                 )
             elif tracker_sel is TrackerSelection.FEAR_NO_PEER:
                 tasks.append(
-                    self._dupe_fearnopeer(
-                        tracker_sel=tracker_sel, file_input=search_input
+                    (
+                        tracker_sel,
+                        self._dupe_fearnopeer(
+                            tracker_sel=tracker_sel, file_input=search_input
+                        ),
                     )
                 )
 
-        async_results = await asyncio.gather(*tasks, return_exceptions=True)
+        timeout = self.config.settings.general.timeout * DUPE_CHECK_TIMEOUT_MULTIPLIER
+        timings: dict[TrackerSelection, float] = {}
+        # one worker per tracker, so no search waits in a queue for a thread and
+        # its timeout and timing cover only the search itself. The executor is
+        # local to this call, so concurrent dupe checks never share or shut
+        # down each other's workers
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, len(tasks)),
+            thread_name_prefix="dupe-check",
+        )
+        try:
+            async_results, _ = await asyncio.gather(
+                asyncio.gather(
+                    *(
+                        self._timed_dupe_check(
+                            tracker_sel, task, timeout, timings, executor
+                        )
+                        for tracker_sel, task in tasks
+                    ),
+                    return_exceptions=True,
+                ),
+                asyncio.to_thread(
+                    self._prefetch_tracker_health,
+                    [
+                        tracker_sel
+                        for tracker_sel, _ in tasks
+                        if not (
+                            release_info.is_series
+                            and tracker_sel in UNSUPPORTED_SERIES_TRACKERS
+                        )
+                    ],
+                    {},
+                ),
+            )
+        finally:
+            # a timed out search can't be interrupted, leave its thread to finish
+            # in the background (its requests are bounded by the general timeout)
+            # rather than holding the results back for it
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.dupe_check_timings = timings
+        if timings:
+            LOG.info(
+                LOG.LOG_SOURCE.BE,
+                "Dupe check timings: "
+                + ", ".join(
+                    f"{tracker_sel}: {seconds:.2f}s"
+                    for tracker_sel, seconds in sorted(
+                        timings.items(), key=lambda item: item[1], reverse=True
+                    )
+                ),
+            )
 
-        dupes: dict[
-            TrackerSelection,
-            tuple[TrackerSelection, bool, list[TrackerSearchResult] | str],
-        ] = {}
-        for tracker_sel, item in zip(processing_queue, async_results, strict=False):
+        dupes: dict[TrackerSelection, DupeCheckResult] = {}
+        for (tracker_sel, _), item in zip(tasks, async_results, strict=True):
             if isinstance(item, tuple) and len(item) == 3:
                 dupes[TrackerSelection(tracker_sel)] = item
             elif isinstance(item, Exception):
@@ -329,6 +516,96 @@ class ProcessBackEnd:
 
         return dupes
 
+    def _prefetch_tracker_health(
+        self,
+        trackers: Sequence[TrackerSelection],
+        cache: dict[TrackerSelection, bool],
+    ) -> dict[TrackerSelection, float]:
+        """
+        Probe every tracker's health at once, filling `cache`.
+
+        Each tracker is probed a single time, an upload still retries its own
+        probe, so an unreachable tracker costs one probe timeout up front rather
+        than its full retry budget once the trackers before it have uploaded.
+        The result and the seconds each probe took are kept in `tracker_health`
+        and `tracker_health_timings`.
+        """
+        timings: dict[TrackerSelection, float] = {}
+
+        def probe(tracker: TrackerSelection) -> None:
+            start = time.perf_counter()
+            try:
+                ensure_tracker_health(
+                    tracker=tracker,
+                    timeout=self.config.settings.general.timeout,
+                    cache=cache,
+                    attempts=1,
+                )
+            except Exception as error:
+                # an unreachable tracker is cached as False and anything
+                # unexpected is left out, process_trackers drops the False
+                # entries again so every upload makes its own first probe
+                LOG.warning(
+                    LOG.LOG_SOURCE.BE,
+                    f"Health probe failed for {tracker}: {scrub_secrets(str(error))}",
+                )
+            finally:
+                timings[tracker] = time.perf_counter() - start
+
+        trackers = [
+            tracker for tracker in dict.fromkeys(trackers) if tracker not in cache
+        ]
+        if trackers:
+            with ThreadPoolExecutor(
+                max_workers=min(HEALTH_PREFETCH_MAX_WORKERS, len(trackers)),
+                thread_name_prefix="health-prefetch",
+            ) as executor:
+                for future in [executor.submit(probe, tracker) for tracker in trackers]:
+                    future.result()
+            LOG.info(
+                LOG.LOG_SOURCE.BE,
+                "Tracker health probe timings: "
+                + ", ".join(
+                    f"{tracker}: {seconds:.2f}s"
+                    for tracker, seconds in sorted(
+                        timings.items(), key=lambda item: item[1], reverse=True
+                    )
+                ),
+            )
+
+        self.tracker_health = dict(cache)
+        self.tracker_health_timings = timings
+        return timings
+
+    async def _timed_dupe_check(
+        self,
+        tracker_sel: TrackerSelection,
+        task: Coroutine[Any, Any, DupeCheckResult],
+        timeout: float,
+        timings: dict[TrackerSelection, float],
+        executor: ThreadPoolExecutor,
+    ) -> DupeCheckResult:
+        """
+        Run a single tracker's dupe check on `executor`, bounded by `timeout` and timed.
+
+        The tracker searches block, so the check runs to completion on its own
+        worker thread rather than on the event loop.
+        """
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(executor, asyncio.run, task),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            LOG.warning(
+                LOG.LOG_SOURCE.BE,
+                f"{tracker_sel} dupe check timed out after {timeout}s",
+            )
+            return tracker_sel, False, f"Dupe check timed out after {timeout}s"
+        finally:
+            timings[tracker_sel] = time.perf_counter() - start
+
     async def _run_duplicate_checker_plugin(
         self,
         tracker_sel: TrackerSelection,
@@ -643,7 +920,9 @@ class ProcessBackEnd:
                 if not v:
                     return tracker_sel, False, f"{tracker_sel} key '{k}' is missing"
             # execute the search
-            search = search_cls(**kwargs).search(file_name=file_input.name)
+            search = search_cls(
+                **kwargs, timeout=self.config.settings.general.timeout
+            ).search(file_name=file_input.name)
             if search:
                 return tracker_sel, True, search
             else:
@@ -920,6 +1199,238 @@ class ProcessBackEnd:
                 )
                 return False, safe_message
 
+    def _finish_tracker_upload(
+        self,
+        *,
+        tracker: TrackerSelection,
+        tracker_name: str,
+        torrent_path: Path,
+        media_input: Path,
+        context: ProcessingContext,
+        upload_result: Callable[[], tuple[Path | bool | str | None, bool]],
+        queued_status_update: Callable[[str, str], None],
+        queued_text_update: Callable[[str], None],
+        queued_text_update_replace_last_line: Callable[[str], None],
+        caught_error: SignalInstance,
+        upload_retry_cb: Callable[[UploadFailure], UploadRetryAction] | None,
+        qbittorrent_save_path: str | None,
+        record_outcome: Callable[[TrackerSelection, TrackerRunOutcome], None],
+    ) -> None:
+        """Settle one tracker's upload, then inject it and run post-upload hooks.
+
+        `upload_result` returns what `_upload_tracker_with_retry` returned: the
+        call itself in a sequential run, or the finished upload's result in a
+        concurrent one. `ProcessCancelled` propagates to the caller, which owns
+        the remaining trackers.
+        """
+        try:
+            execute_upload, skipped_upload = upload_result()
+
+            if execute_upload:
+                queued_text_update("<br /><span>Successfully uploaded release</span>")
+                # handle injection
+                injection_succeeded, injection_error = self._inject_with_user_retry(
+                    tracker=tracker,
+                    tracker_name=tracker_name,
+                    torrent_path=torrent_path,
+                    file_input=media_input,
+                    queued_text_update=queued_text_update,
+                    queued_status_update=queued_status_update,
+                    caught_error=caught_error,
+                    upload_retry_cb=upload_retry_cb,
+                    qbittorrent_save_path=qbittorrent_save_path,
+                )
+                if injection_succeeded:
+                    queued_status_update(tracker_name, "✅ Complete")
+                    self._run_post_upload_plugin(
+                        cur_tracker=tracker,
+                        context=context,
+                        torrent_path=torrent_path,
+                        outcome=PostUploadOutcome.SUCCESS,
+                        queued_text_update=queued_text_update,
+                        queued_text_update_replace_last_line=(
+                            queued_text_update_replace_last_line
+                        ),
+                    )
+                else:
+                    # the release is already on the tracker, so this
+                    # must never be offered for a deferred re-upload
+                    record_outcome(tracker, TrackerRunOutcome.INJECTION_FAILED)
+                    self._run_post_upload_plugin(
+                        cur_tracker=tracker,
+                        context=context,
+                        torrent_path=torrent_path,
+                        outcome=PostUploadOutcome.INJECTION_FAILED,
+                        queued_text_update=queued_text_update,
+                        queued_text_update_replace_last_line=(
+                            queued_text_update_replace_last_line
+                        ),
+                        error=injection_error,
+                    )
+            else:
+                # `_upload_tracker_with_retry` already reported the
+                # skip (with phase-appropriate status/text) when it
+                # returned; nothing further to say here. A mid-retry
+                # user skip is deliberately not a post-upload
+                # `SKIPPED` outcome -- that value is reserved for a
+                # pre_upload plugin's decision.
+                if not skipped_upload:
+                    queued_text_update(
+                        '<br /><span style="font-weight: bold; color: red;">Failed to upload release, '
+                        "check logs for information</span>"
+                    )
+                    queued_status_update(tracker_name, "❌ Failed")
+                    self._run_post_upload_plugin(
+                        cur_tracker=tracker,
+                        context=context,
+                        torrent_path=torrent_path,
+                        outcome=PostUploadOutcome.UPLOAD_FAILED,
+                        queued_text_update=queued_text_update,
+                        queued_text_update_replace_last_line=(
+                            queued_text_update_replace_last_line
+                        ),
+                        error="Failed to upload release; check logs for information",
+                    )
+        except ProcessCancelled:
+            raise
+        except Exception as upload_error:
+            queued_text_update(
+                '<br /><br /><p style="font-weight: bold; color: red;">Failed to upload '
+                f"release, check logs for information ({upload_error})</p>",
+            )
+            caught_error.emit(f"Upload Error: {scrub_secrets(traceback.format_exc())}")
+            queued_status_update(tracker_name, "❌ Failed")
+            # an unexpected error anywhere in this block leaves the
+            # upload's fate genuinely unknown, so refuse to offer it
+            # for a deferred re-upload
+            record_outcome(tracker, TrackerRunOutcome.MAY_HAVE_UPLOADED)
+            self._run_post_upload_plugin(
+                cur_tracker=tracker,
+                context=context,
+                torrent_path=torrent_path,
+                outcome=PostUploadOutcome.UPLOAD_FAILED,
+                queued_text_update=queued_text_update,
+                queued_text_update_replace_last_line=(
+                    queued_text_update_replace_last_line
+                ),
+                error=scrub_secrets(str(upload_error)),
+            )
+
+    def _finish_concurrent_uploads(
+        self,
+        *,
+        pending_uploads: Sequence[_PendingTrackerUpload],
+        upload_events: queue.SimpleQueue[_UploadEvent],
+        media_input: Path,
+        context: ProcessingContext,
+        queued_status_update: Callable[[str, str], None],
+        queued_text_update: Callable[[str], None],
+        queued_text_update_replace_last_line: Callable[[str], None],
+        caught_error: SignalInstance,
+        upload_retry_cb: Callable[[UploadFailure], UploadRetryAction] | None,
+        qbittorrent_save_path: str | None,
+        record_outcome: Callable[[TrackerSelection, TrackerRunOutcome], None],
+    ) -> None:
+        """Answer the upload workers' prompts and finish uploads in tracker order.
+
+        A tracker is injected once its own upload and every earlier tracker's
+        have finished, so the client sees the same order as a sequential run.
+        Prompts are shown one at a time, as they arrive. Once the user cancels,
+        uploads that have not started are dropped, later prompts are answered
+        with a cancel and nothing more is injected.
+        """
+        finished: set[int] = set()
+        next_position = 0
+        cancelled = False
+
+        def cancel_remaining() -> None:
+            nonlocal cancelled
+            cancelled = True
+            for pending in pending_uploads:
+                pending.future.cancel()
+
+        while next_position < len(pending_uploads):
+            event = upload_events.get()
+            if not isinstance(event, int):
+                failure, reply = event
+                if cancelled or upload_retry_cb is None:
+                    reply.set_result(UploadRetryAction.CANCEL)
+                    continue
+                try:
+                    action = upload_retry_cb(failure)
+                except BaseException as error:
+                    reply.set_exception(error)
+                    raise
+                if action is UploadRetryAction.CANCEL:
+                    cancel_remaining()
+                reply.set_result(action)
+                continue
+
+            finished.add(event)
+            while next_position in finished:
+                pending = pending_uploads[next_position]
+                next_position += 1
+                if cancelled:
+                    self._report_cancelled_upload(
+                        pending, queued_status_update, record_outcome
+                    )
+                    continue
+                queued_text_update(
+                    '<br /><span>Finishing work for <span style="font-weight: '
+                    f'bold;">{pending.tracker_name}</span></span>'
+                )
+                try:
+                    self._finish_tracker_upload(
+                        tracker=pending.tracker,
+                        tracker_name=pending.tracker_name,
+                        torrent_path=pending.torrent_path,
+                        media_input=media_input,
+                        context=context,
+                        upload_result=pending.future.result,
+                        queued_status_update=queued_status_update,
+                        queued_text_update=queued_text_update,
+                        queued_text_update_replace_last_line=(
+                            queued_text_update_replace_last_line
+                        ),
+                        caught_error=caught_error,
+                        upload_retry_cb=upload_retry_cb,
+                        qbittorrent_save_path=qbittorrent_save_path,
+                        record_outcome=record_outcome,
+                    )
+                except ProcessCancelled:
+                    # the tracker reported its own outcome before raising
+                    queued_status_update(pending.tracker_name, "⏹ Cancelled")
+                    cancel_remaining()
+
+        if cancelled:
+            self.disconnect_from_clients()
+            raise ProcessCancelled
+
+    @staticmethod
+    def _report_cancelled_upload(
+        pending: _PendingTrackerUpload,
+        queued_status_update: Callable[[str, str], None],
+        record_outcome: Callable[[TrackerSelection, TrackerRunOutcome], None],
+    ) -> None:
+        """Report a concurrent upload the user cancelled the run around."""
+        if pending.future.cancelled():
+            queued_status_update(pending.tracker_name, "⏹ Cancelled")
+            record_outcome(pending.tracker, TrackerRunOutcome.NOT_ATTEMPTED)
+            return
+        error = pending.future.exception()
+        if error is None and pending.future.result()[0]:
+            # already on the tracker (and reported as uploaded), only the
+            # injection was cancelled
+            queued_status_update(
+                pending.tracker_name, "⚠️ Uploaded - not injected (cancelled)"
+            )
+            return
+        queued_status_update(pending.tracker_name, "⏹ Cancelled")
+        if error is not None and not isinstance(error, ProcessCancelled):
+            # `_upload_tracker_with_retry` reports every outcome but this one
+            record_outcome(pending.tracker, TrackerRunOutcome.MAY_HAVE_UPLOADED)
+
+    @_discards_base_torrent_job
     def process_trackers(
         self,
         process_dict: dict[str, Any],
@@ -964,12 +1475,6 @@ class ProcessBackEnd:
                 context,
             )
 
-        # handle image uploading
-        images = self.handle_images_for_trackers(
-            context, process_dict, queued_text_update, progress_bar_cb
-        )
-
-        self.progress_bar_cb = progress_bar_cb
         # A resumed job can carry a torrent it already hashed; the caller has
         # verified the media is unchanged before offering it, so cloning from
         # it is safe and skips the run's most expensive step entirely.
@@ -981,7 +1486,6 @@ class ProcessBackEnd:
                 "<br /><span>Reusing the torrent saved with this job "
                 "(no re-hash needed)</span>"
             )
-        tracker_health_cache: dict[TrackerSelection, bool] = {}
 
         # get media input - use context instead of config
         media_input = context.media_input.require_input_path()
@@ -989,6 +1493,65 @@ class ProcessBackEnd:
         input_is_directory = (
             bool(input_kind()) if callable(input_kind) else media_input.is_dir()
         )
+
+        # Probe every tracker being uploaded to at once, up front, so an
+        # unreachable one shows before anything is hashed and no upload waits on
+        # its own probe. Trackers the dupe check already found reachable are not
+        # probed again; should one have gone down since, its upload's retry
+        # probes it afresh.
+        tracker_health_cache = {
+            tracker: True
+            for tracker, healthy in getattr(self, "tracker_health", {}).items()
+            if healthy
+        }
+        if process_dict and phase is not RunPhase.PREPARE:
+            tracker_settings = self.config.settings.trackers.by_selection()
+            upload_trackers = [
+                TrackerSelection(name)
+                for name in process_dict
+                if tracker_settings[TrackerSelection(name)].upload_enabled
+            ]
+            self._prefetch_tracker_health(upload_trackers, tracker_health_cache)
+            unavailable = [
+                tracker
+                for tracker in upload_trackers
+                if tracker_health_cache.get(tracker) is False
+            ]
+            if unavailable:
+                queued_text_update(
+                    '<br /><span style="font-weight: bold; color: #d68c00;">'
+                    "Trackers currently unreachable: "
+                    f"{', '.join(str(tracker) for tracker in unavailable)}"
+                    "</span>"
+                )
+            # the warning is all a failed probe is for: left in the cache it
+            # would fail the upload's first attempt without a request and spend
+            # one of its automatic retries, so each upload probes again instead
+            for tracker in unavailable:
+                del tracker_health_cache[tracker]
+
+        # A pipelined run hashes the base torrent in the background while the
+        # screenshots are optimized and uploaded (and while any prompt is open),
+        # the two are independent. It is joined when the first tracker clones.
+        self._base_torrent_job = None
+        if process_dict and self.config.settings.general.pipeline_torrent_hashing:
+            # images own the progress bar until they are done, hashing reports
+            # to it from then on
+            self.progress_bar_cb = None
+            self._base_torrent_job = self._start_base_torrent_job(
+                working_dir=context.media_input.require_working_dir(),
+                media_input=media_input,
+                carried_torrent=base_torrent_file,
+                queued_text_update=queued_text_update,
+                input_is_directory=input_is_directory,
+            )
+
+        # handle image uploading
+        images = self.handle_images_for_trackers(
+            context, process_dict, queued_text_update, progress_bar_cb
+        )
+
+        self.progress_bar_cb = progress_bar_cb
         release_info = build_series_release_info(context.media_input)
 
         # process
@@ -1213,8 +1776,9 @@ class ProcessBackEnd:
         # Hash once, here, before any tracker is touched. This runs after the
         # overview prompt so the user is never left waiting on a dialog partway
         # through hashing, and only when there is at least one tracker to stamp
-        # for -- with none, there is nothing to hash for.
-        if process_dict:
+        # for -- with none, there is nothing to hash for. A pipelined run is
+        # already hashing in the background.
+        if process_dict and self._base_torrent_job is None:
             base_torrent_file = self._prepare_base_torrent(
                 working_dir=context.media_input.require_working_dir(),
                 media_input=media_input,
@@ -1223,107 +1787,132 @@ class ProcessBackEnd:
                 input_is_directory=input_is_directory,
             )
 
-        # loop from the start and process jobs
-        for idx, (tracker_name, path_data) in enumerate(process_dict.items()):
-            queued_status_update(tracker_name, "▶️ Processing")
-            queued_text_update(
-                f'<br /><span>Starting work for <span style="font-weight: bold;">{tracker_name}</span></span>'
+        # An opt-in concurrent run uploads to several trackers at once; prompts,
+        # client injection and post-upload plugins stay on this thread and run in
+        # tracker order as the uploads finish.
+        upload_executor: ThreadPoolExecutor | None = None
+        if process_dict and phase is not RunPhase.PREPARE:
+            upload_workers = min(
+                self.config.settings.general.tracker_upload_workers, len(process_dict)
             )
+            if upload_workers > 1:
+                upload_executor = ThreadPoolExecutor(
+                    max_workers=upload_workers, thread_name_prefix="tracker_upload"
+                )
+        pending_uploads: list[_PendingTrackerUpload] = []
+        # the base, read once and stamped for each tracker in turn
+        cloner: BaseTorrentCloner | None = None
+        upload_events: queue.SimpleQueue[_UploadEvent] = queue.SimpleQueue()
 
-            # screenshots stuff, updated below for each tracker in the loop
-            tracker_images = None
-            format_images_to_str = None
-            formatted_screens = None
+        def relay_upload_retry(failure: UploadFailure) -> UploadRetryAction:
+            """Hand a worker's prompt to this run's thread to show and answer."""
+            reply: Future[UploadRetryAction] = Future()
+            upload_events.put((failure, reply))
+            return reply.result()
 
-            # get tracker object and tracker info
-            cur_tracker = TrackerSelection(tracker_name)
-            tracker_info = self.config.settings.trackers.by_selection()[cur_tracker]
+        upload_job_retry_cb = upload_retry_cb
+        if upload_executor is not None and upload_retry_cb is not None:
+            upload_job_retry_cb = relay_upload_retry
 
-            # get tracker title and nfo data
-            cur_tracker_release_data = tracker_release_data.get(cur_tracker, {})
-            cur_tracker_title = cur_tracker_release_data.get("title") or ""
-
-            # get just the torrent path (there is other data that we currently aren't using)
-            # >>> {'path': WindowsPath('path.torrent'), 'image_host': 'URLs',
-            # 'image_host_data': ImageUploadFromTo(img_from=<ImageSource.URLS: 'URLs'>, img_to=<ImageSource.URLS: 'URLs'>)}
-            torrent_path: Path = path_data["path"]
-
-            # output current tracker title we're using
-            if cur_tracker_title:
-                queued_text_update(f"<br />Release title: {cur_tracker_title}")
-
-            # Torrent file: every tracker gets a stamped clone of the neutral
-            # base, the first one included. No tracker's artifact is ever
-            # another tracker's clone source, so a UNIT3D upload replacing this
-            # file with the server's rewritten copy (see
-            # Unit3dBaseUploader._download_uploaded_torrent) cannot leak that
-            # tracker's announce, source, comment or "created by" into anyone
-            # else's torrent.
-            queued_text_update("<br /><span>Cloning torrent</span>")
-            if not base_torrent_file:
-                raise FileNotFoundError(
-                    "Failed to determine base torrent file to clone"
-                )
-            clone = clone_torrent(
-                tracker_info=tracker_info,
-                torrent_path=torrent_path,
-                base_torrent_file=base_torrent_file,
-                tracker_name=tracker_name,
-            )
-            _ = write_torrent(torrent_instance=clone, torrent_path=torrent_path)
-
-            nfo = cur_tracker_release_data.get("nfo") or ""
-            if nfo:
-                with open(
-                    torrent_path.with_suffix(".nfo"), "w", encoding="utf-8"
-                ) as log_out:
-                    log_out.write(nfo)
-
-            if phase is RunPhase.PREPARE:
-                # everything this tracker needs now exists; publishing is what a
-                # later run (or the queue) does with it
-                queued_status_update(tracker_name, "📦 Prepared")
+        try:
+            # loop from the start and process jobs
+            for idx, (tracker_name, path_data) in enumerate(process_dict.items()):
+                queued_status_update(tracker_name, "▶️ Processing")
                 queued_text_update(
-                    "<br /><span>Prepared torrent and NFO; not uploading</span>"
+                    f'<br /><span>Starting work for <span style="font-weight: bold;">{tracker_name}</span></span>'
                 )
-                continue
 
-            # pre upload plugin
-            pre_upload_decision, pre_upload_error = self._run_pre_upload_plugin(
-                cur_tracker=cur_tracker,
-                context=context,
-                torrent_path=torrent_path,
-                queued_text_update=queued_text_update,
-                queued_text_update_replace_last_line=(
-                    queued_text_update_replace_last_line
-                ),
-            )
-            if pre_upload_error:
-                # One tracker's plugin failure must not cancel the rest of the
-                # queue, so this continues rather than propagating.
-                LOG.error(
-                    LOG.LOG_SOURCE.BE,
-                    f"Pre-upload plugin failed for {cur_tracker}: {pre_upload_error}",
+                # screenshots stuff, updated below for each tracker in the loop
+                tracker_images = None
+                format_images_to_str = None
+                formatted_screens = None
+
+                # get tracker object and tracker info
+                cur_tracker = TrackerSelection(tracker_name)
+                tracker_info = self.config.settings.trackers.by_selection()[cur_tracker]
+
+                # get tracker title and nfo data
+                cur_tracker_release_data = tracker_release_data.get(cur_tracker, {})
+                cur_tracker_title = cur_tracker_release_data.get("title") or ""
+
+                # get just the torrent path (there is other data that we currently aren't using)
+                # >>> {'path': WindowsPath('path.torrent'), 'image_host': 'URLs',
+                # 'image_host_data': ImageUploadFromTo(img_from=<ImageSource.URLS: 'URLs'>, img_to=<ImageSource.URLS: 'URLs'>)}
+                torrent_path: Path = path_data["path"]
+
+                # output current tracker title we're using
+                if cur_tracker_title:
+                    queued_text_update(f"<br />Release title: {cur_tracker_title}")
+
+                # Torrent file: every tracker gets a stamped clone of the neutral
+                # base, the first one included. No tracker's artifact is ever
+                # another tracker's clone source, so a UNIT3D upload replacing this
+                # file with the server's rewritten copy (see
+                # Unit3dBaseUploader._download_uploaded_torrent) cannot leak that
+                # tracker's announce, source, comment or "created by" into anyone
+                # else's torrent. The base is read into memory once, so nothing
+                # written to disk afterwards can change what later trackers get.
+                if self._base_torrent_job is not None:
+                    base_torrent_file = self._join_base_torrent_job(queued_text_update)
+                queued_text_update("<br /><span>Cloning torrent</span>")
+                if not base_torrent_file:
+                    raise FileNotFoundError(
+                        "Failed to determine base torrent file to clone"
+                    )
+                if cloner is None or cloner.base_torrent_file != base_torrent_file:
+                    cloner = BaseTorrentCloner(base_torrent_file)
+                cloner.write(tracker_info, torrent_path, tracker_name=tracker_name)
+
+                nfo = cur_tracker_release_data.get("nfo") or ""
+                if nfo:
+                    with open(
+                        torrent_path.with_suffix(".nfo"), "w", encoding="utf-8"
+                    ) as log_out:
+                        log_out.write(nfo)
+
+                if phase is RunPhase.PREPARE:
+                    # everything this tracker needs now exists; publishing is what a
+                    # later run (or the queue) does with it
+                    queued_status_update(tracker_name, "📦 Prepared")
+                    queued_text_update(
+                        "<br /><span>Prepared torrent and NFO; not uploading</span>"
+                    )
+                    continue
+
+                # pre upload plugin
+                pre_upload_decision, pre_upload_error = self._run_pre_upload_plugin(
+                    cur_tracker=cur_tracker,
+                    context=context,
+                    torrent_path=torrent_path,
+                    queued_text_update=queued_text_update,
+                    queued_text_update_replace_last_line=(
+                        queued_text_update_replace_last_line
+                    ),
                 )
-                queued_status_update(tracker_name, "❌ Failed")
-                # failed before any upload request was built, so this tracker
-                # is safe to carry into a deferred job
-                record_outcome(cur_tracker, TrackerRunOutcome.UPLOAD_FAILED)
-                continue
+                if pre_upload_error:
+                    # One tracker's plugin failure must not cancel the rest of the
+                    # queue, so this continues rather than propagating.
+                    LOG.error(
+                        LOG.LOG_SOURCE.BE,
+                        f"Pre-upload plugin failed for {cur_tracker}: {pre_upload_error}",
+                    )
+                    queued_status_update(tracker_name, "❌ Failed")
+                    # failed before any upload request was built, so this tracker
+                    # is safe to carry into a deferred job
+                    record_outcome(cur_tracker, TrackerRunOutcome.UPLOAD_FAILED)
+                    continue
 
-            # upload
-            if (
-                tracker_info.upload_enabled
-                and pre_upload_decision is not PreUploadDecision.SKIP
-            ):
-                execute_upload = None
-                skipped_upload = False
-                try:
+                # upload
+                if (
+                    tracker_info.upload_enabled
+                    and pre_upload_decision is not PreUploadDecision.SKIP
+                ):
                     queued_text_update(
                         "<br /><span>Checking tracker availability and uploading "
                         "release</span>"
                     )
-                    execute_upload, skipped_upload = self._upload_tracker_with_retry(
+                    upload_job = functools.partial(
+                        self._upload_tracker_with_retry,
                         tracker=cur_tracker,
                         torrent_path=torrent_path,
                         tracker_health_cache=tracker_health_cache,
@@ -1340,149 +1929,119 @@ class ProcessBackEnd:
                         queued_status_update=queued_status_update,
                         queued_text_update=queued_text_update,
                         caught_error=caught_error,
-                        upload_retry_cb=upload_retry_cb,
+                        upload_retry_cb=upload_job_retry_cb,
                         record_outcome=lambda outcome, tracker=cur_tracker: (
                             record_outcome(tracker, outcome)
                         ),
                     )
-
-                    if execute_upload:
-                        queued_text_update(
-                            "<br /><span>Successfully uploaded release</span>"
+                    if upload_executor is not None:
+                        # finished below, in tracker order, once every tracker has
+                        # been handed to the pool
+                        position = len(pending_uploads)
+                        upload_future = upload_executor.submit(upload_job)
+                        upload_future.add_done_callback(
+                            lambda _future, position=position: upload_events.put(
+                                position
+                            )
                         )
-                        # handle injection
-                        injection_succeeded, injection_error = (
-                            self._inject_with_user_retry(
+                        pending_uploads.append(
+                            _PendingTrackerUpload(
                                 tracker=cur_tracker,
                                 tracker_name=tracker_name,
                                 torrent_path=torrent_path,
-                                file_input=media_input,
-                                queued_text_update=queued_text_update,
-                                queued_status_update=queued_status_update,
-                                caught_error=caught_error,
-                                upload_retry_cb=upload_retry_cb,
-                                qbittorrent_save_path=qbittorrent_save_path,
+                                future=upload_future,
                             )
                         )
-                        if injection_succeeded:
-                            queued_status_update(tracker_name, "✅ Complete")
-                            self._run_post_upload_plugin(
-                                cur_tracker=cur_tracker,
-                                context=context,
-                                torrent_path=torrent_path,
-                                outcome=PostUploadOutcome.SUCCESS,
-                                queued_text_update=queued_text_update,
-                                queued_text_update_replace_last_line=(
-                                    queued_text_update_replace_last_line
-                                ),
-                            )
-                        else:
-                            # the release is already on the tracker, so this
-                            # must never be offered for a deferred re-upload
-                            record_outcome(
-                                cur_tracker, TrackerRunOutcome.INJECTION_FAILED
-                            )
-                            self._run_post_upload_plugin(
-                                cur_tracker=cur_tracker,
-                                context=context,
-                                torrent_path=torrent_path,
-                                outcome=PostUploadOutcome.INJECTION_FAILED,
-                                queued_text_update=queued_text_update,
-                                queued_text_update_replace_last_line=(
-                                    queued_text_update_replace_last_line
-                                ),
-                                error=injection_error,
-                            )
                     else:
-                        # `_upload_tracker_with_retry` already reported the
-                        # skip (with phase-appropriate status/text) when it
-                        # returned; nothing further to say here. A mid-retry
-                        # user skip is deliberately not a post-upload
-                        # `SKIPPED` outcome -- that value is reserved for a
-                        # pre_upload plugin's decision, below.
-                        if not skipped_upload:
-                            queued_text_update(
-                                '<br /><span style="font-weight: bold; color: red;">Failed to upload release, '
-                                "check logs for information</span>"
-                            )
-                            queued_status_update(tracker_name, "❌ Failed")
-                            self._run_post_upload_plugin(
-                                cur_tracker=cur_tracker,
-                                context=context,
+                        try:
+                            self._finish_tracker_upload(
+                                tracker=cur_tracker,
+                                tracker_name=tracker_name,
                                 torrent_path=torrent_path,
-                                outcome=PostUploadOutcome.UPLOAD_FAILED,
+                                media_input=media_input,
+                                context=context,
+                                upload_result=upload_job,
+                                queued_status_update=queued_status_update,
                                 queued_text_update=queued_text_update,
                                 queued_text_update_replace_last_line=(
                                     queued_text_update_replace_last_line
                                 ),
-                                error="Failed to upload release; check logs for information",
+                                caught_error=caught_error,
+                                upload_retry_cb=upload_retry_cb,
+                                qbittorrent_save_path=qbittorrent_save_path,
+                                record_outcome=record_outcome,
                             )
-                except ProcessCancelled:
-                    for remaining_tracker in list(process_dict)[idx:]:
-                        queued_status_update(remaining_tracker, "⏹ Cancelled")
-                    # the tracker at `idx` already reported its own outcome
-                    # before raising; everything after it was never touched
-                    for remaining_tracker in list(process_dict)[idx + 1 :]:
-                        record_outcome(
-                            TrackerSelection(remaining_tracker),
-                            TrackerRunOutcome.NOT_ATTEMPTED,
-                        )
-                    self.disconnect_from_clients()
-                    raise
-                except Exception as upload_error:
+                        except ProcessCancelled:
+                            for remaining_tracker in list(process_dict)[idx:]:
+                                queued_status_update(remaining_tracker, "⏹ Cancelled")
+                            # the tracker at `idx` already reported its own outcome
+                            # before raising; everything after it was never touched
+                            for remaining_tracker in list(process_dict)[idx + 1 :]:
+                                record_outcome(
+                                    TrackerSelection(remaining_tracker),
+                                    TrackerRunOutcome.NOT_ATTEMPTED,
+                                )
+                            self.disconnect_from_clients()
+                            raise
+                elif not tracker_info.upload_enabled and pre_upload_decision is None:
                     queued_text_update(
-                        '<br /><br /><p style="font-weight: bold; color: red;">Failed to upload '
-                        f"release, check logs for information ({upload_error})</p>",
+                        "<br /><span>Skipping upload & injection, upload is disabled</span>"
                     )
-                    caught_error.emit(
-                        f"Upload Error: {scrub_secrets(traceback.format_exc())}"
+                    queued_status_update(tracker_name, "✅ Complete")
+                    record_outcome(cur_tracker, TrackerRunOutcome.UPLOAD_DISABLED)
+                elif (
+                    tracker_info.upload_enabled
+                    and pre_upload_decision is PreUploadDecision.SKIP
+                ):
+                    queued_text_update(
+                        "<br /><span>Skipping upload & injection, upload is disabled via plugin</span>"
                     )
-                    queued_status_update(tracker_name, "❌ Failed")
-                    # an unexpected error anywhere in this block leaves the
-                    # upload's fate genuinely unknown, so refuse to offer it
-                    # for a deferred re-upload
-                    record_outcome(cur_tracker, TrackerRunOutcome.MAY_HAVE_UPLOADED)
+                    queued_status_update(tracker_name, "✅ Complete")
+                    record_outcome(cur_tracker, TrackerRunOutcome.UPLOAD_DISABLED)
                     self._run_post_upload_plugin(
                         cur_tracker=cur_tracker,
                         context=context,
                         torrent_path=torrent_path,
-                        outcome=PostUploadOutcome.UPLOAD_FAILED,
+                        outcome=PostUploadOutcome.SKIPPED,
                         queued_text_update=queued_text_update,
                         queued_text_update_replace_last_line=(
                             queued_text_update_replace_last_line
                         ),
-                        error=scrub_secrets(str(upload_error)),
                     )
-            elif not tracker_info.upload_enabled and pre_upload_decision is None:
-                queued_text_update(
-                    "<br /><span>Skipping upload & injection, upload is disabled</span>"
-                )
-                queued_status_update(tracker_name, "✅ Complete")
-                record_outcome(cur_tracker, TrackerRunOutcome.UPLOAD_DISABLED)
-            elif (
-                tracker_info.upload_enabled
-                and pre_upload_decision is PreUploadDecision.SKIP
-            ):
+
+                nfo_generated_str = "NFO & " if nfo else ""
                 queued_text_update(
-                    "<br /><span>Skipping upload & injection, upload is disabled via plugin</span>"
+                    f"<br /><span>Generated {nfo_generated_str}torrent output directory:\n{torrent_path.parent}</span><br />",
                 )
-                queued_status_update(tracker_name, "✅ Complete")
-                record_outcome(cur_tracker, TrackerRunOutcome.UPLOAD_DISABLED)
-                self._run_post_upload_plugin(
-                    cur_tracker=cur_tracker,
+
+            if pending_uploads:
+                self._finish_concurrent_uploads(
+                    pending_uploads=pending_uploads,
+                    upload_events=upload_events,
+                    media_input=media_input,
                     context=context,
-                    torrent_path=torrent_path,
-                    outcome=PostUploadOutcome.SKIPPED,
+                    queued_status_update=queued_status_update,
                     queued_text_update=queued_text_update,
                     queued_text_update_replace_last_line=(
                         queued_text_update_replace_last_line
                     ),
-                )
-
-            nfo_generated_str = "NFO & " if nfo else ""
-            queued_text_update(
-                f"<br /><span>Generated {nfo_generated_str}torrent output directory:\n{torrent_path.parent}</span><br />",
-            )
+                    caught_error=caught_error,
+                    upload_retry_cb=upload_retry_cb,
+                    qbittorrent_save_path=qbittorrent_save_path,
+                    record_outcome=record_outcome,
+                )
+        finally:
+            if upload_executor is not None:
+                upload_executor.shutdown(wait=False, cancel_futures=True)
+                # a run that failed part way leaves nobody to answer the workers'
+                # prompts, so they are cancelled rather than left waiting
+                while not all(pending.future.done() for pending in pending_uploads):
+                    try:
+                        event = upload_events.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    if not isinstance(event, int):
+                        event[1].set_result(UploadRetryAction.CANCEL)
 
         # disconnect from clients and reset related variables after use
         self.disconnect_from_clients()
@@ -1744,9 +2303,11 @@ class ProcessBackEnd:
                         f"<br />Optimizing {len(files_to_upload)} image(s)"
                     )
                     try:
-                        files_to_upload = self._optimize_images(
-                            progress_bar_cb, files_to_upload
+                        files_to_upload, summary = self._optimize_images(
+                            progress_bar_cb, files_to_upload, to_image_hosts
                         )
+                        if summary:
+                            queued_text_update(f"<br />{summary}")
                     except Exception as opt_e:
                         queued_text_update(
                             f"<br />Failed to optimize image(s) ({opt_e})"
@@ -1916,9 +2477,12 @@ class ProcessBackEnd:
         return dict(by_host) if by_host else None
 
     def _optimize_images(
-        self, progress_bar_cb: Callable[[float], None], files_to_upload: Sequence[Path]
-    ) -> Sequence[Path]:
-        """Optimizes images and returns the optimized images in a list"""
+        self,
+        progress_bar_cb: Callable[[float], None],
+        files_to_upload: Sequence[Path],
+        to_image_hosts: set[ImageHost],
+    ) -> tuple[Sequence[Path], str]:
+        """Optimizes images and returns the optimized images with a run summary"""
 
         def img_optimizer_job_done_callback(
             _png_path: Path, completed: int, total: int
@@ -1928,6 +2492,8 @@ class ProcessBackEnd:
         image_optimizer = MultiProcessImageOptimizer(
             on_job_done=img_optimizer_job_done_callback,
             cpu_fraction=self.config.settings.screenshots.optimize_downloaded_images_percentage,
+            tier=self.config.settings.screenshots.png_optimization,
+            size_limit=self._optimize_size_limit(to_image_hosts),
         )
         img_opt_output_dir = files_to_upload[0].parent / "optimized"
         try:
@@ -1938,7 +2504,27 @@ class ProcessBackEnd:
             # clean up extra images if failed
             shutil.rmtree(img_opt_output_dir, ignore_errors=True)
             raise
-        return optimized_files
+        return optimized_files, image_optimizer.summary()
+
+    def _optimize_size_limit(self, to_image_hosts: set[ImageHost]) -> int:
+        """
+        Size in bytes an optimized image has to fit under, 0 to always fully optimize.
+
+        The configured limit is capped by the smallest published upload limit of
+        the image hosts the images are going to, so stopping early never leaves an
+        image a host would reject.
+        """
+        configured = int(
+            self.config.settings.screenshots.optimize_size_limit_mb * 1024 * 1024
+        )
+        if not configured:
+            return 0
+        host_limits = (
+            IMAGE_HOST_SIZE_LIMITS[host]
+            for host in to_image_hosts
+            if host in IMAGE_HOST_SIZE_LIMITS
+        )
+        return min((configured, *host_limits))
 
     async def handle_image_upload(
         self,
@@ -2165,6 +2751,54 @@ class ProcessBackEnd:
         """
         return {tracker: results[job_id] for tracker, job_id in host_to_job.items()}
 
+    def _start_base_torrent_job(
+        self,
+        working_dir: Path,
+        media_input: Path,
+        carried_torrent: Path | None,
+        queued_text_update: Callable[[str], None],
+        input_is_directory: bool | None = None,
+    ) -> tuple[Future[Path], threading.Event]:
+        """Start `_prepare_base_torrent` on a background worker."""
+        cancel = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="base-torrent")
+        future = executor.submit(
+            self._prepare_base_torrent,
+            working_dir=working_dir,
+            media_input=media_input,
+            carried_torrent=carried_torrent,
+            queued_text_update=queued_text_update,
+            input_is_directory=input_is_directory,
+            cancel=cancel,
+        )
+        # the submitted job still runs, the worker exits once it is done
+        executor.shutdown(wait=False)
+        return future, cancel
+
+    def _join_base_torrent_job(self, queued_text_update: Callable[[str], None]) -> Path:
+        """Wait for the background base torrent, raising anything hashing raised."""
+        if not self._base_torrent_job:
+            raise RuntimeError("No base torrent is being hashed")
+        future, _ = self._base_torrent_job
+        self._base_torrent_job = None
+        if not future.done():
+            queued_text_update(
+                "<br /><span>Waiting for torrent hashing to finish</span>"
+            )
+        return future.result()
+
+    def _discard_base_torrent_job(self) -> None:
+        """Cancel a background base torrent that was never joined."""
+        job = getattr(self, "_base_torrent_job", None)
+        if not job:
+            return
+        self._base_torrent_job = None
+        future, cancel = job
+        cancel.set()
+        # wait for the worker to stop so a killed mkbrr is reaped and the next run
+        # doesn't hash alongside it; the outcome no longer matters
+        wait((future,))
+
     def _prepare_base_torrent(
         self,
         working_dir: Path,
@@ -2172,6 +2806,7 @@ class ProcessBackEnd:
         carried_torrent: Path | None,
         queued_text_update: Callable[[str], None],
         input_is_directory: bool | None = None,
+        cancel: threading.Event | None = None,
     ) -> Path:
         """Put a neutral base torrent in place for every tracker to clone.
 
@@ -2185,10 +2820,13 @@ class ProcessBackEnd:
         lies, so this path is the single answer to "where is the base": a
         resumed job that gets re-saved keeps one, and the job's own stored file
         is never mutated.
+
+        Setting `cancel` stops hashing early with `ProcessCancelled`.
         """
         base_path = working_dir / (
             f"{release_stem(media_input, input_is_directory)}{BASE_TORRENT_SUFFIX}"
         )
+        self.content_manifest = None
 
         if carried_torrent:
             try:
@@ -2206,36 +2844,65 @@ class ProcessBackEnd:
                     f"torrent: {neutralize_error} (re-hashing)</span>"
                 )
 
-        exponent = piece_exponent(content_size(media_input))
+        # one walk of the release sizes the pieces, checks the piece cache and
+        # lays out the torrent, and is kept for the job's fingerprints
+        manifest = scan_content(media_input)
+        self.content_manifest = manifest
+        exponent = piece_exponent(manifest.size)
         queued_text_update(
             f"<br /><span>Piece size: {1 << exponent} bytes (2^{exponent})</span>"
         )
 
+        piece_cache = PieceCache(
+            cache_dir(self.config.settings.general.working_dir) / PIECE_CACHE_NAME
+        )
+        mkbrr_path = self.config.settings.dependencies.mkbrr
+        use_mkbrr = bool(
+            self.config.settings.general.enable_mkbrr
+            and mkbrr_path
+            and mkbrr_path.exists()
+        )
+        reuse_cached_pieces = False
+        if use_mkbrr:
+            reusable = len(piece_cache.known_pieces(manifest.files, 1 << exponent))
+            total_pieces = math.ceil(manifest.size / (1 << exponent))
+            # mkbrr can only hash everything, but it is far faster than hashing
+            # here, so content hashed before (a retried run, a pack with one
+            # episode replaced) is only finished here when most of it is cached
+            if reusable > total_pieces / 2:
+                reuse_cached_pieces = True
+                use_mkbrr = False
+                queued_text_update(
+                    f"<br /><span>Reusing {reusable} cached piece hashes</span>"
+                )
+
         # try mkbrr first if enabled, fallback to torf if not available or on error
         try:
-            if self.config.settings.general.enable_mkbrr and (
-                self.config.settings.dependencies.mkbrr
-                and self.config.settings.dependencies.mkbrr.exists()
-            ):
+            if use_mkbrr and mkbrr_path:
                 queued_text_update(
                     '<br /><span>Generating torrent with <span style="font-weight: bold;">'
                     "mkbrr</span></span>"
                 )
                 mkbrr_generate_torrent(
-                    mkbrr_path=self.config.settings.dependencies.mkbrr,
+                    mkbrr_path=mkbrr_path,
                     path=media_input,
                     output_path=base_path,
                     piece_exponent=exponent,
                     cb=self.mkbrr_torrent_gen_cb,
+                    cancel=cancel,
                 )
+                piece_cache.record_torrent(manifest.files, base_path, media_input)
                 return base_path
             else:
                 raise Exception("mkbrr not configured or not found")
         except Exception as mkbrr_error:
+            if cancel is not None and cancel.is_set():
+                raise ProcessCancelled from mkbrr_error
             # only show error if mkbrr was available but failed
             if (
                 self.config.settings.general.enable_mkbrr
-                and self.config.settings.dependencies.mkbrr
+                and mkbrr_path
+                and not reuse_cached_pieces
             ):
                 queued_text_update(
                     f'<br /><span style="color: red;">mkbrr failed: {mkbrr_error} '
@@ -2246,14 +2913,28 @@ class ProcessBackEnd:
                 '<br /><span>Generating torrent with <span style="font-weight: bold;">'
                 "torf</span></span>"
             )
+
             # Same explicit exponent as mkbrr would have used, so the fallback
             # produces an identically shaped torrent rather than a differently
             # shaped one.
+            def torf_cb(
+                torrent: Torrent, filepath: str, pieces_done: int, pieces_total: int
+            ) -> bool | None:
+                # torf stops hashing when its callback returns anything but None
+                if cancel is not None and cancel.is_set():
+                    return True
+                self.torrent_gen_cb(torrent, filepath, pieces_done, pieces_total)
+                return None
+
             torrent = generate_torrent(
                 path=media_input,
                 piece_exponent=exponent,
-                cb=self.torrent_gen_cb,
+                cb=torf_cb,
+                piece_cache=piece_cache,
+                manifest=manifest,
             )
+            if cancel is not None and cancel.is_set():
+                raise ProcessCancelled from None
             return write_torrent(torrent, base_path)
 
     def upload(
@@ -2301,6 +2982,10 @@ class ProcessBackEnd:
                 tvdb_id=media_search_obj.tvdb_id,
                 season=release_info.season,
                 episode=release_info.episode_start,
+                response_cache=ResponseCache(
+                    cache_dir(self.config.settings.general.working_dir)
+                    / RESPONSE_CACHE_NAME
+                ),
             )
         elif tracker is TrackerSelection.BEYOND_HD:
             bhd_payload = self.config.settings.trackers.beyond_hd
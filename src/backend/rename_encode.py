@@ -1,10 +1,9 @@
 from collections.abc import Mapping, Sequence
 from pathlib import Path
 
-from guessit import guessit
-
 from src.backend.token_replacer import TokenReplacer
 from src.backend.tokens import FileToken
+from src.backend.utils.guessit_helpers import parse_guessit
 from src.config.models import DynamicRangeSettings
 from src.enums.rename import QualitySelection
 from src.enums.token_replacer import ColonReplace, UnfilledTokenRemoval
@@ -76,11 +75,11 @@ class RenameEncodeBackEnd:
         media_input: Path,
         source_input: Path | None = None,
     ) -> QualitySelection | None:
-        source = guessit(media_input.name).get("source", "")
+        source = parse_guessit(media_input.name).get("source", "")
 
         # if we have access to the source file let's instead parse that
         if source_input:
-            check_source_file = guessit(source_input.name).get("source", "")
+            check_source_file = parse_guessit(source_input.name).get("source", "")
             if check_source_file:
                 source = check_source_file
 
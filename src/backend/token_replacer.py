@@ -1,5 +1,6 @@
 from ast import literal_eval
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import lru_cache
 from pathlib import Path
 import re
 from typing import Any, cast
@@ -7,10 +8,8 @@ from typing import Any, cast
 from auto_qpf import ChapterGenerator
 from auto_qpf.enums import ChapterType
 from babelfish.language import Language as BabelLanguage
-from guessit import guessit
 from iso639 import Lang
 from iso639.exceptions import InvalidLanguageValue
-from jinja2 import meta
 from pymediainfo import MediaInfo, Track
 import unidecode
 
@@ -18,7 +17,7 @@ from src.backend.tokens import FileToken, NfoToken, TokenData, Tokens, TokenType
 from src.backend.utils.anime import is_anime_release
 from src.backend.utils.audio_channels import ParseAudioChannels
 from src.backend.utils.audio_codecs import AudioCodecs
-from src.backend.utils.guessit_helpers import get_guessit_title
+from src.backend.utils.guessit_helpers import get_guessit_title, parse_guessit
 from src.backend.utils.language import (
     get_full_language_str,
     get_language_mi,
@@ -61,6 +60,9 @@ _RESERVED_DEVICE_NAMES = frozenset({"CON", "PRN", "AUX", "NUL"})
 # again before _format_token_string returns.
 _TITLE_CLEAN_SENTINEL = "\x00"
 
+# marks a lazily derived fact not worked out yet; None is a valid answer
+_UNRESOLVED: Any = object()
+
 # Source-override spellings that no longer match a QualitySelection value.
 # `dynamic_data` (which carries the override tokens) is persisted with a saved
 # job, so a job created before WEB_DL became "WEB-DL" replays the old text and
@@ -141,14 +143,17 @@ class TokenReplacer:
         # derived properties (computed from payload)
         "primary_file",
         "source_file",
-        "media_info_obj",
-        "source_file_mi_obj",
-        "guess_name",
-        "guess_source_name",
-        "guessit_title",
         # vars (set during __init__)
-        "guessit_language",
         "token_data",
+        # derived facts, resolved on first use (see the properties below)
+        "_media_info_obj",
+        "_source_file_mi_obj",
+        "_guess_name",
+        "_guess_source_name",
+        "_guessit_title",
+        "_guessit_language",
+        # resolved token values, per render
+        "_token_memo",
         # series caches
         "_series_counts",
         "_series_episode_cache",
@@ -302,16 +307,24 @@ class TokenReplacer:
         # derive file references from payload (paths are always current after renames)
         self.primary_file = self._get_primary_file()
         self.source_file = self._get_source_file()
-        self.media_info_obj = self._get_primary_mediainfo()
-        self.source_file_mi_obj = self._get_source_mediainfo()
-        self.guess_name = guessit(self.primary_file.name)
-        self.guess_source_name = (
-            guessit(self.source_file.name) if self.source_file else None
-        )
-        self.guessit_title = get_guessit_title(self.guess_name)
-        self.guessit_language = self._guessit_language()
         self.token_data = Tokens.generate_token_dataclass(token_type)
 
+        # MediaInfo and guessit facts are only worked out once a token needs
+        # them: a `{title} {release_year}` template needs neither
+        self._media_info_obj: Any = _UNRESOLVED
+        self._source_file_mi_obj: Any = _UNRESOLVED
+        self._guess_name: Any = _UNRESOLVED
+        self._guess_source_name: Any = _UNRESOLVED
+        self._guessit_title: Any = _UNRESOLVED
+        self._guessit_language: Any = _UNRESOLVED
+
+        # keyed by everything that shapes a token's output, so a token used as
+        # an `only_if`/`unless` condition and printed too is resolved once
+        self._token_memo: dict[
+            tuple[str | None, str | None, str | None, tuple[str, ...]],
+            str | Sequence[Any] | None,
+        ] = {}
+
         # series counts and episode lookups have different key/value shapes
         self._series_counts: dict[str, int] = {}
         self._series_episode_cache: dict[int, dict[int, dict[str, Any]]] = {}
@@ -371,6 +384,48 @@ class TokenReplacer:
 
         return None
 
+    @property
+    def media_info_obj(self) -> MediaInfo | None:
+        """MediaInfo for the primary file."""
+        if self._media_info_obj is _UNRESOLVED:
+            self._media_info_obj = self._get_primary_mediainfo()
+        return self._media_info_obj
+
+    @property
+    def source_file_mi_obj(self) -> MediaInfo | None:
+        """MediaInfo for the source file."""
+        if self._source_file_mi_obj is _UNRESOLVED:
+            self._source_file_mi_obj = self._get_source_mediainfo()
+        return self._source_file_mi_obj
+
+    @property
+    def guess_name(self) -> Mapping[str, Any]:
+        """guessit's reading of the primary filename."""
+        if self._guess_name is _UNRESOLVED:
+            self._guess_name = parse_guessit(self.primary_file.name)
+        return self._guess_name
+
+    @property
+    def guess_source_name(self) -> Mapping[str, Any] | None:
+        """guessit's reading of the source filename, if there is one."""
+        if self._guess_source_name is _UNRESOLVED:
+            self._guess_source_name = (
+                parse_guessit(self.source_file.name) if self.source_file else None
+            )
+        return self._guess_source_name
+
+    @property
+    def guessit_title(self) -> str:
+        if self._guessit_title is _UNRESOLVED:
+            self._guessit_title = get_guessit_title(self.guess_name)
+        return self._guessit_title
+
+    @property
+    def guessit_language(self) -> str:
+        if self._guessit_language is _UNRESOLVED:
+            self._guessit_language = self._guessit_language_from_name()
+        return self._guessit_language
+
     @property
     def media_input(self) -> Path:
         """Backward compatibility property."""
@@ -391,6 +446,8 @@ class TokenReplacer:
         Returns:
             Optional[str]: Formatted string.
         """
+        # overrides and jinja globals can change between renders
+        self._token_memo.clear()
         if self.flatten:
             tokens = self._parse_user_input()
             # Keyed by the *occurrence* -- the literal `{token|filter}` text as
@@ -433,8 +490,12 @@ class TokenReplacer:
             return jinja_output
 
     def _update_token_data(self, filled_tokens: Mapping[str, object]) -> None:
+        # `token_data` is slotted to the built-in tokens; user tokens have no
+        # field and never reached `get_dict()` anyway
+        valid_tokens = Tokens.get_tokens()
         for key, value in filled_tokens.items():
-            setattr(self.token_data, key, value)
+            if key in valid_tokens:
+                setattr(self.token_data, key, value)
 
     def _parse_user_input(self) -> set[TokenData]:
         """
@@ -442,39 +503,18 @@ class TokenReplacer:
         Filters are always parsed and applied.
         """
         valid_tokens = Tokens.get_tokens()
-
-        # match tokens with optional :opt=...: before or after, and filters using |filter
-        matches = re.finditer(
-            r"{(?::opt=([^:}]*):)?([^}]+?)(?::opt=([^:}]*):)?}", self.token_string
-        )
-        parsed_tokens: set[TokenData] = set()
-        for match in matches:
-            pre_opt = match.group(1) if match.group(1) else ""
-            token_and_filters = match.group(2)
-            post_opt = match.group(3) if match.group(3) else ""
-
-            # split token and filters
-            parts = [p.strip() for p in token_and_filters.split("|")]
-            base_token = parts[0]
-            filters = parts[1:] if len(parts) > 1 else []
-
+        return {
+            token_data
+            for token_data in _scan_flat_template(self.token_string)
             # only accept built-in or user tokens
-            if base_token in valid_tokens or (
-                base_token.startswith("usr_")
+            if token_data.token in valid_tokens
+            or (
+                token_data.token
+                and token_data.token.startswith("usr_")
                 and self.user_tokens
-                and base_token in self.user_tokens
-            ):
-                token_data = TokenData(
-                    pre_token=pre_opt,
-                    token=base_token,
-                    bracket_token=f"{{{base_token}}}",
-                    post_token=post_opt,
-                    full_match=match.group(0),
-                    filters=tuple(filters),  # make filters a tuple for hash-ability
-                )
-                parsed_tokens.add(token_data)
-
-        return parsed_tokens
+                and token_data.token in self.user_tokens
+            )
+        }
 
     def generate_all_tokens(self) -> set[TokenData]:
         valid_tokens = Tokens.get_tokens()
@@ -497,8 +537,7 @@ class TokenReplacer:
             raise AttributeError("Could not detect 'jinja_engine'")
 
         valid_tokens = Tokens.get_tokens()
-        ast = self.jinja_engine.environment.parse(self.token_string)
-        referenced_tokens = meta.find_undeclared_variables(ast)
+        referenced_tokens = self.jinja_engine.compile(self.token_string).variables
         return {
             TokenData(
                 pre_token="",
@@ -512,6 +551,17 @@ class TokenReplacer:
         }
 
     def _get_token_value(self, token_data: TokenData) -> str | Sequence[Any] | None:
+        key = (
+            token_data.token,
+            token_data.pre_token,
+            token_data.post_token,
+            token_data.filters,
+        )
+        if key not in self._token_memo:
+            self._token_memo[key] = self._resolve_token_value(token_data)
+        return self._token_memo[key]
+
+    def _resolve_token_value(self, token_data: TokenData) -> str | Sequence[Any] | None:
         # handle user and prompt tokens
         if (
             self.user_tokens
@@ -759,375 +809,12 @@ class TokenReplacer:
         return value
 
     def _media_tokens(self, token_data: TokenData) -> str:
-        if token_data.bracket_token == Tokens.EDITION.token:
-            return self._edition(token_data)
-
-        elif token_data.bracket_token == Tokens.CUT.token:
-            return self._cut(token_data)
-
-        elif token_data.bracket_token == Tokens.FRAME_SIZE.token:
-            return self._frame_size(token_data)
-
-        elif token_data.bracket_token == Tokens.HYBRID.token:
-            return self._hybrid(token_data)
-
-        elif token_data.bracket_token == Tokens.LOCALIZATION.token:
-            return self._localization(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_BITRATE.token:
-            return self._audio_bitrate(token_data, False)
-
-        elif token_data.bracket_token == Tokens.AUDIO_BITRATE_FORMATTED.token:
-            return self._audio_bitrate(token_data, True)
-
-        elif token_data.bracket_token == Tokens.AUDIO_CHANNEL_S.token:
-            return self._audio_channel_s(token_data, True)
-
-        elif token_data.bracket_token == Tokens.AUDIO_CHANNEL_S_I.token:
-            return self._audio_channel_s(token_data, False)
-
-        elif token_data.bracket_token == Tokens.AUDIO_CHANNEL_S_LAYOUT.token:
-            return self._audio_channel_s_layout(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_CODEC.token:
-            return self._audio_codec(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_CODEC_NO_ATMOS.token:
-            return self._audio_codec_no_atmos(token_data)
-
-        elif token_data.bracket_token == Tokens.ATMOS.token:
-            return self._atmos(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_COMMERCIAL_NAME.token:
-            return self._audio_commercial_name(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_COMPRESSION.token:
-            return self._audio_compression(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_FORMAT_INFO.token:
-            return self._audio_format_info(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_LANGUAGE_1_FULL.token:
-            return self._audio_language_1_full(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_LANGUAGE_1_ISO_639_1.token:
-            return self._audio_language_1_iso_639_x(1, token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_LANGUAGE_1_ISO_639_2.token:
-            return self._audio_language_1_iso_639_x(2, token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_LANGUAGE_2_ISO_639_1.token:
-            return self._audio_language_2_all_iso_639_x(1, False, token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_LANGUAGE_2_ISO_639_2.token:
-            return self._audio_language_2_all_iso_639_x(2, False, token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_LANGUAGE_ALL_ISO_639_1.token:
-            return self._audio_language_2_all_iso_639_x(1, True, token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_LANGUAGE_ALL_ISO_639_2.token:
-            return self._audio_language_2_all_iso_639_x(2, True, token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_LANGUAGE_ALL_FULL.token:
-            return self._audio_language_all_full(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_LANGUAGE_DUAL.token:
-            return self._audio_language_dual(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_LANGUAGE_MULTI.token:
-            return self._audio_language_multi(token_data)
-
-        elif token_data.bracket_token == Tokens.AUDIO_SAMPLE_RATE.token:
-            return self._audio_sample_rate(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_3D.token:
-            return self._3d(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_BIT_DEPTH_SPACE.token:
-            return self._video_bit_depth_x(False, token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_BIT_DEPTH_DASH.token:
-            return self._video_bit_depth_x(True, token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_CODEC.token:
-            return self._video_codec(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_DYNAMIC_RANGE.token:
-            return self._video_dynamic_range(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_DYNAMIC_RANGE_TYPE.token:
-            return self._video_dynamic_range_type(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_DYNAMIC_RANGE_TYPE_INC_SDR.token:
-            return self._video_dynamic_range_type(token_data, include_sdr=True)
-
-        elif (
-            token_data.bracket_token
-            == Tokens.VIDEO_DYNAMIC_RANGE_TYPE_INC_SDR_OVER_1080.token
-        ):
-            return self._video_dynamic_range_type(
-                token_data, include_sdr=True, uhd_only=True
-            )
-
-        elif token_data.bracket_token == Tokens.VIDEO_FORMAT.token:
-            return self._video_format(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_HEIGHT.token:
-            return self._video_height(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_LANGUAGE_FULL.token:
-            return self._video_language_full(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_LANGUAGE_ISO_639_1.token:
-            return self._video_language_iso_639_x(1, token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_LANGUAGE_ISO_639_2.token:
-            return self._video_language_iso_639_x(2, token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_WIDTH.token:
-            return self._video_width(token_data)
-
-        elif token_data.bracket_token == Tokens.TITLE.token:
-            return self._title(token_data)
-
-        elif token_data.bracket_token == Tokens.TITLE_CLEAN.token:
-            return self._title_clean(token_data)
-
-        elif token_data.bracket_token == Tokens.TITLE_EXACT.token:
-            return self._title_exact(token_data)
-
-        elif token_data.bracket_token == Tokens.IMDB_ID.token:
-            return self._imdb_id(token_data)
-
-        elif token_data.bracket_token == Tokens.ORIGINAL_TITLE.token:
-            return self._original_title(token_data)
-
-        elif token_data.bracket_token == Tokens.ORIGINAL_TITLE_FALLBACK_TITLE.token:
-            return self._original_title(token_data, True)
-
-        elif (
-            token_data.bracket_token == Tokens.ORIGINAL_TITLE_FALLBACK_TITLE_CLEAN.token
-        ):
-            return self._original_title(token_data, True, True)
-
-        elif token_data.bracket_token == Tokens.TMDB_ID.token:
-            return self._tmdb_id(token_data)
-
-        elif token_data.bracket_token == Tokens.TVDB_ID.token:
-            return self._tvdb_id(token_data)
-
-        elif token_data.bracket_token == Tokens.MAL_ID.token:
-            return self._mal_id(token_data)
-
-        elif token_data.bracket_token == Tokens.ORIGINAL_FILENAME.token:
-            return self._original_filename(token_data)
-
-        elif token_data.bracket_token == Tokens.ORIGINAL_LANGUAGE.token:
-            return self._original_language(token_data)
-
-        elif token_data.bracket_token == Tokens.ORIGINAL_LANGUAGE_ISO_639_1.token:
-            return self._original_language(token_data, 1)
-
-        elif token_data.bracket_token == Tokens.ORIGINAL_LANGUAGE_ISO_639_2.token:
-            return self._original_language(token_data, 2)
-
-        elif token_data.bracket_token == Tokens.RELEASE_GROUP.token:
-            return self._release_group(token_data)
-
-        elif token_data.bracket_token == Tokens.RELEASE_DATE.token:
-            return self._release_date(token_data)
-
-        elif token_data.bracket_token == Tokens.RELEASERS_NAME.token:
-            return self._releasers_name(token_data)
-
-        elif token_data.bracket_token == Tokens.RELEASE_YEAR.token:
-            return self._release_year(token_data)
-
-        elif token_data.bracket_token == Tokens.RELEASE_YEAR_PARENTHESES.token:
-            return self._release_year_parentheses(token_data)
-
-        elif token_data.bracket_token == Tokens.RESOLUTION.token:
-            return self._resolution(token_data)
-
-        elif token_data.bracket_token == Tokens.REMUX.token:
-            return self._remux(token_data)
-
-        elif token_data.bracket_token == Tokens.RE_RELEASE.token:
-            return self._re_release(token_data)
-
-        elif token_data.bracket_token == Tokens.SOURCE.token:
-            return self._source(token_data)
-
-        elif token_data.bracket_token == Tokens.STREAMING_SERVICE.token:
-            return self._streaming_service(token_data)
-
-        elif token_data.bracket_token == Tokens.AIR_DATE.token:
-            return self._air_date(token_data)
-
-        elif token_data.bracket_token == Tokens.SEASON_NUMBER.token:
-            return self._season_number(token_data)
-
-        elif token_data.bracket_token == Tokens.EPISODE_AIR_DATE.token:
-            return self._episode_air_date(token_data)
-
-        elif token_data.bracket_token == Tokens.EPISODE_NUMBER.token:
-            return self._episode_number(token_data)
-
-        elif token_data.bracket_token == Tokens.EPISODE_NUMBER_ABSOLUTE.token:
-            return self._episode_number_absolute(token_data)
-
-        elif token_data.bracket_token == Tokens.END_EPISODE_NUMBER.token:
-            return self._end_episode_number(token_data)
-
-        elif token_data.bracket_token == Tokens.EPISODE_TITLE.token:
-            return self._episode_title(token_data)
-
-        elif token_data.bracket_token == Tokens.EPISODE_TITLE_CLEAN.token:
-            return self._episode_title_clean(token_data)
-
-        elif token_data.bracket_token == Tokens.EPISODE_TITLE_EXACT.token:
-            return self._episode_title_exact(token_data)
-
-        return ""
+        resolver = _MEDIA_RESOLVERS.get(token_data.bracket_token or "")
+        return resolver(self, token_data) if resolver else ""
 
     def _nfo_tokens(self, token_data: TokenData) -> str | Sequence[Any] | None:
-        if token_data.bracket_token == Tokens.MEDIA_TYPE.token:
-            return self._media_type(token_data)
-
-        elif token_data.bracket_token == Tokens.IS_ANIME.token:
-            return self._is_anime(token_data)
-
-        elif token_data.bracket_token == Tokens.CHAPTER_TYPE.token:
-            return self._chapter_type(token_data)
-
-        elif token_data.bracket_token == Tokens.FORMAT_PROFILE.token:
-            return self._format_profile(token_data)
-
-        elif token_data.bracket_token == Tokens.MEDIA_FILE.token:
-            return self._media_file(token_data)
-
-        elif token_data.bracket_token == Tokens.MEDIA_FILE_NO_EXT.token:
-            return self._media_file_no_ext(token_data)
-
-        elif token_data.bracket_token == Tokens.SOURCE_FILE.token:
-            return self._source_file(token_data)
-
-        elif token_data.bracket_token == Tokens.SOURCE_FILE_NO_EXT.token:
-            return self._source_file_no_ext(token_data)
-
-        elif token_data.bracket_token == Tokens.MEDIA_INFO.token:
-            return self._media_info(token_data)
-
-        elif token_data.bracket_token == Tokens.MEDIA_INFO_SHORT.token:
-            return self._media_info_short(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_BIT_RATE.token:
-            return self._video_bit_rate(token_data, False)
-
-        elif token_data.bracket_token == Tokens.VIDEO_BIT_RATE_NUM_ONLY.token:
-            return self._video_bit_rate(token_data, True)
-
-        elif token_data.bracket_token == Tokens.REPACK.token:
-            return self._repack(token_data)
-
-        elif token_data.bracket_token == Tokens.REPACK_N.token:
-            return self._repack_n(token_data)
-
-        elif token_data.bracket_token == Tokens.REPACK_REASON.token:
-            return self._repack_reason(token_data)
-
-        elif token_data.bracket_token == Tokens.SCREEN_SHOTS.token:
-            return self._screen_shots(token_data)
-
-        elif token_data.bracket_token == Tokens.SCREEN_SHOTS_COMPARISON.token:
-            return self._screen_shots_comparison(token_data)
-
-        elif token_data.bracket_token == Tokens.SCREEN_SHOTS_EVEN_OJB.token:
-            return self._screen_shots_even_obj()
-
-        elif token_data.bracket_token == Tokens.SCREEN_SHOTS_ODD_OBJ.token:
-            return self._screen_shots_odd_obj()
-
-        elif token_data.bracket_token == Tokens.SCREEN_SHOTS_EVEN_STR.token:
-            return self._screen_shots_even_str()
-
-        elif token_data.bracket_token == Tokens.SCREEN_SHOTS_ODD_STR.token:
-            return self._screen_shots_odd_str()
-
-        elif token_data.bracket_token == Tokens.RELEASE_NOTES.token:
-            return self._release_notes(token_data)
-
-        elif token_data.bracket_token == Tokens.FILE_SIZE_BYTES.token:
-            return self._file_size_bytes(token_data)
-
-        elif token_data.bracket_token == Tokens.FILE_SIZE.token:
-            return self._file_size(token_data)
-
-        elif token_data.bracket_token == Tokens.DURATION_MILLISECONDS.token:
-            return self._duration_milliseconds(token_data)
-
-        elif token_data.bracket_token == Tokens.DURATION_SHORT.token:
-            return self._duration_other(token_data, 0)
-
-        elif token_data.bracket_token == Tokens.DURATION_LONG.token:
-            return self._duration_other(token_data, 1)
-
-        elif token_data.bracket_token == Tokens.DURATION_DETAILED.token:
-            return self._duration_other(token_data, 3)
-
-        elif token_data.bracket_token == Tokens.VIDEO_WIDTH.token:
-            return self._video_width(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_HEIGHT.token:
-            return self._video_height(token_data)
-
-        elif token_data.bracket_token == Tokens.ASPECT_RATIO.token:
-            return self._aspect_ratio(token_data)
-
-        elif token_data.bracket_token == Tokens.VIDEO_FRAME_RATE.token:
-            return self._video_frame_rate(token_data)
-
-        elif token_data.bracket_token == Tokens.SUBTITLE_S.token:
-            return self._subtitle_s(token_data)
-
-        elif token_data.bracket_token == Tokens.PROPER.token:
-            return self._proper(token_data)
-
-        elif token_data.bracket_token == Tokens.PROPER_N.token:
-            return self._proper_n(token_data)
-
-        elif token_data.bracket_token == Tokens.PROPER_REASON.token:
-            return self._proper_reason(token_data)
-
-        elif token_data.bracket_token == Tokens.EPISODE_MEDIAINFO.token:
-            return self._episode_mediainfo(token_data)
-
-        elif token_data.bracket_token == Tokens.EPISODE_METADATA.token:
-            return self._episode_metadata(token_data)
-
-        elif token_data.bracket_token == Tokens.EPISODE_METADATA_MEDIAINFO.token:
-            return self._episode_metadata_mediainfo(token_data)
-
-        elif token_data.bracket_token == Tokens.TOTAL_SEASONS.token:
-            return self._total_seasons(token_data)
-
-        elif token_data.bracket_token == Tokens.TOTAL_EPISODES.token:
-            return self._total_episodes(token_data)
-
-        # nfo forge specific tokens
-        elif token_data.bracket_token == Tokens.PROGRAM_INFO.token:
-            return self._program_info(token_data)
-
-        elif token_data.bracket_token == Tokens.SHARED_WITH.token:
-            return self._shared_with(token_data, SharedWithType.BASIC)
-
-        elif token_data.bracket_token == Tokens.SHARED_WITH_BBCODE.token:
-            return self._shared_with(token_data, SharedWithType.BBCODE)
-
-        elif token_data.bracket_token == Tokens.SHARED_WITH_HTML.token:
-            return self._shared_with(token_data, SharedWithType.HTML)
-
-        return ""
+        resolver = _NFO_RESOLVERS.get(token_data.bracket_token or "")
+        return resolver(self, token_data) if resolver else ""
 
     def _format_token_string(
         self, filled_tokens: dict[str, tuple[str, str]]
@@ -1260,10 +947,26 @@ class TokenReplacer:
         if self.edition_override:
             return self._optional_user_input(self.edition_override, token_data)
 
-        def collect_editions(source: dict[str, Any], key: str) -> list[object]:
+        edition = self.media_input_obj.analysis_cache.remember(
+            self.guess_name,
+            "edition",
+            self._detect_edition,
+            (self.media_input.stem, self._custom_edition_key()),
+        )
+        return self._optional_user_input(edition, token_data)
+
+    def _custom_edition_key(self) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """The plugin edition entries in hashable form, for cache variants."""
+        return tuple(
+            (entry.normalized, tuple(entry.re_gex))
+            for entry in self.custom_edition_info
+        )
+
+    def _detect_edition(self) -> str:
+        def collect_editions(source: Mapping[str, Any], key: str) -> list[object]:
             """Helper function to collect edition data from a source."""
             values = source.get(key, [])
-            return values if isinstance(values, list) else [values]
+            return list(values) if isinstance(values, list | tuple) else [values]
 
         # plugin-contributed entries (src.plugins.api.CustomEditionContribution)
         # are recognized alongside the built-in table, same regex matching
@@ -1297,9 +1000,7 @@ class TokenReplacer:
             if not matched:
                 normalized_edition_set.add(item)
 
-        return self._optional_user_input(
-            " ".join(str(item) for item in normalized_edition_set), token_data
-        )
+        return " ".join(str(item) for item in normalized_edition_set)
 
     def _cut(self, token_data: TokenData) -> str:
         """Subset of {edition} covering only "Cut"-classified entries (see
@@ -1326,10 +1027,27 @@ class TokenReplacer:
                         )
             return self._optional_user_input("", token_data)
 
-        def collect_editions(source: dict[str, Any], key: str) -> list[object]:
+        cut = self.media_input_obj.analysis_cache.remember(
+            self.guess_name,
+            "cut",
+            lambda: self._detect_cut(all_edition_info, all_cut_names),
+            (
+                self.media_input.stem,
+                self._custom_edition_key(),
+                self.custom_cut_names,
+            ),
+        )
+        return self._optional_user_input(cut, token_data)
+
+    def _detect_cut(
+        self,
+        all_edition_info: Sequence[RenameNormalization],
+        all_cut_names: frozenset[str],
+    ) -> str:
+        def collect_editions(source: Mapping[str, Any], key: str) -> list[object]:
             """Helper function to collect edition data from a source."""
             values = source.get(key, [])
-            return values if isinstance(values, list) else [values]
+            return list(values) if isinstance(values, list | tuple) else [values]
 
         # ensure we have unique cuts
         normalized_cut_set: set[str] = set()
@@ -1366,18 +1084,25 @@ class TokenReplacer:
                 if matched:
                     break
 
-        return self._optional_user_input(
-            " ".join(str(item) for item in normalized_cut_set), token_data
-        )
+        return " ".join(str(item) for item in normalized_cut_set)
 
     def _frame_size(self, token_data: TokenData) -> str:
         if self.frame_size_override:
             return self._optional_user_input(self.frame_size_override, token_data)
 
-        def collect_editions(source: dict[str, Any], key: str) -> list[object]:
+        frame_size = self.media_input_obj.analysis_cache.remember(
+            self.guess_name,
+            "frame_size",
+            self._detect_frame_size,
+            self.source_file.name if self.source_file else None,
+        )
+        return self._optional_user_input(frame_size, token_data)
+
+    def _detect_frame_size(self) -> str:
+        def collect_editions(source: Mapping[str, Any], key: str) -> list[object]:
             """Helper function to collect edition data from a source."""
             values = source.get(key, [])
-            return values if isinstance(values, list) else [values]
+            return list(values) if isinstance(values, list | tuple) else [values]
 
         # ensure we have unique editions
         edition_set: set[object] = set()
@@ -1393,7 +1118,7 @@ class TokenReplacer:
         for source in [self.guess_name, self.guess_source_name]:
             if source:
                 other = source.get("other", [])
-                items = other if isinstance(other, list) else [other]
+                items = other if isinstance(other, list | tuple) else [other]
                 if "Open Matte" in items:
                     edition_set.add("Open Matte")
                     break
@@ -1408,9 +1133,7 @@ class TokenReplacer:
             edition_set = normalized_edition_set
 
         # convert the set back to a string, joining with spaces
-        return self._optional_user_input(
-            " ".join(str(item) for item in edition_set), token_data
-        )
+        return " ".join(str(item) for item in edition_set)
 
     def _hybrid(self, token_data: TokenData) -> str:
         return self._optional_user_input(
@@ -1496,14 +1219,17 @@ class TokenReplacer:
                 and self.media_info_obj
                 and self.media_info_obj.audio_tracks
             ):
-                audio_codecs = AudioCodecs()
+                audio_track = self.media_info_obj.audio_tracks[0]
                 # The bundled conventions file is a runtime asset in both source and frozen builds.
                 audio_convention_path = Path(
                     RUNTIME_DIR / "config" / "audio_conventions" / "default.json"
                 )
-                codec = audio_codecs.get_codec(
-                    self.media_info_obj.audio_tracks[0],
-                    audio_convention_path,
+                # the conventions file is read per lookup, and the codec is the
+                # same for every tracker's title and NFO, so share it for the run
+                codec = self.media_input_obj.analysis_cache.remember(
+                    audio_track,
+                    "audio_codec",
+                    lambda: AudioCodecs().get_codec(audio_track, audio_convention_path),
                 )
             self._audio_codec_cache = codec
         return self._audio_codec_cache
@@ -1554,7 +1280,9 @@ class TokenReplacer:
     def _audio_language_1_full(self, token_data: TokenData) -> str:
         language = ""
         if self.media_info_obj and self.media_info_obj.audio_tracks:
-            detect_language_code = get_language_mi(self.media_info_obj.audio_tracks[0])
+            detect_language_code = self._track_language(
+                self.media_info_obj.audio_tracks[0]
+            )
             if detect_language_code:
                 detect_language = get_full_language_str(detect_language_code)
                 if detect_language:
@@ -1565,7 +1293,7 @@ class TokenReplacer:
     def _audio_language_1_iso_639_x(self, char_code: int, token_data: TokenData) -> str:
         language = self.guessit_language
         if self.media_info_obj and self.media_info_obj.audio_tracks:
-            detect_language = get_language_mi(
+            detect_language = self._track_language(
                 self.media_info_obj.audio_tracks[0], char_code
             )
             if detect_language:
@@ -1578,7 +1306,7 @@ class TokenReplacer:
     ) -> str:
         language = ""
         guess_lang = self.guessit_language
-        if isinstance(guess_lang, list):
+        if isinstance(guess_lang, list | tuple):
             language_s = {
                 lang for x in guess_lang if (lang := get_language_str(x, char_code))
             }
@@ -1597,7 +1325,7 @@ class TokenReplacer:
             language_list = {
                 lang
                 for track in self.media_info_obj.audio_tracks
-                if (lang := get_language_mi(track, char_code))
+                if (lang := self._track_language(track, char_code))
             }
 
             if language_list:
@@ -1614,7 +1342,7 @@ class TokenReplacer:
     def _audio_language_all_full(self, token_data: TokenData) -> str:
         all_lang = ""
         guess_lang = self.guessit_language
-        if isinstance(guess_lang, list):
+        if isinstance(guess_lang, list | tuple):
             language_s = {
                 lang for x in guess_lang if (lang := get_full_language_str(x))
             }
@@ -1630,7 +1358,7 @@ class TokenReplacer:
             language_set = {
                 lang
                 for track in self.media_info_obj.audio_tracks
-                if (lang := get_language_mi(track))
+                if (lang := self._track_language(track))
             }
 
             if language_set:
@@ -1652,9 +1380,9 @@ class TokenReplacer:
 
         if self.media_info_obj and self.media_info_obj.audio_tracks:
             language_set = {
-                get_language_mi(track)
+                self._track_language(track)
                 for track in self.media_info_obj.audio_tracks
-                if get_language_mi(track)
+                if self._track_language(track)
             }
 
             if len(language_set) >= 2:
@@ -1665,7 +1393,7 @@ class TokenReplacer:
     def _audio_language_multi(self, token_data: TokenData) -> str:
         multi = ""
         language = self.guessit_language
-        if isinstance(language, list):
+        if isinstance(language, list | tuple):
             for lang in language:
                 if lang == "mul":
                     multi = "Multi"
@@ -1676,9 +1404,9 @@ class TokenReplacer:
 
         if self.media_info_obj and self.media_info_obj.audio_tracks:
             language_set = {
-                get_language_mi(track)
+                self._track_language(track)
                 for track in self.media_info_obj.audio_tracks
-                if get_language_mi(track)
+                if self._track_language(track)
             }
             if len(language_set) >= 3:
                 multi = "Multi"
@@ -1945,6 +1673,18 @@ class TokenReplacer:
             if int(self._detect_resolution(self.media_info_obj, True)) <= 1080:
                 return ""
 
+        if self.media_info_obj:
+            dynamic_range_type = self.media_input_obj.analysis_cache.remember(
+                self.media_info_obj,
+                "dynamic_range_type",
+                lambda: self._detect_dynamic_range_type(include_sdr),
+                (self.primary_file.name, include_sdr),
+            )
+        else:
+            dynamic_range_type = self._detect_dynamic_range_type(include_sdr)
+        return self._optional_user_input(dynamic_range_type, token_data)
+
+    def _detect_dynamic_range_type(self, include_sdr: bool) -> str:
         dv = "DV" if "Dolby Vision" in self.guess_name.get("other", "") else ""
         hdr10 = "HDR" if "HDR10" in self.guess_name.get("other", "") else ""
         hdr10_plus = "HDR10Plus" if "HDR10+" in self.guess_name.get("other", "") else ""
@@ -1989,7 +1729,7 @@ class TokenReplacer:
                 else:
                     dynamic_range_type = ""
 
-        return self._optional_user_input(dynamic_range_type, token_data)
+        return dynamic_range_type
 
     def _video_format(self, token_data: TokenData) -> str:
         v_format = ""
@@ -2010,7 +1750,9 @@ class TokenReplacer:
     def _video_language_full(self, token_data: TokenData) -> str:
         language = ""
         if self.media_info_obj and self.media_info_obj.video_tracks:
-            detect_language_code = get_language_mi(self.media_info_obj.video_tracks[0])
+            detect_language_code = self._track_language(
+                self.media_info_obj.video_tracks[0]
+            )
             if detect_language_code:
                 detect_language = get_full_language_str(detect_language_code)
                 if detect_language:
@@ -2022,7 +1764,7 @@ class TokenReplacer:
         detect_language = ""
         if self.media_info_obj and self.media_info_obj.video_tracks:
             track = self.media_info_obj.video_tracks[0]
-            detect_language = get_language_mi(track, char_code) or ""
+            detect_language = self._track_language(track, char_code) or ""
 
         return self._optional_user_input(detect_language, token_data)
 
@@ -2818,7 +2560,7 @@ class TokenReplacer:
         for a_track in mi_obj.audio_tracks:
             a_channel_s = ParseAudioChannels.get_channel_layout(a_track)
             a_lang = None
-            detect_language_code = get_language_mi(a_track)
+            detect_language_code = self._track_language(a_track)
             if detect_language_code:
                 a_lang = get_full_language_str(detect_language_code)
             a_avg_bitrate = calculate_avg_bitrate(a_track)
@@ -3206,13 +2948,13 @@ class TokenReplacer:
             )
         return self._optional_user_input(output, token_data)
 
-    def _guessit_language(self) -> str:
+    def _guessit_language_from_name(self) -> str:
         guess_lang = self.guess_name.get("language")
         if not guess_lang:
             return ""
 
         if (
-            isinstance(guess_lang, list)
+            isinstance(guess_lang, list | tuple)
             and guess_lang
             and isinstance(guess_lang[0], BabelLanguage)
         ):
@@ -3279,6 +3021,16 @@ class TokenReplacer:
 
         return resolution
 
+    def _track_language(self, media_track: Track, char_code: int = 1) -> str | None:
+        """`get_language_mi` for a track, shared with every other replacer for
+        the payload."""
+        return self.media_input_obj.analysis_cache.remember(
+            media_track,
+            "track_language",
+            lambda: get_language_mi(media_track, char_code),
+            char_code,
+        )
+
     def get_language(self, media_track: Track) -> str | None:
         if media_track.language:
             try:
@@ -3501,3 +3253,310 @@ class TokenReplacer:
                 return None
             return val
         return None
+
+
+@lru_cache(maxsize=256)
+def _scan_flat_template(token_string: str) -> tuple[TokenData, ...]:
+    """Every `{token}` occurrence in a flat template, filters already split.
+
+    Templates are shared by every file of a pack and every tracker, so each is
+    scanned once; `_parse_user_input` only picks out the usable tokens.
+    """
+    scanned: list[TokenData] = []
+    # match tokens with optional :opt=...: before or after, and filters using |filter
+    for match in re.finditer(
+        r"{(?::opt=([^:}]*):)?([^}]+?)(?::opt=([^:}]*):)?}", token_string
+    ):
+        # split token and filters
+        base_token, *filters = (part.strip() for part in match.group(2).split("|"))
+        scanned.append(
+            TokenData(
+                pre_token=match.group(1) or "",
+                token=base_token,
+                bracket_token=f"{{{base_token}}}",
+                post_token=match.group(3) or "",
+                full_match=match.group(0),
+                filters=tuple(filters),  # make filters a tuple for hash-ability
+            )
+        )
+    return tuple(scanned)
+
+
+# bracket token -> resolver, looked up by `_media_tokens` and `_nfo_tokens`
+_MEDIA_RESOLVERS: dict[str, Callable[[TokenReplacer, TokenData], str]] = {
+    Tokens.EDITION.token: lambda self, token_data: self._edition(token_data),
+    Tokens.CUT.token: lambda self, token_data: self._cut(token_data),
+    Tokens.FRAME_SIZE.token: lambda self, token_data: self._frame_size(token_data),
+    Tokens.HYBRID.token: lambda self, token_data: self._hybrid(token_data),
+    Tokens.LOCALIZATION.token: lambda self, token_data: self._localization(token_data),
+    Tokens.AUDIO_BITRATE.token: lambda self, token_data: self._audio_bitrate(
+        token_data, False
+    ),
+    Tokens.AUDIO_BITRATE_FORMATTED.token: lambda self, token_data: self._audio_bitrate(
+        token_data, True
+    ),
+    Tokens.AUDIO_CHANNEL_S.token: lambda self, token_data: self._audio_channel_s(
+        token_data, True
+    ),
+    Tokens.AUDIO_CHANNEL_S_I.token: lambda self, token_data: self._audio_channel_s(
+        token_data, False
+    ),
+    Tokens.AUDIO_CHANNEL_S_LAYOUT.token: lambda self, token_data: (
+        self._audio_channel_s_layout(token_data)
+    ),
+    Tokens.AUDIO_CODEC.token: lambda self, token_data: self._audio_codec(token_data),
+    Tokens.AUDIO_CODEC_NO_ATMOS.token: lambda self, token_data: (
+        self._audio_codec_no_atmos(token_data)
+    ),
+    Tokens.ATMOS.token: lambda self, token_data: self._atmos(token_data),
+    Tokens.AUDIO_COMMERCIAL_NAME.token: lambda self, token_data: (
+        self._audio_commercial_name(token_data)
+    ),
+    Tokens.AUDIO_COMPRESSION.token: lambda self, token_data: self._audio_compression(
+        token_data
+    ),
+    Tokens.AUDIO_FORMAT_INFO.token: lambda self, token_data: self._audio_format_info(
+        token_data
+    ),
+    Tokens.AUDIO_LANGUAGE_1_FULL.token: lambda self, token_data: (
+        self._audio_language_1_full(token_data)
+    ),
+    Tokens.AUDIO_LANGUAGE_1_ISO_639_1.token: lambda self, token_data: (
+        self._audio_language_1_iso_639_x(1, token_data)
+    ),
+    Tokens.AUDIO_LANGUAGE_1_ISO_639_2.token: lambda self, token_data: (
+        self._audio_language_1_iso_639_x(2, token_data)
+    ),
+    Tokens.AUDIO_LANGUAGE_2_ISO_639_1.token: lambda self, token_data: (
+        self._audio_language_2_all_iso_639_x(1, False, token_data)
+    ),
+    Tokens.AUDIO_LANGUAGE_2_ISO_639_2.token: lambda self, token_data: (
+        self._audio_language_2_all_iso_639_x(2, False, token_data)
+    ),
+    Tokens.AUDIO_LANGUAGE_ALL_ISO_639_1.token: lambda self, token_data: (
+        self._audio_language_2_all_iso_639_x(1, True, token_data)
+    ),
+    Tokens.AUDIO_LANGUAGE_ALL_ISO_639_2.token: lambda self, token_data: (
+        self._audio_language_2_all_iso_639_x(2, True, token_data)
+    ),
+    Tokens.AUDIO_LANGUAGE_ALL_FULL.token: lambda self, token_data: (
+        self._audio_language_all_full(token_data)
+    ),
+    Tokens.AUDIO_LANGUAGE_DUAL.token: lambda self, token_data: (
+        self._audio_language_dual(token_data)
+    ),
+    Tokens.AUDIO_LANGUAGE_MULTI.token: lambda self, token_data: (
+        self._audio_language_multi(token_data)
+    ),
+    Tokens.AUDIO_SAMPLE_RATE.token: lambda self, token_data: self._audio_sample_rate(
+        token_data
+    ),
+    Tokens.VIDEO_3D.token: lambda self, token_data: self._3d(token_data),
+    Tokens.VIDEO_BIT_DEPTH_SPACE.token: lambda self, token_data: (
+        self._video_bit_depth_x(False, token_data)
+    ),
+    Tokens.VIDEO_BIT_DEPTH_DASH.token: lambda self, token_data: self._video_bit_depth_x(
+        True, token_data
+    ),
+    Tokens.VIDEO_CODEC.token: lambda self, token_data: self._video_codec(token_data),
+    Tokens.VIDEO_DYNAMIC_RANGE.token: lambda self, token_data: (
+        self._video_dynamic_range(token_data)
+    ),
+    Tokens.VIDEO_DYNAMIC_RANGE_TYPE.token: lambda self, token_data: (
+        self._video_dynamic_range_type(token_data)
+    ),
+    Tokens.VIDEO_DYNAMIC_RANGE_TYPE_INC_SDR.token: lambda self, token_data: (
+        self._video_dynamic_range_type(token_data, include_sdr=True)
+    ),
+    Tokens.VIDEO_DYNAMIC_RANGE_TYPE_INC_SDR_OVER_1080.token: lambda self, token_data: (
+        self._video_dynamic_range_type(token_data, include_sdr=True, uhd_only=True)
+    ),
+    Tokens.VIDEO_FORMAT.token: lambda self, token_data: self._video_format(token_data),
+    Tokens.VIDEO_HEIGHT.token: lambda self, token_data: self._video_height(token_data),
+    Tokens.VIDEO_LANGUAGE_FULL.token: lambda self, token_data: (
+        self._video_language_full(token_data)
+    ),
+    Tokens.VIDEO_LANGUAGE_ISO_639_1.token: lambda self, token_data: (
+        self._video_language_iso_639_x(1, token_data)
+    ),
+    Tokens.VIDEO_LANGUAGE_ISO_639_2.token: lambda self, token_data: (
+        self._video_language_iso_639_x(2, token_data)
+    ),
+    Tokens.VIDEO_WIDTH.token: lambda self, token_data: self._video_width(token_data),
+    Tokens.TITLE.token: lambda self, token_data: self._title(token_data),
+    Tokens.TITLE_CLEAN.token: lambda self, token_data: self._title_clean(token_data),
+    Tokens.TITLE_EXACT.token: lambda self, token_data: self._title_exact(token_data),
+    Tokens.IMDB_ID.token: lambda self, token_data: self._imdb_id(token_data),
+    Tokens.ORIGINAL_TITLE.token: lambda self, token_data: self._original_title(
+        token_data
+    ),
+    Tokens.ORIGINAL_TITLE_FALLBACK_TITLE.token: lambda self, token_data: (
+        self._original_title(token_data, True)
+    ),
+    Tokens.ORIGINAL_TITLE_FALLBACK_TITLE_CLEAN.token: lambda self, token_data: (
+        self._original_title(token_data, True, True)
+    ),
+    Tokens.TMDB_ID.token: lambda self, token_data: self._tmdb_id(token_data),
+    Tokens.TVDB_ID.token: lambda self, token_data: self._tvdb_id(token_data),
+    Tokens.MAL_ID.token: lambda self, token_data: self._mal_id(token_data),
+    Tokens.ORIGINAL_FILENAME.token: lambda self, token_data: self._original_filename(
+        token_data
+    ),
+    Tokens.ORIGINAL_LANGUAGE.token: lambda self, token_data: self._original_language(
+        token_data
+    ),
+    Tokens.ORIGINAL_LANGUAGE_ISO_639_1.token: lambda self, token_data: (
+        self._original_language(token_data, 1)
+    ),
+    Tokens.ORIGINAL_LANGUAGE_ISO_639_2.token: lambda self, token_data: (
+        self._original_language(token_data, 2)
+    ),
+    Tokens.RELEASE_GROUP.token: lambda self, token_data: self._release_group(
+        token_data
+    ),
+    Tokens.RELEASE_DATE.token: lambda self, token_data: self._release_date(token_data),
+    Tokens.RELEASERS_NAME.token: lambda self, token_data: self._releasers_name(
+        token_data
+    ),
+    Tokens.RELEASE_YEAR.token: lambda self, token_data: self._release_year(token_data),
+    Tokens.RELEASE_YEAR_PARENTHESES.token: lambda self, token_data: (
+        self._release_year_parentheses(token_data)
+    ),
+    Tokens.RESOLUTION.token: lambda self, token_data: self._resolution(token_data),
+    Tokens.REMUX.token: lambda self, token_data: self._remux(token_data),
+    Tokens.RE_RELEASE.token: lambda self, token_data: self._re_release(token_data),
+    Tokens.SOURCE.token: lambda self, token_data: self._source(token_data),
+    Tokens.STREAMING_SERVICE.token: lambda self, token_data: self._streaming_service(
+        token_data
+    ),
+    Tokens.AIR_DATE.token: lambda self, token_data: self._air_date(token_data),
+    Tokens.SEASON_NUMBER.token: lambda self, token_data: self._season_number(
+        token_data
+    ),
+    Tokens.EPISODE_AIR_DATE.token: lambda self, token_data: self._episode_air_date(
+        token_data
+    ),
+    Tokens.EPISODE_NUMBER.token: lambda self, token_data: self._episode_number(
+        token_data
+    ),
+    Tokens.EPISODE_NUMBER_ABSOLUTE.token: lambda self, token_data: (
+        self._episode_number_absolute(token_data)
+    ),
+    Tokens.END_EPISODE_NUMBER.token: lambda self, token_data: self._end_episode_number(
+        token_data
+    ),
+    Tokens.EPISODE_TITLE.token: lambda self, token_data: self._episode_title(
+        token_data
+    ),
+    Tokens.EPISODE_TITLE_CLEAN.token: lambda self, token_data: (
+        self._episode_title_clean(token_data)
+    ),
+    Tokens.EPISODE_TITLE_EXACT.token: lambda self, token_data: (
+        self._episode_title_exact(token_data)
+    ),
+}
+_NFO_RESOLVERS: dict[
+    str, Callable[[TokenReplacer, TokenData], str | Sequence[Any] | None]
+] = {
+    Tokens.MEDIA_TYPE.token: lambda self, token_data: self._media_type(token_data),
+    Tokens.IS_ANIME.token: lambda self, token_data: self._is_anime(token_data),
+    Tokens.CHAPTER_TYPE.token: lambda self, token_data: self._chapter_type(token_data),
+    Tokens.FORMAT_PROFILE.token: lambda self, token_data: self._format_profile(
+        token_data
+    ),
+    Tokens.MEDIA_FILE.token: lambda self, token_data: self._media_file(token_data),
+    Tokens.MEDIA_FILE_NO_EXT.token: lambda self, token_data: self._media_file_no_ext(
+        token_data
+    ),
+    Tokens.SOURCE_FILE.token: lambda self, token_data: self._source_file(token_data),
+    Tokens.SOURCE_FILE_NO_EXT.token: lambda self, token_data: self._source_file_no_ext(
+        token_data
+    ),
+    Tokens.MEDIA_INFO.token: lambda self, token_data: self._media_info(token_data),
+    Tokens.MEDIA_INFO_SHORT.token: lambda self, token_data: self._media_info_short(
+        token_data
+    ),
+    Tokens.VIDEO_BIT_RATE.token: lambda self, token_data: self._video_bit_rate(
+        token_data, False
+    ),
+    Tokens.VIDEO_BIT_RATE_NUM_ONLY.token: lambda self, token_data: self._video_bit_rate(
+        token_data, True
+    ),
+    Tokens.REPACK.token: lambda self, token_data: self._repack(token_data),
+    Tokens.REPACK_N.token: lambda self, token_data: self._repack_n(token_data),
+    Tokens.REPACK_REASON.token: lambda self, token_data: self._repack_reason(
+        token_data
+    ),
+    Tokens.SCREEN_SHOTS.token: lambda self, token_data: self._screen_shots(token_data),
+    Tokens.SCREEN_SHOTS_COMPARISON.token: lambda self, token_data: (
+        self._screen_shots_comparison(token_data)
+    ),
+    Tokens.SCREEN_SHOTS_EVEN_OJB.token: lambda self, _token_data: (
+        self._screen_shots_even_obj()
+    ),
+    Tokens.SCREEN_SHOTS_ODD_OBJ.token: lambda self, _token_data: (
+        self._screen_shots_odd_obj()
+    ),
+    Tokens.SCREEN_SHOTS_EVEN_STR.token: lambda self, _token_data: (
+        self._screen_shots_even_str()
+    ),
+    Tokens.SCREEN_SHOTS_ODD_STR.token: lambda self, _token_data: (
+        self._screen_shots_odd_str()
+    ),
+    Tokens.RELEASE_NOTES.token: lambda self, token_data: self._release_notes(
+        token_data
+    ),
+    Tokens.FILE_SIZE_BYTES.token: lambda self, token_data: self._file_size_bytes(
+        token_data
+    ),
+    Tokens.FILE_SIZE.token: lambda self, token_data: self._file_size(token_data),
+    Tokens.DURATION_MILLISECONDS.token: lambda self, token_data: (
+        self._duration_milliseconds(token_data)
+    ),
+    Tokens.DURATION_SHORT.token: lambda self, token_data: self._duration_other(
+        token_data, 0
+    ),
+    Tokens.DURATION_LONG.token: lambda self, token_data: self._duration_other(
+        token_data, 1
+    ),
+    Tokens.DURATION_DETAILED.token: lambda self, token_data: self._duration_other(
+        token_data, 3
+    ),
+    Tokens.VIDEO_WIDTH.token: lambda self, token_data: self._video_width(token_data),
+    Tokens.VIDEO_HEIGHT.token: lambda self, token_data: self._video_height(token_data),
+    Tokens.ASPECT_RATIO.token: lambda self, token_data: self._aspect_ratio(token_data),
+    Tokens.VIDEO_FRAME_RATE.token: lambda self, token_data: self._video_frame_rate(
+        token_data
+    ),
+    Tokens.SUBTITLE_S.token: lambda self, token_data: self._subtitle_s(token_data),
+    Tokens.PROPER.token: lambda self, token_data: self._proper(token_data),
+    Tokens.PROPER_N.token: lambda self, token_data: self._proper_n(token_data),
+    Tokens.PROPER_REASON.token: lambda self, token_data: self._proper_reason(
+        token_data
+    ),
+    Tokens.EPISODE_MEDIAINFO.token: lambda self, token_data: self._episode_mediainfo(
+        token_data
+    ),
+    Tokens.EPISODE_METADATA.token: lambda self, token_data: self._episode_metadata(
+        token_data
+    ),
+    Tokens.EPISODE_METADATA_MEDIAINFO.token: lambda self, token_data: (
+        self._episode_metadata_mediainfo(token_data)
+    ),
+    Tokens.TOTAL_SEASONS.token: lambda self, token_data: self._total_seasons(
+        token_data
+    ),
+    Tokens.TOTAL_EPISODES.token: lambda self, token_data: self._total_episodes(
+        token_data
+    ),
+    Tokens.PROGRAM_INFO.token: lambda self, token_data: self._program_info(token_data),
+    Tokens.SHARED_WITH.token: lambda self, token_data: self._shared_with(
+        token_data, SharedWithType.BASIC
+    ),
+    Tokens.SHARED_WITH_BBCODE.token: lambda self, token_data: self._shared_with(
+        token_data, SharedWithType.BBCODE
+    ),
+    Tokens.SHARED_WITH_HTML.token: lambda self, token_data: self._shared_with(
+        token_data, SharedWithType.HTML
+    ),
+}
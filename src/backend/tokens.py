@@ -326,38 +326,68 @@ class Tokens:
     @classmethod
     def get_token_objects(
         cls, token_type: Iterable[TokenType] | type[TokenType] | None = None
-    ) -> set[TokenType]:
-        """Returns a set of token objects based on the specified token type"""
-        token_types = [FileToken, NfoToken] if token_type is None else [token_type]
-        return {
-            getattr(cls, attr)
-            for attr in dir(cls)
-            for ttype in token_types
-            if isinstance(
-                getattr(cls, attr), ttype if isinstance(ttype, type) else type(ttype)
-            )
-        }
+    ) -> frozenset[TokenType]:
+        """Returns the token objects of the specified token type"""
+        return frozenset().union(
+            *(_TOKEN_OBJECTS[ttype] for ttype in _token_classes(token_type))
+        )
 
     @staticmethod
     def get_tokens(
         token_type: Iterable[TokenType] | type[TokenType] | None = None,
-    ) -> set[str]:
-        """Returns a set of tokens without the brackets based on the specified token type"""
-        return {token.token[1:-1] for token in Tokens.get_token_objects(token_type)}
+    ) -> frozenset[str]:
+        """Returns the tokens without the brackets of the specified token type"""
+        return frozenset().union(
+            *(_TOKEN_NAMES[ttype] for ttype in _token_classes(token_type))
+        )
 
     @staticmethod
     def generate_token_dataclass(
         token_type: Iterable[TokenType] | type[TokenType] | None = None,
     ) -> Any:
-        """This dynamically creates a data class for the tokens above"""
-        fields = [
-            (token, str | None, field(default=None))
-            for token in Tokens.get_tokens(token_type)
-        ]
+        """Returns an empty `TokenInfo` to collect resolved token values in.
 
-        TokenDataClass = make_dataclass(
-            cls_name="TokenInfo",
-            fields=fields,
-            namespace={"get_dict": lambda self: asdict(self)},
-        )
-        return TokenDataClass()
+        `TokenInfo` has a field for every token, so `token_type` only documents
+        which of them the caller will fill; the rest stay None.
+        """
+        return TokenInfo()
+
+
+def _token_classes(
+    token_type: Iterable[TokenType] | type[TokenType] | None,
+) -> tuple[type[TokenType], ...]:
+    """The token classes a `token_type` argument names."""
+    if token_type is None:
+        return (FileToken, NfoToken)
+    if isinstance(token_type, type):
+        return (token_type,)
+    if isinstance(token_type, TokenType):
+        return (type(token_type),)
+    return tuple(
+        ttype if isinstance(ttype, type) else type(ttype) for ttype in token_type
+    )
+
+
+# the registry is fixed once `Tokens` is defined, so it is built once here
+# rather than by reflecting over `Tokens` on every lookup
+_TOKEN_OBJECTS: dict[type[TokenType], frozenset[TokenType]] = {
+    ttype: frozenset(
+        value for value in vars(Tokens).values() if isinstance(value, ttype)
+    )
+    for ttype in (FileToken, NfoToken)
+}
+_TOKEN_NAMES: dict[type[TokenType], frozenset[str]] = {
+    ttype: frozenset(token.token[1:-1] for token in tokens)
+    for ttype, tokens in _TOKEN_OBJECTS.items()
+}
+
+# resolved token values by bare token name, one slot per token
+TokenInfo = make_dataclass(
+    cls_name="TokenInfo",
+    fields=[
+        (token, str | None, field(default=None))
+        for token in sorted(Tokens.get_tokens())
+    ],
+    namespace={"get_dict": lambda self: asdict(self)},
+    slots=True,
+)
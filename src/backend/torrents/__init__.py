@@ -1,8 +1,9 @@
+from .manifest import ContentManifest, scan_content
+from .piece_cache import PIECE_CACHE_NAME, PieceCache
 from .piece_size import MAX_PIECE_EXPONENT, piece_exponent
 from .torrent import (
     BASE_TORRENT_SUFFIX,
-    clone_torrent,
-    content_size,
+    BaseTorrentCloner,
     generate_torrent,
     mkbrr_generate_torrent,
     neutralize_base,
@@ -11,12 +12,15 @@ from .torrent import (
 
 __all__ = (
     "BASE_TORRENT_SUFFIX",
+    "BaseTorrentCloner",
+    "ContentManifest",
     "MAX_PIECE_EXPONENT",
-    "clone_torrent",
-    "content_size",
+    "PIECE_CACHE_NAME",
+    "PieceCache",
     "generate_torrent",
     "mkbrr_generate_torrent",
     "neutralize_base",
     "piece_exponent",
+    "scan_content",
     "write_torrent",
 )
@@ -0,0 +1,191 @@
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import os
+from pathlib import Path
+import time
+
+#: Bytes of SHA-1 per piece in a v1 torrent's `pieces` field.
+PIECE_HASH_SIZE = 20
+
+#: How much of the content a single read (and a single hashing job) covers. The
+#: piece size still decides where hashes split; this only decides how often the
+#: disk and the pool are touched.
+READ_BUFFER_SIZE = 1 << 23
+
+#: Most bytes of content queued for hashing at once. A chunk is at least a
+#: piece, so with large pieces this, not the worker count, bounds the buffers.
+MAX_IN_FLIGHT_BYTES = 1 << 28
+
+#: Most hashing threads used by default, past this the disk rather than the
+#: CPU sets the pace.
+MAX_DEFAULT_WORKERS = 8
+
+#: Default minimum seconds between progress reports.
+PROGRESS_INTERVAL = 0.1
+
+
+def _missing_runs(pieces_total: int, known: Mapping[int, bytes]) -> Iterator[range]:
+    """Consecutive piece indexes not in `known`, as ranges."""
+    first = None
+    for index in range(pieces_total):
+        if index in known:
+            if first is not None:
+                yield range(first, index)
+                first = None
+        elif first is None:
+            first = index
+    if first is not None:
+        yield range(first, pieces_total)
+
+
+def _read_chunks(
+    filepaths: Sequence[Path],
+    sizes: Sequence[int],
+    start: int,
+    stop: int,
+    chunk_size: int,
+) -> Iterator[bytearray]:
+    """Bytes `start` to `stop` of the files read back to back, in chunks.
+
+    Every chunk but the last is exactly `chunk_size`, whichever files it spans,
+    so piece boundaries fall where they would in the concatenated content.
+    """
+    chunk = bytearray(chunk_size)
+    view = memoryview(chunk)
+    filled = 0
+    file_start = 0
+    for filepath, size in zip(filepaths, sizes, strict=True):
+        file_end = file_start + size
+        if file_end > start and file_start < stop:
+            with open(filepath, "rb", buffering=0) as file:
+                position = max(start, file_start)
+                file.seek(position - file_start)
+                remaining = min(stop, file_end) - position
+                while remaining:
+                    read = file.readinto(
+                        view[filled : filled + min(remaining, chunk_size - filled)]
+                    )
+                    if not read:
+                        raise OSError(f"File shrank while being hashed: {filepath}")
+                    filled += read
+                    remaining -= read
+                    if filled == chunk_size:
+                        yield chunk
+                        # the previous chunk may still be hashing, so never
+                        # reuse it
+                        chunk = bytearray(chunk_size)
+                        view = memoryview(chunk)
+                        filled = 0
+        file_start = file_end
+        if file_start >= stop:
+            break
+    if filled:
+        yield chunk[:filled]
+
+
+def _chunks_in_flight(chunk_size: int, workers: int) -> int:
+    """Chunks to keep queued: two per worker, within `MAX_IN_FLIGHT_BYTES`."""
+    return max(1, min(workers * 2, MAX_IN_FLIGHT_BYTES // chunk_size))
+
+
+def _hash_chunk(chunk: bytearray, piece_size: int) -> bytes:
+    # hashlib drops the GIL for inputs this large, so chunks hash in parallel
+    view = memoryview(chunk)
+    return b"".join(
+        hashlib.sha1(view[start : start + piece_size]).digest()  # noqa: S324 - BitTorrent v1 piece hash
+        for start in range(0, len(view), piece_size)
+    )
+
+
+def hash_pieces(
+    filepaths: Sequence[Path],
+    piece_size: int,
+    progress: Callable[[int, int], object] | None = None,
+    *,
+    known: Mapping[int, bytes] | None = None,
+    workers: int | None = None,
+    interval: float = PROGRESS_INTERVAL,
+) -> bytes | None:
+    """Hash `filepaths`, read back to back, into a v1 `pieces` field.
+
+    Files are read sequentially in large buffers on the calling thread and
+    hashed on a pool of `workers` threads (one per core, up to
+    `MAX_DEFAULT_WORKERS`, by default), a buffer at a time. At most two buffers
+    per worker, and no more than `MAX_IN_FLIGHT_BYTES` of them, are queued at
+    once.
+
+    Pieces in `known` (hashes by piece index, see `PieceCache`) are taken as
+    given, and their bytes are never read.
+
+    `progress` gets the pieces hashed so far and the total, at most once per
+    `interval` seconds plus once at the end. Returning anything but None stops
+    hashing, and this returns None, the same contract as torf's callback.
+    """
+    known = known or {}
+    sizes = [os.path.getsize(filepath) for filepath in filepaths]
+    total_size = sum(sizes)
+    pieces_total = -(-total_size // piece_size)
+    chunk_size = max(piece_size, READ_BUFFER_SIZE // piece_size * piece_size)
+    workers = workers or min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS)
+    max_in_flight = _chunks_in_flight(chunk_size, workers)
+    # a worker with no buffer to hash would only sit idle
+    workers = min(workers, max_in_flight)
+
+    pieces = bytearray(pieces_total * PIECE_HASH_SIZE)
+    for index, digest in known.items():
+        pieces[index * PIECE_HASH_SIZE : (index + 1) * PIECE_HASH_SIZE] = digest
+    pieces_done = len(known)
+    last_report = time.monotonic()
+    in_flight: deque[tuple[int, Future[bytes]]] = deque()
+
+    def report() -> bool:
+        """Pass progress on if it is due; whether hashing should go on."""
+        nonlocal last_report
+        now = time.monotonic()
+        if progress is None or (
+            pieces_done < pieces_total and now - last_report < interval
+        ):
+            return True
+        last_report = now
+        return progress(pieces_done, pieces_total) is None
+
+    def collect() -> bool:
+        """Record the oldest chunk's hashes; whether hashing should go on."""
+        nonlocal pieces_done
+        first, future = in_flight.popleft()
+        digest = future.result()
+        pieces[first * PIECE_HASH_SIZE : first * PIECE_HASH_SIZE + len(digest)] = digest
+        pieces_done += len(digest) // PIECE_HASH_SIZE
+        return report()
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="piece_hash"
+    ) as executor:
+        try:
+            for run in _missing_runs(pieces_total, known):
+                first = run.start
+                for chunk in _read_chunks(
+                    filepaths,
+                    sizes,
+                    run.start * piece_size,
+                    min(run.stop * piece_size, total_size),
+                    chunk_size,
+                ):
+                    in_flight.append(
+                        (first, executor.submit(_hash_chunk, chunk, piece_size))
+                    )
+                    first += -(-len(chunk) // piece_size)
+                    if len(in_flight) >= max_in_flight and not collect():
+                        return None
+            while in_flight:
+                if not collect():
+                    return None
+        finally:
+            for _first, future in in_flight:
+                future.cancel()
+    if pieces_done == len(known) and not report():
+        # nothing needed hashing, so nothing has reported the end yet
+        return None
+    return bytes(pieces)
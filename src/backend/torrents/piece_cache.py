@@ -0,0 +1,192 @@
+"""Piece hashes of content hashed before, so a re-hash can skip it.
+
+A release is often hashed more than once: a run retried after a failed upload,
+a job whose media was touched without changing, a season pack with one episode
+replaced. Whole-torrent reuse (a job's saved base) is all or nothing, so any
+change to any file used to mean hashing everything again.
+
+Hashes are kept per file rather than per torrent. A piece lying wholly inside
+one file depends only on that file's bytes and on where the file starts
+relative to the piece grid, so the key is the file's path, size and mtime plus
+the piece size and that alignment. Pieces spanning two files are never cached;
+there is at most one per file boundary, and they are re-hashed every time.
+
+Alignment is what limits reuse. Replacing an episode with one of a different
+size moves every later file against the piece grid, and in a v1 torrent that
+genuinely changes their pieces.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from contextlib import closing
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+import sqlite3
+import time
+
+from torf import Torrent
+
+from src.backend.torrents.hashing import PIECE_HASH_SIZE
+from src.logger.nfo_forge_logger import LOG
+
+PIECE_CACHE_NAME = "piece_hashes.sqlite3"
+
+#: Files remembered before the least recently used are dropped. An entry is
+#: 20 bytes a piece, so this is tens of MB at most.
+MAX_CACHED_FILES = 20_000
+
+
+@dataclass(frozen=True, slots=True)
+class CachedFile:
+    """A content file as it was when its pieces were (or will be) hashed."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, path: Path) -> CachedFile:
+        stat = path.stat()
+        return cls(path=path, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+def _whole_pieces(
+    files: Sequence[CachedFile], piece_size: int
+) -> list[tuple[CachedFile, int, int, int]]:
+    """Each file with its alignment and the pieces lying wholly inside it."""
+    spans = []
+    starts = accumulate((file.size for file in files), initial=0)
+    for file, start in zip(files, starts, strict=False):
+        first = -(-start // piece_size)
+        stop = (start + file.size) // piece_size
+        if stop > first:
+            spans.append((file, start % piece_size, first, stop))
+    return spans
+
+
+class PieceCache:
+    """Per-file piece hashes in a small SQLite database.
+
+    Every call opens and closes its own connection, so one instance is safe to
+    share between threads. A cache that cannot be read or written only costs a
+    re-hash: failures are logged and otherwise treated as misses.
+    """
+
+    def __init__(self, database: Path, max_files: int = MAX_CACHED_FILES) -> None:
+        self.database = database
+        self.max_files = max_files
+
+    def _connect(self) -> sqlite3.Connection:
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.database)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS pieces ("
+            "path TEXT NOT NULL, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+            "piece_size INTEGER NOT NULL, alignment INTEGER NOT NULL, "
+            "hashes BLOB NOT NULL, used_at REAL NOT NULL, "
+            "PRIMARY KEY (path, size, mtime_ns, piece_size, alignment))"
+        )
+        return connection
+
+    def known_pieces(
+        self, files: Sequence[CachedFile], piece_size: int
+    ) -> dict[int, bytes]:
+        """Hashes already known for the torrent `files` make up, by piece index."""
+        known: dict[int, bytes] = {}
+        try:
+            with closing(self._connect()) as connection, connection:
+                for file, alignment, first, stop in _whole_pieces(files, piece_size):
+                    key = (
+                        str(file.path),
+                        file.size,
+                        file.mtime_ns,
+                        piece_size,
+                        alignment,
+                    )
+                    row = connection.execute(
+                        "SELECT hashes FROM pieces WHERE path = ? AND size = ? "
+                        "AND mtime_ns = ? AND piece_size = ? AND alignment = ?",
+                        key,
+                    ).fetchone()
+                    if row is None or len(row[0]) != (stop - first) * PIECE_HASH_SIZE:
+                        continue
+                    connection.execute(
+                        "UPDATE pieces SET used_at = ? WHERE path = ? AND size = ? "
+                        "AND mtime_ns = ? AND piece_size = ? AND alignment = ?",
+                        (time.time(), *key),
+                    )
+                    for index in range(first, stop):
+                        offset = (index - first) * PIECE_HASH_SIZE
+                        known[index] = row[0][offset : offset + PIECE_HASH_SIZE]
+        except sqlite3.Error as error:
+            LOG.warning(LOG.LOG_SOURCE.BE, f"Could not read piece cache: {error}")
+            return {}
+        return known
+
+    def record(
+        self, files: Sequence[CachedFile], piece_size: int, pieces: bytes
+    ) -> None:
+        """Remember the hashes of a torrent made from `files`."""
+        now = time.time()
+        rows = [
+            (
+                str(file.path),
+                file.size,
+                file.mtime_ns,
+                piece_size,
+                alignment,
+                pieces[first * PIECE_HASH_SIZE : stop * PIECE_HASH_SIZE],
+                now,
+            )
+            for file, alignment, first, stop in _whole_pieces(files, piece_size)
+        ]
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO pieces VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                connection.execute(
+                    "DELETE FROM pieces WHERE rowid NOT IN (SELECT rowid FROM pieces "
+                    "ORDER BY used_at DESC LIMIT ?)",
+                    (self.max_files,),
+                )
+        except sqlite3.Error as error:
+            LOG.warning(LOG.LOG_SOURCE.BE, f"Could not update piece cache: {error}")
+
+    def record_torrent(
+        self, files: Sequence[CachedFile], torrent_path: Path, content_path: Path
+    ) -> None:
+        """Remember the hashes of a torrent written by another tool (mkbrr).
+
+        Only recorded when the torrent lists exactly `files`, in the same order
+        and at the same sizes; pieces of a torrent laid out differently cannot
+        be attributed to them.
+        """
+        try:
+            torrent = Torrent.read(torrent_path)
+            listed = [
+                (
+                    file.parts[1:] if torrent.mode == "multifile" else (file.name,),
+                    file.size,
+                )
+                for file in torrent.files
+            ]
+            pieces = torrent.metainfo["info"]["pieces"]
+        except Exception as error:
+            LOG.warning(
+                LOG.LOG_SOURCE.BE, f"Could not read hashes for the piece cache: {error}"
+            )
+            return
+        expected = [
+            (
+                file.path.relative_to(content_path).parts
+                if content_path.is_dir()
+                else (file.path.name,),
+                file.size,
+            )
+            for file in files
+        ]
+        if listed == expected:
+            self.record(files, torrent.piece_size, pieces)
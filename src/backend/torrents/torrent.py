@@ -1,22 +1,29 @@
+from bisect import bisect_right
 from collections.abc import Callable
+from itertools import accumulate
 from pathlib import Path
 import re
-import shutil
 import subprocess
+import threading
 from typing import Any
 import urllib.parse
 
-from torf import Torrent
+from torf import PathError, Torrent
 
+from src.backend.torrents.hashing import PROGRESS_INTERVAL, hash_pieces
+from src.backend.torrents.manifest import (
+    INDEX_SIDECAR_GLOBS,
+    INDEX_SIDECAR_SUFFIXES,
+    ContentManifest,
+    scan_content,
+)
+from src.backend.torrents.piece_cache import PieceCache
 from src.backend.utils.subprocess_flags import get_subprocess_creation_flags
 from src.exceptions import MkbrrTorrentError, ProcessError
 from src.logger.nfo_forge_logger import LOG
 from src.payloads.trackers import TrackerInfo
 from src.version import __version__, program_name
 
-INDEX_SIDECAR_SUFFIXES = frozenset({".lwi", ".ffindex"})
-INDEX_SIDECAR_GLOBS = ("*.lwi", "*.ffindex", "*.LWI", "*.FFINDEX")
-
 BASE_TORRENT_SUFFIX = ".base.torrent"
 
 #: What the torf path writes as ``created by``. mkbrr writes its own string and
@@ -40,42 +47,86 @@ def _validate_torrent_contents(torrent: Torrent) -> None:
         )
 
 
-def content_size(path: Path) -> int:
-    """Total bytes the generated torrent will cover.
-
-    Built from torf's own walk with the same `exclude_globs` the torrent uses,
-    so the size matches exactly the file set that ends up in it -- a release
-    near a piece size band boundary must not be sized from a total that
-    includes files the torrent excludes. No hashing happens here; constructing
-    the torrent only walks and stats.
-    """
-    return Torrent(path=path, exclude_globs=INDEX_SIDECAR_GLOBS).size
-
-
 def generate_torrent(
     path: Path,
     piece_exponent: int,
     cb: Callable[[Torrent, str, int, int], Any],
+    progress_interval: float = PROGRESS_INTERVAL,
+    piece_cache: PieceCache | None = None,
+    manifest: ContentManifest | None = None,
 ) -> Torrent:
     """Hash the media into a neutral base torrent.
 
     Neutral means no announce, source or comment: this torrent belongs to no
     tracker and is never uploaded, so no tracker's server can rewrite it. Every
     tracker -- including the first -- gets a stamped clone of it instead (see
-    `clone_torrent`).
+    `BaseTorrentCloner`).
 
     `piece_exponent` is applied verbatim rather than letting torf choose, so
     this fallback produces a torrent shaped identically to the one mkbrr would
     have produced (see `src/backend/torrents/piece_size.py`).
+
+    torf lays out the metainfo, but the pieces are hashed by `hash_pieces`
+    rather than `Torrent.generate`, which reads a piece at a time. `cb` keeps
+    torf's callback contract, except that it is called at most every
+    `progress_interval` seconds rather than for every piece; a return value
+    other than None stops hashing and leaves the torrent without pieces.
+
+    With a `piece_cache`, pieces of files hashed before are taken from it
+    rather than read, and this run's hashes are added to it.
+
+    The torrent is laid out from `manifest` (scanned from `path` when not
+    given) rather than from torf's own walk of the tree.
     """
+    if manifest is None:
+        manifest = scan_content(path)
+    files = manifest.files
+    filepaths = manifest.filepaths
+    ends = list(accumulate(file.size for file in files))
+    if not ends or ends[-1] < 1:
+        raise PathError(path, msg="Empty or all files excluded")
     torrent = Torrent(
-        path=path,
         private=True,
         piece_size=2**piece_exponent,
         created_by=NFO_FORGE_CREATOR,
-        exclude_globs=INDEX_SIDECAR_GLOBS,
     )
-    torrent.generate(callback=cb, interval=0)
+    info = torrent.metainfo["info"]
+    info["name"] = path.name
+    if manifest.is_directory:
+        info["files"] = [
+            {"length": file.size, "path": list(file.path.relative_to(path).parts)}
+            for file in files
+        ]
+    else:
+        info["length"] = files[0].size
+
+    def progress(pieces_done: int, pieces_total: int) -> object:
+        # the file the last hashed piece ended in, as torf would report it
+        offset = min(pieces_done * torrent.piece_size, ends[-1]) - 1
+        filepath = filepaths[bisect_right(ends, offset)]
+        return cb(torrent, str(filepath), pieces_done, pieces_total)
+
+    known = (
+        piece_cache.known_pieces(files, torrent.piece_size)
+        if piece_cache is not None
+        else {}
+    )
+    if known:
+        LOG.info(
+            LOG.LOG_SOURCE.BE,
+            f"Reusing {len(known)} of {torrent.pieces} piece hashes from the cache",
+        )
+    pieces = hash_pieces(
+        filepaths,
+        torrent.piece_size,
+        progress,
+        known=known,
+        interval=progress_interval,
+    )
+    if pieces is not None:
+        torrent.metainfo["info"]["pieces"] = pieces
+        if piece_cache is not None:
+            piece_cache.record(files, torrent.piece_size, pieces)
     _validate_torrent_contents(torrent)
     return torrent
 
@@ -139,28 +190,8 @@ def _shorten(value: str, limit: int = 60) -> str:
     return collapsed if len(collapsed) <= limit else f"{collapsed[:limit]}..."
 
 
-def clone_torrent(
-    tracker_info: TrackerInfo,
-    torrent_path: Path,
-    base_torrent_file: Path,
-    tracker_name: str | None = None,
-) -> Torrent:
-    """Stamp one tracker's identity onto a copy of the neutral base.
-
-    Every tracker gets one of these, the first included -- no tracker's torrent
-    is ever another tracker's clone source. `created_by` is deliberately left
-    alone: it names whichever tool hashed the base, and the base is never
-    uploaded, so nothing can append an "Edited by" to it.
-
-    `tracker_name` is only used to make a configuration error legible.
-    """
-    if not base_torrent_file or not base_torrent_file.exists():
-        raise FileNotFoundError(f"Cannot find file: {base_torrent_file}")
-
-    # Checked before any file work, and before torf gets the chance to fail on
-    # it with a MetainfoError that names neither the tracker nor the setting --
-    # and that quotes the offending value in full, which is unreadable when
-    # what landed in the field is something like an NFO template.
+def _check_announce_url(tracker_info: TrackerInfo, tracker_name: str | None) -> None:
+    """Reject an announce URL torf would refuse, naming the tracker's setting."""
     if tracker_info.announce_url and not _is_announce_url(tracker_info.announce_url):
         who = f"{tracker_name}: t" if tracker_name else "T"
         where = f" ({tracker_name} -> Announce URL)" if tracker_name else ""
@@ -170,29 +201,144 @@ def clone_torrent(
             f"Check Settings -> Trackers{where}."
         )
 
-    shutil.copy(base_torrent_file, torrent_path)
-    torrent = Torrent.read(torrent_path)
-    torrent.private = True
-    # Each field is set *or cleared*, never merely overwritten. The base is
-    # neutral, so there is normally nothing to clear -- but a tracker that
-    # configures no announce, source or comment must end up with none of them
-    # rather than inheriting whatever the source torrent happened to carry. A
-    # stale comment is visible to anyone who opens the torrent in a client, and
-    # a stale source tag changes the infohash; both would advertise the wrong
-    # tracker. A tracker with no announce URL wants no announce at all --
-    # UNIT3D stamps its own in server-side and returns that torrent on upload.
-    if tracker_info.announce_url:
-        torrent.metainfo["announce"] = tracker_info.announce_url
-    else:
-        torrent.metainfo.pop("announce", None)
-        torrent.metainfo.pop("announce-list", None)
-    if tracker_info.source:
-        torrent.metainfo["info"]["source"] = tracker_info.source
-    else:
-        torrent.metainfo["info"].pop("source", None)
-    torrent.comment = tracker_info.comments if tracker_info.comments else None
-    clone = Torrent.copy(torrent)
-    return clone
+
+def _bencoded_end(data: bytes, pos: int) -> int:
+    """Index just past the bencoded value starting at `pos`."""
+    token = data[pos : pos + 1]
+    if token == b"i":
+        return data.index(b"e", pos) + 1
+    if token in (b"l", b"d"):
+        pos += 1
+        while data[pos : pos + 1] != b"e":
+            pos = _bencoded_end(data, pos)
+        return pos + 1
+    colon = data.index(b":", pos)
+    return colon + 1 + int(data[pos:colon])
+
+
+def _bencoded_dict(data: bytes, start: int = 0) -> dict[bytes, bytes]:
+    """Split the dictionary at `start` into its keys and raw bencoded values.
+
+    Values stay encoded, so a large one (an info dict's `pieces`) is sliced out
+    once rather than parsed.
+    """
+    if data[start : start + 1] != b"d":
+        raise ValueError("Expected a bencoded dictionary")
+    items: dict[bytes, bytes] = {}
+    pos = start + 1
+    while data[pos : pos + 1] != b"e":
+        key_end = _bencoded_end(data, pos)
+        key = data[data.index(b":", pos) + 1 : key_end]
+        value_end = _bencoded_end(data, key_end)
+        items[key] = data[key_end:value_end]
+        pos = value_end
+    return items
+
+
+def _bencode_dict(items: dict[bytes, bytes]) -> bytes:
+    """Join keys and raw bencoded values back into a dictionary."""
+    return b"".join(
+        (
+            b"d",
+            *(b"%d:%s%s" % (len(key), key, items[key]) for key in sorted(items)),
+            b"e",
+        )
+    )
+
+
+def _bencode_str(value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return b"%d:%s" % (len(encoded), encoded)
+
+
+class BaseTorrentCloner:
+    """Stamp tracker torrents from a neutral base held in memory.
+
+    Every tracker in a run gets one of these, the first included -- no
+    tracker's torrent is ever another tracker's clone source. The base is read
+    and split into raw fields once, rather than re-reading and re-validating it
+    (and its several MB `pieces` field) for each tracker; a tracker's torrent is
+    the base's fields with announce and comment swapped in and the info dict
+    stamped with its source. Only `source` lives in the info dict, so the
+    stamped info is built once per distinct source and shared by every tracker
+    using it.
+
+    Each field is set *or cleared*, never merely overwritten. The base is
+    neutral, so there is normally nothing to clear -- but a tracker that
+    configures no announce, source or comment must end up with none of them
+    rather than inheriting whatever the source torrent happened to carry. A
+    stale comment is visible to anyone who opens the torrent in a client, and a
+    stale source tag changes the infohash; both would advertise the wrong
+    tracker. A tracker with no announce URL wants no announce at all -- UNIT3D
+    stamps its own in server-side and returns that torrent on upload.
+
+    `created by` is deliberately left alone: it names whichever tool hashed the
+    base, and the base is never uploaded, so nothing can append an "Edited by"
+    to it.
+    """
+
+    def __init__(self, base_torrent_file: Path) -> None:
+        if not base_torrent_file or not base_torrent_file.exists():
+            raise FileNotFoundError(f"Cannot find file: {base_torrent_file}")
+        self.base_torrent_file = base_torrent_file
+        data = base_torrent_file.read_bytes()
+        try:
+            self._metainfo = _bencoded_dict(data)
+            self._info = _bencoded_dict(self._metainfo[b"info"])
+        except (IndexError, KeyError, ValueError) as error:
+            raise ValueError(
+                f"Cannot read base torrent {base_torrent_file}: {error}"
+            ) from error
+        # every clone is private
+        self._info[b"private"] = b"i1e"
+        self._stamped_info: dict[str | None, bytes] = {}
+
+    def info(self, source: str | None) -> bytes:
+        """The bencoded info dict stamped with `source`."""
+        stamped = self._stamped_info.get(source)
+        if stamped is None:
+            info = dict(self._info)
+            if source:
+                info[b"source"] = _bencode_str(source)
+            else:
+                info.pop(b"source", None)
+            stamped = self._stamped_info[source] = _bencode_dict(info)
+        return stamped
+
+    def stamp(
+        self, tracker_info: TrackerInfo, tracker_name: str | None = None
+    ) -> bytes:
+        """One tracker's torrent, bencoded.
+
+        `tracker_name` is only used to make a configuration error legible.
+        """
+        # Checked before torf ever sees the value: its MetainfoError names
+        # neither the tracker nor the setting, and quotes the offending value in
+        # full, which is unreadable when what landed in the field is something
+        # like an NFO template.
+        _check_announce_url(tracker_info, tracker_name)
+        metainfo = dict(self._metainfo)
+        if tracker_info.announce_url:
+            metainfo[b"announce"] = _bencode_str(tracker_info.announce_url)
+        else:
+            metainfo.pop(b"announce", None)
+            metainfo.pop(b"announce-list", None)
+        if tracker_info.comments:
+            metainfo[b"comment"] = _bencode_str(tracker_info.comments)
+        else:
+            metainfo.pop(b"comment", None)
+        metainfo[b"info"] = self.info(tracker_info.source or None)
+        return _bencode_dict(metainfo)
+
+    def write(
+        self,
+        tracker_info: TrackerInfo,
+        torrent_path: Path,
+        tracker_name: str | None = None,
+    ) -> Path:
+        """Write one tracker's torrent to `torrent_path`."""
+        torrent_path.write_bytes(self.stamp(tracker_info, tracker_name))
+        return torrent_path
 
 
 def write_torrent(torrent_instance: Torrent, torrent_path: Path) -> Path:
@@ -208,14 +354,17 @@ def mkbrr_generate_torrent(
     output_path: Path,
     piece_exponent: int,
     cb: Callable[[int], None],
+    cancel: threading.Event | None = None,
 ) -> Torrent | None:
     """Hash the media into a neutral base torrent, using mkbrr.
 
     The torf equivalent is `generate_torrent`; both must produce the same shape,
     which is why the exponent is passed explicitly to each.
+
+    Setting `cancel` kills mkbrr at its next line of output.
     """
     # No --tracker, --source or --comment: the base belongs to no tracker and is
-    # never uploaded, so no tracker's server can rewrite it -- `clone_torrent`
+    # never uploaded, so no tracker's server can rewrite it -- `BaseTorrentCloner`
     # stamps a per-tracker copy instead. Omitting --tracker also keeps mkbrr's
     # per-tracker piece size rules out of the decision, which matters because
     # they prescribe an exact exponent and conflict between trackers.
@@ -253,6 +402,9 @@ def mkbrr_generate_torrent(
             result = None
             if job.stdout:
                 for line in job.stdout:
+                    if cancel is not None and cancel.is_set():
+                        job.kill()
+                        raise MkbrrTorrentError("Torrent generation cancelled")
                     match = re.search(r"\s(\d+)%", line.strip())
                     if match:
                         progress = int(match.group(1))
@@ -1,11 +1,11 @@
 import asyncio
+from collections.abc import Mapping
 from pathlib import Path
 import re
 from tempfile import TemporaryDirectory
 import time
 from typing import Any
 
-from guessit import guessit
 import niquests
 from niquests.typing import MultiPartFilesAltType
 from pymediainfo import MediaInfo
@@ -17,6 +17,7 @@ from src.backend.trackers.cookie_storage import load_cookies, save_cookies
 from src.backend.trackers.utils import DISC_TITLE_REGEX, TRACKER_HEADERS
 from src.backend.upload_retry import classify_upload_post_error
 from src.backend.utils.file_utilities import release_stem
+from src.backend.utils.guessit_helpers import parse_guessit
 from src.backend.utils.http_client import new_http_session
 from src.backend.utils.resolution import VideoResolutionAnalyzer
 from src.enums.media_type import MediaType
@@ -461,21 +462,21 @@ class PTPUploader:
         title_lowered = release_stem(input_path).lower()
 
         # editions
-        def collect_editions(source: dict[str, Any], key: str) -> list[Any]:
+        def collect_editions(source: Mapping[str, Any], key: str) -> list[Any]:
             """Helper function to collect edition data from a source."""
             values = source.get(key, [])
-            return values if isinstance(values, list) else [values]
+            return list(values) if isinstance(values, list | tuple) else [values]
 
         # ensure we have unique editions
         edition_set = set()
-        guess_name = guessit(input_path.name)
+        guess_name = parse_guessit(input_path.name)
 
         # collect editions from `guess_name`
         edition_set.update(collect_editions(guess_name, "edition"))
 
         # check for "Open Matte" in `other` fields of `guess_name`
         other = guess_name.get("other", [])
-        items = other if isinstance(other, list) else [other]
+        items = other if isinstance(other, list | tuple) else [other]
         if "Open Matte" in items:
             edition_set.add("Open Matte")
 
@@ -12,6 +12,7 @@ from src.backend.upload_retry import classify_upload_post_error
 from src.backend.utils.file_utilities import release_stem
 from src.backend.utils.http_client import new_http_session
 from src.backend.utils.resolution import VideoResolutionAnalyzer
+from src.backend.utils.response_cache import ResponseCache
 from src.backend.utils.tvmaze_client import TVmazeClient, normalize_imdb_id
 from src.enums.media_type import MediaType
 from src.enums.tracker_selection import TrackerSelection
@@ -36,6 +37,7 @@ def tl_upload(
     tvdb_id: str | None = None,
     season: int | None = None,
     episode: int | None = None,
+    response_cache: ResponseCache | None = None,
 ) -> bool | None:
     uploader = TLUploader(
         announce_key=announce_key,
@@ -44,6 +46,7 @@ def tl_upload(
         tvdb_id=tvdb_id,
         season=season,
         episode=episode,
+        response_cache=response_cache,
     )
     return uploader.upload(
         nfo=nfo,
@@ -73,6 +76,7 @@ class TLUploader:
         season: int | None = None,
         episode: int | None = None,
         tvmaze_client: TVmazeClient | None = None,
+        response_cache: ResponseCache | None = None,
     ):
         self.announce_key = announce_key
         self.timeout = timeout
@@ -81,6 +85,7 @@ class TLUploader:
         self.season = season
         self.episode = episode
         self._tvmaze_client = tvmaze_client
+        self._response_cache = response_cache
 
     def upload(
         self,
@@ -223,7 +228,9 @@ class TLUploader:
         numbering, among other gaps) we fall back to the show -- still a
         correct title, just less specific.
         """
-        client = self._tvmaze_client or TVmazeClient(timeout=self.timeout)
+        client = self._tvmaze_client or TVmazeClient(
+            timeout=self.timeout, cache=self._response_cache
+        )
         try:
             show_id = client.lookup_show_id(imdb_id=self.imdb_id, tvdb_id=self.tvdb_id)
             if show_id is None:
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+from pathlib import Path
+from threading import Lock
+import time
+from typing import Any, ClassVar
+
+from src.backend.jobs.assets import MediaFingerprint
+from src.backend.utils.working_dir import cache_dir
+from src.config.paths import ConfigPaths
+from src.config.persistence import atomic_write_text
+from src.logger.nfo_forge_logger import LOG
+
+
+class CropDetectCache:
+    """Persist crop detection results for sources that are compared repeatedly.
+
+    The same source is routinely compared against many encodes, and detecting
+    its crop decodes a large part of it every time. Results are keyed by the
+    resolved source path, the detection method and its parameters, so a crop
+    found one way is never served for another. They are only served while the
+    source's size and mtime (its `MediaFingerprint`) are unchanged, so a
+    replaced source is scanned again rather than handed a stale crop.
+
+    Entries are evicted least recently used first once `MAX_ENTRIES` is
+    exceeded. Hit and miss totals are logged on every lookup.
+
+    The cache file is read once and kept in memory. A lookup only updates that
+    copy (when the entry was last used, and the counters), which is written out
+    with the next store; re-writing the file on every hit would cost more than
+    the lookup saves. The file lives in the working directory's cache folder,
+    so the working directory clean up in Settings removes every entry.
+    """
+
+    CACHE_FILE_NAME = "crop_detect_cache.json"
+    MAX_ENTRIES: ClassVar[int] = 200
+    _lock: ClassVar[Lock] = Lock()
+    # each cache file's document, with the (mtime, size) of the file it was
+    # read from, so a file replaced or removed on disk is read again
+    _documents: ClassVar[dict[Path, tuple[tuple[int, int] | None, dict[str, Any]]]] = {}
+
+    def __init__(self, working_dir: Path | None = None) -> None:
+        base = working_dir or ConfigPaths.default_working_dir()
+        self.cache_file = cache_dir(Path(base)) / self.CACHE_FILE_NAME
+
+    def get_or_detect(
+        self,
+        source: Path,
+        segments: int,
+        frames: int,
+        detect: Callable[[], str | None],
+        *,
+        method: str,
+    ) -> str | None:
+        """Return the cached crop for `source`, running `detect` on a miss."""
+        cached = self.lookup(source, segments, frames, method=method)
+        if cached is not None:
+            return cached
+        crop = detect()
+        if crop:
+            self.store(source, segments, frames, crop, method=method)
+        return crop
+
+    def lookup(
+        self, source: Path, segments: int, frames: int, *, method: str
+    ) -> str | None:
+        """Return a cached crop, or None when there is no valid entry."""
+        key = self._key(source, method, segments, frames)
+        with self._lock:
+            document = self._document()
+            entry = document["entries"].get(key)
+            crop = None
+            if isinstance(entry, dict):
+                fingerprint = MediaFingerprint.from_dict(entry)
+                if fingerprint is not None and fingerprint.matches(source):
+                    crop = entry.get("crop")
+                    if isinstance(crop, str):
+                        entry["last_used"] = time.time_ns()
+                    else:
+                        crop = None
+                if crop is None:
+                    # stale entries are dropped rather than left to be evicted
+                    document["entries"].pop(key, None)
+
+            stats = document["stats"]
+            stats["hits" if crop else "misses"] += 1
+
+        LOG.info(
+            LOG.LOG_SOURCE.BE,
+            f"Crop detect cache {'hit' if crop else 'miss'} for {source.name} "
+            f"(hits: {stats['hits']}, misses: {stats['misses']})",
+        )
+        return crop
+
+    def store(
+        self, source: Path, segments: int, frames: int, crop: str, *, method: str
+    ) -> None:
+        """Record a detected crop against the source's current fingerprint."""
+        try:
+            fingerprint = MediaFingerprint.of(source)
+        except OSError as error:
+            LOG.warning(
+                LOG.LOG_SOURCE.BE,
+                f"Could not fingerprint {source} for the crop detect cache: {error}",
+            )
+            return
+
+        with self._lock:
+            document = self._document()
+            document["entries"][self._key(source, method, segments, frames)] = {
+                **fingerprint.to_dict(),
+                "crop": crop,
+                "last_used": time.time_ns(),
+            }
+            self._evict(document["entries"])
+            self._write(document)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the hit/miss counters."""
+        with self._lock:
+            self._documents.pop(self.cache_file, None)
+            try:
+                self.cache_file.unlink(missing_ok=True)
+            except OSError as error:
+                LOG.warning(
+                    LOG.LOG_SOURCE.BE,
+                    f"Could not remove crop detect cache {self.cache_file}: {error}",
+                )
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit/miss totals."""
+        with self._lock:
+            return dict(self._document()["stats"])
+
+    @classmethod
+    def _evict(cls, entries: dict[str, Any]) -> None:
+        if len(entries) <= cls.MAX_ENTRIES:
+            return
+        by_age = sorted(
+            entries,
+            key=lambda key: (
+                entries[key].get("last_used", 0)
+                if isinstance(entries[key], dict)
+                else 0
+            ),
+        )
+        for key in by_age[: len(entries) - cls.MAX_ENTRIES]:
+            del entries[key]
+
+    def _document(self) -> dict[str, Any]:
+        """The in-memory document, read again only if the file changed."""
+        signature = self._signature()
+        loaded = self._documents.get(self.cache_file)
+        if loaded is not None and loaded[0] == signature:
+            return loaded[1]
+        document = self._read()
+        self._documents[self.cache_file] = (signature, document)
+        return document
+
+    def _signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self.cache_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self) -> dict[str, Any]:
+        document: Any = None
+        try:
+            document = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as error:
+            LOG.warning(
+                LOG.LOG_SOURCE.BE,
+                f"Ignoring unreadable crop detect cache {self.cache_file}: {error}",
+            )
+
+        if not isinstance(document, dict):
+            document = {}
+        entries = document.get("entries")
+        stats = document.get("stats")
+        if not isinstance(entries, dict):
+            entries = {}
+        if not isinstance(stats, dict):
+            stats = {}
+        return {
+            "entries": entries,
+            "stats": {
+                name: value if isinstance(value, int) else 0
+                for name, value in (
+                    ("hits", stats.get("hits", 0)),
+                    ("misses", stats.get("misses", 0)),
+                )
+            },
+        }
+
+    def _write(self, document: dict[str, Any]) -> None:
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.cache_file, json.dumps(document, indent=2))
+            self._documents[self.cache_file] = (self._signature(), document)
+        except OSError as error:
+            LOG.warning(
+                LOG.LOG_SOURCE.BE,
+                f"Could not write crop detect cache {self.cache_file}: {error}",
+            )
+
+    @classmethod
+    def _key(cls, source: Path, method: str, segments: int, frames: int) -> str:
+        return f"{cls._resolve(source)}\0{method}\0{segments}\0{frames}"
+
+    @staticmethod
+    def _resolve(source: Path) -> Path:
+        try:
+            return source.resolve()
+        except OSError:
+            return source.absolute()
@@ -1,6 +1,208 @@
-from collections.abc import Mapping, Sequence
+"""One shared, memoized GuessIt parser, plus helpers for reading its results.
+
+GuessIt is the slowest thing most renames do that is not I/O (tens of
+milliseconds a name), and the same names are parsed over and over: the token
+replacer, the series payload, the episode mapper, the title inferer and the
+search backend each used to run their own `guessit()` on a season pack's
+filenames. `parse_guessit` parses a (name, options) pair once per process and
+hands every caller the same read-only result; `parse_guessit_batch` fills the
+cache for a whole pack at once, across a worker pool that is kept alive for the
+session once a pack is big enough to need it.
+
+A release's files are always parsed by their bare name with no options, by
+every caller, so a file is parsed once however many places read it; the key
+includes the options, so a caller that passes any parses the name again.
+
+Results are shared, so they are frozen: the mapping is read-only and GuessIt's
+multi-value lists come back as tuples.
+"""
+
+import atexit
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+import os
+from threading import Lock
+from types import MappingProxyType
 from typing import Any
 
+from guessit import guessit
+
+from src.logger.nfo_forge_logger import LOG
+
+#: Parsed names kept before the least recently used are dropped.
+MAX_CACHED_PARSES = 4096
+
+#: Names still to parse before a batch is spread over worker processes; below
+#: this, handing the names to the workers costs more than it saves.
+BATCH_POOL_MIN = 32
+
+#: Upper bound on the worker processes in the batch pool.
+MAX_BATCH_WORKERS = 8
+
+GuessResult = Mapping[str, Any]
+_OptionsKey = tuple[tuple[str, Any], ...]
+
+_PARSES: OrderedDict[tuple[str, _OptionsKey], GuessResult] = OrderedDict()
+_PARSES_LOCK = Lock()
+
+# started by the first large batch and reused by every later one, so GuessIt is
+# imported into the workers once per session rather than once per batch
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """`value` with every list made a tuple and every dict read-only."""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _options_key(options: Mapping[str, Any] | None) -> _OptionsKey:
+    return tuple(
+        sorted((str(name), _freeze(value)) for name, value in (options or {}).items())
+    )
+
+
+def _thaw_options(options: _OptionsKey) -> dict[str, Any]:
+    """GuessIt options back in the shape it accepts (it wants lists)."""
+    return {
+        name: list(value) if isinstance(value, tuple) else value
+        for name, value in options
+    }
+
+
+def _guessit_dict(name: str, options: _OptionsKey) -> dict[str, Any]:
+    """Run GuessIt itself; module level so worker processes can import it."""
+    return dict(guessit(name, _thaw_options(options)))
+
+
+def _remember(key: tuple[str, _OptionsKey], parsed: Mapping[str, Any]) -> GuessResult:
+    result: GuessResult = MappingProxyType(
+        {field: _freeze(value) for field, value in parsed.items()}
+    )
+    with _PARSES_LOCK:
+        _PARSES[key] = result
+        _PARSES.move_to_end(key)
+        while len(_PARSES) > MAX_CACHED_PARSES:
+            _PARSES.popitem(last=False)
+    return result
+
+
+def _cached(key: tuple[str, _OptionsKey]) -> GuessResult | None:
+    with _PARSES_LOCK:
+        result = _PARSES.get(key)
+        if result is not None:
+            _PARSES.move_to_end(key)
+        return result
+
+
+def parse_guessit(name: str, options: Mapping[str, Any] | None = None) -> GuessResult:
+    """GuessIt's reading of `name`, parsed at most once per process.
+
+    Errors propagate exactly as from `guessit()` and are not cached.
+    """
+    key = (name, _options_key(options))
+    cached = _cached(key)
+    if cached is not None:
+        return cached
+    return _remember(key, _guessit_dict(*key))
+
+
+def _pool_workers() -> int:
+    return min(MAX_BATCH_WORKERS, os.cpu_count() or 1)
+
+
+def _batch_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=_pool_workers())
+            atexit.register(shutdown_guessit_pool)
+        return _POOL
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_guessit_pool(wait: bool = True) -> None:
+    """Shut down the batch pool's worker processes, if it was ever started."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def parse_guessit_batch(
+    names: Iterable[str], options: Mapping[str, Any] | None = None
+) -> list[GuessResult]:
+    """`parse_guessit` for every name, in order, parsing the misses together.
+
+    A season pack's worth of uncached names is spread over the shared process
+    pool. A name GuessIt cannot parse comes back as an empty mapping rather
+    than failing the batch, and a pool that cannot run them falls back to
+    parsing here.
+    """
+    options_key = _options_key(options)
+    keys = [(name, options_key) for name in names]
+    results = {key: cached for key in keys if (cached := _cached(key)) is not None}
+    missing = list(dict.fromkeys(key for key in keys if key not in results))
+
+    parsed: dict[tuple[str, _OptionsKey], Mapping[str, Any]] = {}
+    if len(missing) >= BATCH_POOL_MIN:
+        pool = None
+        try:
+            pool = _batch_pool()
+            workers = _pool_workers()
+            for key, result in zip(
+                missing,
+                pool.map(
+                    _guessit_dict,
+                    [name for name, _options in missing],
+                    [options_key] * len(missing),
+                    chunksize=max(1, len(missing) // (workers * 4)),
+                ),
+                strict=True,
+            ):
+                parsed[key] = result
+        except Exception as error:
+            LOG.warning(
+                LOG.LOG_SOURCE.BE,
+                f"Could not parse names in worker processes, parsing here: {error}",
+            )
+            parsed.clear()
+            # a broken pool would fail every later batch too
+            if isinstance(error, BrokenExecutor) and pool is not None:
+                _discard_pool(pool)
+
+    for key in missing:
+        if key in parsed:
+            results[key] = _remember(key, parsed[key])
+            continue
+        try:
+            results[key] = parse_guessit(key[0], options)
+        except Exception as error:
+            LOG.warning(
+                LOG.LOG_SOURCE.BE, f"GuessIt could not parse {key[0]!r}: {error}"
+            )
+            results[key] = MappingProxyType({})
+    return [results[key] for key in keys]
+
+
+def clear_guessit_cache() -> None:
+    """Forget every parsed name."""
+    with _PARSES_LOCK:
+        _PARSES.clear()
+
 
 def _first_non_empty_string(value: object) -> str:
     """Return the first usable string from a GuessIt scalar or collection."""
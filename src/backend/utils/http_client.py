@@ -11,3 +11,12 @@ def new_http_session() -> niquests.Session:
     server.
     """
     return niquests.Session(disable_http3=True)
+
+
+def new_async_http_session(pool_maxsize: int = 10) -> niquests.AsyncSession:
+    """The async counterpart of `new_http_session`, with the same HTTP/3 rule.
+
+    `pool_maxsize` bounds the connections kept open to one host, which is also
+    how many requests to it run at once.
+    """
+    return niquests.AsyncSession(disable_http3=True, pool_maxsize=pool_maxsize)
@@ -1,21 +1,104 @@
+import atexit
 from collections.abc import Callable, Sequence
-from multiprocessing import Manager, Pool, cpu_count
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from multiprocessing import cpu_count
 from pathlib import Path
 import shutil
-from typing import Any
+from threading import Lock
+import time
+from typing import Any, ClassVar
 
 from PIL import Image
 
+from src.backend.utils.file_utilities import file_bytes_to_str
+from src.enums.png_optimization import PngOptimization
+from src.logger.nfo_forge_logger import LOG
+from src.packages.custom_types import OptimizedImage
 
-def optimize_img_to_png(image_in: Path, output_dir: Path) -> Path:
-    """Converts an image to PNG and optimizes it, saving it in the output directory."""
+# encoder passes for each tier, lightest first
+PNG_OPTIMIZATION_PASSES: dict[PngOptimization, tuple[dict[str, Any], ...]] = {
+    PngOptimization.FAST: ({"compress_level": 1},),
+    PngOptimization.BALANCED: ({"compress_level": 1}, {"compress_level": 6}),
+    PngOptimization.MAX: (
+        {"compress_level": 1},
+        {"compress_level": 6},
+        {"optimize": True},
+    ),
+}
+
+
+def optimize_img_to_png(
+    image_in: Path,
+    output_dir: Path,
+    tier: PngOptimization = PngOptimization.MAX,
+    size_limit: int = 0,
+) -> OptimizedImage:
+    """
+    Converts an image to PNG and optimizes it, saving it in the output directory.
+
+    Without a size limit only the heaviest pass of the tier is run. With one, the
+    tier's passes run lightest first and stop as soon as an image fits under
+    `size_limit` bytes, a PNG that already fits is copied as is.
+
+    Parameters:
+        image_in (Path): Image to optimize.
+        output_dir (Path): Directory the optimized PNG is written to.
+        tier (Optional[PngOptimization]): Optimization tier.
+        size_limit (Optional[int]): Size in bytes that is considered small enough,
+            0 disables stopping early.
+    """
+    start = time.perf_counter()
     output_path = output_dir / image_in.with_suffix(".png").name
-    image = Image.open(image_in)
-    image.save(output_path, "PNG", optimize=True)
-    return output_path
+    original_bytes = image_in.stat().st_size
+
+    if (
+        size_limit
+        and image_in.suffix.lower() == ".png"
+        and original_bytes <= size_limit
+    ):
+        shutil.copyfile(image_in, output_path)
+        return OptimizedImage(
+            output_path, original_bytes, original_bytes, time.perf_counter() - start
+        )
+
+    passes = PNG_OPTIMIZATION_PASSES[tier]
+    if not size_limit:
+        passes = passes[-1:]
+
+    best = b""
+    with Image.open(image_in) as image:
+        for save_kwargs in passes:
+            buffer = BytesIO()
+            image.save(buffer, "PNG", **save_kwargs)
+            encoded = buffer.getvalue()
+            if not best or len(encoded) < len(best):
+                best = encoded
+            if size_limit and len(best) <= size_limit:
+                break
+
+    output_path.write_bytes(best)
+    return OptimizedImage(
+        output_path, original_bytes, len(best), time.perf_counter() - start
+    )
 
 
 class MultiProcessImageOptimizer:
+    """Optimizes images across a process pool that is kept alive for the session.
+
+    Pools are shared per worker count, so repeated runs skip the process start up
+    cost. Jobs are streamed into the pool with at most `batch_size` jobs queued
+    per worker, and progress is reported from the calling thread as each job's
+    future completes. The size and time of every optimized image is kept in
+    `results` for the last run, and `summary` totals them. The pools are shut down when the main window
+    closes, or at interpreter exit for runs without one.
+    """
+
+    _pools: ClassVar[dict[int, ProcessPoolExecutor]] = {}
+    _pools_lock: ClassVar[Lock] = Lock()
+    _exit_hook_registered: ClassVar[bool] = False
+
     def __init__(
         self,
         max_workers: int | None = None,
@@ -23,43 +106,17 @@ class MultiProcessImageOptimizer:
         on_job_done: Callable[[Path, int, int], None] | None = None,
         on_all_jobs_done: Callable[[], None] | None = None,
         cpu_fraction: float = 0.25,
+        tier: PngOptimization = PngOptimization.MAX,
+        size_limit: int = 0,
     ) -> None:
         """Initialize the customizable pool executor."""
         self.max_workers = max_workers or self._get_optimize_workers(cpu_fraction)
-        self.batch_size = batch_size
+        self.batch_size = max(1, batch_size)
         self.on_job_done = on_job_done
         self.on_all_jobs_done = on_all_jobs_done
-
-    def _job_callback(
-        self, result: Path, completed_jobs: Any, total_jobs: int, lock: Any
-    ) -> None:
-        """Updates progress after a job completes."""
-        with lock:
-            completed_jobs.value += 1
-            if self.on_job_done:
-                self.on_job_done(result, completed_jobs.value, total_jobs)
-
-    def _process_batch(
-        self,
-        job_batch: Sequence[Path],
-        output_dir: Path,
-        completed_jobs: Any,
-        total_jobs: int,
-        lock: Any,
-    ) -> None:
-        """Process a batch of jobs concurrently using multiprocessing."""
-        with Pool(self.max_workers) as pool:
-            for in_path in job_batch:
-                pool.apply_async(
-                    optimize_img_to_png,
-                    (in_path, output_dir),
-                    callback=lambda res: self._job_callback(
-                        res, completed_jobs, total_jobs, lock
-                    ),
-                )
-
-            pool.close()
-            pool.join()
+        self.tier = tier
+        self.size_limit = size_limit
+        self.results: list[OptimizedImage] = []
 
     def process_jobs(
         self, input_files: Sequence[Path], output_dir: Path
@@ -71,24 +128,108 @@ class MultiProcessImageOptimizer:
             shutil.rmtree(output_dir)
         output_dir.mkdir(exist_ok=True, parents=True)
 
-        with Manager() as manager:
-            completed_jobs = manager.Value("i", 0)
-            lock = manager.Lock()
+        pool = self._get_pool(self.max_workers)
+        max_in_flight = self.max_workers * self.batch_size
+        pending_files = iter(input_files)
+        in_flight: set[Future[OptimizedImage]] = set()
+        self.results = []
+        completed_jobs = 0
+
+        try:
+            while True:
+                # keep the pool fed without queuing every job up front
+                for in_path in pending_files:
+                    in_flight.add(
+                        pool.submit(
+                            optimize_img_to_png,
+                            in_path,
+                            output_dir,
+                            self.tier,
+                            self.size_limit,
+                        )
+                    )
+                    if len(in_flight) >= max_in_flight:
+                        break
+                if not in_flight:
+                    break
 
-            job_batches = [
-                input_files[i : i + self.batch_size]
-                for i in range(0, len(input_files), self.batch_size)
-            ]
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    self.results.append(result)
+                    completed_jobs += 1
+                    LOG.debug(
+                        LOG.LOG_SOURCE.BE,
+                        f"Optimized {result.path.name} ({self.tier}): "
+                        f"{result.original_bytes} -> {result.optimized_bytes} bytes "
+                        f"in {result.seconds:.2f}s",
+                    )
+                    if self.on_job_done:
+                        self.on_job_done(result.path, completed_jobs, total_jobs)
+        except BrokenProcessPool:
+            # a dead worker poisons the pool, the next run starts a fresh one
+            self._discard_pool(self.max_workers, pool)
+            raise
+        finally:
+            for future in in_flight:
+                future.cancel()
 
-            for batch in job_batches:
-                self._process_batch(batch, output_dir, completed_jobs, total_jobs, lock)
+        if self.results:
+            LOG.info(LOG.LOG_SOURCE.BE, self.summary())
 
-            # callback when all jobs are done
-            if self.on_all_jobs_done:
-                self.on_all_jobs_done()
+        # callback when all jobs are done
+        if self.on_all_jobs_done:
+            self.on_all_jobs_done()
 
         return [x for x in output_dir.glob("*")]
 
+    def summary(self) -> str:
+        """Totals of the last run, used to compare tiers against each other."""
+        if not self.results:
+            return ""
+        original = sum(result.original_bytes for result in self.results)
+        optimized = sum(result.optimized_bytes for result in self.results)
+        seconds = sum(result.seconds for result in self.results)
+        saved = (original - optimized) / original * 100 if original else 0.0
+        return (
+            f"Optimized {len(self.results)} image(s) ({self.tier}): "
+            f"{file_bytes_to_str(original)} -> {file_bytes_to_str(optimized)} "
+            f"({saved:.1f}% saved), {seconds / len(self.results):.2f}s per image"
+        )
+
+    @classmethod
+    def shutdown_pools(cls, wait: bool = True) -> None:
+        """Shut down every pooled worker process.
+
+        Queued jobs are cancelled, but a job already running is not, so
+        `wait=True` blocks until it finishes. Callers on the GUI thread should
+        pass `wait=False`.
+        """
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    @classmethod
+    def _get_pool(cls, max_workers: int) -> ProcessPoolExecutor:
+        with cls._pools_lock:
+            pool = cls._pools.get(max_workers)
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=max_workers)
+                cls._pools[max_workers] = pool
+                if not cls._exit_hook_registered:
+                    atexit.register(cls.shutdown_pools)
+                    cls._exit_hook_registered = True
+            return pool
+
+    @classmethod
+    def _discard_pool(cls, max_workers: int, pool: ProcessPoolExecutor) -> None:
+        with cls._pools_lock:
+            if cls._pools.get(max_workers) is pool:
+                del cls._pools[max_workers]
+        pool.shutdown(wait=False, cancel_futures=True)
+
     @staticmethod
     def _get_optimize_workers(fraction: float = 0.25) -> int:
         total_cores = cpu_count() or 2
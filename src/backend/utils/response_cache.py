@@ -0,0 +1,230 @@
+"""Metadata API responses kept on disk, so a repeated lookup costs nothing.
+
+The same show is looked up over and over: every episode of a season, every
+re-run of a release, every reload of a saved job resolves the same TMDB, TVDB,
+TVmaze and AniList records, and each used to be a fresh round trip (several,
+for a TVDB series with alternate orderings).
+
+Responses are kept in one SQLite database shared by every metadata client,
+each entry fresh for a TTL the caller picks per endpoint -- a search goes
+stale sooner than a show's external IDs. A stale entry is not dropped: when
+the server sent an `ETag` or `Last-Modified`, the next lookup revalidates with
+a conditional request and a 304 renews it without a body. The database is
+bounded by size, least recently used responses going first.
+
+Keys are hashed from the request, with API keys left out, so no credential is
+ever written to disk and changing keys keeps the cache.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from contextlib import closing
+from dataclasses import dataclass
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import time
+from typing import Any
+
+import niquests
+
+from src.logger.nfo_forge_logger import LOG
+
+RESPONSE_CACHE_NAME = "metadata_responses.sqlite3"
+
+#: Bytes of response bodies kept before the least recently used are dropped.
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# request parameters that identify the caller rather than the resource
+_CREDENTIAL_PARAMS = frozenset({"api_key", "apikey"})
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """A decoded response body and what is needed to revalidate it."""
+
+    payload: Any
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers, empty when the server sent none."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def request_key(
+    url: str,
+    params: Mapping[str, Any] | None = None,
+    body: Any = None,
+) -> str:
+    """A stable digest of a request, independent of the API key it used."""
+    canonical = json.dumps(
+        [
+            url,
+            sorted(
+                (str(name), str(value))
+                for name, value in (params or {}).items()
+                if name not in _CREDENTIAL_PARAMS
+            ),
+            body,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Decoded JSON responses in a small SQLite database.
+
+    Every call opens and closes its own connection, so one instance is safe to
+    share between threads. A cache that cannot be read or written only costs a
+    request: failures are logged and otherwise treated as misses.
+    """
+
+    def __init__(self, database: Path, max_bytes: int = MAX_CACHE_BYTES) -> None:
+        self.database = database
+        self.max_bytes = max_bytes
+
+    def _connect(self) -> sqlite3.Connection:
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.database)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body TEXT NOT NULL, etag TEXT, "
+            "last_modified TEXT, expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        return connection
+
+    def get(self, key: str) -> CachedResponse | None:
+        """The entry stored for `key`, fresh or not."""
+        try:
+            with closing(self._connect()) as connection, connection:
+                row = connection.execute(
+                    "SELECT body, etag, last_modified, expires_at FROM responses "
+                    "WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute(
+                    "UPDATE responses SET used_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+            return CachedResponse(
+                payload=json.loads(row[0]),
+                etag=row[1],
+                last_modified=row[2],
+                expires_at=row[3],
+            )
+        except (sqlite3.Error, ValueError) as error:
+            LOG.warning(LOG.LOG_SOURCE.BE, f"Could not read response cache: {error}")
+            return None
+
+    def put(
+        self,
+        key: str,
+        payload: Any,
+        ttl: float,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Store `payload` for `ttl` seconds, with any validators in `headers`."""
+        now = time.time()
+        headers = headers or {}
+        try:
+            body = json.dumps(payload)
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        body,
+                        headers.get("ETag"),
+                        headers.get("Last-Modified"),
+                        now + ttl,
+                        now,
+                    ),
+                )
+                connection.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM ("
+                    "SELECT key, SUM(LENGTH(body)) OVER (ORDER BY used_at DESC) "
+                    "AS running FROM responses) WHERE running > ?)",
+                    (self.max_bytes,),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as error:
+            LOG.warning(LOG.LOG_SOURCE.BE, f"Could not update response cache: {error}")
+
+    def renew(self, key: str, ttl: float) -> CachedResponse | None:
+        """Mark the entry for `key` fresh again, after a 304 confirmed it."""
+        now = time.time()
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    "UPDATE responses SET expires_at = ?, used_at = ? WHERE key = ?",
+                    (now + ttl, now, key),
+                )
+        except sqlite3.Error as error:
+            LOG.warning(LOG.LOG_SOURCE.BE, f"Could not update response cache: {error}")
+        return self.get(key)
+
+
+def fetch_json(
+    session: niquests.Session,
+    url: str,
+    *,
+    timeout: int,
+    cache: ResponseCache | None = None,
+    ttl: float = DAY,
+    params: Mapping[str, Any] | None = None,
+    json_body: Any = None,
+    headers: Mapping[str, str] | None = None,
+) -> Any:
+    """GET `url` (POST, when there is a `json_body`) and decode its JSON.
+
+    Fails exactly as the bare request would -- `raise_for_status` and
+    `response.json()` errors propagate -- so callers keep their own error
+    handling. Only successful responses are cached.
+    """
+    key = request_key(url, params, json_body) if cache is not None else ""
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None and cached.fresh:
+        return cached.payload
+
+    conditional = cached.validators() if cached is not None else {}
+    while True:
+        kwargs: dict[str, Any] = {"timeout": timeout}
+        if params is not None:
+            kwargs["params"] = params
+        if json_body is not None:
+            kwargs["json"] = json_body
+        if headers or conditional:
+            kwargs["headers"] = {**(headers or {}), **conditional}
+        send = session.post if json_body is not None else session.get
+        with send(url, **kwargs) as response:
+            if conditional and cache is not None and response.status_code == 304:
+                renewed = cache.renew(key, ttl)
+                if renewed is not None:
+                    return renewed.payload
+                # evicted since it was read, ask again for the whole body
+                conditional = {}
+                continue
+            response.raise_for_status()
+            payload = response.json()
+            if cache is not None:
+                cache.put(key, payload, ttl, response.headers)
+            return payload
@@ -23,8 +23,7 @@ from importlib import resources
 import json
 from typing import Any
 
-from guessit import guessit
-
+from src.backend.utils.guessit_helpers import parse_guessit
 from src.logger.nfo_forge_logger import LOG
 
 # A handful of well-known services, used only to prove the derived table
@@ -109,7 +108,7 @@ def abbreviate_streaming_service(name: object) -> str:
     the first is the one that won. An unknown name returns "" rather than
     itself -- a full service name in a title is more wrong than no service.
     """
-    if isinstance(name, list):
+    if isinstance(name, list | tuple):
         name = name[0] if name else ""
     if not isinstance(name, str) or not name.strip():
         return ""
@@ -126,5 +125,5 @@ def detect_streaming_service(release_name: str) -> str:
     if not release_name:
         return ""
     return abbreviate_streaming_service(
-        guessit(release_name).get("streaming_service", "")
+        parse_guessit(release_name).get("streaming_service", "")
     )
@@ -1,16 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from enum import IntEnum
 from pathlib import Path
 import re
 from typing import Any
 
-from guessit import guessit
-
 from src.backend.utils import media_files
-from src.backend.utils.guessit_helpers import get_guessit_title
+from src.backend.utils.guessit_helpers import get_guessit_title, parse_guessit
 from src.exceptions import MediaParsingError
 
 
@@ -127,7 +125,6 @@ class MediaTitleInferer:
         self.recursive = recursive
         self.include_samples = include_samples
 
-        self._guess_cache: dict[str, dict[str, Any]] = {}
         self._candidates: dict[str, _Candidate] = {}
 
     def infer(
@@ -157,7 +154,6 @@ class MediaTitleInferer:
         if not path.exists():
             raise FileNotFoundError(f"Input path does not exist: {path}")
 
-        self._guess_cache.clear()
         self._candidates.clear()
 
         if video_files is None:
@@ -329,21 +325,10 @@ class MediaTitleInferer:
 
         return sanitized
 
-    def _guess(self, value: str) -> dict[str, Any]:
-        """Run GuessIt while caching repeated values."""
-
-        cache_key = value.casefold()
-
-        if cache_key not in self._guess_cache:
-            result = guessit(
-                value,
-                {
-                    "excludes": ["language"],
-                },
-            )
-            self._guess_cache[cache_key] = dict(result)
-
-        return self._guess_cache[cache_key]
+    @staticmethod
+    def _guess(value: str) -> Mapping[str, Any]:
+        """Run GuessIt through the shared cache."""
+        return parse_guessit(value, {"excludes": ["language"]})
 
     def _add_candidate(self, title: str, weight: int) -> None:
         """Add weighted evidence while merging equivalent capitalization."""
@@ -1,148 +1,274 @@
 import asyncio
-from collections.abc import Mapping
-from typing import Any, cast
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, TypeVar, cast
 from urllib.parse import quote
 
 import niquests
 
-from src.backend.utils.http_client import new_http_session
+from src.backend.utils.http_client import new_async_http_session
+from src.backend.utils.response_cache import DAY, ResponseCache, request_key
 from src.exceptions import MediaSearchError, MediaSearchUnavailableError
 
+_T = TypeVar("_T")
 
-class TVDBClient:
-    """
-    Minimal TVDB v4 client (sync) used by the media-search pipeline.
+# A TVDB token is valid for a month and is not tied to a connection, so one
+# login serves every client using the same key for the life of the process.
+_TOKENS: dict[str, str] = {}
+
+_UNAVAILABLE_ERRORS = (
+    niquests.exceptions.ConnectionError,
+    niquests.exceptions.Timeout,
+    niquests.exceptions.ProxyError,
+    niquests.exceptions.SSLError,
+)
+_UNAVAILABLE_MESSAGE = (
+    "TVDB is unavailable. Check your internet connection and try again."
+)
+
+
+def _read_token(response_json: Any) -> str:
+    if not isinstance(response_json, dict):
+        raise MediaSearchError("TVDB returned an invalid authentication response.")
+    data = response_json.get("data")
+    token = data.get("token") if isinstance(data, dict) else None
+    if not isinstance(token, str) or not token:
+        raise MediaSearchError("TVDB authentication returned no token.")
+    return token
+
+
+def _read_data(response_json: Any) -> Any:
+    if not isinstance(response_json, dict):
+        raise MediaSearchError("TVDB returned an invalid response.")
+    data = response_json.get("data")
+    if data is None or response_json.get("status") == "failure":
+        message = response_json.get("message") or "unknown error"
+        raise MediaSearchError(f"TVDB request failed: {message}")
+    return data
+
+
+def _page_count(response_json: Any) -> int:
+    """How many pages a paged listing has, from the `links` of its first."""
+    links = response_json.get("links") if isinstance(response_json, dict) else None
+    if not isinstance(links, dict):
+        return 1
+    total, page_size = links.get("total_items"), links.get("page_size")
+    if not isinstance(total, int) or not isinstance(page_size, int) or page_size < 1:
+        return 1
+    return max(1, -(-total // page_size))
+
+
+class AsyncTVDBClient:
+    """Native async TVDB v4 client for the Qt worker pipeline.
 
     The third-party TVDB wrapper used by the project relied on ``urllib`` without
-    passing a socket timeout. These clients keep the small endpoint surface we
-    need, enforce a timeout on every request, and reuse one authenticated session
-    for the lifetime of a media-search backend
+    passing a socket timeout. This client keeps the small endpoint surface we
+    need and enforces a timeout on every request.
+
+    Used as an async context manager, one pool of kept-alive connections
+    serves every request made inside it, so a series' orderings -- and the
+    pages of each -- are fetched concurrently rather than one at a time. A
+    call made outside one opens a connection of its own.
+
+    Identical requests in flight at once are sent once and their result
+    shared, which is also how concurrent first requests share one login. A
+    paged episode listing fetches every page after the first at once, as the
+    first reports how many there are.
     """
 
     BASE_URL = "https://api4.thetvdb.com/v4"
+    # a remote ID maps to the same series for good; a series and its episode
+    # orderings change as episodes air
+    REMOTE_ID_CACHE_TTL = 7 * DAY
+    SERIES_CACHE_TTL = DAY
+    # requests to TVDB at once within one lookup
+    MAX_CONNECTIONS = 8
 
-    def __init__(self, api_key: str, timeout: int) -> None:
+    def __init__(
+        self, api_key: str, timeout: int, cache: ResponseCache | None = None
+    ) -> None:
         self.api_key = api_key
         self.timeout = max(1, timeout)
-        self.session = new_http_session()
-        self._token: str | None = None
+        self.cache = cache
+        self._session: niquests.AsyncSession | None = None
+        self._depth = 0
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+
+    async def __aenter__(self) -> "AsyncTVDBClient":
+        if self._depth == 0:
+            self._session = new_async_http_session(self.MAX_CONNECTIONS)
+        self._depth += 1
+        return self
 
-    def close(self) -> None:
-        self.session.close()
+    async def __aexit__(self, *_exc_info: object) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
 
-    def search_by_remote_id(self, remote_id: str) -> list[dict[str, Any]]:
-        result = self._request(f"/search/remoteid/{quote(remote_id, safe='')}")
+    async def search_by_remote_id(self, remote_id: str) -> list[dict[str, Any]]:
+        result = _read_data(
+            await self._get(
+                f"/search/remoteid/{quote(remote_id, safe='')}",
+                ttl=self.REMOTE_ID_CACHE_TTL,
+            )
+        )
         return cast(list[dict[str, Any]], result) if isinstance(result, list) else []
 
-    def get_series_extended(self, series_id: int) -> dict[str, Any]:
-        result = self._request(
-            f"/series/{series_id}/extended",
-            params={"meta": "episodes", "short": "true"},
+    async def get_series_extended(self, series_id: int) -> dict[str, Any]:
+        result = _read_data(
+            await self._get(
+                f"/series/{series_id}/extended",
+                params={"meta": "episodes", "short": "true"},
+                ttl=self.SERIES_CACHE_TTL,
+            )
         )
-        return cast(dict[str, Any], result) if isinstance(result, dict) else {}
+        # a copy, since a coalesced result is shared and callers add to it
+        return dict(cast(dict[str, Any], result)) if isinstance(result, dict) else {}
+
+    async def get_series_episodes(
+        self, series_id: int, season_type: str
+    ) -> dict[str, Any]:
+        """One ordering of a series, with the episodes of every page."""
+        path = f"/series/{series_id}/episodes/{season_type}"
+        first = await self._get(path, {"page": "0"}, self.SERIES_CACHE_TTL)
+        data = _read_data(first)
+        if not isinstance(data, dict):
+            return {}
+        series = dict(cast(dict[str, Any], data))
+        pages = _page_count(first)
+        if pages > 1:
+            rest = await asyncio.gather(
+                *(
+                    self._get(path, {"page": str(page)}, self.SERIES_CACHE_TTL)
+                    for page in range(1, pages)
+                )
+            )
+            episodes = list(series.get("episodes") or ())
+            for response_json in rest:
+                page_data = _read_data(response_json)
+                page_episodes = (
+                    page_data.get("episodes") if isinstance(page_data, dict) else None
+                )
+                if isinstance(page_episodes, list):
+                    episodes.extend(page_episodes)
+            series["episodes"] = episodes
+        return series
+
+    async def _coalesced(self, key: str, start: Callable[[], Awaitable[_T]]) -> _T:
+        """Await the request in flight for `key`, starting it if there is none."""
+        task = self._in_flight.get(key)
+        # a task left behind by an event loop that has since closed is useless
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(start())
+            self._in_flight[key] = task
 
-    def get_series_episodes(self, series_id: int, season_type: str) -> dict[str, Any]:
-        result = self._request(f"/series/{series_id}/episodes/{season_type}")
-        return cast(dict[str, Any], result) if isinstance(result, dict) else {}
+            def forget(done: asyncio.Task[Any]) -> None:
+                if self._in_flight.get(key) is done:
+                    del self._in_flight[key]
+
+            task.add_done_callback(forget)
+        # shielded, so one caller giving up does not cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _get(
+        self,
+        path: str,
+        params: Mapping[str, str] | None = None,
+        ttl: float = DAY,
+    ) -> Any:
+        url = f"{self.BASE_URL}{path}"
+        key = request_key(url, params)
+        return await self._coalesced(key, lambda: self._fetch(url, key, params, ttl))
+
+    async def _fetch(
+        self, url: str, key: str, params: Mapping[str, str] | None, ttl: float
+    ) -> Any:
+        cached = await asyncio.to_thread(self.cache.get, key) if self.cache else None
+        # a fresh cached response needs no token, so a fully cached lookup
+        # never logs in at all
+        if cached is not None and cached.fresh:
+            return cached.payload
+
+        validators = cached.validators() if cached is not None else {}
+        logged_in_again = False
+        while True:
+            token = await self._login()
+            response = await self._send(
+                url,
+                params=params,
+                headers={"Authorization": f"Bearer {token}", **validators},
+            )
+            if response.status_code == 401 and not logged_in_again:
+                # tokens expire after a month; one fresh login before failing
+                if _TOKENS.get(self.api_key) == token:
+                    del _TOKENS[self.api_key]
+                logged_in_again = True
+                continue
+            if validators and self.cache and response.status_code == 304:
+                renewed = await asyncio.to_thread(self.cache.renew, key, ttl)
+                if renewed is not None:
+                    return renewed.payload
+                validators = {}
+                continue
+            break
 
-    def _authenticate(self) -> str:
         try:
-            with self.session.post(
-                f"{self.BASE_URL}/login",
-                json={"apikey": self.api_key},
-                timeout=self.timeout,
-            ) as response:
-                response.raise_for_status()
-                response_json = response.json()
-        except (
-            niquests.exceptions.ConnectionError,
-            niquests.exceptions.Timeout,
-            niquests.exceptions.ProxyError,
-            niquests.exceptions.SSLError,
-        ) as error:
-            raise MediaSearchUnavailableError(
-                "TVDB is unavailable. Check your internet connection and try again."
-            ) from error
+            response.raise_for_status()
+            payload = response.json()
+        except niquests.exceptions.RequestException as error:
+            raise MediaSearchError(f"TVDB request failed: {error}") from error
+        except (TypeError, ValueError) as error:
+            raise MediaSearchError("TVDB returned an invalid response.") from error
+        if self.cache:
+            await asyncio.to_thread(self.cache.put, key, payload, ttl, response.headers)
+        return payload
+
+    async def _login(self) -> str:
+        token = _TOKENS.get(self.api_key)
+        if token:
+            return token
+        return await self._coalesced("login", self._authenticate)
+
+    async def _authenticate(self) -> str:
+        response = await self._send(
+            f"{self.BASE_URL}/login", json_body={"apikey": self.api_key}
+        )
+        try:
+            response.raise_for_status()
+            response_json = response.json()
         except niquests.exceptions.RequestException as error:
             raise MediaSearchError(f"TVDB authentication failed: {error}") from error
         except (TypeError, ValueError) as error:
             raise MediaSearchError(
                 "TVDB returned an invalid authentication response."
             ) from error
-
-        if not isinstance(response_json, dict):
-            raise MediaSearchError("TVDB returned an invalid authentication response.")
-        data = response_json.get("data")
-        token = data.get("token") if isinstance(data, dict) else None
-        if not isinstance(token, str) or not token:
-            raise MediaSearchError("TVDB authentication returned no token.")
-        self._token = token
+        token = _read_token(response_json)
+        _TOKENS[self.api_key] = token
         return token
 
-    def _request(self, path: str, params: Mapping[str, str] | None = None) -> Any:
-        token = self._token or self._authenticate()
+    async def _send(
+        self, url: str, json_body: Any = None, **kwargs: Any
+    ) -> niquests.Response:
+        """GET `url` (POST `json_body`), on the pooled session when one is open."""
         try:
-            with self.session.get(
-                f"{self.BASE_URL}{path}",
-                headers={"Authorization": f"Bearer {token}"},
-                params=params,
-                timeout=self.timeout,
-            ) as response:
-                response.raise_for_status()
-                response_json = response.json()
-        except (
-            niquests.exceptions.ConnectionError,
-            niquests.exceptions.Timeout,
-            niquests.exceptions.ProxyError,
-            niquests.exceptions.SSLError,
-        ) as error:
-            raise MediaSearchUnavailableError(
-                "TVDB is unavailable. Check your internet connection and try again."
-            ) from error
+            if self._session is not None:
+                return await self._request(self._session, url, json_body, kwargs)
+            async with new_async_http_session(1) as session:
+                return await self._request(session, url, json_body, kwargs)
+        except _UNAVAILABLE_ERRORS as error:
+            raise MediaSearchUnavailableError(_UNAVAILABLE_MESSAGE) from error
         except niquests.exceptions.RequestException as error:
             raise MediaSearchError(f"TVDB request failed: {error}") from error
-        except (TypeError, ValueError) as error:
-            raise MediaSearchError("TVDB returned an invalid response.") from error
 
-        if not isinstance(response_json, dict):
-            raise MediaSearchError("TVDB returned an invalid response.")
-        data = response_json.get("data")
-        if data is None or response_json.get("status") == "failure":
-            message = response_json.get("message") or "unknown error"
-            raise MediaSearchError(f"TVDB request failed: {message}")
-        return data
-
-
-class AsyncTVDBClient:
-    """Async facade over :class:`TVDBClient` for the Qt worker pipeline."""
-
-    def __init__(self, client: TVDBClient) -> None:
-        self.client = client
-
-    @property
-    def timeout(self) -> int:
-        return self.client.timeout
-
-    def close(self) -> None:
-        self.client.close()
-
-    async def search_by_remote_id(self, remote_id: str) -> list[dict[str, Any]]:
-        return await self._run(self.client.search_by_remote_id, remote_id)
-
-    async def get_series_extended(self, series_id: int) -> dict[str, Any]:
-        return await self._run(self.client.get_series_extended, series_id)
-
-    async def get_series_episodes(
-        self, series_id: int, season_type: str
-    ) -> dict[str, Any]:
-        return await self._run(
-            self.client.get_series_episodes,
-            series_id,
-            season_type,
-        )
-
-    async def _run(self, method: Any, *args: Any) -> Any:
-        return await asyncio.wait_for(
-            asyncio.to_thread(method, *args),
-            timeout=self.timeout,
-        )
+    async def _request(
+        self,
+        session: niquests.AsyncSession,
+        url: str,
+        json_body: Any,
+        kwargs: dict[str, Any],
+    ) -> niquests.Response:
+        if json_body is not None:
+            return await session.post(
+                url, json=json_body, timeout=self.timeout, **kwargs
+            )
+        return await session.get(url, timeout=self.timeout, **kwargs)
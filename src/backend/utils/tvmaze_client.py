@@ -7,6 +7,7 @@ from typing import Any
 import niquests
 
 from src.backend.utils.http_client import new_http_session
+from src.backend.utils.response_cache import DAY, ResponseCache, request_key
 from src.logger.nfo_forge_logger import LOG
 from src.version import __version__, program_name
 
@@ -57,13 +58,22 @@ class TVmazeClient:
     RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
     MAX_ATTEMPTS = 3
     RETRY_BACKOFF_SECONDS = 1.0
+    # an ID lookup answers the same for good; episodes are added as they air,
+    # so a miss is only remembered for a day
+    LOOKUP_CACHE_TTL = 7 * DAY
+    EPISODE_CACHE_TTL = DAY
+    MISS_CACHE_TTL = DAY
 
     def __init__(
-        self, timeout: int = 60, session: niquests.Session | None = None
+        self,
+        timeout: int = 60,
+        session: niquests.Session | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         self.timeout = max(1, timeout)
         self._session = session if session is not None else new_http_session()
         self._owns_session = session is None
+        self.cache = cache
 
     def close(self) -> None:
         if self._owns_session:
@@ -86,7 +96,9 @@ class TVmazeClient:
         for param, value in candidates:
             if not value:
                 continue
-            payload = self._get("/lookup/shows", params={param: value})
+            payload = self._get(
+                "/lookup/shows", params={param: value}, ttl=self.LOOKUP_CACHE_TTL
+            )
             show_id = self._extract_id(payload)
             if show_id is not None:
                 LOG.debug(
@@ -107,6 +119,7 @@ class TVmazeClient:
         payload = self._get(
             f"/shows/{show_id}/episodebynumber",
             params={"season": str(season), "number": str(episode)},
+            ttl=self.EPISODE_CACHE_TTL,
         )
         episode_id = self._extract_id(payload)
         if episode_id is None:
@@ -135,26 +148,48 @@ class TVmazeClient:
         except (TypeError, ValueError):
             return None
 
-    def _get(self, path: str, params: Mapping[str, str] | None = None) -> Any | None:
+    def _get(
+        self,
+        path: str,
+        params: Mapping[str, str] | None = None,
+        ttl: float = DAY,
+    ) -> Any | None:
         """GET a TVmaze endpoint, returning None rather than raising.
 
         A 404 from ``/lookup`` is TVmaze's documented "no match" answer, so it
-        short-circuits instead of burning the remaining retries.
+        short-circuits instead of burning the remaining retries -- and, being
+        an answer, is cached like one.
         """
         url = f"{self.BASE_URL}{path}"
+        key = request_key(url, params)
+        cached = self.cache.get(key) if self.cache else None
+        if cached is not None and cached.fresh:
+            return cached.payload
+        headers = {**TVMAZE_HEADERS, **(cached.validators() if cached else {})}
         for attempt in range(1, self.MAX_ATTEMPTS + 1):
             try:
                 with self._session.get(
                     url,
                     params=params,
-                    headers=TVMAZE_HEADERS,
+                    headers=headers,
                     timeout=self.timeout,
                 ) as response:
                     status_code = response.status_code
+                    if status_code == 304 and self.cache:
+                        renewed = self.cache.renew(key, ttl)
+                        if renewed is not None:
+                            return renewed.payload
+                        headers = TVMAZE_HEADERS
+                        continue
                     if status_code == 404:
+                        if self.cache:
+                            self.cache.put(key, None, self.MISS_CACHE_TTL)
                         return None
                     if response.ok:
-                        return response.json()
+                        payload = response.json()
+                        if self.cache:
+                            self.cache.put(key, payload, ttl, response.headers)
+                        return payload
                     if (
                         status_code in self.RETRY_STATUS_CODES
                         and attempt < self.MAX_ATTEMPTS
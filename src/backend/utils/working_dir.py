@@ -35,6 +35,11 @@ PROCESSING_DIR_NAME = "processing"
 """Per-run artifacts (screenshots, torrents, NFOs). Safe to delete."""
 
 
+CACHE_DIR_NAME = "cache"
+"""Data kept between runs only to save work (piece hashes, metadata
+responses). Safe to delete."""
+
+
 def jobs_dir(working_dir: Path, ensure_exists: bool = False) -> Path:
     """Where saved jobs live for a given working directory."""
     path = working_dir / JOBS_DIR_NAME
@@ -51,6 +56,14 @@ def processing_dir(working_dir: Path, ensure_exists: bool = False) -> Path:
     return path
 
 
+def cache_dir(working_dir: Path, ensure_exists: bool = False) -> Path:
+    """Where data reused between runs lives for a given working directory."""
+    path = working_dir / CACHE_DIR_NAME
+    if ensure_exists:
+        path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def cleanable_items(working_dir: Path) -> list[Path]:
     """Everything clean up may delete: all of the working directory but jobs.
 
@@ -138,6 +138,12 @@ class TomlConfigCodec:
             "screenshots.optimize_downloaded_images_percentage": (
                 0 < config.screenshots.optimize_downloaded_images_percentage <= 1
             ),
+            "screenshots.optimize_size_limit_mb": (
+                config.screenshots.optimize_size_limit_mb >= 0
+            ),
+            "screenshots.frame_extraction_percentage": (
+                0 < config.screenshots.frame_extraction_percentage <= 1
+            ),
             "urls.columns": config.urls.columns >= 0,
             "urls.vertical": config.urls.vertical >= 0,
             "urls.horizontal": config.urls.horizontal >= 0,
@@ -10,6 +10,7 @@ from src.enums.indexer import Indexer
 from src.enums.logging_settings import LogLevel
 from src.enums.media_search_mode import MediaSearchMode
 from src.enums.multi_episode_style import MultiEpisodeStyle
+from src.enums.png_optimization import PngOptimization
 from src.enums.screen_shot_mode import ScreenShotMode
 from src.enums.subtitles import SubtitleAlignment
 from src.enums.theme import NfoForgeTheme
@@ -103,6 +104,8 @@ class GeneralSettings:
     timeout: int
     enable_prompt_overview: bool
     enable_mkbrr: bool
+    pipeline_torrent_hashing: bool
+    tracker_upload_workers: int
     log_level: LogLevel
     log_total: int
     working_dir: Path
@@ -345,6 +348,9 @@ class ScreenshotSettings:
     optimize_generated_images: bool
     optimize_downloaded_images: bool
     optimize_downloaded_images_percentage: float
+    png_optimization: PngOptimization
+    optimize_size_limit_mb: float
+    frame_extraction_percentage: float
     indexer: Indexer
     image_plugin: ImagePlugin
 
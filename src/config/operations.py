@@ -40,6 +40,7 @@ from src.enums.indexer import Indexer
 from src.enums.logging_settings import LogLevel
 from src.enums.media_search_mode import MediaSearchMode
 from src.enums.multi_episode_style import MultiEpisodeStyle
+from src.enums.png_optimization import PngOptimization
 from src.enums.screen_shot_mode import ScreenShotMode
 from src.enums.series import EpisodeFormat
 from src.enums.subtitles import SubtitleAlignment
@@ -158,6 +159,12 @@ class TypedTomlOperations:
                 self.settings.general.enable_prompt_overview
             )
             general_data["enable_mkbrr"] = self.settings.general.enable_mkbrr
+            general_data["pipeline_torrent_hashing"] = (
+                self.settings.general.pipeline_torrent_hashing
+            )
+            general_data["tracker_upload_workers"] = (
+                self.settings.general.tracker_upload_workers
+            )
             general_data["log_level"] = LogLevel(self.settings.general.log_level).value
             general_data["log_total"] = self.settings.general.log_total
             general_data["working_dir"] = str(self.settings.general.working_dir)
@@ -1131,6 +1138,15 @@ class TypedTomlOperations:
             screen_shot_data["optimize_dl_url_images_percentage"] = (
                 self.settings.screenshots.optimize_downloaded_images_percentage
             )
+            screen_shot_data["png_optimization"] = PngOptimization(
+                self.settings.screenshots.png_optimization
+            ).value
+            screen_shot_data["optimize_size_limit_mb"] = (
+                self.settings.screenshots.optimize_size_limit_mb
+            )
+            screen_shot_data["frame_extraction_percentage"] = (
+                self.settings.screenshots.frame_extraction_percentage
+            )
             screen_shot_data["indexer"] = Indexer(
                 self.settings.screenshots.indexer
             ).value
@@ -2055,6 +2071,10 @@ class TypedTomlOperations:
                     timeout=int(general_data["timeout"]),
                     enable_prompt_overview=bool(general_data["enable_prompt_overview"]),
                     enable_mkbrr=bool(general_data["enable_mkbrr"]),
+                    pipeline_torrent_hashing=bool(
+                        general_data["pipeline_torrent_hashing"]
+                    ),
+                    tracker_upload_workers=int(general_data["tracker_upload_workers"]),
                     log_level=LogLevel(general_data["log_level"]),
                     log_total=int(general_data["log_total"]),
                     working_dir=Path(general_data["working_dir"])
@@ -2223,6 +2243,15 @@ class TypedTomlOperations:
                     optimize_downloaded_images_percentage=float(
                         screen_shot_data["optimize_dl_url_images_percentage"]
                     ),
+                    png_optimization=PngOptimization(
+                        screen_shot_data["png_optimization"]
+                    ),
+                    optimize_size_limit_mb=float(
+                        screen_shot_data["optimize_size_limit_mb"]
+                    ),
+                    frame_extraction_percentage=float(
+                        screen_shot_data["frame_extraction_percentage"]
+                    ),
                     indexer=Indexer(screen_shot_data["indexer"]),
                     image_plugin=ImagePlugin(screen_shot_data["image_plugin"]),
                 ),
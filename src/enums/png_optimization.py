@@ -0,0 +1,26 @@
+from enum import auto as auto_enum
+
+from typing_extensions import override
+
+from src.enums import CaseInsensitiveEnum
+
+
+class PngOptimization(CaseInsensitiveEnum):
+    """
+    FAST = Light zlib compression, quickest on large (4K) frames
+    BALANCED = Default zlib compression, faster than MAX with larger images
+    MAX = Maximum zlib compression with PIL's optimizer (slowest, smallest, default)
+    """
+
+    FAST = auto_enum()
+    BALANCED = auto_enum()
+    MAX = auto_enum()
+
+    @override
+    def __str__(self) -> str:
+        enum_map = {
+            PngOptimization.FAST: "Fast",
+            PngOptimization.BALANCED: "Balanced",
+            PngOptimization.MAX: "Maximum",
+        }
+        return enum_map[self]
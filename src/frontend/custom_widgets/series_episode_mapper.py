@@ -1,10 +1,10 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
 import re
 from typing import Any
 
-from guessit import guessit
 from PySide6.QtCore import QSize, Qt, Signal, Slot
 from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import (
@@ -29,6 +29,7 @@ from PySide6.QtWidgets import (
 )
 from rapidfuzz import fuzz
 
+from src.backend.utils.guessit_helpers import GuessResult, parse_guessit_batch
 from src.config.tv_tokens import SUPPORTED_TVR_FORMATS
 from src.enums.series import EpisodeFormat
 from src.frontend.custom_widgets.custom_splitter import CustomSplitter
@@ -285,7 +286,6 @@ class SeriesEpisodeMapper(QWidget):
         self.episodes_by_type: dict[Any, EpisodeData] = {}
         self.file_episode_mappings: dict[Path, EpisodeMapping] = {}
         self.episode_items: list[EpisodeListItem] = []
-        self._guessit_cache: dict[Path, EpisodeData] = {}
         self._release_format_manually_selected = False
         self._loading_release_format_combo = False
 
@@ -580,26 +580,49 @@ class SeriesEpisodeMapper(QWidget):
         finally:
             self.episode_order_combo.blockSignals(False)
 
+    @staticmethod
+    def _folder_seasons(
+        file_list: Sequence[Path], parses: Sequence[GuessResult]
+    ) -> dict[Path, Any]:
+        """Season named by the folder of each file whose name carries none.
+
+        Files are parsed by their bare name, the same parse the rest of the
+        program shares, so a "Season 1/05 - Title.mkv" layout gets its season
+        from the folder here instead, one parse per folder.
+        """
+        folders = list(
+            dict.fromkeys(
+                file_path.parent
+                for file_path, parsed in zip(file_list, parses, strict=True)
+                if parsed.get("season") is None and file_path.parent.name
+            )
+        )
+        folder_parses = parse_guessit_batch(folder.name for folder in folders)
+        return {
+            folder: parsed["season"]
+            for folder, parsed in zip(folders, folder_parses, strict=True)
+            if parsed.get("season") is not None
+        }
+
     def _populate_files_table(self) -> None:
         """Populate the files table with file data"""
         if not self.media_input_payload or not self.media_input_payload.file_list:
             return
 
-        self.files_table.setRowCount(len(self.media_input_payload.file_list))
-
-        for row, file_path in enumerate(self.media_input_payload.file_list):
-            # Parse each filename at most once for this mapper.  Loading the
-            # same page again should not repeat the relatively expensive
-            # GuessIt work on the GUI thread.
-            parsed_data = self._guessit_cache.get(file_path)
-            if parsed_data is None:
-                try:
-                    parsed_data = dict(guessit(str(file_path)))
-                except Exception:
-                    parsed_data = {}
-                self._guessit_cache[file_path] = parsed_data
-            else:
-                parsed_data = dict(parsed_data)
+        file_list = self.media_input_payload.file_list
+        self.files_table.setRowCount(len(file_list))
+
+        # parse the whole pack in one batch; filenames already parsed this
+        # session come from the shared cache, so reloading the page does not
+        # repeat the relatively expensive GuessIt work on the GUI thread
+        parses = parse_guessit_batch(file_path.name for file_path in file_list)
+        folder_seasons = self._folder_seasons(file_list, parses)
+        for row, (file_path, parsed) in enumerate(zip(file_list, parses, strict=True)):
+            parsed_data = dict(parsed)
+            if parsed_data.get("season") is None:
+                folder_season = folder_seasons.get(file_path.parent)
+                if folder_season is not None:
+                    parsed_data["season"] = folder_season
 
             # create filename item (read only)
             filename_item = EnhancedFileTableItem(file_path.name, file_path)
@@ -649,7 +672,7 @@ class SeriesEpisodeMapper(QWidget):
     @staticmethod
     def _coerce_season(value: Any) -> int | None:
         """Return a parsed season number, including GuessIt's list form."""
-        if isinstance(value, list):
+        if isinstance(value, list | tuple):
             value = value[0] if value else None
         return value if isinstance(value, int) else None
 
@@ -671,7 +694,7 @@ class SeriesEpisodeMapper(QWidget):
         episode_title_candidates: list[str] = []
         if parsed_data:
             parsed_episode_title = parsed_data.get("episode_title")
-            if isinstance(parsed_episode_title, list):
+            if isinstance(parsed_episode_title, list | tuple):
                 parsed_episode_title = " ".join(
                     value
                     for value in parsed_episode_title
@@ -831,7 +854,7 @@ class SeriesEpisodeMapper(QWidget):
             # primary episode and carry the highest as the range end so a
             # single file's multi-episode span isn't collapsed to episode 1.
             episode_end = None
-            if isinstance(episode, list):
+            if isinstance(episode, list | tuple):
                 if episode:
                     episode = sorted(episode)
                     episode, episode_end = episode[0], episode[-1]
@@ -20,6 +20,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from src.backend.utils.crop_detect_cache import CropDetectCache
 from src.backend.utils.file_utilities import (
     file_bytes_to_str,
     open_explorer,
@@ -155,6 +156,24 @@ class GeneralSettings(BaseSettings):
         mkbrr_h_box.addWidget(self.enable_mkbrr)
         mkbrr_h_box.addWidget(check_mkbrr, alignment=Qt.AlignmentFlag.AlignRight)
 
+        self.pipeline_torrent_hashing = QCheckBox(
+            "Hash Torrent During Image Upload", self
+        )
+        self.pipeline_torrent_hashing.setToolTip(
+            "If enabled the torrent is hashed in the background while screenshots are "
+            "optimized and uploaded,\ninstead of after they have finished"
+        )
+
+        tracker_upload_workers_lbl = QLabel("Concurrent Tracker Uploads", self)
+        tracker_upload_workers_lbl.setToolTip(
+            "Sets how many trackers are uploaded to at the same time (1 uploads one "
+            "tracker at a time)\n\nNote: torrents are always injected into the client "
+            "in tracker order"
+        )
+        self.tracker_upload_workers_spinbox = QSpinBox(self)
+        self.tracker_upload_workers_spinbox.setRange(1, 8)
+        self._disable_scrollwheel_spinbox(self.tracker_upload_workers_spinbox)
+
         log_level_lbl = QLabel("Log Level", self)
         log_level_lbl.setToolTip("Sets minimum log level")
 
@@ -257,6 +276,12 @@ class GeneralSettings(BaseSettings):
         self.add_widget(build_h_line((10, 1, 10, 1)))
         self.add_layout(create_form_layout(self.enable_prompt_overview))
         self.add_layout(create_form_layout(mkbrr_widget))
+        self.add_layout(create_form_layout(self.pipeline_torrent_hashing))
+        self.add_layout(
+            create_form_layout(
+                tracker_upload_workers_lbl, self.tracker_upload_workers_spinbox
+            )
+        )
         self.add_widget(build_h_line((10, 1, 10, 1)))
         self.add_layout(create_form_layout(log_level_lbl, self.log_level_combo))
         self.add_layout(
@@ -289,6 +314,8 @@ class GeneralSettings(BaseSettings):
         self.tmdb_api_key_entry.setText(self.config.settings.api_keys.tmdb_api_key)
         self.enable_prompt_overview.setChecked(payload.enable_prompt_overview)
         self.enable_mkbrr.setChecked(payload.enable_mkbrr)
+        self.pipeline_torrent_hashing.setChecked(payload.pipeline_torrent_hashing)
+        self.tracker_upload_workers_spinbox.setValue(payload.tracker_upload_workers)
         self.load_combo_box(self.log_level_combo, LogLevel, payload.log_level)
         self.max_log_files_spinbox.setValue(payload.log_total)
         self.working_dir_entry.setText(
@@ -504,7 +531,8 @@ class GeneralSettings(BaseSettings):
             "Would you like to clean up the working directory now?\n\n"
             f"Size: {file_bytes_to_str(total_size)}\n\n"
             "WARNING: This removes all generated data (screenshots, torrents, "
-            "and NFOs).\n\nSaved jobs are kept."
+            "and NFOs) and cached results, such as detected crops.\n\n"
+            "Saved jobs are kept."
         )
 
         if (
@@ -520,6 +548,8 @@ class GeneralSettings(BaseSettings):
                     shutil.rmtree(item)
                 else:
                     item.unlink()
+            # drop the copy of the crop cache this session still holds
+            CropDetectCache(working_dir).clear()
 
     @Slot()
     def _swap_dep_tab(self) -> None:
@@ -552,6 +582,12 @@ class GeneralSettings(BaseSettings):
             self.enable_prompt_overview.isChecked()
         )
         self.config.settings.general.enable_mkbrr = self.enable_mkbrr.isChecked()
+        self.config.settings.general.pipeline_torrent_hashing = (
+            self.pipeline_torrent_hashing.isChecked()
+        )
+        self.config.settings.general.tracker_upload_workers = (
+            self.tracker_upload_workers_spinbox.value()
+        )
         self.config.settings.general.log_level = LogLevel(
             self.log_level_combo.currentData()
         )
@@ -587,6 +623,12 @@ class GeneralSettings(BaseSettings):
             self.config.settings.general.enable_prompt_overview
         )
         self.enable_mkbrr.setChecked(self.config.defaults.general.enable_mkbrr)
+        self.pipeline_torrent_hashing.setChecked(
+            self.config.defaults.general.pipeline_torrent_hashing
+        )
+        self.tracker_upload_workers_spinbox.setValue(
+            self.config.defaults.general.tracker_upload_workers
+        )
         self.working_dir_entry.setText(str(self.config.defaults.general.working_dir))
 
     def _disable_scrollwheel_spinbox(self, spinbox: QSpinBox) -> None:
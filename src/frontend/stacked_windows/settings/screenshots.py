@@ -17,6 +17,7 @@ from src.config.config import ConfigManager
 from src.enums.cropping import Cropping
 from src.enums.image_plugin import ImagePlugin
 from src.enums.indexer import Indexer
+from src.enums.png_optimization import PngOptimization
 from src.enums.screen_shot_mode import ScreenShotMode
 from src.enums.settings_window import SettingsTabs
 from src.enums.subtitles import SubtitleAlignment
@@ -221,6 +222,45 @@ class ScreenShotSettings(BaseSettings):
         self.optimize_cpu_cores_percent.installEventFilter(self)
         self.optimize_cpu_cores_percent.valueChanged.connect(self._optimize_cpu_changed)
 
+        png_optimization_lbl = QLabel("Image Optimization Level", self)
+        png_optimization_lbl.setToolTip(
+            "Fast compresses lightly and is quickest on large (4K) images, Maximum "
+            "produces the smallest images but is the slowest"
+        )
+        self.png_optimization_combo = CustomComboBox(
+            completer=True, disable_mouse_wheel=True, parent=self
+        )
+
+        optimize_size_limit_lbl = QLabel("Image Optimization Size Limit (MB)", self)
+        optimize_size_limit_lbl.setToolTip(
+            "Stop optimizing an image as soon as it is under this size (lowered to "
+            "the upload limit of the selected image hosts), set to 0 to always "
+            "fully optimize"
+        )
+        self.optimize_size_limit_spinbox = QDoubleSpinBox(self)
+        self.optimize_size_limit_spinbox.setStepType(
+            QDoubleSpinBox.StepType.AdaptiveDecimalStepType
+        )
+        self.optimize_size_limit_spinbox.setSingleStep(0.5)
+        self.optimize_size_limit_spinbox.setRange(0.0, 100.0)
+        self.optimize_size_limit_spinbox.installEventFilter(self)
+
+        self.extraction_cpu_cores_percent_lbl = QLabel(self)
+        self.extraction_cpu_cores_percent_lbl.setToolTip(
+            "Percentage of CPUs used to extract frames concurrently with FFMPEG "
+            "(8 threads at 50% = 4 frames at a time)"
+        )
+        self.extraction_cpu_cores_percent = QDoubleSpinBox(self)
+        self.extraction_cpu_cores_percent.setStepType(
+            QDoubleSpinBox.StepType.AdaptiveDecimalStepType
+        )
+        self.extraction_cpu_cores_percent.setSingleStep(0.1)
+        self.extraction_cpu_cores_percent.setRange(0.1, 1.0)
+        self.extraction_cpu_cores_percent.installEventFilter(self)
+        self.extraction_cpu_cores_percent.valueChanged.connect(
+            self._extraction_cpu_changed
+        )
+
         image_host_config_label = QLabel("Image Hosts Configuration", self)
         self.image_host_config = ImageHostListBox(self.config, self)
         self.image_host_config.setMinimumHeight(180)
@@ -243,6 +283,12 @@ class ScreenShotSettings(BaseSettings):
         self.add_layout(create_form_layout(crop_mode_lbl, self.crop_mode_combo))
         self.add_layout(create_form_layout(indexer_lbl, self.indexer_combo))
         self.add_layout(create_form_layout(image_plugin_lbl, self.image_plugin_combo))
+        self.add_layout(
+            create_form_layout(
+                self.extraction_cpu_cores_percent_lbl,
+                self.extraction_cpu_cores_percent,
+            )
+        )
         self.add_widget(build_h_line((10, 1, 10, 1)))
         self.add_layout(
             create_form_layout(
@@ -288,6 +334,14 @@ class ScreenShotSettings(BaseSettings):
                 self.optimize_cpu_cores_percent_lbl, self.optimize_cpu_cores_percent
             )
         )
+        self.add_layout(
+            create_form_layout(png_optimization_lbl, self.png_optimization_combo)
+        )
+        self.add_layout(
+            create_form_layout(
+                optimize_size_limit_lbl, self.optimize_size_limit_spinbox
+            )
+        )
         self.add_widget(build_h_line((10, 1, 10, 1)))
         self.add_layout(
             create_form_layout(image_host_config_label, self.image_host_config)
@@ -367,6 +421,13 @@ class ScreenShotSettings(BaseSettings):
             f"Optimize Images CPU Percent ({value:.0%})"
         )
 
+    @Slot(float)
+    def _extraction_cpu_changed(self, value: float) -> None:
+        """When extraction spinbox is changed the label is automatically populated"""
+        self.extraction_cpu_cores_percent_lbl.setText(
+            f"Frame Extraction CPU Percent ({value:.0%})"
+        )
+
     @Slot()
     def _load_saved_settings(self) -> None:
         """Applies user saved settings from the config"""
@@ -381,6 +442,7 @@ class ScreenShotSettings(BaseSettings):
         self.load_combo_box(self.crop_mode_combo, Cropping, payload.crop_mode)
         self.load_combo_box(self.indexer_combo, Indexer, payload.indexer)
         self.load_combo_box(self.image_plugin_combo, ImagePlugin, payload.image_plugin)
+        self.extraction_cpu_cores_percent.setValue(payload.frame_extraction_percentage)
         self.ss_comparison_subtitle_btn.setChecked(payload.comparison_subtitles)
         self.ss_comp_source_entry.setText(payload.comparison_source_name)
         self.ss_comp_encode_entry.setText(payload.comparison_encode_name)
@@ -406,6 +468,10 @@ class ScreenShotSettings(BaseSettings):
         self.optimize_cpu_cores_percent.setValue(
             self.config.settings.screenshots.optimize_downloaded_images_percentage
         )
+        self.load_combo_box(
+            self.png_optimization_combo, PngOptimization, payload.png_optimization
+        )
+        self.optimize_size_limit_spinbox.setValue(payload.optimize_size_limit_mb)
         self.image_host_config.add_items(
             self.config.settings.image_hosts.by_selection()
         )
@@ -426,6 +492,9 @@ class ScreenShotSettings(BaseSettings):
         self.config.settings.screenshots.image_plugin = (
             self.image_plugin_combo.currentData()
         )
+        self.config.settings.screenshots.frame_extraction_percentage = (
+            self.extraction_cpu_cores_percent.value()
+        )
         self.config.settings.screenshots.comparison_subtitles = (
             self.ss_comparison_subtitle_btn.isChecked()
         )
@@ -462,6 +531,12 @@ class ScreenShotSettings(BaseSettings):
         self.config.settings.screenshots.optimize_downloaded_images_percentage = (
             self.optimize_cpu_cores_percent.value()
         )
+        self.config.settings.screenshots.png_optimization = (
+            self.png_optimization_combo.currentData()
+        )
+        self.config.settings.screenshots.optimize_size_limit_mb = (
+            self.optimize_size_limit_spinbox.value()
+        )
         try:
             self.image_host_config.validate_settings()
         except AttributeError as attr_error:
@@ -491,6 +566,9 @@ class ScreenShotSettings(BaseSettings):
         self.image_plugin_combo.setCurrentIndex(
             self.config.defaults.screenshots.image_plugin.value - 1
         )
+        self.extraction_cpu_cores_percent.setValue(
+            self.config.defaults.screenshots.frame_extraction_percentage
+        )
         self.ss_comparison_subtitle_btn.setChecked(
             self.config.defaults.screenshots.comparison_subtitles
         )
@@ -526,6 +604,12 @@ class ScreenShotSettings(BaseSettings):
         self.optimize_cpu_cores_percent.setValue(
             self.config.defaults.screenshots.optimize_downloaded_images_percentage
         )
+        self.png_optimization_combo.setCurrentIndex(
+            self.config.defaults.screenshots.png_optimization.value - 1
+        )
+        self.optimize_size_limit_spinbox.setValue(
+            self.config.defaults.screenshots.optimize_size_limit_mb
+        )
         self.image_host_config.add_items(
             self.config.settings.image_hosts.by_selection(), reset=True
         )
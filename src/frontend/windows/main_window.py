@@ -17,6 +17,8 @@ from PySide6.QtWidgets import (
 
 from src.backend.main_window import kill_child_processes
 from src.backend.utils.file_utilities import file_bytes_to_str
+from src.backend.utils.guessit_helpers import shutdown_guessit_pool
+from src.backend.utils.image_optimizer import MultiProcessImageOptimizer
 from src.backend.utils.working_dir import cleanable_size
 from src.config.config import ConfigManager
 from src.enums.screen_shot_mode import ScreenShotMode
@@ -263,6 +265,10 @@ class MainWindow(QMainWindow):
             self._config_save_timer.stop()
             self._save_config_debounced()
 
+        # stop the pooled optimizer and GuessIt workers without blocking the
+        # window on a running job, any still busy are killed just below
+        MultiProcessImageOptimizer.shutdown_pools(wait=False)
+        shutdown_guessit_pool(wait=False)
         kill_child_processes()
         self.save_window_settings()
         super().closeEvent(event)
@@ -19,7 +19,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from src.backend.images import ImagesBackEnd
+from src.backend.images import DEFAULT_EXTRACTION_CPU_FRACTION, ImagesBackEnd
 from src.backend.utils.images import (
     compare_resolutions,
     determine_sub_size,
@@ -84,6 +84,7 @@ class QueuedWorker(QThread):
         parent: QObject | None = None,
         index_cache_root: Path | None = None,
         protected_media_root: Path | None = None,
+        extraction_cpu_fraction: float = DEFAULT_EXTRACTION_CPU_FRACTION,
     ) -> None:
         """
         Generate images and emit progress signals.
@@ -112,9 +113,11 @@ class QueuedWorker(QThread):
             source_file (Optional[Path]): The input file path for the source.
             source_file_mi_obj (Optional[Path]): MediaInfo object of the input file.
             index_cache_root (Optional[Path]): Base directory for FrameForge's
-                private index cache.
+                private index cache and the crop detection cache.
             protected_media_root (Optional[Path]): Upload tree that the private
                 FrameForge encode index must remain outside.
+            extraction_cpu_fraction (float): Share of CPU threads used for
+                concurrent FFMPEG frame extraction.
         """
         super().__init__(parent=parent)
         self.backend = backend
@@ -142,6 +145,7 @@ class QueuedWorker(QThread):
         self.source_file_mi_obj = source_file_mi_obj
         self.index_cache_root = index_cache_root
         self.protected_media_root = protected_media_root
+        self.extraction_cpu_fraction = extraction_cpu_fraction
 
     def run(self) -> None:
         try:
@@ -170,6 +174,7 @@ class QueuedWorker(QThread):
             self.trim,
             self.ffmpeg_path,
             self.progress_signal,
+            cpu_fraction=self.extraction_cpu_fraction,
         )
         self.job_finished.emit(job)
 
@@ -195,6 +200,8 @@ class QueuedWorker(QThread):
             self.ffmpeg_path,
             self.progress_signal,
             self.re_sync,
+            cpu_fraction=self.extraction_cpu_fraction,
+            cache_root=self.index_cache_root,
         )
         self.job_finished.emit(job)
 
@@ -668,6 +675,7 @@ class ImagesPage(BaseWizardPage):
             source_file_mi_obj=source_file_mi_obj,
             index_cache_root=self.config.settings.general.working_dir,
             protected_media_root=self._protected_media_root(),
+            extraction_cpu_fraction=self.config.settings.screenshots.frame_extraction_percentage,
             parent=self,
         )
         self.queued_worker.job_finished.connect(self._generate_finished)
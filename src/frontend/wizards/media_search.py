@@ -37,8 +37,9 @@ from PySide6.QtWidgets import (
 from qtawesome import IconWidget
 
 from src.backend.media_search import MediaSearchBackEnd
+from src.backend.utils.response_cache import RESPONSE_CACHE_NAME, ResponseCache
 from src.backend.utils.title_inference import MediaTitleInferer
-from src.backend.utils.working_dir import RUNTIME_DIR
+from src.backend.utils.working_dir import RUNTIME_DIR, cache_dir
 from src.config.config import ConfigManager
 from src.context.processing_context import ProcessingContext
 from src.enums.media_search_mode import MediaSearchMode
@@ -255,6 +256,7 @@ class MediaSearch(BaseWizardPage):
             language=self.config.settings.general.tmdb_language,
             timeout=self.config.settings.general.timeout,
             api_key=self.config.settings.api_keys.tmdb_api_key,
+            cache=self._response_cache(),
         )
 
         # listen for settings changes to update the language and TMDB API key
@@ -906,6 +908,12 @@ class MediaSearch(BaseWizardPage):
         new_language = self.config.settings.general.tmdb_language
         self.backend.update_language(new_language)
         self.backend.update_api_key(self.config.settings.api_keys.tmdb_api_key)
+        self.backend.update_cache(self._response_cache())
+
+    def _response_cache(self) -> ResponseCache:
+        return ResponseCache(
+            cache_dir(self.config.settings.general.working_dir) / RESPONSE_CACHE_NAME
+        )
 
     def isComplete(self) -> bool:
         """Overrides isComplete method to control the next button"""
@@ -39,18 +39,16 @@ from src.backend.jobs import (
     copy_base_torrent,
     copy_images,
     filter_context_document,
-    fingerprint_files,
     job_dir,
     load_job,
     mediainfo_sources,
     prune_unreferenced_nfos,
     rebuild_job_document,
     save_job,
-    torrent_content_files,
     write_job_document,
 )
 from src.backend.process import ProcessBackEnd
-from src.backend.torrents import BASE_TORRENT_SUFFIX
+from src.backend.torrents import BASE_TORRENT_SUFFIX, ContentManifest, scan_content
 from src.backend.tracker_run_data import build_tracker_data, image_host_label
 from src.backend.upload_retry import (
     TrackerRunOutcome,
@@ -87,16 +85,12 @@ def _measure_content_size(input_path: Path) -> int | None:
 
     Matches what a generated torrent reports (`Torrent.size`), so a job that
     has a base torrent and one that does not record the same number: the sum of
-    every file for a pack, the file's own size for a single file. `stat()` on a
-    directory would report the directory entry instead, which is not a release
-    size at all.
+    every file the torrent would contain for a pack, the file's own size for a
+    single file. `stat()` on a directory would report the directory entry
+    instead, which is not a release size at all.
     """
     try:
-        if input_path.is_dir():
-            return sum(
-                path.stat().st_size for path in torrent_content_files(input_path)
-            )
-        return input_path.stat().st_size if input_path.is_file() else None
+        return scan_content(input_path).size if input_path.exists() else None
     except OSError as error:
         LOG.warning(
             LOG.LOG_SOURCE.FE,
@@ -685,12 +679,29 @@ class ProcessPage(BaseWizardPage):
                 "snapshot": snapshot,
                 # every file, not just the first: the torrent is built from
                 # `input_path`, so one file of a pack cannot vouch for the rest
-                "fingerprints": fingerprint_files(torrent_content_files(input_path)),
+                "fingerprints": self._content_manifest(input_path).fingerprints(),
             }
         if keep_trackers is not None:
             document = filter_context_document(document, keep_trackers)
         return document
 
+    def _content_manifest(self, input_path: Path) -> ContentManifest:
+        """The files the base torrent covers, for its fingerprints.
+
+        The backend's own manifest when it hashed `input_path` this run, so the
+        fingerprints describe the files exactly as they were hashed rather than
+        as they are now; walked afresh otherwise (a carried base was cloned).
+        """
+        manifest = self.backend.content_manifest
+        if manifest is not None and manifest.path == input_path:
+            return manifest
+        try:
+            return scan_content(input_path)
+        except OSError as error:
+            raise JobAssetError(
+                f"Could not fingerprint '{input_path}': {error}"
+            ) from error
+
     def _first_generated_torrent(self) -> Path | None:
         """The neutral base this run hashed, usable as a clone source.
 
@@ -918,6 +929,42 @@ class ProcessPage(BaseWizardPage):
         else:
             self._on_text_update("<br /><span>✅ No duplicates found</span>")
 
+        timings = self.backend.dupe_check_timings
+        if timings:
+            self._on_text_update(
+                "<span style='color: #808080;'>⏱️ Tracker search times: "
+                + ", ".join(
+                    f"{tracker} {seconds:.2f}s"
+                    for tracker, seconds in sorted(
+                        timings.items(), key=lambda item: item[1], reverse=True
+                    )
+                )
+                + "</span>"
+            )
+
+        health_timings = self.backend.tracker_health_timings
+        if health_timings:
+            self._on_text_update(
+                "<span style='color: #808080;'>⏱️ Tracker probe times: "
+                + ", ".join(
+                    f"{tracker} {seconds:.2f}s"
+                    for tracker, seconds in sorted(
+                        health_timings.items(), key=lambda item: item[1], reverse=True
+                    )
+                )
+                + "</span>"
+            )
+        unreachable = [
+            str(tracker)
+            for tracker, healthy in self.backend.tracker_health.items()
+            if not healthy
+        ]
+        if unreachable:
+            self._on_text_update(
+                "<span style='color: #d68c00;'>⚠️ Trackers currently unreachable: "
+                f"{', '.join(unreachable)}</span>"
+            )
+
         self.processing_mode = UploadProcessMode.UPLOAD
         self._job_ended()
         GSigs().wizard_process_btn_change_txt.emit("Process (Generate and Upload)")
@@ -1,11 +1,24 @@
+from collections import OrderedDict
 from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template, meta
+
+#: Compiled string templates an engine keeps before dropping the least recent.
+MAX_COMPILED_TEMPLATES = 128
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTemplate:
+    """A string template compiled once, with the variables it reads."""
+
+    template: Template
+    variables: frozenset[str]
 
 
 class Jinja2TemplateEngine:
-    __slots__ = ("environment", "_resettable_globals")
+    __slots__ = ("environment", "_resettable_globals", "_compiled")
 
     def __init__(self, template_dir: str | None = None, **env_options: Any) -> None:
         """
@@ -15,6 +28,7 @@ class Jinja2TemplateEngine:
         :param env_options: Options to configure the Jinja2 Environment.
         """
         self._resettable_globals: list[str] = []
+        self._compiled: OrderedDict[str, CompiledTemplate] = OrderedDict()
         # lint reason: this engine renders plain-text NFO release descriptions,
         # not HTML; autoescape would corrupt the output by HTML-escaping
         # ordinary characters (&, ', ", etc.) that belong in the NFO verbatim
@@ -44,6 +58,31 @@ class Jinja2TemplateEngine:
     def add_filter(self, name: str, func: Callable[..., Any]) -> None:
         """Add a custom filter to the environment."""
         self.environment.filters[name] = func
+        # filter names are checked when a template compiles
+        self._compiled.clear()
+
+    def compile(self, data: str) -> CompiledTemplate:
+        """
+        Compile a template from string, once per engine.
+
+        Filters and globals are looked up when the template renders, so a
+        compiled template stays valid as they change.
+
+        :param data: Template in a string form.
+        """
+        compiled = self._compiled.get(data)
+        if compiled is None:
+            ast = self.environment.parse(data)
+            compiled = CompiledTemplate(
+                template=self.environment.from_string(ast),
+                variables=frozenset(meta.find_undeclared_variables(ast)),
+            )
+            self._compiled[data] = compiled
+            while len(self._compiled) > MAX_COMPILED_TEMPLATES:
+                self._compiled.popitem(last=False)
+        else:
+            self._compiled.move_to_end(data)
+        return compiled
 
     def render_from_str(self, data: str, context: Mapping[str, Any]) -> str:
         """
@@ -52,8 +91,7 @@ class Jinja2TemplateEngine:
         :param data: Template in a string form.
         :param context: Context dictionary to render the template.
         """
-        template = self.environment.from_string(data)
-        return str(template.render(context))
+        return str(self.compile(data).template.render(context))
 
     def render_from_env(self, template_name: str, context: Mapping[str, Any]) -> str:
         """
@@ -1,24 +1,52 @@
 from collections import Counter
-from os import PathLike
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike, cpu_count
 from pathlib import Path
 import re
 import subprocess
 
 from src.backend.utils.subprocess_flags import get_subprocess_creation_flags
 
+# cropdetect discards the first frames it receives (its `skip` option, 2 by
+# default), so every seeked segment decodes this many extra frames
+CROPDETECT_SKIPPED_FRAMES = 2
+
+# how a crop was found, results of one method are never reused for another
+SEGMENTED_METHOD = "segmented-seek-v1"
+SCAN_METHOD = "select-scan-v1"
+
 
 class CropDetect:
-    """Utilizes FFMPEG cropdetect filter to detect the crop needed from a source file"""
+    """Utilizes FFMPEG cropdetect filter to detect the crop needed from a source file
+
+    When the duration of the source is known, `segments` evenly spaced points are
+    input seeked (`-ss`) and only `frames` frames are decoded at each, with the
+    segments running in parallel subprocesses. Without a duration it falls back to
+    a single `select` filtered scan from the start of the file.
+    """
 
     def __init__(
-        self, ffmpeg: Path, file_input: PathLike[str], segments: int, frames: int
+        self,
+        ffmpeg: Path,
+        file_input: PathLike[str],
+        segments: int,
+        frames: int,
+        duration: float | None = None,
+        max_workers: int | None = None,
     ) -> None:
         self.ffmpeg = Path(ffmpeg)
         self.file_input = Path(file_input)
         self.segments = segments
         self.frames = frames
+        self.duration = duration
+        self.max_workers = max_workers or max(1, (cpu_count() or 2) // 2)
         self.result = self._detect_crop()
 
+    @staticmethod
+    def method(duration: float | None) -> str:
+        """The detection method used for a source of `duration` seconds."""
+        return SEGMENTED_METHOD if duration and duration > 0 else SCAN_METHOD
+
     def _detect_crop(self) -> str | None:
         crop_segments = self._detect_crop_in_segments()
         largest_common_crop = self._get_largest_common_crop_params(crop_segments)
@@ -26,11 +54,64 @@ class CropDetect:
         return crop
 
     def _detect_crop_in_segments(self) -> list[str]:
+        if self.duration and self.method(self.duration) == SEGMENTED_METHOD:
+            return self._run_segmented_crop_detect(self.file_input, self.duration)
+
         crop_params_list = self._run_crop_detect(
             self.file_input, self.segments * self.frames
         )
         return crop_params_list
 
+    def segment_offsets(self, duration: float) -> list[float]:
+        """Evenly spaced seek points that avoid the very start and end of the file."""
+        return [
+            duration * (idx + 1) / (self.segments + 1) for idx in range(self.segments)
+        ]
+
+    def _run_segmented_crop_detect(
+        self, input_video: Path, duration: float
+    ) -> list[str]:
+        offsets = self.segment_offsets(duration)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(offsets))),
+            thread_name_prefix="crop-detect",
+        ) as executor:
+            results = executor.map(
+                lambda offset: self._run_segment_crop_detect(input_video, offset),
+                offsets,
+            )
+            return [crop for segment in results for crop in segment]
+
+    def _run_segment_crop_detect(self, input_video: Path, offset: float) -> list[str]:
+        command = (
+            str(self.ffmpeg),
+            "-ss",
+            f"{offset:.3f}",
+            "-i",
+            input_video,
+            "-vf",
+            "cropdetect=round=2",
+            "-frames:v",
+            str(self.frames + CROPDETECT_SKIPPED_FRAMES),
+            "-an",
+            "-f",
+            "null",
+            "-",
+            "-hide_banner",
+        )
+
+        try:
+            result = subprocess.run(  # noqa: S603 - list argv, no shell; ffmpeg path is the configured binary
+                command,
+                stderr=subprocess.PIPE,
+                text=True,
+                creationflags=get_subprocess_creation_flags(),
+            )
+        except OSError:
+            return []
+
+        return re.findall(r"crop=(\d+):(\d+):(\d+):(\d+)", result.stderr)
+
     def _run_crop_detect(self, input_video: Path, num_frames: int) -> list[str]:
         command = (
             str(self.ffmpeg),
@@ -42,3 +42,14 @@ class ComparisonPair(NamedTuple):
     source: Path
     media: Path
     script: Path | None
+
+
+class OptimizedImage(NamedTuple):
+    path: Path
+    original_bytes: int
+    optimized_bytes: int
+    seconds: float
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_bytes - self.optimized_bytes
@@ -1,38 +1,76 @@
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
 from pymediainfo import MediaInfo
 
+_T = TypeVar("_T")
+
+# marks a fact that has not been stored; None is a valid fact
+_MISSING: Any = object()
+
 
 @dataclass(slots=True)
 class MediaAnalysisCache:
     """Cache derived media facts for one :class:`MediaInputPayload`.
 
-    The cache keeps the ``MediaInfo`` object alongside each value. That makes
-    the object-identity key safe if a payload replaces a media object during a
-    run and Python later reuses the old object's id.
+    A fact is keyed by the object it was derived from (a ``MediaInfo``, a
+    track, a guessit result), its name and an optional hashable ``variant``
+    holding anything else it depends on. Every ``TokenReplacer`` built for the
+    payload during a run -- one per tracker title and NFO, one per episode
+    rename -- reads the same cache, so a fact that does not depend on tracker
+    settings is worked out once per run.
+
+    The cache keeps the subject object alongside each value. That makes the
+    object-identity key safe if a payload replaces a media object during a run
+    and Python later reuses the old object's id.
     """
 
-    _resolution: dict[tuple[int, bool], tuple[MediaInfo, str]] = field(
+    _facts: dict[tuple[int, str, Hashable], tuple[object, Any]] = field(
         default_factory=dict
     )
 
-    def get_resolution(self, media_info: MediaInfo, remove_scan: bool) -> str | None:
-        key = (id(media_info), remove_scan)
-        cached = self._resolution.get(key)
+    def get(self, subject: object, fact: str, variant: Hashable = None) -> Any:
+        """The stored fact, or ``_MISSING`` when there is none for `subject`."""
+        key = (id(subject), fact, variant)
+        cached = self._facts.get(key)
         if cached is None:
-            return None
+            return _MISSING
 
-        if cached[0] is not media_info:
-            self._resolution.pop(key, None)
-            return None
+        if cached[0] is not subject:
+            self._facts.pop(key, None)
+            return _MISSING
 
         return cached[1]
 
+    def set(
+        self, subject: object, fact: str, value: Any, variant: Hashable = None
+    ) -> None:
+        self._facts[(id(subject), fact, variant)] = (subject, value)
+
+    def remember(
+        self,
+        subject: object,
+        fact: str,
+        compute: Callable[[], _T],
+        variant: Hashable = None,
+    ) -> _T:
+        """Return the stored fact, computing and storing it on first use."""
+        value = self.get(subject, fact, variant)
+        if value is _MISSING:
+            value = compute()
+            self.set(subject, fact, value, variant)
+        return value
+
+    def get_resolution(self, media_info: MediaInfo, remove_scan: bool) -> str | None:
+        resolution = self.get(media_info, "resolution", remove_scan)
+        return None if resolution is _MISSING else resolution
+
     def set_resolution(
         self, media_info: MediaInfo, remove_scan: bool, resolution: str
     ) -> None:
-        self._resolution[(id(media_info), remove_scan)] = (media_info, resolution)
+        self.set(media_info, "resolution", resolution, remove_scan)
 
     def clear(self) -> None:
         """Discard all derived values before a payload is reused."""
-        self._resolution.clear()
+        self._facts.clear()
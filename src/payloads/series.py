@@ -3,8 +3,7 @@ from pathlib import Path
 import re
 from typing import Any
 
-from guessit import guessit
-
+from src.backend.utils.guessit_helpers import parse_guessit_batch
 from src.enums.media_type import MediaType
 from src.enums.series import EpisodeFormat
 from src.payloads.media_inputs import MediaInputPayload
@@ -145,8 +144,12 @@ def build_series_release_info(media_input: MediaInputPayload) -> SeriesReleaseIn
     need_seasons = not seasons
     need_episodes = not episode_starts
     if need_seasons or need_episodes:
-        for file_path in file_list or ([primary_file] if primary_file else []):
-            parsed = guessit(file_path.name, options={"type": "episode"})
+        file_paths = file_list or ([primary_file] if primary_file else [])
+        # no type hint: the bare name with no options is the parse every other
+        # reader of these files shares, and it finds the same seasons and
+        # episodes in them
+        parses = parse_guessit_batch([file_path.name for file_path in file_paths])
+        for file_path, parsed in zip(file_paths, parses, strict=True):
             if need_seasons:
                 season = _fallback_season(file_path.name, parsed.get("season"))
                 if season is not None:
@@ -10,6 +10,8 @@ announce, source, comment and `created by` to another tracker's users.
 """
 
 from pathlib import Path
+import threading
+import time
 from types import SimpleNamespace
 from typing import Any, cast
 from unittest.mock import MagicMock
@@ -19,7 +21,11 @@ from torf import Torrent
 
 import src.backend.process as process_module
 from src.backend.process import ProcessBackEnd
-from src.backend.torrents import BASE_TORRENT_SUFFIX, generate_torrent
+from src.backend.torrents import (
+    BASE_TORRENT_SUFFIX,
+    BaseTorrentCloner,
+    generate_torrent,
+)
 from src.backend.torrents.torrent import NFO_FORGE_CREATOR
 from src.context.processing_context import ProcessingContext
 from src.enums.tracker_selection import TrackerSelection
@@ -43,7 +49,7 @@ _TRACKERS = {
 }
 
 
-def _backend(monkeypatch: pytest.MonkeyPatch) -> ProcessBackEnd:
+def _backend(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> ProcessBackEnd:
     backend = object.__new__(ProcessBackEnd)
     backend.config = cast(
         Any,
@@ -52,6 +58,9 @@ def _backend(monkeypatch: pytest.MonkeyPatch) -> ProcessBackEnd:
                 general=SimpleNamespace(
                     timeout=60,
                     enable_mkbrr=False,
+                    pipeline_torrent_hashing=False,
+                    tracker_upload_workers=1,
+                    working_dir=tmp_path,
                     enable_plugins=False,
                     enable_prompt_overview=False,
                     releasers_name="tester",
@@ -134,7 +143,7 @@ def test_the_base_is_written_outside_every_tracker_directory(
     """It must not be any tracker's artifact, and it must not be reachable by
     the `*/<stem>.torrent` glob a saved job uses to find its clone source."""
     context = _context(tmp_path)
-    backend = _backend(monkeypatch)
+    backend = _backend(monkeypatch, tmp_path)
 
     backend.process_trackers(**_kwargs(context, tmp_path), phase=RunPhase.PREPARE)
 
@@ -149,7 +158,7 @@ def test_the_base_carries_no_tracker_identity_after_a_full_run(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     context = _context(tmp_path)
-    backend = _backend(monkeypatch)
+    backend = _backend(monkeypatch, tmp_path)
 
     backend.process_trackers(**_kwargs(context, tmp_path), phase=RunPhase.PREPARE)
 
@@ -166,15 +175,15 @@ def test_the_first_tracker_gets_a_stamped_clone_like_every_other(
     """There is no longer a privileged first tracker whose own file becomes the
     base -- that asymmetry is what the aliasing bug rested on."""
     context = _context(tmp_path)
-    backend = _backend(monkeypatch)
+    backend = _backend(monkeypatch, tmp_path)
     cloned_from: list[Path] = []
-    real_clone = process_module.clone_torrent
 
-    def recording_clone(**kwargs: Any) -> Any:
-        cloned_from.append(kwargs["base_torrent_file"])
-        return real_clone(**kwargs)
+    class RecordingCloner(BaseTorrentCloner):
+        def write(self, *args: Any, **kwargs: Any) -> Path:
+            cloned_from.append(self.base_torrent_file)
+            return super().write(*args, **kwargs)
 
-    monkeypatch.setattr(process_module, "clone_torrent", recording_clone)
+    monkeypatch.setattr(process_module, "BaseTorrentCloner", RecordingCloner)
 
     backend.process_trackers(**_kwargs(context, tmp_path), phase=RunPhase.PREPARE)
 
@@ -186,7 +195,7 @@ def test_every_tracker_gets_only_its_own_identity(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     context = _context(tmp_path)
-    backend = _backend(monkeypatch)
+    backend = _backend(monkeypatch, tmp_path)
 
     backend.process_trackers(**_kwargs(context, tmp_path), phase=RunPhase.PREPARE)
 
@@ -218,13 +227,11 @@ def test_a_tracker_rewriting_its_own_torrent_cannot_reach_the_next_one(
     "Edited by LST.GG" with no edit of its own.
     """
     context = _context(tmp_path)
-    backend = _backend(monkeypatch)
-    tracker_dirs = {tmp_path / str(tracker).lower() for tracker in _TRACKERS}
-    real_write = process_module.write_torrent
+    backend = _backend(monkeypatch, tmp_path)
 
-    def server_rewriting_write(torrent_instance: Any, torrent_path: Path) -> Path:
-        written = real_write(torrent_instance, torrent_path)
-        if written.parent in tracker_dirs:
+    class ServerRewritingCloner(BaseTorrentCloner):
+        def write(self, *args: Any, **kwargs: Any) -> Path:
+            written = super().write(*args, **kwargs)
             rewritten = Torrent.read(written)
             rewritten.metainfo["announce"] = "https://server.invalid/STAMPED/announce"
             rewritten.metainfo["info"]["source"] = "SERVER"
@@ -232,10 +239,10 @@ def test_a_tracker_rewriting_its_own_torrent_cannot_reach_the_next_one(
             rewritten.metainfo["created by"] = (
                 f"{rewritten.metainfo.get('created by')}. Edited by SERVER"
             )
-            real_write(Torrent.copy(rewritten), written)
-        return written
+            Torrent.copy(rewritten).write(written, overwrite=True)
+            return written
 
-    monkeypatch.setattr(process_module, "write_torrent", server_rewriting_write)
+    monkeypatch.setattr(process_module, "BaseTorrentCloner", ServerRewritingCloner)
 
     backend.process_trackers(**_kwargs(context, tmp_path), phase=RunPhase.PREPARE)
 
@@ -271,7 +278,7 @@ def test_a_carried_base_is_neutralized_into_the_run_folder(
     legacy.write(carried, overwrite=True)
     context.shared_data.base_torrent = carried
 
-    backend = _backend(monkeypatch)
+    backend = _backend(monkeypatch, tmp_path)
     hashed = MagicMock(side_effect=AssertionError("must not re-hash"))
     monkeypatch.setattr(process_module, "generate_torrent", hashed)
 
@@ -298,9 +305,73 @@ def test_an_unreadable_carried_base_falls_back_to_hashing(
     carried.write_bytes(b"not a torrent")
     context.shared_data.base_torrent = carried
 
-    backend = _backend(monkeypatch)
+    backend = _backend(monkeypatch, tmp_path)
     backend.process_trackers(**_kwargs(context, tmp_path), phase=RunPhase.PREPARE)
 
     base = Torrent.read(_base_path(tmp_path))
     assert "announce" not in base.metainfo
     assert base.metainfo["created by"] == NFO_FORGE_CREATOR
+
+
+def test_a_pipelined_run_hashes_while_images_are_handled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    context = _context(tmp_path)
+    backend = _backend(monkeypatch, tmp_path)
+    backend.config.settings.general.pipeline_torrent_hashing = True
+    hashing = threading.Event()
+    real_generate = process_module.generate_torrent
+
+    def recording_generate(**kwargs: Any) -> Torrent:
+        hashing.set()
+        return real_generate(**kwargs)
+
+    def images_waiting_on_hashing(*_args: Any, **_kwargs: Any) -> dict:
+        # would only pass after a timeout if hashing waited for the images
+        assert hashing.wait(5)
+        return {}
+
+    monkeypatch.setattr(process_module, "generate_torrent", recording_generate)
+    monkeypatch.setattr(
+        backend, "handle_images_for_trackers", images_waiting_on_hashing
+    )
+
+    backend.process_trackers(**_kwargs(context, tmp_path), phase=RunPhase.PREPARE)
+
+    assert _base_path(tmp_path).is_file()
+    for path in _tracker_paths(tmp_path).values():
+        assert path.is_file()
+
+
+def test_a_pipelined_run_that_fails_first_cancels_its_hash(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    context = _context(tmp_path)
+    backend = _backend(monkeypatch, tmp_path)
+    backend.config.settings.general.pipeline_torrent_hashing = True
+    hashing = threading.Event()
+    cancelled: list[bool] = []
+
+    def endless_generate(**kwargs: Any) -> Torrent:
+        hashing.set()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if kwargs["cb"](MagicMock(), "release.mkv", 1, 100) is not None:
+                cancelled.append(True)
+                break
+            time.sleep(0.01)
+        return Torrent()
+
+    def failing_images(*_args: Any, **_kwargs: Any) -> dict:
+        hashing.wait(5)
+        raise RuntimeError("image host down")
+
+    monkeypatch.setattr(process_module, "generate_torrent", endless_generate)
+    monkeypatch.setattr(backend, "handle_images_for_trackers", failing_images)
+
+    with pytest.raises(RuntimeError, match="image host down"):
+        backend.process_trackers(**_kwargs(context, tmp_path), phase=RunPhase.PREPARE)
+
+    # the hash was stopped, rather than left to finish after the run had failed
+    assert cancelled == [True]
+    assert not _base_path(tmp_path).exists()
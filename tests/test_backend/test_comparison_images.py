@@ -1,5 +1,6 @@
 from pathlib import Path
 import subprocess
+import threading
 from types import SimpleNamespace
 from typing import Any
 
@@ -8,7 +9,10 @@ import pytest
 from src.backend import images as images_module
 from src.backend.images import (
     COMPARISON_FONT_PATH,
+    BasicImageGeneration,
     ComparisonImageGeneration,
+    FrameSegment,
+    MergedProgressSignal,
     _build_drawtext_filter,
 )
 from src.backend.utils import subprocess_flags
@@ -229,3 +233,280 @@ def test_sync_failure_does_not_emit_false_completion(
 
 def test_required_comparison_font_exists() -> None:
     assert COMPARISON_FONT_PATH.is_file()
+
+
+def test_frame_commands_run_concurrently_with_steady_progress(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    generator = BasicImageGeneration(max_workers=4)
+    signal = SignalSpy()
+    barrier = threading.Barrier(4, timeout=5)
+    outputs: list[str] = []
+    lock = threading.Lock()
+
+    def concurrent_run(
+        command: list[str], **_kwargs: Any
+    ) -> subprocess.CompletedProcess[str]:
+        # every worker must be in flight at once for the barrier to release
+        barrier.wait()
+        with lock:
+            outputs.append(command[-4])
+        return subprocess.CompletedProcess(command, 0, "", "")
+
+    monkeypatch.setattr(images_module.subprocess, "run", concurrent_run)
+
+    commands = [
+        (f"00:00:0{i}.000", ["ffmpeg", "-y", f"{i:02d}_output.png", "-v", "error", "-"])
+        for i in range(1, 5)
+    ]
+    assert generator.run_frame_commands(commands, 4, signal) == 4  # type: ignore[arg-type]
+
+    assert sorted(outputs) == [f"{i:02d}_output.png" for i in range(1, 5)]
+    assert [progress for _, progress in signal.messages] == [25, 50, 75, 100]
+
+
+def test_frame_command_failure_is_counted_not_raised(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    generator = BasicImageGeneration(max_workers=2)
+    signal = SignalSpy()
+
+    def timeout_run(
+        command: list[str], **_kwargs: Any
+    ) -> subprocess.CompletedProcess[str]:
+        if "bad" in command:
+            raise subprocess.TimeoutExpired(command, 30)
+        return subprocess.CompletedProcess(command, 0, "", "")
+
+    monkeypatch.setattr(images_module.subprocess, "run", timeout_run)
+
+    commands = [
+        ("00:00:01.000", ["ffmpeg", "good"]),
+        ("00:00:02.000", ["ffmpeg", "bad"]),
+    ]
+    assert generator.run_frame_commands(commands, 2, signal) == 1  # type: ignore[arg-type]
+    assert len(signal.messages) == 1
+
+
+def test_a_failed_frame_keeps_progress_short_of_complete(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # one worker, so the failed frame finishes before the extracted one
+    generator = BasicImageGeneration(max_workers=1)
+    signal = SignalSpy()
+
+    def failing_run(
+        command: list[str], **_kwargs: Any
+    ) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(command, 0 if "good" in command else 1)
+
+    monkeypatch.setattr(images_module.subprocess, "run", failing_run)
+
+    commands = [
+        ("00:00:01.000", ["ffmpeg", "bad"]),
+        ("00:00:02.000", ["ffmpeg", "good"]),
+    ]
+    assert generator.run_frame_commands(commands, 2, signal) == 1  # type: ignore[arg-type]
+    assert signal.messages == [("Extracted frame 1/2", 50)]
+
+
+def test_single_pass_command_seeks_each_segment_as_its_own_input(
+    tmp_path: Path,
+) -> None:
+    command, targets = ComparisonImageGeneration._build_single_pass_command(
+        Path("ffmpeg"),
+        Path("source.mkv"),
+        [
+            FrameSegment(
+                "00:00:10.000", "scale=1920:1080", (str(tmp_path / "01.png"),)
+            ),
+            FrameSegment(
+                "00:01:00.000",
+                "copy",
+                (str(tmp_path / "sync" / "01.png"), str(tmp_path / "sync" / "02.png")),
+            ),
+        ],
+    )
+
+    assert command.count("-i") == 2
+    assert command[command.index("-filter_complex") + 1] == (
+        "[0:v]scale=1920:1080[v0];[1:v]copy[v1]"
+    )
+    assert targets == [
+        str(tmp_path / "01.png"),
+        str(tmp_path / "sync" / "_single_pass_01_%03d.png"),
+    ]
+    second_map = command.index("[v1]")
+    assert command[second_map + 1 : second_map + 3] == ["-frames:v", "2"]
+
+
+def _single_frame_segments(tmp_path: Path, count: int) -> list[FrameSegment]:
+    return [
+        FrameSegment(f"00:00:{i:02d}.000", "copy", (str(tmp_path / f"{i:02d}.png"),))
+        for i in range(count)
+    ]
+
+
+def test_single_pass_opens_a_bounded_number_of_inputs_per_invocation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    generator = ComparisonImageGeneration(max_workers=8)
+    calls: list[tuple[int, float]] = []
+    lock = threading.Lock()
+
+    def run(
+        command: list[str], timeout: float, **_kwargs: Any
+    ) -> subprocess.CompletedProcess[str]:
+        with lock:
+            calls.append((command.count("-i"), timeout))
+        for arg in command:
+            if arg.endswith(".png"):
+                Path(arg).touch()
+        return subprocess.CompletedProcess(command, 0, "", "")
+
+    monkeypatch.setattr(images_module.subprocess, "run", run)
+
+    assert generator._extract_single_pass(
+        Path("ffmpeg"), tmp_path / "source.mkv", _single_frame_segments(tmp_path, 10)
+    )
+
+    assert sorted(inputs for inputs, _timeout in calls) == [2, 4, 4]
+    assert all(
+        timeout <= images_module.SINGLE_PASS_TIMEOUT for _inputs, timeout in calls
+    )
+
+
+def test_a_failed_single_pass_skips_the_rest_and_removes_partial_frames(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    generator = ComparisonImageGeneration(max_workers=1)
+    calls = 0
+
+    def run(command: list[str], **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        nonlocal calls
+        calls += 1
+        raise subprocess.TimeoutExpired(command, images_module.SINGLE_PASS_TIMEOUT)
+
+    monkeypatch.setattr(images_module.subprocess, "run", run)
+    segments = _single_frame_segments(tmp_path, 10)
+    Path(segments[0].output_files[0]).touch()
+
+    assert not generator._extract_single_pass(
+        Path("ffmpeg"), tmp_path / "source.mkv", segments
+    )
+
+    assert calls == 1
+    assert not any(tmp_path.glob("*.png"))
+
+
+def test_rejected_single_pass_falls_back_to_per_frame_commands(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    generator = ComparisonImageGeneration(max_workers=2)
+    signal = SignalSpy()
+    single_pass_calls = 0
+    frame_calls = 0
+    lock = threading.Lock()
+
+    def run(command: list[str], **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        nonlocal single_pass_calls, frame_calls
+        with lock:
+            if "-filter_complex" in command:
+                single_pass_calls += 1
+                return subprocess.CompletedProcess(command, 1, "", "invalid graph")
+            frame_calls += 1
+        return subprocess.CompletedProcess(command, 0, "", "")
+
+    monkeypatch.setattr(images_module.subprocess, "run", run)
+    monkeypatch.setattr(images_module, "get_total_frames", lambda _mi: 1000)
+    monkeypatch.setattr(
+        images_module,
+        "determine_ffmpeg_trimmed_frames",
+        lambda **_kwargs: (500, "0"),
+    )
+
+    result = generator.generate_comp_frames(
+        input_video=tmp_path / "encode.mkv",
+        output_pattern=str(tmp_path / "%02db_encode.png"),
+        text_overlay=None,
+        sub_size=16,
+        mi_object=SimpleNamespace(  # type: ignore[arg-type]
+            video_tracks=[SimpleNamespace(other_hdr_format=None)]
+        ),
+        total_images=4,
+        trim=(12, 12),
+        random_offset=0,
+        frame_rate=24.0,
+        subtitle_color="#ffffff",
+        subtitle_outline_color="#000000",
+        ffmpeg=tmp_path / "ffmpeg",
+        signal=signal,  # type: ignore[arg-type]
+    )
+
+    assert result == 0
+    assert single_pass_calls == 1
+    assert frame_calls == 4
+    assert signal.messages[-1][1] == 100
+
+
+def test_merged_progress_reports_average_of_pipelines() -> None:
+    signal = SignalSpy()
+    merged = MergedProgressSignal(signal, ("Encode", "Source"))
+
+    merged.pipeline("Encode").emit("Extracted frame 2/2", 100)
+    merged.pipeline("Source").emit("\nExtracted frame 1/2", 50)
+
+    assert signal.messages == [
+        ("[Encode] Extracted frame 2/2", 50),
+        ("[Source] Extracted frame 1/2", 75),
+    ]
+    with pytest.raises(KeyError):
+        merged.pipeline("Sync")
+
+
+def test_encode_and_source_frames_are_generated_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    generator = ComparisonImageGeneration(max_workers=8)
+    media_info = SimpleNamespace(
+        video_tracks=[SimpleNamespace(width=1920, height=1080)]
+    )
+    barrier = threading.Barrier(2, timeout=5)
+    worker_limits: list[int | None] = []
+
+    monkeypatch.setattr(
+        images_module,
+        "create_directories",
+        lambda *_args, **_kwargs: (tmp_path / "comparison", tmp_path / "selected"),
+    )
+    monkeypatch.setattr(generator, "_validate_drawtext_support", lambda _path: None)
+    monkeypatch.setattr(images_module, "get_frame_rate", lambda _mi: 24.0)
+
+    def generate(**kwargs: Any) -> int:
+        # both inputs must be in flight at once for the barrier to release
+        barrier.wait()
+        worker_limits.append(kwargs["max_workers"])
+        return 0
+
+    monkeypatch.setattr(generator, "generate_comp_frames", generate)
+
+    result = generator.comparison_image_generation(
+        source_input=tmp_path / "source.mkv",
+        source_file_mi_obj=media_info,  # type: ignore[arg-type]
+        media_input=tmp_path / "encode.mkv",
+        media_file_mi_obj=media_info,  # type: ignore[arg-type]
+        output_directory=tmp_path / "images",
+        total_images=6,
+        trim=(12, 12),
+        subtitle_color="#ffffff",
+        subtitle_outline_color="#000000",
+        sub_names=None,
+        sub_size=16,
+        crop_mode=Cropping.DISABLED,
+        crop_values=None,
+        ffmpeg_path=tmp_path / "ffmpeg.exe",
+        signal=SignalSpy(),  # type: ignore[arg-type]
+    )
+
+    assert result == 0
+    assert worker_limits == [4, 4]
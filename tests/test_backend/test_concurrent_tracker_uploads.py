@@ -0,0 +1,223 @@
+from pathlib import Path
+import threading
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+from PySide6.QtCore import SignalInstance
+import pytest
+
+import src.backend.process as process_module
+from src.backend.process import ProcessBackEnd
+from src.backend.torrents import ContentManifest
+from src.backend.upload_retry import TrackerRunOutcome, UploadFailure, UploadRetryAction
+from src.config.config import ConfigManager
+from src.context.processing_context import ProcessingContext
+from src.enums.tracker_selection import TrackerSelection
+from src.exceptions import ProcessCancelled, TrackerError
+from src.payloads.shared_data import SharedPayload
+
+TRACKERS = (TrackerSelection.AITHER, TrackerSelection.BEYOND_HD, TrackerSelection.LST)
+
+
+@pytest.fixture(autouse=True)
+def _patch_torrent_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(process_module, "ensure_tracker_health", lambda **_kwargs: None)
+    monkeypatch.setattr(
+        process_module, "scan_content", lambda path: ContentManifest(path, ())
+    )
+    monkeypatch.setattr(
+        process_module, "generate_torrent", lambda **_kwargs: MagicMock()
+    )
+    monkeypatch.setattr(process_module, "BaseTorrentCloner", MagicMock())
+    monkeypatch.setattr(
+        process_module,
+        "write_torrent",
+        lambda *_a, **_kwargs: tmp_path / "written.torrent",
+    )
+    monkeypatch.setattr(
+        process_module,
+        "build_series_release_info",
+        lambda *_a, **_kwargs: MagicMock(),
+    )
+
+
+def _backend(upload: Any, tmp_path: Path, workers: int = 3) -> ProcessBackEnd:
+    tracker_info = SimpleNamespace(upload_enabled=True, nfo_template=None)
+    backend = object.__new__(ProcessBackEnd)
+    backend.config = cast(
+        ConfigManager,
+        SimpleNamespace(
+            settings=SimpleNamespace(
+                general=SimpleNamespace(
+                    timeout=60,
+                    enable_mkbrr=False,
+                    pipeline_torrent_hashing=False,
+                    tracker_upload_workers=workers,
+                    working_dir=tmp_path,
+                    enable_plugins=False,
+                    enable_prompt_overview=False,
+                ),
+                trackers=SimpleNamespace(
+                    by_selection=lambda: dict.fromkeys(TRACKERS, tracker_info)
+                ),
+                user_tokens=SimpleNamespace(tokens={}),
+                dependencies=SimpleNamespace(mkbrr=None),
+                torrent_clients=SimpleNamespace(
+                    qbittorrent=SimpleNamespace(enabled=False)
+                ),
+            )
+        ),
+    )
+    backend.template_selector_be = SimpleNamespace(
+        load_templates=lambda: None, read_template=lambda name=None: None
+    )
+    backend.handle_images_for_trackers = MagicMock(return_value={})  # type: ignore[method-assign]
+    backend.generate_tracker_title = MagicMock(return_value=None)  # type: ignore[method-assign]
+    backend.upload = MagicMock(side_effect=upload)  # type: ignore[method-assign]
+    backend._handle_injection = MagicMock(return_value=None)  # type: ignore[method-assign]
+    backend.disconnect_from_clients = MagicMock()  # type: ignore[method-assign]
+    return backend
+
+
+def _run(
+    backend: ProcessBackEnd,
+    tmp_path: Path,
+    *,
+    upload_retry_cb: Any = None,
+    outcomes: dict[TrackerSelection, TrackerRunOutcome] | None = None,
+    statuses: list[tuple[str, str]] | None = None,
+) -> None:
+    context = cast(
+        ProcessingContext,
+        SimpleNamespace(
+            media_input=SimpleNamespace(
+                require_input_path=lambda: tmp_path / "media.mkv",
+                require_working_dir=lambda: tmp_path,
+            ),
+            shared_data=SharedPayload(),
+        ),
+    )
+    backend.process_trackers(
+        process_dict={
+            str(tracker): {"path": tmp_path / f"{tracker}.torrent"}
+            for tracker in TRACKERS
+        },
+        queued_status_update=lambda tracker, status: (
+            statuses.append((tracker, status)) if statuses is not None else None
+        ),
+        queued_text_update=MagicMock(),
+        queued_text_update_replace_last_line=MagicMock(),
+        progress_bar_cb=MagicMock(),
+        caught_error=cast(SignalInstance, MagicMock()),
+        context=context,
+        upload_retry_cb=upload_retry_cb,
+        run_outcome_cb=lambda tracker, outcome: (
+            outcomes.__setitem__(tracker, outcome) if outcomes is not None else None
+        ),
+    )
+
+
+def _injected(backend: ProcessBackEnd) -> list[str]:
+    injection = cast(MagicMock, backend._handle_injection)
+    return [call.kwargs["tracker_name"] for call in injection.call_args_list]
+
+
+def test_trackers_upload_at_the_same_time(tmp_path: Path) -> None:
+    # every upload waits for all the others, which a sequential run never allows
+    barrier = threading.Barrier(len(TRACKERS), timeout=5)
+
+    def upload(**_kwargs: Any) -> bool:
+        barrier.wait()
+        return True
+
+    backend = _backend(upload, tmp_path)
+    outcomes: dict[TrackerSelection, TrackerRunOutcome] = {}
+
+    _run(backend, tmp_path, outcomes=outcomes)
+
+    assert outcomes == dict.fromkeys(TRACKERS, TrackerRunOutcome.UPLOADED)
+    backend.disconnect_from_clients.assert_called_once()  # type: ignore[attr-defined]
+
+
+def test_injection_keeps_tracker_order_when_a_later_upload_finishes_first(
+    tmp_path: Path,
+) -> None:
+    last_done = threading.Event()
+
+    def upload(*, tracker: TrackerSelection, **_kwargs: Any) -> bool:
+        if tracker is TrackerSelection.LST:
+            last_done.set()
+        else:
+            assert last_done.wait(timeout=5)
+        return True
+
+    backend = _backend(upload, tmp_path)
+
+    _run(backend, tmp_path)
+
+    assert _injected(backend) == [str(tracker) for tracker in TRACKERS]
+
+
+def test_a_single_worker_keeps_the_sequential_run(tmp_path: Path) -> None:
+    threads: set[int] = set()
+
+    def upload(**_kwargs: Any) -> bool:
+        threads.add(threading.get_ident())
+        return True
+
+    backend = _backend(upload, tmp_path, workers=1)
+
+    _run(backend, tmp_path)
+
+    assert threads == {threading.get_ident()}
+    assert _injected(backend) == [str(tracker) for tracker in TRACKERS]
+
+
+def test_worker_prompts_are_shown_on_the_run_thread(tmp_path: Path) -> None:
+    def upload(*, tracker: TrackerSelection, **_kwargs: Any) -> bool:
+        if tracker is TrackerSelection.BEYOND_HD:
+            raise TrackerError("rejected", retryable=False)
+        return True
+
+    prompt_threads: list[int] = []
+
+    def upload_retry_cb(failure: UploadFailure) -> UploadRetryAction:
+        prompt_threads.append(threading.get_ident())
+        assert failure.tracker is TrackerSelection.BEYOND_HD
+        return UploadRetryAction.SKIP
+
+    backend = _backend(upload, tmp_path)
+    outcomes: dict[TrackerSelection, TrackerRunOutcome] = {}
+
+    _run(backend, tmp_path, upload_retry_cb=upload_retry_cb, outcomes=outcomes)
+
+    assert prompt_threads == [threading.get_ident()]
+    assert outcomes[TrackerSelection.BEYOND_HD] is TrackerRunOutcome.SKIPPED
+    assert _injected(backend) == ["Aither", "LST"]
+
+
+def test_cancel_stops_injection_and_reports_every_tracker(tmp_path: Path) -> None:
+    def upload(*, tracker: TrackerSelection, **_kwargs: Any) -> bool:
+        if tracker is TrackerSelection.AITHER:
+            raise TrackerError("rejected", retryable=False)
+        return True
+
+    backend = _backend(upload, tmp_path)
+    outcomes: dict[TrackerSelection, TrackerRunOutcome] = {}
+    statuses: list[tuple[str, str]] = []
+
+    with pytest.raises(ProcessCancelled):
+        _run(
+            backend,
+            tmp_path,
+            upload_retry_cb=lambda _failure: UploadRetryAction.CANCEL,
+            outcomes=outcomes,
+            statuses=statuses,
+        )
+
+    assert _injected(backend) == []
+    assert outcomes[TrackerSelection.AITHER] is TrackerRunOutcome.UPLOAD_FAILED
+    assert set(outcomes) == set(TRACKERS)
+    assert ("Aither", "⏹ Cancelled") in statuses
+    backend.disconnect_from_clients.assert_called_once()  # type: ignore[attr-defined]
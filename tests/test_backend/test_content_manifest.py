@@ -0,0 +1,96 @@
+import os
+from pathlib import Path
+
+import pytest
+from torf import Torrent
+
+from src.backend.torrents.manifest import INDEX_SIDECAR_GLOBS, scan_content
+from src.backend.torrents.torrent import generate_torrent
+
+
+def _torf_files(path: Path) -> list[Path]:
+    torrent = Torrent(path=path, exclude_globs=INDEX_SIDECAR_GLOBS)
+    return [Path(filepath) for filepath in torrent.filepaths]
+
+
+def _pack(tmp_path: Path) -> Path:
+    pack = tmp_path / "Show.S01"
+    (pack / "Subs").mkdir(parents=True)
+    (pack / "Show.S01E02.mkv").write_bytes(b"b" * 300)
+    (pack / "show.S01E01.mkv").write_bytes(b"a" * 200)
+    (pack / "Subs" / "Show.S01E01.srt").write_bytes(b"s" * 10)
+    (pack / "Show.S01E01.mkv.LWI").write_bytes(b"index")
+    (pack / "Subs" / "Show.S01E02.ffindex").write_bytes(b"index")
+    (pack / ".DS_Store").write_bytes(b"hidden")
+    (pack / "empty.nfo").write_bytes(b"")
+    return pack
+
+
+def test_a_pack_scans_to_exactly_what_torf_would_include(tmp_path: Path) -> None:
+    pack = _pack(tmp_path)
+
+    manifest = scan_content(pack)
+
+    # same files in the same order, down to torf's case-sensitive sort
+    assert manifest.filepaths == _torf_files(pack)
+    assert manifest.size == Torrent(path=pack, exclude_globs=INDEX_SIDECAR_GLOBS).size
+    assert manifest.is_directory
+
+
+def test_a_single_file_scans_to_itself(tmp_path: Path) -> None:
+    media = tmp_path / "Movie.mkv"
+    media.write_bytes(b"m" * 123)
+
+    manifest = scan_content(media)
+
+    assert manifest.filepaths == [media]
+    assert manifest.size == 123
+    assert not manifest.is_directory
+
+
+def test_a_missing_path_scans_as_empty(tmp_path: Path) -> None:
+    assert scan_content(tmp_path / "gone").files == ()
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+def test_a_symlinked_directory_is_followed(tmp_path: Path) -> None:
+    pack = _pack(tmp_path)
+    extras = tmp_path / "extras"
+    extras.mkdir()
+    (extras / "Featurette.mkv").write_bytes(b"f" * 50)
+    try:
+        (pack / "Extras").symlink_to(extras, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks are not permitted here")
+
+    assert scan_content(pack).filepaths == _torf_files(pack)
+
+
+def test_fingerprints_cover_every_scanned_file(tmp_path: Path) -> None:
+    pack = _pack(tmp_path)
+
+    fingerprints = scan_content(pack).fingerprints()
+
+    episode = pack / "Show.S01E02.mkv"
+    assert fingerprints[str(episode)] == {
+        "size": 300,
+        "mtime_ns": episode.stat().st_mtime_ns,
+    }
+    assert str(pack / "Show.S01E01.mkv.LWI") not in fingerprints
+
+
+def test_a_torrent_laid_out_from_the_manifest_matches_torf(tmp_path: Path) -> None:
+    pack = _pack(tmp_path)
+    torrent = Torrent(
+        path=pack, private=True, piece_size=1 << 14, exclude_globs=INDEX_SIDECAR_GLOBS
+    )
+    torrent.generate()
+
+    generated = generate_torrent(
+        path=pack,
+        piece_exponent=14,
+        cb=lambda *_args: None,
+        manifest=scan_content(pack),
+    )
+
+    assert generated.infohash == torrent.infohash
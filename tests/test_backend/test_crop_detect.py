@@ -0,0 +1,84 @@
+from pathlib import Path
+import subprocess
+import threading
+from typing import Any
+
+import pytest
+
+from src.packages import crop_detect
+from src.packages.crop_detect import CROPDETECT_SKIPPED_FRAMES, CropDetect
+
+
+def test_segmented_detection_seeks_each_segment_in_parallel(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    commands: list[tuple[Any, ...]] = []
+    # every segment must be in flight at once for the barrier to release
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_run(command: tuple[Any, ...], **_kwargs: Any):
+        commands.append(command)
+        barrier.wait()
+        return subprocess.CompletedProcess(
+            command, 0, stderr="[Parsed_cropdetect_0] crop=1920:800:0:140\n"
+        )
+
+    monkeypatch.setattr(crop_detect.subprocess, "run", fake_run)
+
+    detector = CropDetect(
+        Path("ffmpeg"), Path("Source.mkv"), 3, 4, duration=400.0, max_workers=3
+    )
+
+    assert detector.get_result() == "crop=1920:800:0:140"
+    seeks = sorted(float(command[command.index("-ss") + 1]) for command in commands)
+    assert seeks == [100.0, 200.0, 300.0]
+    for command in commands:
+        # input seeking puts -ss ahead of -i and decodes only a few frames
+        assert command.index("-ss") < command.index("-i")
+        frames = command[command.index("-frames:v") + 1]
+        assert frames == str(4 + CROPDETECT_SKIPPED_FRAMES)
+        assert "select" not in " ".join(str(part) for part in command)
+
+
+def test_segment_results_feed_the_largest_common_crop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    crops = iter(
+        [
+            "crop=1920:800:0:140\ncrop=1920:800:0:140\n",
+            "crop=1920:1080:0:0\n",
+            "crop=1920:800:0:140\n",
+        ]
+    )
+    lock = threading.Lock()
+
+    def fake_run(command: tuple[Any, ...], **_kwargs: Any):
+        with lock:
+            return subprocess.CompletedProcess(command, 0, stderr=next(crops))
+
+    monkeypatch.setattr(crop_detect.subprocess, "run", fake_run)
+
+    detector = CropDetect(
+        Path("ffmpeg"), Path("Source.mkv"), 3, 4, duration=400.0, max_workers=1
+    )
+
+    # a single full frame segment keeps the image from being over cropped
+    assert detector.get_result() == "crop=1920:1080:0:0"
+
+
+def test_unknown_duration_falls_back_to_select_scan(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    commands: list[tuple[Any, ...]] = []
+
+    def fake_run(command: tuple[Any, ...], **_kwargs: Any):
+        commands.append(command)
+        return subprocess.CompletedProcess(command, 0, stderr="crop=1920:800:0:140\n")
+
+    monkeypatch.setattr(crop_detect.subprocess, "run", fake_run)
+
+    detector = CropDetect(Path("ffmpeg"), Path("Source.mkv"), 3, 4)
+
+    assert detector.get_result() == "crop=1920:800:0:140"
+    assert len(commands) == 1
+    assert "-ss" not in commands[0]
@@ -0,0 +1,171 @@
+import json
+import os
+from pathlib import Path
+import shutil
+
+import pytest
+
+from src.backend.utils.crop_detect_cache import CropDetectCache
+from src.backend.utils.working_dir import cache_dir
+from src.packages.crop_detect import SCAN_METHOD, SEGMENTED_METHOD
+
+
+def _source(tmp_path: Path, name: str = "Source.mkv") -> Path:
+    source = tmp_path / "media" / name
+    source.parent.mkdir(parents=True, exist_ok=True)
+    source.write_bytes(b"source")
+    return source
+
+
+def test_detection_runs_once_per_unchanged_source(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    cache = CropDetectCache(tmp_path / "work")
+    calls = 0
+
+    def detect() -> str:
+        nonlocal calls
+        calls += 1
+        return "crop=1920:800:0:140"
+
+    first = cache.get_or_detect(source, 15, 4, detect, method=SEGMENTED_METHOD)
+    # a fresh instance reads the persisted result
+    second = CropDetectCache(tmp_path / "work").get_or_detect(
+        source, 15, 4, detect, method=SEGMENTED_METHOD
+    )
+
+    assert first == second == "crop=1920:800:0:140"
+    assert calls == 1
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_changed_source_is_detected_again(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    cache = CropDetectCache(tmp_path / "work")
+    cache.store(source, 15, 4, "crop=1920:800:0:140", method=SEGMENTED_METHOD)
+
+    source.write_bytes(b"replaced source")
+
+    assert cache.lookup(source, 15, 4, method=SEGMENTED_METHOD) is None
+    assert cache.stats() == {"hits": 0, "misses": 1}
+
+
+def test_detection_parameters_are_part_of_the_key(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    cache = CropDetectCache(tmp_path / "work")
+    cache.store(source, 15, 4, "crop=1920:800:0:140", method=SEGMENTED_METHOD)
+
+    assert cache.lookup(source, 30, 4, method=SEGMENTED_METHOD) is None
+    assert cache.lookup(source, 15, 4, method=SEGMENTED_METHOD) == "crop=1920:800:0:140"
+
+
+def test_failed_detection_is_not_cached(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    cache = CropDetectCache(tmp_path / "work")
+
+    assert (
+        cache.get_or_detect(source, 15, 4, lambda: None, method=SEGMENTED_METHOD)
+        is None
+    )
+    assert cache.lookup(source, 15, 4, method=SEGMENTED_METHOD) is None
+
+
+def test_least_recently_used_entries_are_evicted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(CropDetectCache, "MAX_ENTRIES", 2)
+    sources = [_source(tmp_path, f"Source{index}.mkv") for index in range(3)]
+    cache = CropDetectCache(tmp_path / "work")
+    cache.store(sources[0], 15, 4, "crop=0", method=SEGMENTED_METHOD)
+    cache.store(sources[1], 15, 4, "crop=1", method=SEGMENTED_METHOD)
+    # touching the oldest entry makes the second the least recently used
+    assert cache.lookup(sources[0], 15, 4, method=SEGMENTED_METHOD) == "crop=0"
+
+    cache.store(sources[2], 15, 4, "crop=2", method=SEGMENTED_METHOD)
+
+    assert cache.lookup(sources[1], 15, 4, method=SEGMENTED_METHOD) is None
+    assert cache.lookup(sources[0], 15, 4, method=SEGMENTED_METHOD) == "crop=0"
+    assert cache.lookup(sources[2], 15, 4, method=SEGMENTED_METHOD) == "crop=2"
+
+
+def test_unreadable_cache_is_treated_as_empty(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    cache = CropDetectCache(tmp_path / "work")
+    cache.cache_file.parent.mkdir(parents=True)
+    cache.cache_file.write_text("{not json", encoding="utf-8")
+
+    assert cache.lookup(source, 15, 4, method=SEGMENTED_METHOD) is None
+    cache.store(source, 15, 4, "crop=1920:800:0:140", method=SEGMENTED_METHOD)
+    assert cache.lookup(source, 15, 4, method=SEGMENTED_METHOD) == "crop=1920:800:0:140"
+
+
+def test_clear_removes_entries_and_counters(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    cache = CropDetectCache(tmp_path / "work")
+    cache.store(source, 15, 4, "crop=1920:800:0:140", method=SEGMENTED_METHOD)
+    cache.lookup(source, 15, 4, method=SEGMENTED_METHOD)
+
+    cache.clear()
+
+    assert not os.path.exists(cache.cache_file)
+    assert cache.stats() == {"hits": 0, "misses": 0}
+
+
+def test_a_crop_found_by_another_method_is_not_reused(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    cache = CropDetectCache(tmp_path / "work")
+    cache.store(source, 15, 4, "crop=1920:800:0:140", method=SCAN_METHOD)
+
+    assert cache.lookup(source, 15, 4, method=SEGMENTED_METHOD) is None
+
+
+def test_the_cache_lives_in_the_working_directory_cache_folder(
+    tmp_path: Path,
+) -> None:
+    cache = CropDetectCache(tmp_path / "work")
+
+    assert cache.cache_file.parent == cache_dir(tmp_path / "work")
+
+
+def test_a_hit_does_not_rewrite_the_cache_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = _source(tmp_path)
+    cache = CropDetectCache(tmp_path / "work")
+    cache.store(source, 15, 4, "crop=1920:800:0:140", method=SEGMENTED_METHOD)
+    writes: list[object] = []
+    monkeypatch.setattr(
+        CropDetectCache, "_write", lambda _self, doc: writes.append(doc)
+    )
+
+    for _ in range(3):
+        assert (
+            cache.lookup(source, 15, 4, method=SEGMENTED_METHOD)
+            == "crop=1920:800:0:140"
+        )
+
+    assert writes == []
+    assert cache.stats() == {"hits": 3, "misses": 0}
+
+
+def test_counters_are_written_with_the_next_store(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    other = _source(tmp_path, "Other.mkv")
+    cache = CropDetectCache(tmp_path / "work")
+    cache.store(source, 15, 4, "crop=1920:800:0:140", method=SEGMENTED_METHOD)
+    cache.lookup(source, 15, 4, method=SEGMENTED_METHOD)
+    cache.lookup(other, 15, 4, method=SEGMENTED_METHOD)
+
+    cache.store(other, 15, 4, "crop=1920:1040:0:20", method=SEGMENTED_METHOD)
+
+    persisted = json.loads(cache.cache_file.read_text(encoding="utf-8"))
+    assert persisted["stats"] == {"hits": 1, "misses": 1}
+
+
+def test_a_cache_file_removed_by_clean_up_drops_its_entries(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    cache = CropDetectCache(tmp_path / "work")
+    cache.store(source, 15, 4, "crop=1920:800:0:140", method=SEGMENTED_METHOD)
+
+    shutil.rmtree(cache_dir(tmp_path / "work"))
+
+    assert cache.lookup(source, 15, 4, method=SEGMENTED_METHOD) is None
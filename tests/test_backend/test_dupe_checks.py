@@ -0,0 +1,230 @@
+import asyncio
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from src.backend.process import ProcessBackEnd
+from src.config.config import ConfigManager
+from src.config.paths import ConfigPaths
+from src.enums.tracker_selection import TrackerSelection
+from src.payloads.media_inputs import MediaInputPayload
+from src.payloads.media_search import MediaSearchPayload
+from src.payloads.tracker_search_result import TrackerSearchResult
+from tests.repo_paths import DEFAULT_CONFIG_DIR
+
+
+def _paths(tmp_path: Path) -> ConfigPaths:
+    defaults = tmp_path / "defaults"
+    defaults.mkdir()
+    default_config = defaults / "default_config.toml"
+    default_program = defaults / "default_program_conf.toml"
+    default_config.write_text(
+        (DEFAULT_CONFIG_DIR / "default_config.toml").read_text(encoding="utf-8"),
+        encoding="utf-8",
+    )
+    default_program.write_text(
+        (DEFAULT_CONFIG_DIR / "default_program_conf.toml").read_text(encoding="utf-8"),
+        encoding="utf-8",
+    )
+    return ConfigPaths(
+        default_config=default_config,
+        default_program=default_program,
+        program=tmp_path / "program/conf.toml",
+        user_configs=tmp_path / "user",
+        tracker_cookies=tmp_path / "cookies",
+    )
+
+
+@pytest.fixture
+def process_backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ProcessBackEnd:
+    monkeypatch.setattr(
+        "src.config.config.FindDependencies.update_dependencies",
+        lambda self, dependencies: None,
+    )
+    monkeypatch.setattr(
+        "src.backend.process.ensure_tracker_health", lambda **_kwargs: None
+    )
+    config = ConfigManager("test", _paths(tmp_path))
+    config.settings.trackers.aither.api_key = "aither-key"
+    config.settings.trackers.blutopia.api_key = "blu-key"
+    return ProcessBackEnd(config)
+
+
+def _fake_search(search: Any) -> type:
+    class FakeSearch:
+        def __init__(self, **_kwargs: Any) -> None:
+            pass
+
+        def search(self, file_name: str) -> list[TrackerSearchResult]:
+            return search(file_name)
+
+    return FakeSearch
+
+
+def _run_dupe_checks(backend: ProcessBackEnd) -> dict:
+    media_input = MediaInputPayload(
+        input_path=Path("Movie.2020.1080p.BluRay.x264-GRP.mkv"),
+        file_list=[Path("Movie.2020.1080p.BluRay.x264-GRP.mkv")],
+    )
+    return asyncio.run(
+        backend.dupe_checks(
+            [TrackerSelection.AITHER, TrackerSelection.BLUTOPIA],
+            media_input,
+            MediaSearchPayload(),
+        )
+    )
+
+
+def test_tracker_searches_run_concurrently(
+    process_backend: ProcessBackEnd, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # each search only returns once both are running at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def search(_file_name: str) -> list[TrackerSearchResult]:
+        barrier.wait()
+        return []
+
+    monkeypatch.setattr("src.backend.process.AitherSearch", _fake_search(search))
+    monkeypatch.setattr("src.backend.process.BlutopiaSearch", _fake_search(search))
+
+    dupes = _run_dupe_checks(process_backend)
+
+    assert dupes == {
+        TrackerSelection.AITHER: (TrackerSelection.AITHER, True, []),
+        TrackerSelection.BLUTOPIA: (TrackerSelection.BLUTOPIA, True, []),
+    }
+    assert set(process_backend.dupe_check_timings) == {
+        TrackerSelection.AITHER,
+        TrackerSelection.BLUTOPIA,
+    }
+
+
+def test_every_tracker_search_starts_without_waiting_for_a_worker(
+    process_backend: ProcessBackEnd, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # a search queued behind the others would spend its timeout waiting and
+    # report the wait as its own time
+    trackers = {
+        TrackerSelection.REELFLIX: ("reelflix", "ReelFlixSearch"),
+        TrackerSelection.AITHER: ("aither", "AitherSearch"),
+        TrackerSelection.HUNO: ("huno", "HunoSearch"),
+        TrackerSelection.LST: ("lst", "LSTSearch"),
+        TrackerSelection.DARK_PEERS: ("dark_peers", "DarkPeersSearch"),
+        TrackerSelection.SHARE_ISLAND: ("share_island", "ShareIslandSearch"),
+        TrackerSelection.UPLOAD_CX: ("upload_cx", "UploadCXSearch"),
+        TrackerSelection.ONLY_ENCODES: ("only_encodes", "OnlyEncodesSearch"),
+        TrackerSelection.BLUTOPIA: ("blutopia", "BlutopiaSearch"),
+        TrackerSelection.SEEDPOOL: ("seedpool", "SeedPoolSearch"),
+        TrackerSelection.UTOPIA: ("utp", "UTPSearch"),
+        TrackerSelection.YU_SCENE: ("yuscene", "YuSceneSearch"),
+    }
+    barrier = threading.Barrier(len(trackers), timeout=5)
+
+    def search(_file_name: str) -> list[TrackerSearchResult]:
+        barrier.wait()
+        return []
+
+    for settings_name, search_cls in trackers.values():
+        getattr(process_backend.config.settings.trackers, settings_name).api_key = "key"
+        monkeypatch.setattr(f"src.backend.process.{search_cls}", _fake_search(search))
+    media_input = MediaInputPayload(
+        input_path=Path("Movie.2020.1080p.BluRay.x264-GRP.mkv"),
+        file_list=[Path("Movie.2020.1080p.BluRay.x264-GRP.mkv")],
+    )
+
+    dupes = asyncio.run(
+        process_backend.dupe_checks(list(trackers), media_input, MediaSearchPayload())
+    )
+
+    assert dupes == {tracker: (tracker, True, []) for tracker in trackers}
+
+
+def test_a_slow_tracker_times_out_without_holding_back_the_others(
+    process_backend: ProcessBackEnd, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    release = threading.Event()
+
+    def slow_search(_file_name: str) -> list[TrackerSearchResult]:
+        release.wait(5)
+        return []
+
+    monkeypatch.setattr("src.backend.process.AitherSearch", _fake_search(slow_search))
+    monkeypatch.setattr(
+        "src.backend.process.BlutopiaSearch", _fake_search(lambda _file_name: [])
+    )
+    monkeypatch.setattr("src.backend.process.DUPE_CHECK_TIMEOUT_MULTIPLIER", 0.1)
+    process_backend.config.settings.general.timeout = 1
+
+    start = time.perf_counter()
+    try:
+        dupes = _run_dupe_checks(process_backend)
+    finally:
+        release.set()
+
+    assert time.perf_counter() - start < 2
+    _, success, error = dupes[TrackerSelection.AITHER]
+    assert not success
+    assert "timed out" in str(error)
+    assert dupes[TrackerSelection.BLUTOPIA] == (TrackerSelection.BLUTOPIA, True, [])
+    assert process_backend.dupe_check_timings[TrackerSelection.AITHER] >= 0.1
+
+
+def test_tracker_health_is_probed_alongside_the_searches(
+    process_backend: ProcessBackEnd, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # the probe only answers once a search is running
+    searching = threading.Event()
+
+    def search(_file_name: str) -> list[TrackerSearchResult]:
+        searching.set()
+        return []
+
+    def probe(
+        *,
+        tracker: TrackerSelection,
+        cache: dict[TrackerSelection, bool],
+        **_kwargs: Any,
+    ) -> None:
+        assert searching.wait(5)
+        cache[tracker] = tracker is not TrackerSelection.BLUTOPIA
+
+    monkeypatch.setattr("src.backend.process.AitherSearch", _fake_search(search))
+    monkeypatch.setattr("src.backend.process.BlutopiaSearch", _fake_search(search))
+    monkeypatch.setattr("src.backend.process.ensure_tracker_health", probe)
+
+    _run_dupe_checks(process_backend)
+
+    assert process_backend.tracker_health == {
+        TrackerSelection.AITHER: True,
+        TrackerSelection.BLUTOPIA: False,
+    }
+    assert set(process_backend.tracker_health_timings) == {
+        TrackerSelection.AITHER,
+        TrackerSelection.BLUTOPIA,
+    }
+
+
+def test_unit3d_searches_are_bounded_by_the_general_timeout(
+    process_backend: ProcessBackEnd, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # a timed out search keeps its thread, so its request has to end on its own
+    timeouts: list[int] = []
+
+    class TimeoutSearch:
+        def __init__(self, *, timeout: int, **_kwargs: Any) -> None:
+            timeouts.append(timeout)
+
+        def search(self, file_name: str) -> list[TrackerSearchResult]:
+            return []
+
+    monkeypatch.setattr("src.backend.process.AitherSearch", TimeoutSearch)
+    monkeypatch.setattr("src.backend.process.BlutopiaSearch", TimeoutSearch)
+    process_backend.config.settings.general.timeout = 7
+
+    _run_dupe_checks(process_backend)
+
+    assert timeouts == [7, 7]
@@ -32,6 +32,7 @@ def _backend(
             plugin_manager=manager,
         ),
     )
+    backend._prefetch_tracker_health = lambda *_args: {}  # type: ignore[method-assign]
     return backend
 
 
@@ -1,4 +1,38 @@
-from src.backend.utils.guessit_helpers import get_guessit_title
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+import src.backend.utils.guessit_helpers as guessit_helpers_module
+from src.backend.utils.guessit_helpers import (
+    clear_guessit_cache,
+    get_guessit_title,
+    parse_guessit,
+    parse_guessit_batch,
+    shutdown_guessit_pool,
+)
+
+_EPISODE = "Show.Name.S01E{:02d}.1080p.WEB-DL.DDP5.1.H.264-GROUP.mkv"
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache() -> Iterator[None]:
+    clear_guessit_cache()
+    yield
+    clear_guessit_cache()
+
+
+@pytest.fixture
+def parsed_names(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Every name GuessIt itself is asked to parse."""
+    parsed: list[str] = []
+
+    def fake_guessit(name: str, options: dict[str, Any]) -> dict[str, Any]:
+        parsed.append(name)
+        return {"title": name, "other": ["Rip"], "options": options}
+
+    monkeypatch.setattr(guessit_helpers_module, "guessit", fake_guessit)
+    return parsed
 
 
 def test_get_guessit_title_keeps_scalar_title() -> None:
@@ -26,3 +60,85 @@ def test_get_guessit_title_uses_fallback_without_title_values() -> None:
 
 def test_get_guessit_title_never_stringifies_a_list() -> None:
     assert get_guessit_title({"title": ["One", "Two"]}) != "['One', 'Two']"
+
+
+def test_a_name_is_parsed_once_per_set_of_options(parsed_names: list[str]) -> None:
+    first = parse_guessit("Movie.2019.mkv", {"excludes": ["language"]})
+    again = parse_guessit("Movie.2019.mkv", {"excludes": ["language"]})
+    episode = parse_guessit("Movie.2019.mkv", {"type": "episode"})
+
+    assert first is again
+    assert first["options"] == {"excludes": ("language",)}
+    assert episode["options"] == {"type": "episode"}
+    assert parsed_names == ["Movie.2019.mkv", "Movie.2019.mkv"]
+
+
+def test_shared_results_cannot_be_changed(parsed_names: list[str]) -> None:
+    result = parse_guessit("Movie.2019.mkv")
+
+    with pytest.raises(TypeError):
+        result["title"] = "Other"  # type: ignore[index]
+    assert result["other"] == ("Rip",)
+
+
+def test_the_least_recently_used_parses_are_dropped(
+    parsed_names: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(guessit_helpers_module, "MAX_CACHED_PARSES", 2)
+    for name in ("a.mkv", "b.mkv", "a.mkv", "c.mkv", "a.mkv", "b.mkv"):
+        parse_guessit(name)
+
+    assert parsed_names == ["a.mkv", "b.mkv", "c.mkv", "b.mkv"]
+
+
+def test_a_batch_parses_each_new_name_once_and_keeps_order(
+    parsed_names: list[str],
+) -> None:
+    parse_guessit("b.mkv")
+
+    results = parse_guessit_batch(["a.mkv", "b.mkv", "a.mkv"])
+
+    assert [result["title"] for result in results] == ["a.mkv", "b.mkv", "a.mkv"]
+    assert parsed_names == ["b.mkv", "a.mkv"]
+
+
+def test_a_name_that_cannot_be_parsed_does_not_fail_the_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_guessit(name: str, _options: dict[str, Any]) -> dict[str, Any]:
+        if name == "bad.mkv":
+            raise ValueError("unparseable")
+        return {"title": name}
+
+    monkeypatch.setattr(guessit_helpers_module, "guessit", fake_guessit)
+
+    assert parse_guessit_batch(["bad.mkv", "good.mkv"]) == [{}, {"title": "good.mkv"}]
+
+
+def test_a_large_batch_parsed_in_worker_processes_matches_guessit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(guessit_helpers_module, "BATCH_POOL_MIN", 4)
+    names = [_EPISODE.format(episode) for episode in range(1, 9)]
+
+    pooled = parse_guessit_batch(names, {"type": "episode"})
+    clear_guessit_cache()
+    local = [parse_guessit(name, {"type": "episode"}) for name in names]
+
+    assert pooled == local
+    assert [result["episode"] for result in pooled] == list(range(1, 9))
+
+
+def test_large_batches_share_one_worker_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(guessit_helpers_module, "BATCH_POOL_MIN", 4)
+    try:
+        parse_guessit_batch([_EPISODE.format(episode) for episode in range(1, 5)])
+        pool = guessit_helpers_module._POOL
+        parse_guessit_batch([_EPISODE.format(episode) for episode in range(5, 9)])
+
+        assert pool is not None
+        assert guessit_helpers_module._POOL is pool
+    finally:
+        shutdown_guessit_pool()
+
+    assert guessit_helpers_module._POOL is None
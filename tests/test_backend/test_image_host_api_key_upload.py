@@ -1,4 +1,4 @@
-"""Coverage for the shared base64+API-key image-host upload flow
+"""Coverage for the shared API-key image-host upload flow
 (src/backend/image_host_uploading/api_key_upload.py) and the three
 uploaders built on it: ImgBB (refactored to use it), OnlyImage, and
 Lensdump. No image host's upload logic was unit tested before this file --
@@ -10,13 +10,16 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import aiohttp
 import pytest
 
+from src.backend.image_host_uploading import api_key_upload
 from src.backend.image_host_uploading.api_key_upload import (
     _post_image,
     api_key_image_upload,
 )
 from src.backend.image_host_uploading.base_image_host import ImageUploadRequest
+from src.backend.image_host_uploading.host_limiter import AdaptiveHostLimiter
 from src.backend.image_host_uploading.imgbb import ImageBBUploader
 from src.backend.image_host_uploading.lensdump import LensdumpUploader
 from src.backend.image_host_uploading.onlyimage import OnlyImageUploader
@@ -25,9 +28,15 @@ from src.packages.custom_types import ImageUploadData
 
 
 class _MockResponse:
-    def __init__(self, status: int, json_data: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        status: int,
+        json_data: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> None:
         self.status = status
         self.reason = "OK"
+        self.headers = headers or {}
         self._json_data = json_data
 
     async def json(self) -> dict[str, Any]:
@@ -52,7 +61,13 @@ def _patched_post(response: _MockResponse) -> MagicMock:
     return MagicMock(return_value=response)
 
 
-def test_body_auth_mode_sends_key_in_form_data_not_headers() -> None:
+def _form_field_names(form_data: aiohttp.FormData) -> set[str]:
+    return {field[0]["name"] for field in form_data._fields}
+
+
+def test_body_auth_mode_sends_key_in_form_data_not_headers(tmp_path: Path) -> None:
+    image = tmp_path / "shot.png"
+    image.write_bytes(b"fake image data")
     post = _patched_post(_MockResponse(200, _SUCCESS_RESPONSE))
     with patch("aiohttp.ClientSession.post", post):
         asyncio.run(
@@ -60,17 +75,19 @@ def test_body_auth_mode_sends_key_in_form_data_not_headers() -> None:
                 "https://api.imgbb.com/1/upload",
                 "my-key",
                 "body",
-                "base64data",
+                image,
                 "imgbb",
             )
         )
 
     _, kwargs = post.call_args
-    assert kwargs["data"] == {"image": "base64data", "key": "my-key"}
+    assert _form_field_names(kwargs["data"]) == {"image", "key"}
     assert kwargs["headers"] is None
 
 
-def test_header_auth_mode_sends_key_as_header_not_form_data() -> None:
+def test_header_auth_mode_sends_key_as_header_not_form_data(tmp_path: Path) -> None:
+    image = tmp_path / "shot.png"
+    image.write_bytes(b"fake image data")
     post = _patched_post(_MockResponse(200, _SUCCESS_RESPONSE))
     with patch("aiohttp.ClientSession.post", post):
         asyncio.run(
@@ -78,13 +95,13 @@ def test_header_auth_mode_sends_key_as_header_not_form_data() -> None:
                 "https://onlyimage.org/api/1/upload",
                 "my-key",
                 "header",
-                "base64data",
+                image,
                 "OnlyImage",
             )
         )
 
     _, kwargs = post.call_args
-    assert kwargs["data"] == {"image": "base64data"}
+    assert _form_field_names(kwargs["data"]) == {"image"}
     assert kwargs["headers"] == {"X-API-Key": "my-key"}
 
 
@@ -176,4 +193,117 @@ def test_onlyimage_and_lensdump_target_their_own_url_with_header_auth(
         args, kwargs = post.call_args
         assert args[0] == expected_url
         assert kwargs["headers"] == {"X-API-Key": "my-key"}
-        assert "key" not in kwargs["data"]
+        assert _form_field_names(kwargs["data"]) == {"image"}
+
+
+def test_images_are_streamed_from_disk_as_multipart(tmp_path: Path) -> None:
+    image = tmp_path / "shot.png"
+    image.write_bytes(b"fake image data")
+    post = _patched_post(_MockResponse(200, _SUCCESS_RESPONSE))
+
+    with patch("aiohttp.ClientSession.post", post):
+        asyncio.run(
+            api_key_image_upload(
+                url="https://api.imgbb.com/1/upload",
+                api_key="my-key",
+                auth_mode="body",
+                host_name="imgbb",
+                filepaths=[image],
+            )
+        )
+
+    _, kwargs = post.call_args
+    form_data = kwargs["data"]
+    assert isinstance(form_data, aiohttp.FormData)
+    assert _form_field_names(form_data) == {"image", "key"}
+    image_field = next(
+        field for field in form_data._fields if field[0]["name"] == "image"
+    )
+    # the file object itself is handed to aiohttp, not its encoded contents
+    assert image_field[0]["filename"] == "shot.png"
+    assert not isinstance(image_field[2], str | bytes)
+
+
+def test_the_image_is_opened_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    image = tmp_path / "shot.png"
+    image.write_bytes(b"fake image data")
+    post = _patched_post(_MockResponse(200, _SUCCESS_RESPONSE))
+    offloaded: list[object] = []
+    to_thread = asyncio.to_thread
+
+    async def recording_to_thread(func: Any, *args: Any) -> Any:
+        offloaded.append(func)
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr(api_key_upload.asyncio, "to_thread", recording_to_thread)
+
+    with patch("aiohttp.ClientSession.post", post):
+        asyncio.run(
+            _post_image(
+                "https://api.imgbb.com/1/upload", "my-key", "body", image, "imgbb"
+            )
+        )
+
+    assert offloaded == [open]
+
+
+def test_a_retried_upload_reopens_the_streamed_file(tmp_path: Path) -> None:
+    image = tmp_path / "shot.png"
+    image.write_bytes(b"fake image data")
+    post = MagicMock(
+        side_effect=[
+            _MockResponse(503, {}),
+            _MockResponse(200, _SUCCESS_RESPONSE),
+        ]
+    )
+
+    with (
+        patch("aiohttp.ClientSession.post", post),
+        patch("asyncio.sleep", return_value=None),
+    ):
+        response = asyncio.run(
+            _post_image(
+                "https://api.imgbb.com/1/upload", "my-key", "body", image, "imgbb"
+            )
+        )
+
+    assert response == _SUCCESS_RESPONSE
+    first, second = (call.kwargs["data"] for call in post.call_args_list)
+    assert first is not second
+
+
+def test_retry_after_is_honoured_instead_of_exponential_backoff(
+    tmp_path: Path,
+) -> None:
+    image = tmp_path / "shot.png"
+    image.write_bytes(b"fake image data")
+    post = MagicMock(
+        side_effect=[
+            _MockResponse(429, {}, {"Retry-After": "0.05"}),
+            _MockResponse(200, _SUCCESS_RESPONSE),
+        ]
+    )
+    limiter = AdaptiveHostLimiter(initial=4)
+
+    async def run() -> tuple[dict[str, Any], float]:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        response = await _post_image(
+            "https://api.imgbb.com/1/upload",
+            "my-key",
+            "body",
+            image,
+            "imgbb",
+            limiter=limiter,
+        )
+        return response, loop.time() - started
+
+    with patch("aiohttp.ClientSession.post", post):
+        response, elapsed = asyncio.run(run())
+
+    assert response == _SUCCESS_RESPONSE
+    # waited out the host's Retry-After rather than the 1s default backoff
+    assert 0.05 <= elapsed < 1
+    assert limiter.limit == 2
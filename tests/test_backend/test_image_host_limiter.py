@@ -0,0 +1,86 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from src.backend.image_host_uploading.host_limiter import (
+    MAX_RETRY_AFTER,
+    AdaptiveHostLimiter,
+    parse_retry_after,
+)
+
+
+def test_concurrency_is_capped_at_the_limit_and_grows_with_successes() -> None:
+    limiter = AdaptiveHostLimiter(initial=2, maximum=4)
+    in_flight = 0
+    peak = 0
+
+    async def upload() -> None:
+        nonlocal in_flight, peak
+        async with limiter.slot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            limiter.success()
+
+    async def run() -> None:
+        await asyncio.gather(*(upload() for _ in range(2)))
+        assert peak == 2
+        await asyncio.gather(*(upload() for _ in range(20)))
+
+    asyncio.run(run())
+
+    assert limiter.limit == 4
+    assert peak == 4
+
+
+def test_push_back_halves_the_limit_down_to_the_minimum() -> None:
+    limiter = AdaptiveHostLimiter(initial=8, minimum=1)
+
+    async def run() -> None:
+        for expected in (4, 2, 1, 1):
+            limiter.throttled()
+            assert limiter.limit == expected
+
+    asyncio.run(run())
+
+
+def test_retry_after_pauses_every_upload_to_the_host() -> None:
+    limiter = AdaptiveHostLimiter(initial=4)
+
+    async def run() -> float:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert limiter.throttled("0.1") == pytest.approx(0.1)
+        async with limiter.slot():
+            return loop.time() - started
+
+    assert asyncio.run(run()) >= 0.1
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("not a date", None),
+        ("3", 3.0),
+        ("-5", 0.0),
+        ("99999", MAX_RETRY_AFTER),
+    ],
+)
+def test_retry_after_seconds_are_parsed_and_clamped(
+    header: str | None, expected: float | None
+) -> None:
+    assert parse_retry_after(header) == expected
+
+
+def test_retry_after_accepts_an_http_date() -> None:
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+    assert delay is not None
+    assert 28 <= delay <= 30
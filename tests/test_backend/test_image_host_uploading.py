@@ -1,6 +1,20 @@
+import asyncio
+from pathlib import Path
+
+import aiohttp
 import pytest
 
-from src.backend.image_host_uploading.img_uploader import assert_all_images_uploaded
+from src.backend.image_host_uploading.base_image_host import (
+    BaseImageHostUploader,
+    ImageUploadRequest,
+)
+from src.backend.image_host_uploading.img_uploader import (
+    ImageUploader,
+    assert_all_images_uploaded,
+)
+from src.backend.image_host_uploading.session_registry import (
+    ImageHostSessionRegistry,
+)
 from src.exceptions import ImageUploadError
 from src.packages.custom_types import ImageUploadData
 
@@ -31,3 +45,47 @@ def test_a_complete_batch_raises_nothing() -> None:
 def test_an_empty_batch_raises_nothing() -> None:
     # No images requested is not a failure; only a requested-but-missing URL is.
     assert_all_images_uploaded("Aither", {})
+
+
+class _SessionRecordingUploader(BaseImageHostUploader):
+    def __init__(self) -> None:
+        self.sessions: list[aiohttp.ClientSession | None] = []
+
+    async def upload(self, request: ImageUploadRequest) -> dict[int, ImageUploadData]:
+        self.sessions.append(request.session)
+        return {0: ImageUploadData("http://a", "http://a_m")}
+
+
+def test_jobs_share_one_session_per_host_closed_after_the_run() -> None:
+    first_host = _SessionRecordingUploader()
+    second_host = _SessionRecordingUploader()
+    request = ImageUploadRequest(filepaths=[Path("01.png")])
+
+    async def run() -> None:
+        uploader = ImageUploader()
+        uploader.register_uploader("first", first_host)
+        uploader.register_uploader("second", second_host)
+        uploader.add_job("first", request)
+        uploader.add_job("first", request)
+        uploader.add_job("second", request)
+        await uploader.start_jobs()
+
+    asyncio.run(run())
+
+    assert len(first_host.sessions) == 2
+    first_session, repeat_session = first_host.sessions
+    (second_session,) = second_host.sessions
+    assert first_session is not None and second_session is not None
+    assert first_session is repeat_session
+    assert first_session is not second_session
+    assert first_session.closed and second_session.closed
+
+
+def test_a_hosts_limiter_never_grows_past_its_connection_limit() -> None:
+    uploader = ImageUploader(sessions=ImageHostSessionRegistry(connection_limit=3))
+    limiter = uploader.limiter("host", initial=2)
+
+    for _ in range(50):
+        limiter.success()
+
+    assert limiter.limit == 3
@@ -0,0 +1,243 @@
+from collections.abc import Iterator
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+from typing import cast
+
+from PIL import Image
+import pytest
+
+from src.backend.process import ProcessBackEnd
+from src.backend.utils import image_optimizer
+from src.backend.utils.image_optimizer import (
+    MultiProcessImageOptimizer,
+    optimize_img_to_png,
+)
+from src.config.config import ConfigManager
+from src.enums.image_host import ImageHost
+from src.enums.png_optimization import PngOptimization
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_pools() -> Iterator[None]:
+    yield
+    MultiProcessImageOptimizer.shutdown_pools()
+
+
+def _images(tmp_path: Path, count: int) -> list[Path]:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    images = []
+    for index in range(count):
+        image = source_dir / f"{index:02d}.jpg"
+        Image.new("RGB", (32, 32), (index * 20, 0, 0)).save(image, "JPEG")
+        images.append(image)
+    return images
+
+
+def test_jobs_stream_through_pool_and_report_each_completion(tmp_path: Path) -> None:
+    images = _images(tmp_path, 7)
+    progress: list[tuple[int, int]] = []
+    finished: list[bool] = []
+
+    optimizer = MultiProcessImageOptimizer(
+        max_workers=2,
+        batch_size=1,
+        on_job_done=lambda _path, done, total: progress.append((done, total)),
+        on_all_jobs_done=lambda: finished.append(True),
+    )
+    output = optimizer.process_jobs(images, tmp_path / "optimized")
+
+    assert sorted(path.name for path in output) == [
+        f"{index:02d}.png" for index in range(7)
+    ]
+    assert progress == [(done, 7) for done in range(1, 8)]
+    assert finished == [True]
+
+
+def test_pool_is_reused_across_runs(tmp_path: Path) -> None:
+    images = _images(tmp_path, 2)
+    optimizer = MultiProcessImageOptimizer(max_workers=2)
+
+    optimizer.process_jobs(images, tmp_path / "first")
+    pool = MultiProcessImageOptimizer._pools[2]
+    MultiProcessImageOptimizer(max_workers=2).process_jobs(images, tmp_path / "second")
+
+    assert MultiProcessImageOptimizer._pools[2] is pool
+
+
+def test_failed_job_is_raised_to_the_caller(tmp_path: Path) -> None:
+    broken = tmp_path / "broken.jpg"
+    broken.write_bytes(b"not an image")
+
+    with pytest.raises(OSError):
+        MultiProcessImageOptimizer(max_workers=1).process_jobs(
+            [broken], tmp_path / "optimized"
+        )
+
+
+def _noisy_image(tmp_path: Path) -> Path:
+    image = tmp_path / "noisy.bmp"
+    gradient = Image.linear_gradient("L").resize((256, 256))
+    noise = Image.effect_noise((256, 256), 8)
+    Image.merge("RGB", (gradient, noise, gradient.rotate(90))).save(image, "BMP")
+    return image
+
+
+def test_heavier_tiers_produce_smaller_images(tmp_path: Path) -> None:
+    image = _noisy_image(tmp_path)
+    sizes = {}
+    for tier in PngOptimization:
+        output_dir = tmp_path / str(tier)
+        output_dir.mkdir()
+        result = optimize_img_to_png(image, output_dir, tier)
+        assert result.path.stat().st_size == result.optimized_bytes
+        assert result.original_bytes == image.stat().st_size
+        assert result.bytes_saved == result.original_bytes - result.optimized_bytes
+        sizes[tier] = result.optimized_bytes
+
+    assert (
+        sizes[PngOptimization.FAST]
+        > sizes[PngOptimization.BALANCED]
+        > sizes[PngOptimization.MAX]
+    )
+
+
+def test_default_tier_matches_pil_optimize_output(tmp_path: Path) -> None:
+    # before the tiers existed every PNG was saved with optimize=True, and
+    # existing configs must keep getting the same images
+    image = _noisy_image(tmp_path)
+    expected = BytesIO()
+    with Image.open(image) as opened:
+        opened.save(expected, "PNG", optimize=True)
+
+    result = optimize_img_to_png(image, tmp_path)
+
+    assert result.path.read_bytes() == expected.getvalue()
+
+
+def test_size_limit_stops_at_the_first_pass_that_fits(tmp_path: Path) -> None:
+    image = _noisy_image(tmp_path)
+    fast_dir = tmp_path / "fast"
+    fast_dir.mkdir()
+    fast = optimize_img_to_png(image, fast_dir, PngOptimization.FAST)
+
+    output_dir = tmp_path / "limited"
+    output_dir.mkdir()
+    limited = optimize_img_to_png(
+        image, output_dir, PngOptimization.MAX, size_limit=fast.optimized_bytes
+    )
+
+    # the light first pass already fits so the heavier passes never run
+    assert limited.optimized_bytes == fast.optimized_bytes
+
+
+def test_png_under_the_size_limit_is_copied_as_is(tmp_path: Path) -> None:
+    image = tmp_path / "small.png"
+    Image.new("RGB", (16, 16)).save(image, "PNG", compress_level=0)
+    output_dir = tmp_path / "optimized"
+    output_dir.mkdir()
+
+    result = optimize_img_to_png(
+        image, output_dir, PngOptimization.MAX, size_limit=image.stat().st_size
+    )
+
+    assert result.path.read_bytes() == image.read_bytes()
+    assert result.bytes_saved == 0
+
+
+def test_results_are_recorded_per_image(tmp_path: Path) -> None:
+    images = _images(tmp_path, 3)
+    optimizer = MultiProcessImageOptimizer(max_workers=1, tier=PngOptimization.FAST)
+
+    optimizer.process_jobs(images, tmp_path / "optimized")
+
+    assert sorted(result.path.name for result in optimizer.results) == [
+        "00.png",
+        "01.png",
+        "02.png",
+    ]
+    assert all(result.seconds >= 0 for result in optimizer.results)
+
+
+def test_summary_totals_the_last_run(tmp_path: Path) -> None:
+    optimizer = MultiProcessImageOptimizer(max_workers=1, tier=PngOptimization.FAST)
+    assert optimizer.summary() == ""
+
+    optimizer.process_jobs(_images(tmp_path, 2), tmp_path / "optimized")
+
+    summary = optimizer.summary()
+    assert summary.startswith("Optimized 2 image(s) (Fast): ")
+    assert "% saved" in summary
+    assert summary.endswith("s per image")
+
+
+def _backend(limit_mb: float) -> ProcessBackEnd:
+    backend = object.__new__(ProcessBackEnd)
+    backend.config = cast(
+        ConfigManager,
+        SimpleNamespace(
+            settings=SimpleNamespace(
+                screenshots=SimpleNamespace(optimize_size_limit_mb=limit_mb)
+            )
+        ),
+    )
+    return backend
+
+
+def test_size_limit_is_capped_by_the_destination_hosts() -> None:
+    backend = _backend(20)
+
+    assert backend._optimize_size_limit({ImageHost.IMAGE_BB}) == 20 * 1024 * 1024
+    assert (
+        backend._optimize_size_limit({ImageHost.IMAGE_BB, ImageHost.PIXHOST})
+        == 10 * 1024 * 1024
+    )
+    assert backend._optimize_size_limit({ImageHost.CHEVERETO_V4}) == 20 * 1024 * 1024
+
+
+def test_no_size_limit_still_fully_optimizes_for_limited_hosts() -> None:
+    assert _backend(0)._optimize_size_limit({ImageHost.IMAGE_BOX}) == 0
+
+
+def test_shutdown_pools_releases_the_worker_processes(tmp_path: Path) -> None:
+    MultiProcessImageOptimizer(max_workers=2).process_jobs(
+        _images(tmp_path, 2), tmp_path / "optimized"
+    )
+    pool = MultiProcessImageOptimizer._pools[2]
+    workers = list((pool._processes or {}).values())
+    assert workers
+
+    MultiProcessImageOptimizer.shutdown_pools()
+
+    assert MultiProcessImageOptimizer._pools == {}
+    assert not any(worker.is_alive() for worker in workers)
+
+
+def test_the_first_pool_registers_the_exit_shutdown_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    registered: list[object] = []
+    monkeypatch.setattr(image_optimizer.atexit, "register", registered.append)
+    monkeypatch.setattr(MultiProcessImageOptimizer, "_exit_hook_registered", False)
+    images = _images(tmp_path, 1)
+
+    MultiProcessImageOptimizer(max_workers=1).process_jobs(images, tmp_path / "one")
+    MultiProcessImageOptimizer(max_workers=2).process_jobs(images, tmp_path / "two")
+
+    assert registered == [MultiProcessImageOptimizer.shutdown_pools]
+
+
+def test_shutdown_pools_can_return_without_waiting_on_running_jobs() -> None:
+    calls: list[dict[str, bool]] = []
+
+    class _Pool:
+        def shutdown(self, **kwargs: bool) -> None:
+            calls.append(kwargs)
+
+    MultiProcessImageOptimizer._pools[3] = _Pool()  # type: ignore[assignment]
+
+    MultiProcessImageOptimizer.shutdown_pools(wait=False)
+
+    assert calls == [{"wait": False, "cancel_futures": True}]
+    assert MultiProcessImageOptimizer._pools == {}
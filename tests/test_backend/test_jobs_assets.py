@@ -18,11 +18,11 @@ from src.backend.jobs.assets import (
     capture_mediainfo,
     copy_base_torrent,
     copy_images,
-    fingerprint_files,
     fingerprints_match,
     read_job_asset,
     torrent_content_files,
 )
+from src.backend.torrents.manifest import scan_content
 from src.backend.utils.media_info_utils import (
     MinimalMediaInfo,
     cache_full_mi_str,
@@ -310,6 +310,18 @@ def test_torrent_content_files_walks_a_directory(tmp_path: Path) -> None:
     ]
 
 
+def test_torrent_content_files_leaves_out_what_the_torrent_does(
+    tmp_path: Path,
+) -> None:
+    pack = tmp_path / "Pack.S01"
+    pack.mkdir()
+    (pack / "e01.mkv").write_bytes(b"a")
+    (pack / "e01.mkv.lwi").write_bytes(b"index")
+    (pack / ".DS_Store").write_bytes(b"hidden")
+
+    assert torrent_content_files(pack) == [pack / "e01.mkv"]
+
+
 def test_torrent_content_files_of_a_single_file_is_that_file(tmp_path: Path) -> None:
     media = tmp_path / "movie.mkv"
     media.write_bytes(b"a")
@@ -323,7 +335,7 @@ def test_fingerprints_match_an_unchanged_pack(tmp_path: Path) -> None:
     (pack / "e01.mkv").write_bytes(b"a")
     (pack / "e02.mkv").write_bytes(b"bb")
 
-    stored = fingerprint_files(torrent_content_files(pack))
+    stored = scan_content(pack).fingerprints()
 
     assert fingerprints_match(stored, pack) is True
 
@@ -334,7 +346,7 @@ def test_a_changed_second_file_invalidates_the_pack(tmp_path: Path) -> None:
     pack.mkdir()
     (pack / "e01.mkv").write_bytes(b"a")
     (pack / "e02.mkv").write_bytes(b"bb")
-    stored = fingerprint_files(torrent_content_files(pack))
+    stored = scan_content(pack).fingerprints()
 
     (pack / "e02.mkv").write_bytes(b"changed")
 
@@ -345,7 +357,7 @@ def test_an_added_file_invalidates_the_pack(tmp_path: Path) -> None:
     pack = tmp_path / "Pack.S01"
     pack.mkdir()
     (pack / "e01.mkv").write_bytes(b"a")
-    stored = fingerprint_files(torrent_content_files(pack))
+    stored = scan_content(pack).fingerprints()
 
     (pack / "e02.mkv").write_bytes(b"b")
 
@@ -357,7 +369,7 @@ def test_a_removed_file_invalidates_the_pack(tmp_path: Path) -> None:
     pack.mkdir()
     (pack / "e01.mkv").write_bytes(b"a")
     (pack / "e02.mkv").write_bytes(b"b")
-    stored = fingerprint_files(torrent_content_files(pack))
+    stored = scan_content(pack).fingerprints()
 
     (pack / "e02.mkv").unlink()
 
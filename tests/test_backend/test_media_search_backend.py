@@ -6,7 +6,8 @@ import niquests
 import pytest
 
 from src.backend.media_search import MediaSearchBackEnd
-from src.backend.utils.tvdb_client import AsyncTVDBClient, TVDBClient
+import src.backend.utils.tvdb_client as tvdb_module
+from src.backend.utils.tvdb_client import AsyncTVDBClient
 from src.enums.media_search_mode import MediaSearchMode
 from src.enums.media_type import MediaType
 from src.enums.tmdb_genres import TMDBGenreIDsMovies, TMDBGenreIDsSeries
@@ -14,6 +15,9 @@ from src.exceptions import MediaSearchError, MediaSearchUnavailableError
 
 
 class _Response:
+    status_code = 200
+    headers: dict[str, str] = {}
+
     def __init__(self, payload: Any) -> None:
         self.payload = payload
 
@@ -96,7 +100,7 @@ def test_tmdb_connection_failure_is_not_reported_as_empty_results(
 def test_guessit_list_title_uses_first_title(monkeypatch: pytest.MonkeyPatch) -> None:
     backend = MediaSearchBackEnd()
     monkeypatch.setattr(
-        "src.backend.media_search.guessit",
+        "src.backend.media_search.parse_guessit",
         lambda *_args, **_kwargs: {"title": ["Primary", "Alternative"], "year": "2024"},
     )
 
@@ -247,37 +251,47 @@ def test_tvdb_decimal_validation_does_not_convert_superscript_digits() -> None:
     assert result["resolved_ids"]["result"]["tvdb_id"] is None
 
 
-class _FakeTVDBSession:
+class _FakeAsyncTVDBSession:
     def __init__(self) -> None:
         self.post_calls: list[dict[str, Any]] = []
         self.get_calls: list[dict[str, Any]] = []
 
-    def post(self, url: str, **kwargs: Any) -> _Response:
+    async def post(self, url: str, **kwargs: Any) -> _Response:
         self.post_calls.append({"url": url, **kwargs})
         return _Response({"data": {"token": "tvdb-token"}})
 
-    def get(self, url: str, **kwargs: Any) -> _Response:
+    async def get(self, url: str, **kwargs: Any) -> _Response:
         self.get_calls.append({"url": url, **kwargs})
         if url.endswith("/search/remoteid/tt123%26x"):
             return _Response({"data": [{"series": {"id": 321}}]})
         return _Response({"data": {"id": 321, "episodes": []}})
 
-    def close(self) -> None:
+    async def close(self) -> None:
+        return None
+
+    async def __aenter__(self) -> "_FakeAsyncTVDBSession":
+        return self
+
+    async def __aexit__(self, *_args: object) -> None:
         return None
 
 
-def test_tvdb_sync_and_async_clients_use_timeouts_and_reuse_token(
+def test_tvdb_clients_use_timeouts_and_share_a_token(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    fake_session = _FakeTVDBSession()
+    monkeypatch.setattr(tvdb_module, "_TOKENS", {})
+    fake_session = _FakeAsyncTVDBSession()
     monkeypatch.setattr(
-        "src.backend.utils.http_client.niquests.Session",
-        lambda **_kwargs: fake_session,
+        tvdb_module, "new_async_http_session", lambda *_args: fake_session
     )
-    client = TVDBClient("api-key", timeout=7)
 
-    assert client.search_by_remote_id("tt123&x")[0]["series"]["id"] == 321
-    async_client = AsyncTVDBClient(client)
+    assert (
+        asyncio.run(
+            AsyncTVDBClient("api-key", timeout=7).search_by_remote_id("tt123&x")
+        )[0]["series"]["id"]
+        == 321
+    )
+    async_client = AsyncTVDBClient("api-key", timeout=7)
     assert asyncio.run(async_client.get_series_extended(321))["id"] == 321
 
     assert len(fake_session.post_calls) == 1
@@ -0,0 +1,235 @@
+from contextlib import closing
+import os
+from pathlib import Path
+import sqlite3
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from torf import Torrent
+
+import src.backend.process as process_module
+from src.backend.process import ProcessBackEnd
+from src.backend.torrents import hashing as hashing_module
+from src.backend.torrents.hashing import PIECE_HASH_SIZE
+from src.backend.torrents.manifest import scan_content
+from src.backend.torrents.piece_cache import PieceCache
+from src.backend.torrents.torrent import INDEX_SIDECAR_GLOBS, generate_torrent
+
+_EXPONENT = 14
+_PIECE_SIZE = 1 << _EXPONENT
+# deliberately not piece multiples, so every boundary piece spans two episodes
+_EPISODE_SIZE = _PIECE_SIZE * 6 + 123
+_EPISODES = 8
+
+
+def _pack(tmp_path: Path) -> Path:
+    pack = tmp_path / "Show.S01"
+    pack.mkdir()
+    for episode in range(1, _EPISODES + 1):
+        (pack / f"Show.S01E{episode:02}.mkv").write_bytes(
+            bytes([episode]) * _EPISODE_SIZE
+        )
+    return pack
+
+
+def _replace(path: Path, content: bytes) -> None:
+    path.write_bytes(content)
+    # a distinct mtime even on filesystems with coarse timestamps
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _torf_pieces(path: Path) -> bytes:
+    torrent = Torrent(
+        path=path,
+        private=True,
+        piece_size=_PIECE_SIZE,
+        exclude_globs=INDEX_SIDECAR_GLOBS,
+    )
+    torrent.generate()
+    return torrent.metainfo["info"]["pieces"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+
+
+@pytest.fixture
+def hashed(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Pieces actually read and hashed, one entry per hashing job."""
+    counts: list[int] = []
+    real_hash_chunk = hashing_module._hash_chunk
+
+    def counting(chunk: bytearray, piece_size: int) -> bytes:
+        digest = real_hash_chunk(chunk, piece_size)
+        counts.append(len(digest) // PIECE_HASH_SIZE)
+        return digest
+
+    monkeypatch.setattr(hashing_module, "_hash_chunk", counting)
+    return counts
+
+
+def _generate(pack: Path, cache: PieceCache) -> bytes:
+    torrent = generate_torrent(
+        path=pack, piece_exponent=_EXPONENT, cb=lambda *_a: None, piece_cache=cache
+    )
+    return torrent.metainfo["info"]["pieces"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+
+
+def test_an_unchanged_pack_is_not_read_again(tmp_path: Path, hashed: list[int]) -> None:
+    pack = _pack(tmp_path)
+    cache = PieceCache(tmp_path / "cache.sqlite3")
+    first = _generate(pack, cache)
+    hashed.clear()
+
+    assert _generate(pack, cache) == first
+    # only the pieces spanning two episodes, and the short last one, are ever
+    # hashed again
+    assert sum(hashed) == _EPISODES
+
+
+def test_replacing_one_episode_only_rehashes_its_own_pieces(
+    tmp_path: Path, hashed: list[int]
+) -> None:
+    pack = _pack(tmp_path)
+    cache = PieceCache(tmp_path / "cache.sqlite3")
+    _generate(pack, cache)
+    _replace(pack / "Show.S01E04.mkv", b"\xff" * _EPISODE_SIZE)
+    hashed.clear()
+
+    pieces = _generate(pack, cache)
+
+    assert pieces == _torf_pieces(pack)
+    # the replaced episode's pieces plus the boundary pieces of the others
+    assert sum(hashed) <= -(-_EPISODE_SIZE // _PIECE_SIZE) + _EPISODES
+
+
+def test_a_resized_episode_still_produces_correct_pieces(tmp_path: Path) -> None:
+    pack = _pack(tmp_path)
+    cache = PieceCache(tmp_path / "cache.sqlite3")
+    _generate(pack, cache)
+    _replace(pack / "Show.S01E02.mkv", b"\xee" * (_EPISODE_SIZE + 999))
+
+    assert _generate(pack, cache) == _torf_pieces(pack)
+
+
+def test_a_torrent_from_another_tool_fills_the_cache(tmp_path: Path) -> None:
+    pack = _pack(tmp_path)
+    torrent = Torrent(path=pack, private=True, piece_size=_PIECE_SIZE)
+    torrent.generate()
+    torrent.write(tmp_path / "mkbrr.torrent")
+    files = scan_content(pack).files
+    cache = PieceCache(tmp_path / "cache.sqlite3")
+
+    cache.record_torrent(files, tmp_path / "mkbrr.torrent", pack)
+
+    known = cache.known_pieces(files, _PIECE_SIZE)
+    assert known
+    assert known[0] == torrent.metainfo["info"]["pieces"][:PIECE_HASH_SIZE]
+
+
+def test_a_torrent_laid_out_differently_is_not_recorded(tmp_path: Path) -> None:
+    pack = _pack(tmp_path)
+    torrent = Torrent(path=pack / "Show.S01E01.mkv", piece_size=_PIECE_SIZE)
+    torrent.generate()
+    torrent.write(tmp_path / "other.torrent")
+    files = scan_content(pack).files
+    cache = PieceCache(tmp_path / "cache.sqlite3")
+
+    cache.record_torrent(files, tmp_path / "other.torrent", pack)
+
+    assert cache.known_pieces(files, _PIECE_SIZE) == {}
+
+
+def test_an_unreadable_cache_only_costs_a_rehash(tmp_path: Path) -> None:
+    pack = _pack(tmp_path)
+    database = tmp_path / "cache.sqlite3"
+    database.write_bytes(b"not a database")
+
+    assert _generate(pack, PieceCache(database)) == _torf_pieces(pack)
+
+
+def test_the_least_recently_used_files_are_evicted(tmp_path: Path) -> None:
+    pack = _pack(tmp_path)
+    files = scan_content(pack).files
+    cache = PieceCache(tmp_path / "cache.sqlite3", max_files=2)
+
+    cache.record(files, _PIECE_SIZE, _torf_pieces(pack))
+
+    with closing(sqlite3.connect(cache.database)) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM pieces").fetchone() == (2,)
+
+
+def _mkbrr_backend(tmp_path: Path) -> ProcessBackEnd:
+    mkbrr = tmp_path / "mkbrr"
+    mkbrr.write_bytes(b"")
+    backend = object.__new__(ProcessBackEnd)
+    backend.config = cast(
+        Any,
+        SimpleNamespace(
+            settings=SimpleNamespace(
+                general=SimpleNamespace(enable_mkbrr=True, working_dir=tmp_path),
+                dependencies=SimpleNamespace(mkbrr=mkbrr),
+            )
+        ),
+    )
+    backend.mkbrr_torrent_gen_cb = lambda *_a: None  # pyright: ignore[reportAttributeAccessIssue]
+    backend.torrent_gen_cb = lambda *_a: None  # pyright: ignore[reportAttributeAccessIssue]
+    return backend
+
+
+@pytest.fixture
+def mkbrr_runs(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Content hashed by a stand-in for mkbrr, which writes torf's torrent."""
+    runs: list[Path] = []
+
+    def fake_mkbrr(*, path: Path, output_path: Path, **_kwargs: Any) -> Path:
+        runs.append(path)
+        torrent = Torrent(
+            path=path,
+            private=True,
+            piece_size=_PIECE_SIZE,
+            exclude_globs=INDEX_SIDECAR_GLOBS,
+        )
+        torrent.generate()
+        torrent.write(output_path, overwrite=True)
+        return output_path
+
+    monkeypatch.setattr(process_module, "mkbrr_generate_torrent", fake_mkbrr)
+    monkeypatch.setattr(process_module, "piece_exponent", lambda _size: _EXPONENT)
+    return runs
+
+
+def _base_torrent(backend: ProcessBackEnd, tmp_path: Path, pack: Path) -> Path:
+    return backend._prepare_base_torrent(
+        working_dir=tmp_path,
+        media_input=pack,
+        carried_torrent=None,
+        queued_text_update=lambda _text: None,
+    )
+
+
+def test_a_mostly_cached_release_is_finished_without_mkbrr(
+    tmp_path: Path, mkbrr_runs: list[Path]
+) -> None:
+    pack = _pack(tmp_path)
+    backend = _mkbrr_backend(tmp_path)
+    _base_torrent(backend, tmp_path, pack)
+    _replace(pack / "Show.S01E04.mkv", b"\xff" * _EPISODE_SIZE)
+
+    base = _base_torrent(backend, tmp_path, pack)
+
+    assert mkbrr_runs == [pack]
+    assert Torrent.read(base).metainfo["info"]["pieces"] == _torf_pieces(pack)  # pyright: ignore[reportTypedDictNotRequiredAccess]
+
+
+def test_a_mostly_changed_release_is_still_hashed_by_mkbrr(
+    tmp_path: Path, mkbrr_runs: list[Path]
+) -> None:
+    # a few cached pieces do not make up for hashing the rest without mkbrr
+    pack = _pack(tmp_path)
+    backend = _mkbrr_backend(tmp_path)
+    _base_torrent(backend, tmp_path, pack)
+    for episode in range(1, _EPISODES):
+        _replace(pack / f"Show.S01E{episode:02}.mkv", b"\xff" * _EPISODE_SIZE)
+
+    _base_torrent(backend, tmp_path, pack)
+
+    assert mkbrr_runs == [pack, pack]
@@ -0,0 +1,140 @@
+from pathlib import Path
+
+import pytest
+from torf import Torrent
+
+from src.backend.torrents import hashing as hashing_module
+from src.backend.torrents.hashing import PIECE_HASH_SIZE, hash_pieces
+from src.backend.torrents.torrent import INDEX_SIDECAR_GLOBS, generate_torrent
+
+_PIECE_SIZE = 1 << 14
+
+
+def _release(tmp_path: Path) -> Path:
+    """Files whose boundaries fall mid-piece, plus an index torf excludes."""
+    release = tmp_path / "Release"
+    release.mkdir()
+    for index, size in enumerate((50_001, 3, 70_000, _PIECE_SIZE * 2)):
+        (release / f"E{index:02}.mkv").write_bytes(bytes([index + 1]) * size)
+    (release / "E00.lwi").write_bytes(b"index")
+    return release
+
+
+def _torf_pieces(path: Path, piece_size: int) -> bytes:
+    torrent = Torrent(
+        path=path,
+        private=True,
+        piece_size=piece_size,
+        exclude_globs=INDEX_SIDECAR_GLOBS,
+    )
+    torrent.generate()
+    return torrent.metainfo["info"]["pieces"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+
+
+@pytest.mark.parametrize("buffer_size", [_PIECE_SIZE, _PIECE_SIZE * 3, 1 << 23])
+def test_pieces_match_torf_across_file_and_buffer_boundaries(
+    buffer_size: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    release = _release(tmp_path)
+    monkeypatch.setattr(hashing_module, "READ_BUFFER_SIZE", buffer_size)
+    files = sorted(release.glob("*.mkv"))
+
+    assert hash_pieces(files, _PIECE_SIZE, workers=2) == _torf_pieces(
+        release, _PIECE_SIZE
+    )
+
+
+def test_generate_torrent_matches_the_torrent_torf_would_hash(tmp_path: Path) -> None:
+    release = _release(tmp_path)
+
+    torrent = generate_torrent(path=release, piece_exponent=14, cb=lambda *_a: None)
+
+    assert torrent.metainfo["info"]["pieces"] == _torf_pieces(release, _PIECE_SIZE)  # pyright: ignore[reportTypedDictNotRequiredAccess]
+    torrent.validate()
+
+
+def test_progress_is_throttled_but_always_reports_the_end(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    release = _release(tmp_path)
+    monkeypatch.setattr(hashing_module, "READ_BUFFER_SIZE", _PIECE_SIZE)
+    reports: list[tuple[int, int]] = []
+
+    def progress(done: int, total: int) -> None:
+        reports.append((done, total))
+
+    pieces = hash_pieces(
+        sorted(release.glob("*.mkv")), _PIECE_SIZE, progress, interval=60
+    )
+
+    assert pieces is not None
+    total = len(pieces) // PIECE_HASH_SIZE
+    assert reports == [(total, total)]
+
+
+def test_a_progress_callback_can_stop_hashing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    release = _release(tmp_path)
+    monkeypatch.setattr(hashing_module, "READ_BUFFER_SIZE", _PIECE_SIZE)
+    reports: list[int] = []
+
+    def progress(done: int, _total: int) -> bool:
+        reports.append(done)
+        return True
+
+    assert (
+        hash_pieces(
+            sorted(release.glob("*.mkv")), _PIECE_SIZE, progress, workers=1, interval=0
+        )
+        is None
+    )
+    assert reports == [1]
+
+
+def test_a_stopped_generate_leaves_the_torrent_without_pieces(tmp_path: Path) -> None:
+    release = _release(tmp_path)
+
+    torrent = generate_torrent(
+        path=release, piece_exponent=14, cb=lambda *_a: True, progress_interval=0
+    )
+
+    assert "pieces" not in torrent.metainfo["info"]
+
+
+def test_large_pieces_are_bounded_by_bytes_not_just_workers() -> None:
+    piece_size = 1 << 24
+
+    assert hashing_module._chunks_in_flight(piece_size, 32) == (
+        hashing_module.MAX_IN_FLIGHT_BYTES // piece_size
+    )
+    assert hashing_module._chunks_in_flight(1 << 30, 4) == 1
+    assert hashing_module._chunks_in_flight(1 << 20, 2) == 4
+
+
+def test_default_workers_are_capped_and_the_result_is_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    release = _release(tmp_path)
+    pools: list[int] = []
+    executor_cls = hashing_module.ThreadPoolExecutor
+
+    def executor(max_workers: int, **kwargs: str) -> object:
+        pools.append(max_workers)
+        return executor_cls(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(hashing_module.os, "cpu_count", lambda: 64)
+    monkeypatch.setattr(hashing_module, "ThreadPoolExecutor", executor)
+    monkeypatch.setattr(hashing_module, "READ_BUFFER_SIZE", _PIECE_SIZE)
+
+    assert hash_pieces(sorted(release.glob("*.mkv")), _PIECE_SIZE) == _torf_pieces(
+        release, _PIECE_SIZE
+    )
+
+    monkeypatch.setattr(hashing_module, "MAX_IN_FLIGHT_BYTES", _PIECE_SIZE * 3)
+
+    assert hash_pieces(sorted(release.glob("*.mkv")), _PIECE_SIZE) == _torf_pieces(
+        release, _PIECE_SIZE
+    )
+    # only three chunks fit under the byte cap, so more workers would idle
+    assert pools == [hashing_module.MAX_DEFAULT_WORKERS, 3]
@@ -40,6 +40,8 @@ def _backend(monkeypatch: pytest.MonkeyPatch) -> ProcessBackEnd:
                 general=SimpleNamespace(
                     timeout=60,
                     enable_mkbrr=False,
+                    pipeline_torrent_hashing=False,
+                    tracker_upload_workers=1,
                     enable_plugins=False,
                     enable_prompt_overview=True,
                     releasers_name="tester",
@@ -98,7 +100,7 @@ def _context(tmp_path: Path) -> ProcessingContext:
 
 @pytest.fixture(autouse=True)
 def _stub_torrent_writes(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(process_module, "clone_torrent", lambda **_k: MagicMock())
+    monkeypatch.setattr(process_module, "BaseTorrentCloner", MagicMock())
     monkeypatch.setattr(
         process_module, "write_torrent", lambda **_k: Path("out.torrent")
     )
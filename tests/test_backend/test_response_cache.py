@@ -0,0 +1,194 @@
+import asyncio
+from contextlib import closing
+from pathlib import Path
+import sqlite3
+from typing import Any, cast
+
+import niquests
+import pytest
+
+import src.backend.utils.response_cache as response_cache_module
+from src.backend.utils.response_cache import (
+    ResponseCache,
+    fetch_json,
+    request_key,
+)
+import src.backend.utils.tvdb_client as tvdb_module
+from src.backend.utils.tvdb_client import AsyncTVDBClient
+from src.backend.utils.tvmaze_client import TVmazeClient
+
+
+class _Response:
+    def __init__(
+        self,
+        payload: Any = None,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def __enter__(self) -> "_Response":
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        return None
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise niquests.exceptions.HTTPError(f"{self.status_code}")
+
+    def json(self) -> Any:
+        return self.payload
+
+
+class _Session:
+    """Answers every request from `responses`, recording what was asked."""
+
+    def __init__(self, *responses: _Response) -> None:
+        self.responses = list(responses)
+        self.calls: list[dict[str, Any]] = []
+
+    def get(self, url: str, **kwargs: Any) -> _Response:
+        self.calls.append({"url": url, **kwargs})
+        return self.responses.pop(0)
+
+    post = get
+
+    def close(self) -> None:
+        return None
+
+
+class _AsyncSession(_Session):
+    """`_Session` for the async clients."""
+
+    async def get(self, url: str, **kwargs: Any) -> _Response:  # type: ignore[override]
+        return super().get(url, **kwargs)
+
+    post = get
+
+    async def close(self) -> None:  # type: ignore[override]
+        return None
+
+    async def __aenter__(self) -> "_AsyncSession":
+        return self
+
+    async def __aexit__(self, *_args: object) -> None:
+        return None
+
+
+def _fetch(session: _Session, cache: ResponseCache, **kwargs: Any) -> Any:
+    return fetch_json(
+        cast(niquests.Session, session),
+        "https://api.example.test/show/1",
+        timeout=5,
+        cache=cache,
+        **kwargs,
+    )
+
+
+def test_a_fresh_response_is_served_without_a_request(tmp_path: Path) -> None:
+    session = _Session(_Response({"id": 1}))
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+
+    assert _fetch(session, cache) == {"id": 1}
+    assert _fetch(session, cache) == {"id": 1}
+
+    assert len(session.calls) == 1
+
+
+def test_a_stale_response_is_revalidated_with_its_etag(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = _Session(
+        _Response({"id": 1}, headers={"ETag": '"v1"'}),
+        _Response(status_code=304),
+    )
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    _fetch(session, cache, ttl=60)
+    now = response_cache_module.time.time()
+    monkeypatch.setattr(response_cache_module.time, "time", lambda: now + 120)
+
+    assert _fetch(session, cache, ttl=60) == {"id": 1}
+
+    assert session.calls[1]["headers"] == {"If-None-Match": '"v1"'}
+    # renewed by the 304, so the next lookup is local again
+    assert _fetch(session, cache, ttl=60) == {"id": 1}
+    assert len(session.calls) == 2
+
+
+def test_failed_responses_are_not_cached(tmp_path: Path) -> None:
+    session = _Session(_Response(status_code=503), _Response({"id": 1}))
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+
+    with pytest.raises(niquests.exceptions.HTTPError):
+        _fetch(session, cache)
+
+    assert _fetch(session, cache) == {"id": 1}
+
+
+def test_the_key_leaves_out_the_api_key() -> None:
+    url = "https://api.themoviedb.org/3/search/tv"
+
+    assert request_key(url, {"query": "Show", "api_key": "a"}) == request_key(
+        url, {"api_key": "b", "query": "Show"}
+    )
+    assert request_key(url, {"query": "Show"}) != request_key(url, {"query": "Other"})
+
+
+def test_the_least_recently_used_responses_are_evicted(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "responses.sqlite3", max_bytes=250)
+    for index in range(5):
+        cache.put(f"key-{index}", "x" * 100, ttl=60)
+
+    with closing(sqlite3.connect(cache.database)) as connection:
+        kept = {row[0] for row in connection.execute("SELECT key FROM responses")}
+    assert kept == {"key-3", "key-4"}
+
+
+def test_an_unreadable_cache_only_costs_a_request(tmp_path: Path) -> None:
+    database = tmp_path / "responses.sqlite3"
+    database.write_bytes(b"not a database")
+    session = _Session(_Response({"id": 1}))
+
+    assert _fetch(session, ResponseCache(database)) == {"id": 1}
+
+
+def test_a_cached_tvdb_lookup_never_logs_in(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tvdb_module, "_TOKENS", {})
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    first = _AsyncSession(
+        _Response({"data": {"token": "token"}}),
+        _Response({"status": "success", "data": {"id": 321}}),
+    )
+    monkeypatch.setattr(tvdb_module, "new_async_http_session", lambda *_a: first)
+    assert asyncio.run(
+        AsyncTVDBClient("api-key", timeout=5, cache=cache).get_series_extended(321)
+    )
+
+    second = _AsyncSession()
+    monkeypatch.setattr(tvdb_module, "new_async_http_session", lambda *_a: second)
+    client = AsyncTVDBClient("api-key", timeout=5, cache=cache)
+
+    assert asyncio.run(client.get_series_extended(321)) == {"id": 321}
+    assert second.calls == []
+
+
+def test_a_tvmaze_miss_is_remembered(tmp_path: Path) -> None:
+    session = _Session(_Response(status_code=404))
+    client = TVmazeClient(
+        session=cast(niquests.Session, session),
+        cache=ResponseCache(tmp_path / "responses.sqlite3"),
+    )
+
+    assert client.lookup_show_id(imdb_id="tt1234567") is None
+    assert client.lookup_show_id(imdb_id="tt1234567") is None
+
+    assert len(session.calls) == 1
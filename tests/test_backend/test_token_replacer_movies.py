@@ -1,5 +1,8 @@
+import time
+
 import pytest
 
+import src.backend.token_replacer as token_replacer_module
 from src.backend.token_replacer import TokenReplacer
 from src.backend.tokens import FileToken, TokenData
 from src.backend.utils.audio_codecs import AudioCodecs
@@ -88,7 +91,7 @@ def test_frame_size_normalizes_imax_without_mutating_during_iteration() -> None:
     replacer = _movie_replacer()
 
     editions = replacer.guess_name.get("edition")
-    assert isinstance(editions, list)
+    assert isinstance(editions, tuple)
     assert "IMAX" in editions
     assert any("imax" not in str(e).lower() for e in editions)
 
@@ -97,7 +100,7 @@ def test_frame_size_normalizes_imax_without_mutating_during_iteration() -> None:
 
 def test_frame_size_does_not_normalize_climax_as_imax(monkeypatch) -> None:
     monkeypatch.setattr(
-        "src.backend.token_replacer.guessit",
+        "src.backend.token_replacer.parse_guessit",
         lambda *_args, **_kwargs: {"edition": "Climax"},
     )
     replacer = _movie_replacer()
@@ -143,7 +146,7 @@ def test_cut_excludes_a_non_cut_edition_that_edition_still_includes(
     # actually under test: whether the mocked "Special Edition" leaks into
     # {cut} the way it correctly does into {edition}.
     monkeypatch.setattr(
-        "src.backend.token_replacer.guessit",
+        "src.backend.token_replacer.parse_guessit",
         lambda *_args, **_kwargs: {"edition": "Special Edition"},
     )
     replacer = _movie_replacer()
@@ -232,7 +235,7 @@ def test_custom_edition_is_recognized_from_guessit_edition(monkeypatch) -> None:
     # contains "Director's Cut" (see test_cut_excludes_a_non_cut_edition...
     # above), so {edition}'s filename-scan path still picks that up too.
     monkeypatch.setattr(
-        "src.backend.token_replacer.guessit",
+        "src.backend.token_replacer.parse_guessit",
         lambda *_args, **_kwargs: {"edition": "Fan Edit"},
     )
     replacer = TokenReplacer(
@@ -273,7 +276,7 @@ def test_title_tokens_use_first_guessit_title_when_list_shaped(
     monkeypatch,
 ) -> None:
     monkeypatch.setattr(
-        "src.backend.token_replacer.guessit",
+        "src.backend.token_replacer.parse_guessit",
         lambda *_args, **_kwargs: {"title": ["Primary Title", "Alternative"]},
     )
     replacer = TokenReplacer(
@@ -388,6 +391,64 @@ def test_is_anime_token_renders_for_an_anime_film() -> None:
     assert output == "Anime"
 
 
+def test_a_jinja_template_compiles_once_per_engine(monkeypatch) -> None:
+    engine = Jinja2TemplateEngine()
+    compiled: list[object] = []
+    original = engine.environment.from_string
+
+    def counting_from_string(source, *args, **kwargs):
+        compiled.append(source)
+        return original(source, *args, **kwargs)
+
+    monkeypatch.setattr(engine.environment, "from_string", counting_from_string)
+    outputs = [
+        TokenReplacer(
+            media_input_obj=EXAMPLE_MEDIA_INPUT_PAYLOAD,
+            token_string="{{ media_type }} {{ nf_shared_data }}",  # noqa: S106 - NFO template token string used as test fixture data, not a credential
+            media_search_obj=EXAMPLE_SEARCH_PAYLOAD,
+            jinja_engine=engine,
+        ).get_output()
+        for _ in range(3)
+    ]
+
+    assert outputs == ["Movie "] * 3
+    assert len(compiled) == 1
+    assert engine.compile("{{ media_type }} {{ nf_shared_data }}").variables == {
+        "media_type",
+        "nf_shared_data",
+    }
+
+
+def test_adding_a_filter_recompiles_templates() -> None:
+    engine = Jinja2TemplateEngine()
+    first = engine.compile("{{ title }}")
+    engine.add_filter("shout", str.upper)
+
+    assert engine.compile("{{ title }}") is not first
+    assert engine.render_from_str("{{ title|shout }}", {"title": "a"}) == "A"
+
+
+def test_a_flat_template_occurrence_keeps_its_options_and_filters() -> None:
+    replacer = TokenReplacer(
+        media_input_obj=EXAMPLE_MEDIA_INPUT_PAYLOAD,
+        token_string="{:opt=[:release_group|lower:opt=]:} {not_a_token}",  # noqa: S106 - NFO template token string used as test fixture data, not a credential
+        media_search_obj=EXAMPLE_SEARCH_PAYLOAD,
+        flatten=True,
+        file_name_mode=True,
+        token_type=FileToken,
+        unfilled_token_mode=UnfilledTokenRemoval.TOKEN_ONLY,
+    )
+
+    (token,) = replacer._parse_user_input()
+    assert (token.pre_token, token.token, token.post_token, token.filters) == (
+        "[",
+        "release_group",
+        "]",
+        ("lower",),
+    )
+    assert token.full_match == "{:opt=[:release_group|lower:opt=]:}"
+
+
 def test_audio_codec_reads_the_conventions_file_once_per_instance(monkeypatch) -> None:
     # Three tokens now share this value. Without the cache each one re-reads
     # and re-parses the conventions JSON on every occurrence in a template.
@@ -409,6 +470,43 @@ def test_audio_codec_reads_the_conventions_file_once_per_instance(monkeypatch) -
     assert len(calls) == 1
 
 
+def test_replacers_sharing_a_payload_derive_media_facts_once(monkeypatch) -> None:
+    # One replacer is built per tracker title and NFO in a run; the facts that
+    # do not depend on tracker settings live on the shared payload instead.
+    codec_calls: list[object] = []
+    language_calls: list[int] = []
+    original_codec = AudioCodecs.get_codec
+    original_language = token_replacer_module.get_language_mi
+
+    def counting_get_codec(self, mi_obj, json_path):
+        codec_calls.append(json_path)
+        return original_codec(self, mi_obj, json_path)
+
+    def counting_get_language_mi(track, char_code=1):
+        language_calls.append(char_code)
+        return original_language(track, char_code)
+
+    monkeypatch.setattr(AudioCodecs, "get_codec", counting_get_codec)
+    monkeypatch.setattr(
+        token_replacer_module, "get_language_mi", counting_get_language_mi
+    )
+
+    outputs = []
+    for _ in range(2):
+        replacer = _movie_replacer()
+        outputs.append(
+            (
+                replacer._audio_codec(_td()),
+                replacer._audio_language_1_iso_639_x(2, _td()),
+                replacer._frame_size(_td()),
+            )
+        )
+
+    assert outputs[0] == outputs[1] == ("TrueHD Atmos", "ENG", "IMAX")
+    assert len(codec_calls) == 1
+    assert language_calls == [2]
+
+
 def test_resolution_detection_is_cached_per_scan_mode(monkeypatch) -> None:
     calls: list[bool] = []
 
@@ -755,3 +853,81 @@ def test_an_empty_value_still_skips_the_filters_that_describe_one() -> None:
     output = _title_replacer("S{:opt=E:episode_number|zfill(2)}").get_output()
 
     assert output == "S"
+
+
+def test_title_and_year_templates_never_parse_the_filename(monkeypatch) -> None:
+    parsed: list[object] = []
+    monkeypatch.setattr(
+        "src.backend.token_replacer.parse_guessit",
+        lambda *args, **_kwargs: parsed.append(args) or {},
+    )
+    replacer = TokenReplacer(
+        media_input_obj=EXAMPLE_MEDIA_INPUT_PAYLOAD,
+        token_string="{title} {release_year}",  # noqa: S106 - NFO template token string used as test fixture data, not a credential
+        media_search_obj=EXAMPLE_SEARCH_PAYLOAD,
+        flatten=True,
+        file_name_mode=True,
+        token_type=FileToken,
+        unfilled_token_mode=UnfilledTokenRemoval.TOKEN_ONLY,
+    )
+
+    assert replacer.get_output() == "Movie.Name.2026.mkv"
+    assert parsed == []
+
+
+def test_a_token_used_as_a_condition_is_resolved_once_per_render(
+    monkeypatch,
+) -> None:
+    calls: list[object] = []
+    original = TokenReplacer._source
+
+    def counting_source(self, token_data):
+        calls.append(token_data)
+        return original(self, token_data)
+
+    monkeypatch.setattr(TokenReplacer, "_source", counting_source)
+    replacer = TokenReplacer(
+        media_input_obj=EXAMPLE_MEDIA_INPUT_PAYLOAD,
+        token_string="{video_codec|only_if(source)} {audio_codec|unless(source)} {source}",  # noqa: S106 - NFO template token string used as test fixture data, not a credential
+        media_search_obj=EXAMPLE_SEARCH_PAYLOAD,
+        flatten=True,
+        file_name_mode=True,
+        token_type=FileToken,
+        unfilled_token_mode=UnfilledTokenRemoval.TOKEN_ONLY,
+    )
+
+    replacer.get_output()
+    assert len(calls) == 1
+    replacer.get_output()
+    assert len(calls) == 2
+
+
+def test_rendering_a_pack_of_filenames_is_cheap() -> None:
+    # Micro-benchmark: one replacer per episode, as the series rename does,
+    # with a typical scene-style template. Measured at well under a
+    # millisecond each; the bound only catches per-instance setup creeping
+    # back in (reflection, per-render parsing, eager guessit/MediaInfo work).
+    template = (
+        "{title} {release_year} {:opt=-:edition:opt=-:} {re_release} "
+        "{resolution} {source} {remux} {audio_codec} {audio_channel_s} "
+        "{video_dynamic_range_type} {video_codec}-{release_group}"
+    )
+
+    def render() -> str | None:
+        return TokenReplacer(
+            media_input_obj=EXAMPLE_MEDIA_INPUT_PAYLOAD,
+            token_string=template,
+            media_search_obj=EXAMPLE_SEARCH_PAYLOAD,
+            flatten=True,
+            file_name_mode=True,
+            token_type=FileToken,
+            unfilled_token_mode=UnfilledTokenRemoval.TOKEN_ONLY,
+        ).get_output()
+
+    expected = render()
+    start = time.perf_counter()
+    outputs = [render() for _ in range(200)]
+    elapsed = time.perf_counter() - start
+
+    assert outputs == [expected] * 200
+    assert elapsed < 2
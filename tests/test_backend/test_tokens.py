@@ -1,3 +1,4 @@
+import src.backend.token_replacer as token_replacer_module
 from src.backend.tokens import FileToken, NfoToken, Tokens
 
 
@@ -18,3 +19,25 @@ def test_file_token_dataclass_includes_video_dimensions() -> None:
 
     assert "video_width" in token_data.get_dict()
     assert "video_height" in token_data.get_dict()
+
+
+def test_every_token_has_a_resolver() -> None:
+    assert {token.token for token in Tokens.get_token_objects(FileToken)} == set(
+        token_replacer_module._MEDIA_RESOLVERS
+    )
+    assert {token.token for token in Tokens.get_token_objects(NfoToken)} == set(
+        token_replacer_module._NFO_RESOLVERS
+    )
+
+
+def test_token_lookups_accept_several_token_types() -> None:
+    assert Tokens.get_tokens([FileToken, NfoToken]) == Tokens.get_tokens()
+    assert Tokens.get_tokens(Tokens.EDITION) == Tokens.get_tokens(FileToken)
+
+
+def test_token_values_share_one_slotted_class() -> None:
+    first = Tokens.generate_token_dataclass(FileToken)
+    second = Tokens.generate_token_dataclass()
+
+    assert type(first) is type(second)
+    assert not hasattr(first, "__dict__")
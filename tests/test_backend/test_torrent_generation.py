@@ -7,11 +7,11 @@ import pytest
 from torf import Torrent
 
 from src.backend.torrents import torrent as torrent_module
+from src.backend.torrents.manifest import scan_content
 from src.backend.torrents.torrent import (
     INDEX_SIDECAR_GLOBS,
     NFO_FORGE_CREATOR,
     _validate_torrent_contents,
-    content_size,
     generate_torrent,
     mkbrr_generate_torrent,
     neutralize_base,
@@ -44,6 +44,16 @@ def _base_torrent(tmp_path: Path, media: Path) -> Path:
     return base_path
 
 
+def _clone(
+    tracker_info: TrackerInfo, base_path: Path, tmp_path: Path, **kwargs: Any
+) -> Torrent:
+    """Stamp `tracker_info` onto the base the way a run does, then read it back."""
+    cloner = torrent_module.BaseTorrentCloner(base_path)
+    return Torrent.read(
+        cloner.write(tracker_info, tmp_path / "second.torrent", **kwargs)
+    )
+
+
 def test_torf_excludes_index_sidecars_without_removing_them(tmp_path: Path) -> None:
     release, _ = _release_with_indexes(tmp_path)
 
@@ -60,14 +70,14 @@ def test_torf_excludes_index_sidecars_without_removing_them(tmp_path: Path) -> N
     assert (release / "Movie.ffindex").is_file()
 
 
-def test_content_size_counts_only_what_the_torrent_will_contain(
+def test_manifest_size_counts_only_what_the_torrent_will_contain(
     tmp_path: Path,
 ) -> None:
     """The piece size is chosen from this number, so a release near a band
     boundary must not be sized from a total that includes excluded files."""
     release, media = _release_with_indexes(tmp_path)
 
-    assert content_size(release) == media.stat().st_size
+    assert scan_content(release).size == media.stat().st_size
 
 
 def test_torrent_content_validation_rejects_index_sidecars(tmp_path: Path) -> None:
@@ -206,10 +216,10 @@ def test_clone_strips_the_base_announce_for_a_tracker_without_one(
     base.write(base_path, overwrite=True)
     assert base.trackers
 
-    clone = torrent_module.clone_torrent(
-        tracker_info=TrackerInfo(announce_url=None, source="Second"),
-        torrent_path=tmp_path / "second.torrent",
-        base_torrent_file=base_path,
+    clone = _clone(
+        TrackerInfo(announce_url=None, source="Second"),
+        base_path,
+        tmp_path,
     )
 
     assert clone.trackers == []
@@ -236,14 +246,14 @@ def test_clone_strips_the_base_comment_and_source_for_a_tracker_without_them(
     base.write(base_path, overwrite=True)
     assert base.comment == "Uploaded to First"
 
-    clone = torrent_module.clone_torrent(
-        tracker_info=TrackerInfo(
+    clone = _clone(
+        TrackerInfo(
             announce_url="https://second.invalid/OTHERKEY/announce",
             source=None,
             comments=None,
         ),
-        torrent_path=tmp_path / "second.torrent",
-        base_torrent_file=base_path,
+        base_path,
+        tmp_path,
     )
 
     assert clone.comment is None
@@ -261,14 +271,14 @@ def test_clone_still_overwrites_the_comment_and_source_when_the_tracker_has_them
     _, media = _release_with_indexes(tmp_path)
     base_path = _base_torrent(tmp_path, media)
 
-    clone = torrent_module.clone_torrent(
-        tracker_info=TrackerInfo(
+    clone = _clone(
+        TrackerInfo(
             announce_url="https://second.invalid/OTHERKEY/announce",
             source="Second",
             comments="Uploaded to Second",
         ),
-        torrent_path=tmp_path / "second.torrent",
-        base_torrent_file=base_path,
+        base_path,
+        tmp_path,
     )
 
     assert clone.comment == "Uploaded to Second"
@@ -282,12 +292,12 @@ def test_clone_still_overwrites_the_announce_when_the_tracker_has_one(
     _, media = _release_with_indexes(tmp_path)
     base_path = _base_torrent(tmp_path, media)
 
-    clone = torrent_module.clone_torrent(
-        tracker_info=TrackerInfo(
+    clone = _clone(
+        TrackerInfo(
             announce_url="https://second.invalid/OTHERKEY/announce", source="Second"
         ),
-        torrent_path=tmp_path / "second.torrent",
-        base_torrent_file=base_path,
+        base_path,
+        tmp_path,
     )
 
     assert clone.trackers == [["https://second.invalid/OTHERKEY/announce"]]
@@ -317,10 +327,10 @@ def test_clone_rejects_an_announce_url_that_is_not_a_url(
     base_path = _base_torrent(tmp_path, media)
 
     with pytest.raises(ProcessError, match="not a valid URL"):
-        torrent_module.clone_torrent(
-            tracker_info=TrackerInfo(announce_url=announce_url),
-            torrent_path=tmp_path / "second.torrent",
-            base_torrent_file=base_path,
+        _clone(
+            TrackerInfo(announce_url=announce_url),
+            base_path,
+            tmp_path,
             tracker_name="BeyondHD",
         )
 
@@ -334,10 +344,10 @@ def test_the_invalid_announce_error_names_the_tracker_and_stays_short(
     base_path = _base_torrent(tmp_path, media)
 
     with pytest.raises(ProcessError) as caught:
-        torrent_module.clone_torrent(
-            tracker_info=TrackerInfo(announce_url=_NOT_A_URL),
-            torrent_path=tmp_path / "second.torrent",
-            base_torrent_file=base_path,
+        _clone(
+            TrackerInfo(announce_url=_NOT_A_URL),
+            base_path,
+            tmp_path,
             tracker_name="BeyondHD",
         )
 
@@ -359,10 +369,10 @@ def test_clone_accepts_the_announce_urls_torf_accepts(tmp_path: Path) -> None:
         "http://tracker.invalid:2710/announce",
         "udp://tracker.invalid:6969",
     ):
-        clone = torrent_module.clone_torrent(
-            tracker_info=TrackerInfo(announce_url=announce_url),
-            torrent_path=tmp_path / "second.torrent",
-            base_torrent_file=base_path,
+        clone = _clone(
+            TrackerInfo(announce_url=announce_url),
+            base_path,
+            tmp_path,
             tracker_name="BeyondHD",
         )
         # write_torrent is where torf validates, so this is the real assertion
@@ -378,10 +388,10 @@ def test_a_tracker_without_an_announce_url_is_not_caught_by_the_guard(
     _, media = _release_with_indexes(tmp_path)
     base_path = _base_torrent(tmp_path, media)
 
-    clone = torrent_module.clone_torrent(
-        tracker_info=TrackerInfo(announce_url=None),
-        torrent_path=tmp_path / "second.torrent",
-        base_torrent_file=base_path,
+    clone = _clone(
+        TrackerInfo(announce_url=None),
+        base_path,
+        tmp_path,
         tracker_name="LST",
     )
 
@@ -396,12 +406,12 @@ def test_clone_leaves_created_by_alone(tmp_path: Path) -> None:
     _, media = _release_with_indexes(tmp_path)
     base_path = _base_torrent(tmp_path, media)
 
-    clone = torrent_module.clone_torrent(
-        tracker_info=TrackerInfo(
+    clone = _clone(
+        TrackerInfo(
             announce_url="https://second.invalid/OTHERKEY/announce", source="Second"
         ),
-        torrent_path=tmp_path / "second.torrent",
-        base_torrent_file=base_path,
+        base_path,
+        tmp_path,
     )
 
     assert clone.metainfo["created by"] == NFO_FORGE_CREATOR  # pyright: ignore[reportTypedDictNotRequiredAccess]
@@ -465,3 +475,81 @@ def test_an_already_neutral_base_round_trips_with_its_creator_intact(
         == "mkbrr/1.24.0 (https://github.com/autobrr/mkbrr)"
     )
     assert neutralized.metainfo["info"]["pieces"] == original.metainfo["info"]["pieces"]
+
+
+# the in-memory cloner
+# --------------------------------------------------------------------------
+# A run stamps the base once per tracker; the cloner does it from the bytes it
+# read once, and must write a torrent torf reads and re-encodes byte for byte.
+_STAMPS = [
+    TrackerInfo(
+        announce_url="https://second.invalid/OTHERKEY/announce",
+        source="Second",
+        comments="Uploaded to Second",
+    ),
+    TrackerInfo(announce_url=None, source=None, comments=None),
+]
+
+
+@pytest.mark.parametrize("tracker_info", _STAMPS)
+def test_the_cloner_writes_a_canonical_torrent(
+    tracker_info: TrackerInfo, tmp_path: Path
+) -> None:
+    _, media = _release_with_indexes(tmp_path)
+    base_path = tmp_path / "stamped.torrent"
+    base = generate_torrent(
+        path=media, piece_exponent=_EXPONENT, cb=lambda *_args: None
+    )
+    # a stamped base, so stripping is exercised too
+    base.metainfo["announce"] = "https://first.invalid/PASSKEY/announce"
+    base.metainfo["info"]["source"] = "First"
+    base.comment = "Uploaded to First"
+    base.write(base_path, overwrite=True)
+
+    cloner = torrent_module.BaseTorrentCloner(base_path)
+    written = cloner.write(tracker_info, tmp_path / "cloned.torrent")
+    reencoded = write_torrent(Torrent.read(written), tmp_path / "torf.torrent")
+
+    assert written.read_bytes() == reencoded.read_bytes()
+    clone = Torrent.read(written)
+    assert clone.private is True
+    assert clone.metainfo["info"]["pieces"] == base.metainfo["info"]["pieces"]
+
+
+def test_the_cloner_shares_the_stamped_info_between_equal_sources(
+    tmp_path: Path,
+) -> None:
+    _, media = _release_with_indexes(tmp_path)
+    cloner = torrent_module.BaseTorrentCloner(_base_torrent(tmp_path, media))
+
+    first = cloner.info("Shared")
+
+    assert cloner.info("Shared") is first
+    assert cloner.info("Other") != first
+
+
+def test_the_cloner_never_rereads_the_base(tmp_path: Path) -> None:
+    _, media = _release_with_indexes(tmp_path)
+    base_path = _base_torrent(tmp_path, media)
+    cloner = torrent_module.BaseTorrentCloner(base_path)
+    base_path.write_bytes(b"overwritten")
+
+    written = cloner.write(_STAMPS[0], tmp_path / "cloned.torrent")
+
+    assert Torrent.read(written).metainfo["info"]["source"] == "Second"  # pyright: ignore[reportTypedDictNotRequiredAccess]
+
+
+def test_the_cloner_shares_the_announce_url_guard(tmp_path: Path) -> None:
+    _, media = _release_with_indexes(tmp_path)
+    cloner = torrent_module.BaseTorrentCloner(_base_torrent(tmp_path, media))
+
+    with pytest.raises(ProcessError, match="BeyondHD -> Announce URL"):
+        cloner.stamp(TrackerInfo(announce_url=_NOT_A_URL), tracker_name="BeyondHD")
+
+
+def test_the_cloner_rejects_a_base_that_is_not_a_torrent(tmp_path: Path) -> None:
+    base_path = tmp_path / "base.torrent"
+    base_path.write_bytes(b"not bencode")
+
+    with pytest.raises(ValueError, match="Cannot read base torrent"):
+        torrent_module.BaseTorrentCloner(base_path)
@@ -0,0 +1,217 @@
+from collections import Counter
+from pathlib import Path
+import threading
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+from PySide6.QtCore import SignalInstance
+import pytest
+
+import src.backend.process as process_module
+from src.backend.process import ProcessBackEnd
+from src.backend.torrents import ContentManifest
+import src.backend.trackers.health as health_module
+from src.backend.upload_retry import RETRY_ATTEMPTS
+from src.config.config import ConfigManager
+from src.context.processing_context import ProcessingContext
+from src.enums.tracker_selection import TrackerSelection
+from src.payloads.shared_data import SharedPayload
+
+TRACKERS = (TrackerSelection.AITHER, TrackerSelection.BEYOND_HD, TrackerSelection.LST)
+
+
+def _backend(tmp_path: Path) -> ProcessBackEnd:
+    tracker_info = SimpleNamespace(upload_enabled=True, nfo_template=None)
+    backend = object.__new__(ProcessBackEnd)
+    backend.config = cast(
+        ConfigManager,
+        SimpleNamespace(
+            settings=SimpleNamespace(
+                general=SimpleNamespace(
+                    timeout=60,
+                    enable_mkbrr=False,
+                    pipeline_torrent_hashing=False,
+                    tracker_upload_workers=1,
+                    working_dir=tmp_path,
+                    enable_plugins=False,
+                    enable_prompt_overview=False,
+                ),
+                trackers=SimpleNamespace(
+                    by_selection=lambda: dict.fromkeys(TRACKERS, tracker_info)
+                ),
+                user_tokens=SimpleNamespace(tokens={}),
+                dependencies=SimpleNamespace(mkbrr=None),
+                torrent_clients=SimpleNamespace(
+                    qbittorrent=SimpleNamespace(enabled=False)
+                ),
+            )
+        ),
+    )
+    return backend
+
+
+def _probe_with(
+    monkeypatch: pytest.MonkeyPatch, probe: Any
+) -> Counter[TrackerSelection]:
+    """Stub the network probe, counting how often each tracker is probed."""
+    by_url = {tracker.get_root_url(): tracker for tracker in TRACKERS}
+    probes: Counter[TrackerSelection] = Counter()
+
+    def counted(url: str, _timeout: int, _attempts: int) -> tuple[int, str | None]:
+        probes[by_url[url]] += 1
+        return probe(by_url[url])
+
+    monkeypatch.setattr(health_module, "_probe_tracker", counted)
+    return probes
+
+
+def test_every_tracker_is_probed_at_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    # each probe only answers once all of them are in flight
+    barrier = threading.Barrier(len(TRACKERS), timeout=5)
+
+    def probe(_tracker: TrackerSelection) -> tuple[int, str | None]:
+        barrier.wait()
+        return 200, "OK"
+
+    _probe_with(monkeypatch, probe)
+    backend = _backend(tmp_path)
+    cache: dict[TrackerSelection, bool] = {}
+
+    timings = backend._prefetch_tracker_health(list(TRACKERS), cache)
+
+    assert cache == dict.fromkeys(TRACKERS, True)
+    assert set(timings) == set(TRACKERS)
+    assert backend.tracker_health == cache
+    assert backend.tracker_health_timings == timings
+
+
+def test_a_failed_probe_is_recorded_without_raising(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def probe(tracker: TrackerSelection) -> tuple[int, str | None]:
+        if tracker is TrackerSelection.BEYOND_HD:
+            return 503, "Service Unavailable"
+        if tracker is TrackerSelection.LST:
+            raise RuntimeError("unexpected")
+        return 200, "OK"
+
+    _probe_with(monkeypatch, probe)
+    cache: dict[TrackerSelection, bool] = {}
+
+    _backend(tmp_path)._prefetch_tracker_health(list(TRACKERS), cache)
+
+    # an unexpected failure is left for the upload to probe again
+    assert cache == {TrackerSelection.AITHER: True, TrackerSelection.BEYOND_HD: False}
+
+
+def test_trackers_already_in_the_cache_are_not_probed(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    probes = _probe_with(monkeypatch, lambda _tracker: (200, "OK"))
+    cache = {TrackerSelection.AITHER: True}
+
+    timings = _backend(tmp_path)._prefetch_tracker_health(list(TRACKERS), cache)
+
+    assert TrackerSelection.AITHER not in probes
+    assert set(timings) == {TrackerSelection.BEYOND_HD, TrackerSelection.LST}
+
+
+def _process_trackers(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, backend: ProcessBackEnd
+) -> list[str]:
+    """Run `process_trackers` for every tracker, returning the text updates."""
+    monkeypatch.setattr(
+        process_module, "scan_content", lambda path: ContentManifest(path, ())
+    )
+    monkeypatch.setattr(
+        process_module, "generate_torrent", lambda **_kwargs: MagicMock()
+    )
+    monkeypatch.setattr(process_module, "BaseTorrentCloner", MagicMock())
+    monkeypatch.setattr(
+        process_module, "write_torrent", lambda *_a, **_kwargs: tmp_path / "t.torrent"
+    )
+    monkeypatch.setattr(
+        process_module, "build_series_release_info", lambda *_a, **_kwargs: MagicMock()
+    )
+    backend.template_selector_be = SimpleNamespace(
+        load_templates=lambda: None, read_template=lambda name=None: None
+    )
+    backend.handle_images_for_trackers = MagicMock(return_value={})  # type: ignore[method-assign]
+    backend.generate_tracker_title = MagicMock(return_value=None)  # type: ignore[method-assign]
+    backend.upload = MagicMock(return_value=True)  # type: ignore[method-assign]
+    backend._handle_injection = MagicMock(return_value=None)  # type: ignore[method-assign]
+    backend.disconnect_from_clients = MagicMock()  # type: ignore[method-assign]
+    text_updates: list[str] = []
+
+    backend.process_trackers(
+        process_dict={
+            str(tracker): {"path": tmp_path / f"{tracker}.torrent"}
+            for tracker in TRACKERS
+        },
+        queued_status_update=lambda _tracker, _status: None,
+        queued_text_update=text_updates.append,
+        queued_text_update_replace_last_line=MagicMock(),
+        progress_bar_cb=MagicMock(),
+        caught_error=cast(SignalInstance, MagicMock()),
+        context=cast(
+            ProcessingContext,
+            SimpleNamespace(
+                media_input=SimpleNamespace(
+                    require_input_path=lambda: tmp_path / "media.mkv",
+                    require_working_dir=lambda: tmp_path,
+                ),
+                shared_data=SharedPayload(),
+            ),
+        ),
+    )
+
+    return text_updates
+
+
+def test_the_run_warns_up_front_and_uploads_reuse_the_probe(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    probes = _probe_with(
+        monkeypatch,
+        lambda tracker: (
+            (503, "Service Unavailable")
+            if tracker is TrackerSelection.LST
+            else (200, "OK")
+        ),
+    )
+
+    text_updates = _process_trackers(monkeypatch, tmp_path, _backend(tmp_path))
+
+    warning = next(
+        index for index, text in enumerate(text_updates) if "unreachable: LST" in text
+    )
+    first_tracker = next(
+        index for index, text in enumerate(text_updates) if "Starting work" in text
+    )
+    assert warning < first_tracker
+    # healthy trackers upload on the prefetched result, the unreachable one is
+    # probed again by every attempt of its upload, the first one included
+    assert probes[TrackerSelection.AITHER] == 1
+    assert probes[TrackerSelection.BEYOND_HD] == 1
+    assert probes[TrackerSelection.LST] == 1 + RETRY_ATTEMPTS
+
+
+def test_trackers_the_dupe_check_found_reachable_are_not_probed_again(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    probes = _probe_with(monkeypatch, lambda _tracker: (200, "OK"))
+    backend = _backend(tmp_path)
+    backend._prefetch_tracker_health([TrackerSelection.AITHER], {})
+
+    _process_trackers(monkeypatch, tmp_path, backend)
+
+    assert probes == Counter(
+        {
+            TrackerSelection.AITHER: 1,
+            TrackerSelection.BEYOND_HD: 1,
+            TrackerSelection.LST: 1,
+        }
+    )
@@ -491,9 +491,11 @@ def _process_backend() -> ProcessBackEnd:
     credential fields that `upload`/`dupe_checks` can reach once the series
     guard is cleared are pinned to falsy values so a supported tracker fails
     on "missing credentials" rather than attempting a real network call.
+    The general timeout is pinned too, `dupe_checks` bounds each tracker by it.
     """
     backend = object.__new__(ProcessBackEnd)
     backend.config = MagicMock()
+    backend.config.settings.general.timeout = 60
     backend.config.settings.trackers.torrent_leech.torrent_passkey = ""
     backend.config.settings.trackers.pass_the_popcorn.api_user = ""
     backend.config.settings.trackers.reelflix.api_key = ""
@@ -231,7 +231,7 @@ def test_owned_tvmaze_client_is_closed(monkeypatch: pytest.MonkeyPatch) -> None:
     ours to close, and an injected one is not."""
     client = _FakeTVmazeClient()
     monkeypatch.setattr(
-        "src.backend.trackers.torrentleech.TVmazeClient", lambda timeout: client
+        "src.backend.trackers.torrentleech.TVmazeClient", lambda **_kwargs: client
     )
     uploader = _uploader(imdb_id="tt0944947")
 
@@ -0,0 +1,145 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+import src.backend.utils.tvdb_client as tvdb_module
+from src.backend.utils.tvdb_client import AsyncTVDBClient
+from src.exceptions import MediaSearchError
+
+_SERIES = "https://api4.thetvdb.com/v4/series/321"
+
+
+class _Response:
+    headers: dict[str, str] = {}
+
+    def __init__(self, payload: Any, status_code: int = 200) -> None:
+        self.payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> Any:
+        return self.payload
+
+
+class _AsyncSession:
+    """Answers like TVDB, counting the logins, requests and how many overlap."""
+
+    def __init__(self, episodes: int = 3, page_size: int = 500) -> None:
+        self.episodes = episodes
+        self.page_size = page_size
+        self.logins = 0
+        self.gets: list[tuple[str, dict[str, str] | None]] = []
+        self.open_requests = 0
+        self.most_open_requests = 0
+        self.closed = 0
+        self.expired_tokens: set[str] = set()
+
+    async def post(self, url: str, **_kwargs: Any) -> _Response:
+        self.logins += 1
+        await asyncio.sleep(0)
+        return _Response({"data": {"token": f"token-{self.logins}"}})
+
+    async def get(self, url: str, **kwargs: Any) -> _Response:
+        self.gets.append((url, kwargs.get("params")))
+        self.open_requests += 1
+        self.most_open_requests = max(self.most_open_requests, self.open_requests)
+        # yield so every request started together is open at the same time
+        await asyncio.sleep(0.01)
+        self.open_requests -= 1
+        token = kwargs["headers"]["Authorization"].removeprefix("Bearer ")
+        if token in self.expired_tokens:
+            return _Response({"status": "failure"}, status_code=401)
+        if url.endswith("/extended"):
+            return _Response({"status": "success", "data": {"id": 321}})
+        page = int(kwargs["params"]["page"])
+        start = page * self.page_size
+        stop = min(start + self.page_size, self.episodes)
+        return _Response(
+            {
+                "status": "success",
+                "data": {
+                    "series": {"id": 321},
+                    "episodes": [{"number": number} for number in range(start, stop)],
+                },
+                "links": {"total_items": self.episodes, "page_size": self.page_size},
+            }
+        )
+
+    async def close(self) -> None:
+        self.closed += 1
+
+    async def __aenter__(self) -> "_AsyncSession":
+        return self
+
+    async def __aexit__(self, *_args: object) -> None:
+        await self.close()
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> _AsyncSession:
+    session = _AsyncSession(episodes=1234)
+    monkeypatch.setattr(tvdb_module, "_TOKENS", {})
+    monkeypatch.setattr(tvdb_module, "new_async_http_session", lambda *_a: session)
+    return session
+
+
+def test_every_page_after_the_first_is_fetched_at_once(session: _AsyncSession) -> None:
+    async def fetch() -> dict[str, Any]:
+        async with AsyncTVDBClient("api-key", timeout=5) as client:
+            return await client.get_series_episodes(321, "absolute")
+
+    series = asyncio.run(fetch())
+
+    assert [episode["number"] for episode in series["episodes"]] == list(range(1234))
+    assert [params["page"] for _url, params in session.gets if params] == [
+        "0",
+        "1",
+        "2",
+    ]
+    assert session.most_open_requests == 2
+    # one pooled session for the whole lookup
+    assert session.closed == 1
+
+
+def test_identical_requests_in_flight_are_sent_once(session: _AsyncSession) -> None:
+    async def fetch() -> list[dict[str, Any]]:
+        async with AsyncTVDBClient("api-key", timeout=5) as client:
+            return await asyncio.gather(
+                client.get_series_extended(321), client.get_series_extended(321)
+            )
+
+    first, second = asyncio.run(fetch())
+
+    assert first == second == {"id": 321}
+    # copies, since the caller adds the episode orderings to what it gets back
+    assert first is not second
+    assert session.gets == [
+        (f"{_SERIES}/extended", {"meta": "episodes", "short": "true"})
+    ]
+    assert session.logins == 1
+
+
+def test_a_token_is_reused_by_later_clients(session: _AsyncSession) -> None:
+    for _ in range(2):
+        asyncio.run(AsyncTVDBClient("api-key", timeout=5).get_series_extended(321))
+
+    assert session.logins == 1
+
+
+def test_an_expired_token_is_replaced_once(session: _AsyncSession) -> None:
+    tvdb_module._TOKENS["api-key"] = "stale"
+    session.expired_tokens.add("stale")
+
+    assert asyncio.run(
+        AsyncTVDBClient("api-key", timeout=5).get_series_extended(321)
+    ) == {"id": 321}
+    assert session.logins == 1
+
+    # the fresh login is refused too, so there is nothing left to try
+    session.expired_tokens.add("token-2")
+    tvdb_module._TOKENS["api-key"] = "stale"
+    with pytest.raises(MediaSearchError):
+        asyncio.run(AsyncTVDBClient("api-key", timeout=5).get_series_extended(321))
@@ -9,6 +9,7 @@ from tenacity.wait import wait_none
 
 import src.backend.process as process_module
 from src.backend.process import ProcessBackEnd
+from src.backend.torrents import ContentManifest
 from src.backend.upload_retry import (
     RETRY_ATTEMPTS,
     UploadFailurePhase,
@@ -390,11 +391,13 @@ def test_injection_cancel_marks_remaining_trackers_and_disconnects(
     `disconnect_from_clients()`.
     """
     monkeypatch.setattr(process_module, "ensure_tracker_health", lambda **_kwargs: None)
-    monkeypatch.setattr(process_module, "content_size", lambda _path: 1024)
+    monkeypatch.setattr(
+        process_module, "scan_content", lambda path: ContentManifest(path, ())
+    )
     monkeypatch.setattr(
         process_module, "generate_torrent", lambda **_kwargs: MagicMock()
     )
-    monkeypatch.setattr(process_module, "clone_torrent", lambda **_kwargs: MagicMock())
+    monkeypatch.setattr(process_module, "BaseTorrentCloner", MagicMock())
     monkeypatch.setattr(
         process_module,
         "write_torrent",
@@ -415,6 +418,9 @@ def test_injection_cancel_marks_remaining_trackers_and_disconnects(
                 general=SimpleNamespace(
                     timeout=60,
                     enable_mkbrr=False,
+                    pipeline_torrent_hashing=False,
+                    tracker_upload_workers=1,
+                    working_dir=tmp_path,
                     enable_plugins=False,
                     enable_prompt_overview=False,
                 ),
@@ -479,11 +485,13 @@ def test_injection_cancel_marks_remaining_trackers_and_disconnects(
 
 def _patch_torrent_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     monkeypatch.setattr(process_module, "ensure_tracker_health", lambda **_kwargs: None)
-    monkeypatch.setattr(process_module, "content_size", lambda _path: 1024)
+    monkeypatch.setattr(
+        process_module, "scan_content", lambda path: ContentManifest(path, ())
+    )
     monkeypatch.setattr(
         process_module, "generate_torrent", lambda **_kwargs: MagicMock()
     )
-    monkeypatch.setattr(process_module, "clone_torrent", lambda **_kwargs: MagicMock())
+    monkeypatch.setattr(process_module, "BaseTorrentCloner", MagicMock())
     monkeypatch.setattr(
         process_module,
         "write_torrent",
@@ -497,6 +505,7 @@ def _patch_torrent_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) ->
 
 
 def _process_trackers_backend(
+    tmp_path: Path,
     *,
     upload_return: object = True,
     injection_side_effect: Exception | None = None,
@@ -543,6 +552,9 @@ def _process_trackers_backend(
                 general=SimpleNamespace(
                     timeout=60,
                     enable_mkbrr=False,
+                    pipeline_torrent_hashing=False,
+                    tracker_upload_workers=1,
+                    working_dir=tmp_path,
                     enable_plugins=True,
                     enable_prompt_overview=False,
                 ),
@@ -610,7 +622,7 @@ def test_post_upload_plugin_fires_success_on_full_cycle(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     _patch_torrent_pipeline(monkeypatch, tmp_path)
-    backend, received = _process_trackers_backend()
+    backend, received = _process_trackers_backend(tmp_path)
 
     _run_process_trackers(backend, tmp_path)
 
@@ -624,7 +636,8 @@ def test_post_upload_plugin_fires_injection_failed_with_scrubbed_error(
 ) -> None:
     _patch_torrent_pipeline(monkeypatch, tmp_path)
     backend, received = _process_trackers_backend(
-        injection_side_effect=TrackerClientError("client offline, token=SECRET123")
+        tmp_path,
+        injection_side_effect=TrackerClientError("client offline, token=SECRET123"),
     )
 
     _run_process_trackers(backend, tmp_path)
@@ -639,7 +652,7 @@ def test_post_upload_plugin_fires_upload_failed_on_falsy_result(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     _patch_torrent_pipeline(monkeypatch, tmp_path)
-    backend, received = _process_trackers_backend(upload_return=False)
+    backend, received = _process_trackers_backend(tmp_path, upload_return=False)
 
     _run_process_trackers(backend, tmp_path, upload_retry_cb=None)
 
@@ -651,7 +664,7 @@ def test_post_upload_plugin_fires_skipped_when_pre_upload_plugin_skips(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     _patch_torrent_pipeline(monkeypatch, tmp_path)
-    backend, received = _process_trackers_backend(skip_via_pre_upload=True)
+    backend, received = _process_trackers_backend(tmp_path, skip_via_pre_upload=True)
 
     _run_process_trackers(backend, tmp_path)
 
@@ -663,7 +676,7 @@ def test_post_upload_plugin_does_not_fire_for_a_disabled_tracker(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     _patch_torrent_pipeline(monkeypatch, tmp_path)
-    backend, received = _process_trackers_backend()
+    backend, received = _process_trackers_backend(tmp_path)
     backend.config.settings.trackers.by_selection = lambda: {  # type: ignore[method-assign]
         TrackerSelection.AITHER: SimpleNamespace(
             upload_enabled=False, nfo_template=None
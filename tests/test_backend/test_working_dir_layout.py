@@ -6,8 +6,10 @@ from pathlib import Path
 import pytest
 
 from src.backend.utils.working_dir import (
+    CACHE_DIR_NAME,
     JOBS_DIR_NAME,
     PROCESSING_DIR_NAME,
+    cache_dir,
     cleanable_items,
     cleanable_size,
     jobs_dir,
@@ -18,6 +20,7 @@ from src.backend.utils.working_dir import (
 def test_jobs_and_processing_are_siblings(tmp_path: Path) -> None:
     assert jobs_dir(tmp_path) == tmp_path / JOBS_DIR_NAME
     assert processing_dir(tmp_path) == tmp_path / PROCESSING_DIR_NAME
+    assert cache_dir(tmp_path) == tmp_path / CACHE_DIR_NAME
 
 
 def test_directories_are_only_created_when_asked(tmp_path: Path) -> None:
@@ -23,12 +23,11 @@ from src.backend.jobs import (
     MediaFingerprint,
     context_from_dict,
     context_to_dict,
-    fingerprint_files,
     store,
     template_fingerprint,
-    torrent_content_files,
 )
 from src.backend.jobs.models import JobSummary
+from src.backend.torrents.manifest import scan_content
 from src.backend.upload_retry import TrackerRunOutcome
 from src.backend.utils.media_info_utils import clear_full_mi_str_cache
 from src.context.processing_context import ProcessingContext
@@ -269,6 +268,8 @@ def test_completed_upload_is_kept_as_a_source_less_archive(
     page._build_job_document = lambda directory, keep: ProcessPage._build_job_document(
         page, directory, keep
     )
+    page.backend = SimpleNamespace(content_manifest=None)
+    page._content_manifest = lambda path: ProcessPage._content_manifest(page, path)  # pyright: ignore[reportArgumentType]
     page._job_summary = lambda keep=None: ProcessPage._job_summary(page, keep)
 
     assert ProcessPage._archive_completed_run(page)  # pyright: ignore[reportArgumentType]
@@ -326,6 +327,8 @@ def test_adding_trackers_keeps_one_left_pending_by_an_earlier_run(
     page._build_job_document = lambda directory, keep: ProcessPage._build_job_document(
         page, directory, keep
     )
+    page.backend = SimpleNamespace(content_manifest=None)
+    page._content_manifest = lambda path: ProcessPage._content_manifest(page, path)  # pyright: ignore[reportArgumentType]
     page._job_summary = lambda keep=None: ProcessPage._job_summary(page, keep)
 
     assert ProcessPage._archive_completed_run(page)  # pyright: ignore[reportArgumentType]
@@ -412,6 +415,8 @@ def test_an_uncertain_tracker_keeps_everything_but_the_ability_to_run(
     page._build_job_document = lambda directory, keep: ProcessPage._build_job_document(
         page, directory, keep
     )
+    page.backend = SimpleNamespace(content_manifest=None)
+    page._content_manifest = lambda path: ProcessPage._content_manifest(page, path)  # pyright: ignore[reportArgumentType]
     page._job_summary = lambda keep=None: ProcessPage._job_summary(page, keep)
 
     assert ProcessPage._archive_completed_run(page)  # pyright: ignore[reportArgumentType]
@@ -469,6 +474,8 @@ def test_a_fully_uploaded_archive_still_carries_its_image_urls(
     page._build_job_document = lambda directory, keep: ProcessPage._build_job_document(
         page, directory, keep
     )
+    page.backend = SimpleNamespace(content_manifest=None)
+    page._content_manifest = lambda path: ProcessPage._content_manifest(page, path)  # pyright: ignore[reportArgumentType]
     page._job_summary = lambda keep=None: ProcessPage._job_summary(page, keep)
 
     assert ProcessPage._archive_completed_run(page)  # pyright: ignore[reportArgumentType]
@@ -1516,7 +1523,7 @@ def test_a_pack_with_a_changed_episode_falls_back_to_hashing(
         context={
             "base_torrent": {
                 "media": str(pack),
-                "fingerprints": fingerprint_files(torrent_content_files(pack)),
+                "fingerprints": scan_content(pack).fingerprints(),
             }
         },
     )
@@ -1547,7 +1554,7 @@ def test_an_unchanged_pack_reuses_the_stored_torrent(qapp: Any, tmp_path: Path)
         context={
             "base_torrent": {
                 "media": str(pack),
-                "fingerprints": fingerprint_files(torrent_content_files(pack)),
+                "fingerprints": scan_content(pack).fingerprints(),
             }
         },
     )
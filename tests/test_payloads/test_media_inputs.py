@@ -220,3 +220,22 @@ def test_reset_clears_cached_media_analysis() -> None:
     payload.reset()
 
     assert payload.analysis_cache.get_resolution(media_info, False) is None
+
+
+def test_analysis_cache_keeps_facts_per_subject_and_variant() -> None:
+    cache = _movie_payload().analysis_cache
+    first, second = object(), object()
+    calls: list[str] = []
+
+    def compute(value: str | None) -> str | None:
+        calls.append(str(value))
+        return value
+
+    assert cache.remember(first, "edition", lambda: compute("IMAX")) == "IMAX"
+    assert cache.remember(first, "edition", lambda: compute("other")) == "IMAX"
+    # a missing fact is worth remembering too
+    assert cache.remember(second, "edition", lambda: compute(None)) is None
+    assert cache.remember(second, "edition", lambda: compute("other")) is None
+    assert cache.remember(first, "edition", lambda: compute("Cut"), "v2") == "Cut"
+
+    assert calls == ["IMAX", "None", "Cut"]
@@ -1,5 +1,6 @@
 from datetime import date, datetime
 from pathlib import Path
+from typing import Any
 
 from PySide6.QtGui import QColor
 import pytest
@@ -7,12 +8,15 @@ import pytest
 from src.backend.process import ProcessBackEnd
 from src.backend.token_replacer import TokenReplacer
 from src.backend.tokens import FileToken
+from src.backend.utils import guessit_helpers as guessit_helpers_module
+from src.backend.utils.guessit_helpers import clear_guessit_cache
 from src.enums.media_type import MediaType
 from src.enums.multi_episode_style import MultiEpisodeStyle
 from src.enums.series import EpisodeFormat
 from src.enums.token_replacer import ColonReplace, UnfilledTokenRemoval
 from src.frontend.custom_widgets.series_episode_mapper import (
     NO_TVDB_EPISODE_DATA_MESSAGE,
+    EnhancedFileTableItem,
     SeriesEpisodeMapper,
     match_by_absolute,
     match_by_air_date,
@@ -1291,3 +1295,49 @@ def test_describe_multi_season_pack_silent_for_movies() -> None:
         file_list=[Path("Movie.2024.mkv")],
     )
     assert describe_multi_season_pack(build_series_release_info(media_input)) is None
+
+
+def test_the_mapper_payload_and_token_replacer_parse_each_file_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    parsed: list[str] = []
+    real_guessit = guessit_helpers_module.guessit
+
+    def counting_guessit(name: str, options: dict[str, Any]) -> Any:
+        parsed.append(name)
+        return real_guessit(name, options)
+
+    monkeypatch.setattr(guessit_helpers_module, "guessit", counting_guessit)
+    clear_guessit_cache()
+    file_list = [Path("Show/Show.S01E01.mkv"), Path("Show/Show.S01E02.mkv")]
+    media_input = MediaInputPayload(
+        input_path=Path("Show"), media_type=MediaType.SERIES, file_list=file_list
+    )
+
+    _make_mapper_with_files(file_list)._populate_files_table()
+    build_series_release_info(media_input)
+    TokenReplacer(
+        media_input_obj=media_input,
+        media_search_obj=MediaSearchPayload(media_type=MediaType.SERIES),
+        token_string="{title}",  # noqa: S106 - NFO template token string used as test fixture data, not a credential
+        colon_replace=ColonReplace.REPLACE_WITH_DASH,
+        flatten=True,
+        file_name_mode=False,
+        token_type=FileToken,
+        unfilled_token_mode=UnfilledTokenRemoval.TOKEN_ONLY,
+    ).get_output()
+    clear_guessit_cache()
+
+    assert sorted(parsed) == ["Show.S01E01.mkv", "Show.S01E02.mkv"]
+
+
+def test_the_mapper_takes_the_season_from_the_folder_when_the_name_has_none() -> None:
+    file_path = Path("Show/Season 2/05 - Episode Title.mkv")
+    mapper = _make_mapper_with_files([file_path])
+
+    mapper._populate_files_table()
+
+    filename_item = mapper.files_table.item(0, 0)
+    assert isinstance(filename_item, EnhancedFileTableItem)
+    assert filename_item.parsed_data["season"] == 2
+    assert filename_item.parsed_data["episode"] == 5